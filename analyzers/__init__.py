@@ -1,26 +1,62 @@
 """Analyzers module for document data analysis."""
 
-from .dynamic_counting import (
-    get_dynamic_counts,
-    create_summary_row,
-    create_summary_dataframe
-)
-from .document_tracker import (
-    extract_apartment_number,
-    extract_phase,
-    extract_block,
-    categorize_documents,
-    get_uncategorized_certificates_in_blocks,
-    calculate_category_progress,
-    calculate_progress_by_phase_block,
-    get_overall_progress,
-    get_apartment_certificate_summary
-)
+from utils.lazy_imports import lazy_exports
+
+# Submodules are imported on first use of one of their names
+_SUBMODULE_EXPORTS = {
+    'dynamic_counting': [
+        'get_dynamic_counts',
+        'create_summary_row',
+        'create_summary_dataframe'
+    ],
+    'document_tracker': [
+        'extract_apartment_number',
+        'extract_phase',
+        'extract_block',
+        'categorize_documents',
+        'get_uncategorized_certificates_in_blocks',
+        'calculate_category_progress',
+        'calculate_progress_by_phase_block',
+        'get_overall_progress',
+        'get_apartment_certificate_summary'
+    ],
+    'apartment_index': [
+        'ApartmentIndex',
+        'get_apartment_index'
+    ],
+    'snapshot_profile': [
+        'SnapshotProfile',
+        'build_snapshot_profile',
+        'build_snapshot_profile_from_database'
+    ],
+    'document_attributes': [
+        'get_classification_fingerprint',
+        'compute_document_attributes',
+        'get_categorized_documents'
+    ],
+    'change_detection': [
+        'get_change_detection_fingerprint',
+        'get_tracked_columns',
+        'detect_changes',
+        'format_changes',
+        'summarize_changes'
+    ],
+    'turnaround': [
+        'calculate_status_turnaround',
+        'calculate_revision_turnaround',
+        'get_open_status_ages'
+    ]
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _SUBMODULE_EXPORTS)
 
 __all__ = [
     'get_dynamic_counts',
     'create_summary_row',
     'create_summary_dataframe',
+    'SnapshotProfile',
+    'build_snapshot_profile',
+    'build_snapshot_profile_from_database',
     'extract_apartment_number',
     'extract_phase',
     'extract_block',
@@ -29,6 +65,19 @@ __all__ = [
     'calculate_category_progress',
     'calculate_progress_by_phase_block',
     'get_overall_progress',
-    'get_apartment_certificate_summary'
+    'get_apartment_certificate_summary',
+    'ApartmentIndex',
+    'get_apartment_index',
+    'get_classification_fingerprint',
+    'compute_document_attributes',
+    'get_categorized_documents',
+    'get_change_detection_fingerprint',
+    'get_tracked_columns',
+    'detect_changes',
+    'format_changes',
+    'summarize_changes',
+    'calculate_status_turnaround',
+    'calculate_revision_turnaround',
+    'get_open_status_ages'
 ]
 
@@ -0,0 +1,229 @@
+"""Apartment index - accommodation data arranged for vectorized lookups.
+
+ACCOMMODATION_DATA keeps its apartments as lists and its per-apartment
+attributes as a dictionary of dictionaries, so every membership test is a
+list scan and every attribute lookup a Python loop. The index keeps:
+
+- the apartment numbers as sorted ranges (runs of consecutive numbers), so
+  a number is found with a binary search over the runs rather than a scan
+- one NumPy array of codes per lookup field (phase, block, floor, type,
+  bedrooms, tenure), indexed by the apartment's position in number order
+
+Columns of apartment numbers - such as the apartment_number column of
+categorize_documents() output - are joined to their attributes with array
+indexing, which gives per-floor, per-type or per-tenure certificate coverage
+without walking the documents.
+
+Only apartments numbered by integers are indexed, as those are the numbers
+extract_apartment_number() reads from documents; schedules keyed by plot
+references ('C1-01-01') give an empty index.
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional, Tuple
+
+
+def _sorted_values(values: List) -> List:
+    """Sort distinct values, keeping first-appearance order if they can't be compared."""
+    try:
+        return sorted(values)
+    except TypeError:
+        return values
+
+
+class ApartmentIndex:
+    """Accommodation data indexed by apartment number.
+
+    Build once per accommodation data with get_apartment_index().
+    """
+
+    def __init__(self, accommodation_data: Dict):
+        """
+        Args:
+            accommodation_data: ACCOMMODATION_DATA (see config.get_accommodation_data)
+        """
+        lookup = {
+            apartment: attributes
+            for apartment, attributes in (accommodation_data or {}).get('apartment_lookup', {}).items()
+            if isinstance(apartment, (int, np.integer)) and not isinstance(apartment, bool)
+        }
+        self.numbers = np.array(sorted(lookup), dtype=np.int64)
+
+        # Runs of consecutive numbers: first number, end (exclusive) and position of the first number
+        breaks = np.flatnonzero(np.diff(self.numbers) != 1) + 1
+        self._offsets = np.concatenate(([0], breaks)) if len(self.numbers) else np.zeros(0, dtype=np.int64)
+        self._starts = self.numbers[self._offsets]
+        self._stops = self._starts + np.diff(np.append(self._offsets, len(self.numbers)))
+
+        # Distinct values of each field and one code per apartment (-1 where the value is None)
+        self.fields = list(dict.fromkeys(field for attributes in lookup.values() for field in attributes))
+        self._values = {}
+        self._codes = {}
+        for field in self.fields:
+            column = [lookup[number].get(field) for number in self.numbers.tolist()]
+            values = _sorted_values(list(dict.fromkeys(value for value in column if value is not None)))
+            codes = {value: code for code, value in enumerate(values)}
+            self._values[field] = values
+            self._codes[field] = np.array([-1 if value is None else codes[value] for value in column], dtype=np.int32)
+
+    def __len__(self) -> int:
+        return len(self.numbers)
+
+    def __contains__(self, number) -> bool:
+        return bool(self.contains([number])[0])
+
+    @property
+    def ranges(self) -> List[Tuple[int, int]]:
+        """(first, last) apartment number of each run of consecutive numbers."""
+        return list(zip(self._starts.tolist(), (self._stops - 1).tolist()))
+
+    def positions(self, numbers) -> np.ndarray:
+        """
+        Position of each apartment number in the index.
+
+        Args:
+            numbers: Apartment numbers (list, array or Series; None/NaN and
+                non-integer values are allowed)
+
+        Returns:
+            int64 array aligned with numbers, -1 where the number is not an
+            indexed apartment
+        """
+        values = numbers.to_numpy() if isinstance(numbers, pd.Series) else np.asarray(numbers)
+        if values.dtype.kind in 'iu':
+            return self._positions(values.astype(np.int64))
+        if values.dtype.kind != 'f':
+            # Object columns: convert each distinct value once
+            codes, distinct = pd.factorize(values)
+            distinct_positions = np.append(self.positions(pd.to_numeric(pd.Series(distinct, dtype=object),
+                                                                        errors='coerce').to_numpy(dtype=float)), -1)
+            return distinct_positions[codes]
+
+        positions = np.full(len(values), -1, dtype=np.int64)
+        whole = np.isfinite(values)
+        whole[whole] = values[whole] == np.floor(values[whole])
+        positions[whole] = self._positions(values[whole].astype(np.int64))
+        return positions
+
+    def _positions(self, numbers: np.ndarray) -> np.ndarray:
+        """positions() of an int64 array."""
+        positions = np.full(len(numbers), -1, dtype=np.int64)
+        if not len(self.numbers):
+            return positions
+        runs = np.searchsorted(self._starts, numbers, side='right') - 1
+        found = runs >= 0
+        runs = np.maximum(runs, 0)
+        found &= numbers < self._stops[runs]
+        positions[found] = self._offsets[runs[found]] + numbers[found] - self._starts[runs[found]]
+        return positions
+
+    def contains(self, numbers) -> np.ndarray:
+        """Boolean array: whether each number is an indexed apartment."""
+        return self.positions(numbers) >= 0
+
+    def values(self, field: str) -> List:
+        """Distinct values of a lookup field, sorted where they can be compared."""
+        return self._values[field]
+
+    def codes(self, field: str) -> np.ndarray:
+        """Code of each indexed apartment's value of field (position into values(field), -1 if None)."""
+        return self._codes[field]
+
+    def attributes(self, numbers, fields: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Join apartment numbers to their accommodation attributes.
+
+        Args:
+            numbers: Apartment numbers (a Series keeps its index)
+            fields: Lookup fields to return (default: all)
+
+        Returns:
+            DataFrame with one column per field, aligned with numbers; None
+            for numbers that are not indexed apartments
+        """
+        positions = self.positions(numbers)
+        indexed = positions >= 0
+        columns = {}
+        for field in fields or self.fields:
+            # Code -1 (unknown apartment or no value) picks the trailing None
+            values = np.array(self._values[field] + [None], dtype=object)
+            codes = np.full(len(positions), -1, dtype=np.int32)
+            codes[indexed] = self._codes[field][positions[indexed]]
+            columns[field] = values[codes]
+        index = numbers.index if isinstance(numbers, pd.Series) else None
+        return pd.DataFrame(columns, index=index, dtype=object)
+
+    def apartments_where(self, field: str, value) -> np.ndarray:
+        """Sorted apartment numbers whose field has value."""
+        try:
+            code = self._values[field].index(value)
+        except ValueError:
+            return self.numbers[:0]
+        return self.numbers[self._codes[field] == code]
+
+    def missing(self, numbers) -> np.ndarray:
+        """Sorted indexed apartment numbers that are not among numbers."""
+        present = np.zeros(len(self.numbers), dtype=bool)
+        positions = self.positions(numbers)
+        present[positions[positions >= 0]] = True
+        return self.numbers[~present]
+
+    def coverage(self, categorized_df: pd.DataFrame, field: str,
+                 categories: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Apartments with documents per value of an accommodation field.
+
+        Args:
+            categorized_df: Documents with 'category' and 'apartment_number'
+                columns (categorize_documents() output)
+            field: Lookup field to break down by (e.g. 'floor', 'type', 'tenure')
+            categories: Category columns, in order (default: categories found)
+
+        Returns:
+            DataFrame indexed by the field's values, with the number of
+            indexed 'apartments' per value and one column per category
+            counting the apartments with at least one document
+        """
+        positions = self.positions(categorized_df['apartment_number'])
+        category_values = categorized_df['category'].to_numpy()
+        keep = (positions >= 0) & pd.notna(category_values)
+        documents = pd.DataFrame({
+            'category': category_values[keep],
+            'position': positions[keep],
+        }).drop_duplicates()
+        documents['code'] = self._codes[field][documents['position'].to_numpy()]
+        documents = documents[documents['code'] >= 0]
+
+        codes = self._codes[field]
+        table = pd.DataFrame({'apartments': np.bincount(codes[codes >= 0], minlength=len(self._values[field]))})
+        counts = documents.groupby(['code', 'category'], sort=False).size().unstack(fill_value=0)
+        if categories is None:
+            categories = list(counts.columns)
+        table = table.join(counts.reindex(columns=categories)).fillna(0).astype(int)
+        table.index = pd.Index(self._values[field], name=field)
+        return table
+
+
+# Indexes keyed by the identity of the accommodation data they were built from
+_apartment_index_cache = {}
+
+# Shared stand-in for projects without accommodation data
+_NO_ACCOMMODATION_DATA = {}
+
+
+def get_apartment_index(accommodation_data: Dict) -> ApartmentIndex:
+    """Get the ApartmentIndex for accommodation data (built once per data dictionary).
+
+    Args:
+        accommodation_data: ACCOMMODATION_DATA (see config.get_accommodation_data)
+
+    Returns:
+        ApartmentIndex (empty if there is no numbered apartment lookup)
+    """
+    accommodation_data = accommodation_data or _NO_ACCOMMODATION_DATA
+    cached = _apartment_index_cache.get(id(accommodation_data))
+    if cached is None or cached[0] is not accommodation_data:
+        cached = (accommodation_data, ApartmentIndex(accommodation_data))
+        _apartment_index_cache[id(accommodation_data)] = cached
+    return cached[1]
@@ -0,0 +1,185 @@
+"""Document changes between consecutive snapshots.
+
+Each project's CHANGE_DETECTION settings list the columns whose changes are
+tracked (track_columns) and those to disregard (ignore_columns). Two snapshots
+are joined on Doc Ref and every document is reported as added, removed,
+revised (Rev changed), status changed, or modified (another tracked column
+changed).
+
+The join and comparison are vectorized: Doc Refs and the tracked columns of
+each row are hashed to 64-bit integers, so the snapshots are aligned on an
+integer key and only rows whose hashes differ are compared column by column.
+"""
+
+import pandas as pd
+from typing import Dict, List
+
+from config import DEFAULT_SETTINGS, get_config_fingerprint
+from data.database import DOCUMENT_COLUMNS, DOCUMENT_CHANGE_COLUMNS
+from utils.tracing import traced
+
+
+CHANGE_ADDED = 'added'
+CHANGE_REMOVED = 'removed'
+CHANGE_REVISED = 'revised'
+CHANGE_STATUS_CHANGED = 'status_changed'
+CHANGE_MODIFIED = 'modified'
+
+# Report labels, in the order changes are listed
+CHANGE_LABELS = {
+    CHANGE_ADDED: 'Added',
+    CHANGE_REMOVED: 'Removed',
+    CHANGE_REVISED: 'Revised',
+    CHANGE_STATUS_CHANGED: 'Status Changed',
+    CHANGE_MODIFIED: 'Modified',
+}
+
+# Config sections that drive change detection
+CHANGE_DETECTION_CONFIG_SECTIONS = ['CHANGE_DETECTION']
+
+KEY_COLUMN = 'Doc Ref'
+
+CHANGE_COLUMNS = [column for _, column in DOCUMENT_CHANGE_COLUMNS]
+
+
+def get_change_detection_fingerprint(config: Dict) -> str:
+    """
+    Get the fingerprint of the config sections that drive change detection.
+
+    Args:
+        config: Project configuration dictionary
+
+    Returns:
+        Fingerprint string stored alongside detected changes
+    """
+    return get_config_fingerprint(config, CHANGE_DETECTION_CONFIG_SECTIONS)
+
+
+def get_tracked_columns(config: Dict) -> List[str]:
+    """
+    Get the columns compared between snapshots.
+
+    Args:
+        config: Project configuration dictionary
+
+    Returns:
+        Stored document columns in track_columns but not ignore_columns
+        (Doc Ref is the join key, so it is never compared)
+    """
+    settings = config.get('CHANGE_DETECTION') or DEFAULT_SETTINGS['CHANGE_DETECTION']
+    ignored = set(settings.get('ignore_columns', [])) | {KEY_COLUMN}
+    tracked = [column for column in settings.get('track_columns', []) if column not in ignored]
+    stored = {column for _, column in DOCUMENT_COLUMNS}
+    return [column for column in dict.fromkeys(tracked) if column in stored]
+
+
+def _prepare_snapshot(df: pd.DataFrame, columns: List[str]) -> pd.DataFrame:
+    """Index a snapshot by hashed Doc Ref, one row per document (last row wins)."""
+    df = df[[KEY_COLUMN] + columns].astype(str)
+    df = df.drop_duplicates(KEY_COLUMN, keep='last')
+    df.index = pd.util.hash_array(df[KEY_COLUMN].to_numpy(dtype=object))
+    return df
+
+
+def _row_hashes(df: pd.DataFrame, columns: List[str]) -> pd.Series:
+    """Hash the tracked columns of each row."""
+    if not columns:
+        return pd.Series(0, index=df.index, dtype='uint64')
+    return pd.util.hash_pandas_object(df[columns], index=False).set_axis(df.index)
+
+
+@traced('change detection')
+def detect_changes(previous_df: pd.DataFrame, current_df: pd.DataFrame, config: Dict) -> pd.DataFrame:
+    """
+    Compare two snapshots of a register.
+
+    Args:
+        previous_df: Earlier snapshot with standardized document columns
+        current_df: Later snapshot with standardized document columns
+        config: Project configuration dictionary
+
+    Returns:
+        DataFrame with CHANGE_COLUMNS, one row per changed document, in
+        CHANGE_LABELS order then by Doc Ref
+    """
+    tracked = get_tracked_columns(config)
+    # Rev and Status are always carried so the report can show old and new values
+    columns = list(dict.fromkeys(['Doc Title', 'Rev', 'Status'] + tracked))
+
+    previous = _prepare_snapshot(previous_df, columns)
+    current = _prepare_snapshot(current_df, columns)
+
+    added = current.loc[current.index.difference(previous.index, sort=False)]
+    removed = previous.loc[previous.index.difference(current.index, sort=False)]
+
+    common = current.index.intersection(previous.index, sort=False)
+    old = previous.loc[common]
+    new = current.loc[common]
+    differs = (_row_hashes(old, tracked) != _row_hashes(new, tracked)).to_numpy()
+    old = old[differs]
+    new = new[differs]
+
+    # Only rows whose hashes differ are compared column by column
+    changed = pd.DataFrame({column: old[column] != new[column] for column in tracked}, index=new.index)
+    changed_columns = pd.Series('', index=new.index, dtype=object)
+    for column in tracked:
+        changed_columns = changed_columns.where(~changed[column], changed_columns + column + ', ')
+    changed_columns = changed_columns.str[:-2]
+
+    change_type = pd.Series(CHANGE_MODIFIED, index=new.index, dtype=object)
+    if 'Status' in changed:
+        change_type[changed['Status']] = CHANGE_STATUS_CHANGED
+    if 'Rev' in changed:
+        change_type[changed['Rev']] = CHANGE_REVISED
+
+    frames = [
+        pd.DataFrame({
+            'Doc Ref': added[KEY_COLUMN], 'Doc Title': added['Doc Title'], 'Change': CHANGE_ADDED,
+            'Previous Rev': '', 'Rev': added['Rev'],
+            'Previous Status': '', 'Status': added['Status'], 'Changed Columns': '',
+        }),
+        pd.DataFrame({
+            'Doc Ref': removed[KEY_COLUMN], 'Doc Title': removed['Doc Title'], 'Change': CHANGE_REMOVED,
+            'Previous Rev': removed['Rev'], 'Rev': '',
+            'Previous Status': removed['Status'], 'Status': '', 'Changed Columns': '',
+        }),
+        pd.DataFrame({
+            'Doc Ref': new[KEY_COLUMN], 'Doc Title': new['Doc Title'], 'Change': change_type,
+            'Previous Rev': old['Rev'], 'Rev': new['Rev'],
+            'Previous Status': old['Status'], 'Status': new['Status'], 'Changed Columns': changed_columns,
+        }),
+    ]
+    changes = pd.concat([frame for frame in frames if not frame.empty] or [frames[0]], ignore_index=True)
+
+    order = changes['Change'].map({change: i for i, change in enumerate(CHANGE_LABELS)})
+    changes = changes.assign(_order=order).sort_values(['_order', 'Doc Ref'], kind='stable')
+    return changes[CHANGE_COLUMNS].reset_index(drop=True)
+
+
+def format_changes(changes_df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Prepare changes for a report sheet (change types as labels).
+
+    Args:
+        changes_df: DataFrame from detect_changes or DocumentDatabase.get_document_changes
+
+    Returns:
+        Copy of changes_df with readable change labels
+    """
+    changes = changes_df[CHANGE_COLUMNS].copy()
+    changes['Change'] = changes['Change'].map(CHANGE_LABELS).fillna(changes['Change'])
+    return changes
+
+
+def summarize_changes(changes_df: pd.DataFrame) -> Dict[str, int]:
+    """
+    Count changes by type.
+
+    Args:
+        changes_df: DataFrame from detect_changes
+
+    Returns:
+        Dictionary of change type -> count (every type present, zero if none)
+    """
+    counts = changes_df['Change'].value_counts()
+    return {change: int(counts.get(change, 0)) for change in CHANGE_LABELS}
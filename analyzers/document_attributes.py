@@ -0,0 +1,90 @@
+"""Document attributes computed once at ingest and stored with each row.
+
+Classification (certificate / technical submittal / drawing / other) and
+apartment certificate attributes (category, apartment number, phase, block)
+only depend on the document and a few config sections, so they are worked
+out when a register is imported instead of on every report run.
+"""
+
+import pandas as pd
+from typing import Dict
+
+from config import get_config_fingerprint
+from data.database import ATTRIBUTE_COLUMNS
+from utils.tracing import traced
+from utils.document_filters import (
+    classify_documents,
+    CLASSIFICATION_CONFIG_SECTIONS,
+    DOC_CLASS_CERTIFICATE
+)
+from .document_tracker import categorize_documents
+
+
+CATEGORY_COLUMNS = ['category', 'apartment_number', 'phase', 'block']
+
+
+def get_classification_fingerprint(config: Dict) -> str:
+    """
+    Get the fingerprint of the config sections that drive classification.
+
+    Args:
+        config: Project configuration dictionary
+
+    Returns:
+        Fingerprint string stored alongside classified rows
+    """
+    return get_config_fingerprint(config, CLASSIFICATION_CONFIG_SECTIONS)
+
+
+@traced('classify documents')
+def compute_document_attributes(df: pd.DataFrame, config: Dict) -> pd.DataFrame:
+    """
+    Classify documents and extract apartment certificate attributes.
+
+    Apartment attributes are only extracted for certificates, matching what
+    the certificate report categorizes.
+
+    Args:
+        df: DataFrame with standardized document columns
+        config: Project configuration dictionary
+
+    Returns:
+        DataFrame with ATTRIBUTE_COLUMNS aligned with df.index
+    """
+    attributes = pd.DataFrame(None, index=df.index, columns=ATTRIBUTE_COLUMNS, dtype=object)
+    if df.empty:
+        return attributes
+
+    attributes['doc_class'] = classify_documents(df, config)
+
+    cert_tracking = config.get('CERTIFICATE_TRACKING', {})
+    apartment_certs = cert_tracking.get('apartment_certificates', {})
+    cert_mask = attributes['doc_class'] == DOC_CLASS_CERTIFICATE
+
+    if apartment_certs and cert_mask.any():
+        categorized = categorize_documents(df[cert_mask], apartment_certs, cert_tracking)
+        for column in CATEGORY_COLUMNS:
+            attributes.loc[cert_mask, column] = categorized[column]
+
+    return attributes
+
+
+def get_categorized_documents(df: pd.DataFrame, tracking_config: Dict,
+                              full_tracking_config: Dict = None) -> pd.DataFrame:
+    """
+    Get categorized certificates, reusing attributes stored at ingest.
+
+    Falls back to categorize_documents when the frame does not carry the
+    stored category columns (e.g. classification is out of date).
+
+    Args:
+        df: DataFrame containing certificate data
+        tracking_config: Configuration dictionary with category definitions
+        full_tracking_config: Full tracking configuration including phase/block detection
+
+    Returns:
+        DataFrame with 'category', 'apartment_number', 'phase' and 'block' columns
+    """
+    if df.empty or all(column in df.columns for column in CATEGORY_COLUMNS):
+        return df
+    return categorize_documents(df, tracking_config, full_tracking_config)
@@ -11,6 +11,10 @@ import pandas as pd
 import re
 from typing import Dict, List, Tuple, Optional
 
+from .apartment_index import get_apartment_index
+from utils.folders import document_folder_attributes, parse_folder
+from utils.tracing import traced
+
 
 def extract_apartment_number(doc_title: str, doc_ref: str = "", doc_path: str = "", category: str = None) -> Optional[int]:
     """
@@ -67,12 +71,14 @@ def extract_apartment_number(doc_title: str, doc_ref: str = "", doc_path: str =
     # For Greenwich Peninsula: 
     # - Landlord/communal certs: \18.XX\Landlords\ (EXCLUDE these)
     # - Apartment certificates: \18.XX\Block - X\ (INCLUDE these - any cert type folder within blocks)
-    if '\\Landlords\\' in doc_path or '/Landlords/' in doc_path:
+    # Folder attributes are parsed once per folder (see utils/folders.py)
+    landlords, block, _ = parse_folder(doc_path)
+    if landlords:
         return None
     
     # Only process documents that are in block-specific folders (apartment certificates)
     # Must be in format: \18.XX\Block - X\ (where X is A, B, C, D, E, F, G)
-    if not re.search(r'\\Block\s*-\s*[A-G]\\', doc_path):
+    if block is None:
         return None
     
     # GENERIC APPROACH: For all certificates in block folders, we're more lenient
@@ -200,6 +206,7 @@ def extract_block(doc_title: str, doc_ref: str, doc_path: str, block_detection_c
     return None
 
 
+@traced('tracker.categorize')
 def categorize_documents(df: pd.DataFrame, tracking_config: Dict, full_tracking_config: Dict = None) -> pd.DataFrame:
     """
     Categorize documents based on tracking configuration.
@@ -296,6 +303,7 @@ def categorize_documents(df: pd.DataFrame, tracking_config: Dict, full_tracking_
     return result_df
 
 
+@traced('tracker.uncategorized')
 def get_uncategorized_certificates_in_blocks(all_certificates_df: pd.DataFrame, 
                                               categorized_df: pd.DataFrame) -> pd.DataFrame:
     """
@@ -313,25 +321,14 @@ def get_uncategorized_certificates_in_blocks(all_certificates_df: pd.DataFrame,
     if 'Doc Path' not in all_certificates_df.columns:
         return pd.DataFrame()
     
-    # Pattern to detect block folders: \18.XX\Block - X\
-    in_block_folders = all_certificates_df[
-        all_certificates_df['Doc Path'].fillna('').astype(str).str.contains(
-            r'\\Block\s*-\s*[A-G]\\', 
-            case=False, 
-            na=False, 
-            regex=True
-        )
-    ].copy()
-    
-    # Exclude documents that are in Landlords folders (communal certificates)
-    in_block_folders = in_block_folders[
-        ~in_block_folders['Doc Path'].fillna('').astype(str).str.contains(
-            r'\\Landlords\\',
-            case=False,
-            na=False,
-            regex=True
-        )
-    ]
+    # Certificates in block folders (\18.XX\Block - X\), excluding Landlords
+    # folders (communal certificates). Stored documents carry the attributes
+    # of their folder from the folders table
+    folders = document_folder_attributes(all_certificates_df)
+    in_block_mask = (folders['block'].notna() & ~folders['landlords']).to_numpy()
+    in_block_folders = all_certificates_df[in_block_mask].copy()
+    # Block information for reporting
+    in_block_folders['extracted_block'] = folders['block'].to_numpy()[in_block_mask]
     
     if in_block_folders.empty:
         return pd.DataFrame()
@@ -340,17 +337,10 @@ def get_uncategorized_certificates_in_blocks(all_certificates_df: pd.DataFrame,
     categorized_indices = categorized_df[categorized_df['category'].notna()].index
     uncategorized = in_block_folders[~in_block_folders.index.isin(categorized_indices)].copy()
     
-    # Extract block information for reporting
-    def extract_block_from_path(path):
-        match = re.search(r'\\Block\s*-\s*([A-G])\\', str(path), re.IGNORECASE)
-        return match.group(1).upper() if match else 'Unknown'
-    
-    if not uncategorized.empty:
-        uncategorized['extracted_block'] = uncategorized['Doc Path'].apply(extract_block_from_path)
-    
     return uncategorized
 
 
+@traced('tracker.category progress')
 def calculate_category_progress(categorized_df: pd.DataFrame, tracking_config: Dict, 
                                 accommodation_data: Dict = None) -> Dict:
     """
@@ -438,6 +428,7 @@ def get_overall_progress(progress_stats: Dict) -> Dict:
     }
 
 
+@traced('tracker.phase/block progress')
 def calculate_progress_by_phase_block(categorized_df: pd.DataFrame, tracking_config: Dict, 
                                       full_tracking_config: Dict, accommodation_data: Dict = None) -> Dict:
     """
@@ -521,6 +512,7 @@ def calculate_progress_by_phase_block(categorized_df: pd.DataFrame, tracking_con
     return phase_block_progress
 
 
+@traced('tracker.apartment summary')
 def get_apartment_certificate_summary(categorized_df: pd.DataFrame, tracking_config: Dict, 
                                       full_tracking_config: Dict = None, accommodation_data: Dict = None) -> Dict:
     """
@@ -530,6 +522,8 @@ def get_apartment_certificate_summary(categorized_df: pd.DataFrame, tracking_con
         categorized_df: DataFrame with categorized documents
         tracking_config: Configuration dictionary
         full_tracking_config: Full tracking configuration including phase/block definitions (optional)
+        accommodation_data: Accommodation data from config (optional, provides accurate counts
+            and the apartments missing documents)
         
     Returns:
         Dictionary with detailed apartment certificate summary
@@ -540,6 +534,9 @@ def get_apartment_certificate_summary(categorized_df: pd.DataFrame, tracking_con
     # Get overall progress
     overall_progress = get_overall_progress(progress_stats)
     
+    # Scheduled apartments, to list the ones without documents
+    apartment_index = get_apartment_index(accommodation_data)
+    
     # Get apartment-level details
     apartment_details = {}
     for category_name in tracking_config.keys():
@@ -555,7 +552,7 @@ def get_apartment_certificate_summary(categorized_df: pd.DataFrame, tracking_con
         
         apartment_details[category_name] = {
             'apartments_with_docs': sorted(apartment_groups.index.tolist()),
-            'apartments_missing': [],  # Could be calculated if we had the full apartment list
+            'apartments_missing': apartment_index.missing(apartment_groups.index).tolist(),
             'documents_per_apartment': apartment_groups.to_dict()
         }
     
@@ -1,11 +1,12 @@
 """Dynamic counting for report generation - calculates counts on-the-fly from filtered data."""
 
 import pandas as pd
-from utils.data_cleaning import clean_revision
-from utils.status_mapping import get_grouped_status_counts
+from utils.tracing import traced
+from .snapshot_profile import build_snapshot_profile
 
 
-def get_dynamic_counts(df, config):
+@traced('counting.dynamic counts')
+def get_dynamic_counts(df, config, profile=None):
     """
     Calculate counts dynamically from a filtered dataset.
     
@@ -15,6 +16,7 @@ def get_dynamic_counts(df, config):
     Args:
         df: Filtered DataFrame (e.g., only drawings, or only certificates)
         config: Project configuration
+        profile: Optional SnapshotProfile already built from df
         
     Returns:
         dict: Three datasets in the format that reports expect:
@@ -22,66 +24,21 @@ def get_dynamic_counts(df, config):
             - 'status_counts': {Status_A: 100, Status_B: 20, ...}
             - 'file_type_counts': {FileType_DR: 80, FileType_SH: 20, ...}
     """
-    if df.empty:
-        return {
-            'revision_counts': {},
-            'status_counts': {},
-            'file_type_counts': {}
-        }
-    
-    # Clean revisions
-    if 'Rev' in df.columns:
-        df = df.copy()  # Don't modify original
-        df['Rev'] = df['Rev'].apply(clean_revision)
-    
-    # 1. Count revisions
-    revision_counts = {}
-    if 'Rev' in df.columns:
-        rev_value_counts = df['Rev'].value_counts()
-        for rev, count in rev_value_counts.items():
-            revision_counts[f'Rev_{rev}'] = int(count)
-    
-    # 2. Count statuses (with grouping from STATUS_MAPPINGS)
-    status_counts = {}
-    if 'Status' in df.columns:
-        if config and 'STATUS_MAPPINGS' in config:
-            # Use project-specific status mappings to group statuses
-            grouped_counts = get_grouped_status_counts(df['Status'], config)
-            for category, count in grouped_counts.items():
-                if count > 0:
-                    status_counts[f'Status_{category}'] = int(count)
-        else:
-            # Fallback: count raw status values
-            status_value_counts = df['Status'].value_counts()
-            for status, count in status_value_counts.items():
-                status_counts[f'Status_{status}'] = int(count)
-    
-    # 3. Count file types
-    file_type_counts = {}
-    
-    # Try different file type column names
-    file_type_col = None
-    if 'File Type' in df.columns:
-        file_type_col = 'File Type'
-    elif 'OVL - File Type' in df.columns:
-        file_type_col = 'OVL - File Type'
-    elif 'Form' in df.columns:
-        file_type_col = 'Form'
-    
-    if file_type_col:
-        ft_value_counts = df[file_type_col].value_counts()
-        for file_type, count in ft_value_counts.items():
-            if pd.notna(file_type):
-                file_type_counts[f'FileType_{file_type}'] = int(count)
-    
-    return {
-        'revision_counts': revision_counts,
-        'status_counts': status_counts,
-        'file_type_counts': file_type_counts
-    }
+    if profile is None:
+        if df.empty:
+            return {
+                'revision_counts': {},
+                'status_counts': {},
+                'file_type_counts': {}
+            }
+        
+        # Revisions are cleaned and statuses grouped (STATUS_MAPPINGS) in the profile
+        profile = build_snapshot_profile(df, config)
+    
+    return profile.dynamic_counts()
 
 
-def create_summary_row(date, time, df, config):
+def create_summary_row(date, time, df, config, profile=None):
     """
     Create a single summary row for a snapshot (mimics database summary table row).
     
@@ -90,13 +47,15 @@ def create_summary_row(date, time, df, config):
     Args:
         date: Date string (DD-MMM-YYYY format)
         time: Time string (HH:MM format)
-        df: Filtered DataFrame for this snapshot
+        df: Filtered DataFrame for this snapshot (may be None when profile is given)
         config: Project configuration
+        profile: Optional SnapshotProfile already built from df, or aggregated in
+            the database (see build_snapshot_profile_from_database)
         
     Returns:
         dict: Summary row with all counts (ready to add to DataFrame)
     """
-    counts_dict = get_dynamic_counts(df, config)
+    counts_dict = get_dynamic_counts(df, config, profile)
     
     # Combine all counts into a single row
     row = {
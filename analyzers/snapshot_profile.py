@@ -0,0 +1,234 @@
+"""Snapshot profile - every count a report section needs, aggregated in one pass.
+
+A profile groups a snapshot's documents once by revision, status and file type
+(plus any extra columns such as certificate category). Summary rows, progression
+status sections, pie charts and revision summaries then read from the small
+aggregated table instead of re-filtering the raw documents.
+"""
+
+import pandas as pd
+from typing import Dict, List, Optional
+
+from utils.data_cleaning import clean_revision
+from utils.revisions import parse_revision
+from utils.status_mapping import get_status_mapper, StatusMapper
+from utils.tracing import traced
+
+
+# File type columns checked in order (standardized name first)
+FILE_TYPE_COLUMNS = ['File Type', 'OVL - File Type', 'Form']
+
+
+class SnapshotProfile:
+    """Aggregated revision/status/file type counts for one snapshot."""
+
+    def __init__(self, counts: pd.DataFrame, config: Dict, file_type_column: str = None):
+        """
+        Args:
+            counts: Aggregated table with 'revision', 'status', 'file_type', any
+                extra group columns and 'count', in first-appearance order
+            config: Project configuration
+            file_type_column: Source column the file types were read from
+        """
+        self.counts = counts
+        self.config = config
+        self.file_type_column = file_type_column
+        self.status_mapper = get_status_mapper(config)
+        self.total = int(counts['count'].sum()) if not counts.empty else 0
+        self._crosstabs = {}
+
+    @property
+    def empty(self) -> bool:
+        return self.total == 0
+
+    def _value_counts(self, column: str) -> pd.Series:
+        """Counts per value of a column, ordered like Series.value_counts()."""
+        counts = self.counts.dropna(subset=[column])
+        totals = counts.groupby(column, sort=False)['count'].sum()
+        return totals.sort_values(ascending=False, kind='stable')
+
+    def revision_counts(self) -> Dict[str, int]:
+        """Document count per (cleaned) revision."""
+        return {rev: int(count) for rev, count in self._value_counts('revision').items()}
+
+    def status_counts(self) -> Dict[str, int]:
+        """Document count per status category (raw statuses if no STATUS_MAPPINGS)."""
+        if self.status_mapper is None:
+            return {status: int(count) for status, count in self._value_counts('status').items()}
+
+        grouped_counts = dict.fromkeys(self.status_mapper.category_order(), 0)
+        if 'status_category' in self.counts.columns:
+            # Categories already joined in by the database (see DocumentDatabase.get_snapshot_counts)
+            for category, count in self._value_counts('status_category').items():
+                grouped_counts[category] += count
+        else:
+            for status_value, count in self._value_counts('status').items():
+                category = self.status_mapper.lookup.get(status_value, self.status_mapper.unmapped_category)
+                grouped_counts[category] += count
+        return {k: int(v) for k, v in grouped_counts.items() if v > 0}
+
+    def file_type_counts(self) -> Dict[str, int]:
+        """Document count per file type (missing file types skipped)."""
+        return {ft: int(count) for ft, count in self._value_counts('file_type').items()}
+
+    def dynamic_counts(self) -> Dict[str, Dict[str, int]]:
+        """Counts in the get_dynamic_counts() format."""
+        return {
+            'revision_counts': {f'Rev_{rev}': count for rev, count in self.revision_counts().items()},
+            'status_counts': {f'Status_{status}': count for status, count in self.status_counts().items()},
+            'file_type_counts': {f'FileType_{ft}': count for ft, count in self.file_type_counts().items()}
+        }
+
+    def status_crosstab(self, by: str = 'family', fold_unmapped: bool = True,
+                        status_mapper: StatusMapper = None) -> pd.DataFrame:
+        """
+        Status category x group counts.
+
+        Args:
+            by: 'family' (P/C...), 'revision', or any extra group column
+            fold_unmapped: See StatusMapper.map_series
+            status_mapper: Override the config's mapper (e.g. PROGRESSION_STATUS_ORDER fallback)
+
+        Returns:
+            DataFrame with one row per category and one column per group value
+        """
+        mapper = status_mapper or self.status_mapper
+        cache_key = (by, fold_unmapped, id(mapper))
+        if cache_key in self._crosstabs:
+            return self._crosstabs[cache_key]
+
+        counts = self.counts.dropna(subset=['status'])
+        if mapper is None:
+            categories = counts['status']
+            order = None
+        else:
+            categories = mapper.map_series(counts['status'], fold_unmapped)
+            order = mapper.category_order(fold_unmapped)
+
+        table = counts.assign(status_category=categories).pivot_table(
+            index='status_category', columns=by, values='count', aggfunc='sum', fill_value=0
+        ) if not counts.empty else pd.DataFrame()
+
+        if order is not None:
+            table = table.reindex(order, fill_value=0)
+        table = table.fillna(0).astype(int)
+        self._crosstabs[cache_key] = table
+        return table
+
+    def category_total(self, category: str, fold_unmapped: bool = False,
+                       status_mapper: StatusMapper = None) -> int:
+        """Total documents whose status maps to category."""
+        mapper = status_mapper or self.status_mapper
+        counts = self.counts.dropna(subset=['status'])
+        if mapper is None:
+            categories = counts['status']
+        else:
+            categories = mapper.map_series(counts['status'], fold_unmapped)
+        return int(counts.loc[categories == category, 'count'].sum())
+
+    def grouped_status_counts(self, by: str, values: List) -> Dict[str, int]:
+        """Status category counts summed over the given group values (zeros dropped)."""
+        table = self.status_crosstab(by)
+        columns = [value for value in values if value in table.columns]
+        totals = table[columns].sum(axis=1)
+        return {category: int(count) for category, count in totals.items() if count > 0}
+
+    def status_count(self, category: str, by: str, value, fold_unmapped: bool = False,
+                     status_mapper: StatusMapper = None) -> int:
+        """Documents with statuses explicitly mapped to category within one group value."""
+        table = self.status_crosstab(by, fold_unmapped, status_mapper)
+        if category in table.index and value in table.columns:
+            return int(table.at[category, value])
+        return 0
+
+
+@traced('counting.snapshot profile')
+def build_snapshot_profile(df: pd.DataFrame, config: Dict, extra_columns: List[str] = None) -> SnapshotProfile:
+    """
+    Aggregate a snapshot's documents in a single groupby.
+
+    Args:
+        df: Filtered DataFrame for the snapshot (e.g. main report documents)
+        config: Project configuration
+        extra_columns: Additional columns to keep as group keys (e.g. ['category'])
+
+    Returns:
+        SnapshotProfile
+    """
+    extra_columns = [col for col in (extra_columns or []) if col in df.columns]
+    key_columns = ['revision', 'status', 'file_type'] + extra_columns
+
+    if df.empty:
+        return SnapshotProfile(pd.DataFrame(columns=key_columns + ['count', 'family', 'number']), config)
+
+    file_type_col = next((col for col in FILE_TYPE_COLUMNS if col in df.columns), None)
+    keys = pd.DataFrame({
+        'revision': df['Rev'] if 'Rev' in df.columns else None,
+        'status': df['Status'] if 'Status' in df.columns else None,
+        'file_type': df[file_type_col] if file_type_col else None,
+        **{col: df[col] for col in extra_columns}
+    }, index=df.index)
+
+    counts = keys.groupby(key_columns, sort=False, dropna=False).size().reset_index(name='count')
+    return _finish_profile(counts, config, file_type_col, has_revisions='Rev' in df.columns)
+
+
+@traced('counting.database profile')
+def build_snapshot_profile_from_database(db, project_name: str, snapshot_date: str, snapshot_time: str,
+                                         doc_class: str, config: Dict) -> SnapshotProfile:
+    """
+    Aggregate a snapshot's documents with a GROUP BY in the database.
+
+    Gives the same profile as build_snapshot_profile on the documents of the
+    stored doc_class, without loading them as a DataFrame - for use when the
+    project's stored classification is current.
+
+    Args:
+        db: DocumentDatabase
+        project_name: Name of the project
+        snapshot_date: Date in YYYY-MM-DD format
+        snapshot_time: Time in HH:MM format
+        doc_class: Stored document class or MAIN_REPORT_CLASS
+        config: Project configuration
+
+    Returns:
+        SnapshotProfile
+    """
+    mapper = get_status_mapper(config)
+    counts = db.get_snapshot_counts(
+        project_name, snapshot_date, snapshot_time, doc_class,
+        status_lookup=mapper.lookup if mapper else None,
+        unmapped_category=mapper.unmapped_category if mapper else None
+    )
+    if counts.empty:
+        return build_snapshot_profile(pd.DataFrame(), config)
+    return _finish_profile(counts, config, FILE_TYPE_COLUMNS[0], has_revisions=True)
+
+
+def _finish_profile(counts: pd.DataFrame, config: Dict, file_type_col: Optional[str],
+                    has_revisions: bool) -> SnapshotProfile:
+    """Add cleaned revisions and revision keys to aggregated counts.
+
+    Counts from the database carry the revision keys parsed at ingest
+    (rev_family/rev_number); only groups without them are parsed here.
+    """
+    # Clean revisions once per distinct value rather than per document
+    if has_revisions:
+        counts['revision'] = counts['revision'].map(clean_revision)
+        if 'rev_family' in counts.columns:
+            counts = counts.rename(columns={'rev_family': 'family', 'rev_number': 'number'})
+            counts = counts.drop(columns='rev_suffix')
+            missing = counts['family'].isna()
+        else:
+            counts['family'] = None
+            counts['number'] = None
+            missing = pd.Series(True, index=counts.index)
+        if missing.any():
+            revision_keys = counts.loc[missing, 'revision'].map(parse_revision)
+            counts.loc[missing, 'family'] = revision_keys.str[0]
+            counts.loc[missing, 'number'] = revision_keys.str[1]
+    else:
+        counts['family'] = None
+        counts['number'] = None
+
+    return SnapshotProfile(counts, config, file_type_col)
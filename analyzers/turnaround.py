@@ -0,0 +1,140 @@
+"""Turnaround times from the document history.
+
+The document history (DocumentDatabase.update_document_history) records the
+spans of consecutive snapshots in which a document kept the same revision and
+status. A span is complete once the document is seen with another revision or
+status (or has left the register); its duration runs from the first snapshot
+it was seen in to the snapshot after its last one. Spans still current in the
+latest snapshot are open and aged up to that snapshot.
+
+Spans already under way in the project's first snapshot have no known start,
+so they are left out of the completed durations.
+"""
+
+import pandas as pd
+from typing import Dict
+
+from utils.revisions import revision_family
+from utils.status_mapping import get_status_mapper
+from utils.tracing import traced
+
+
+TURNAROUND_COLUMNS = ['Completed', 'Median Days', 'Mean Days', 'Longest Days',
+                      'Open', 'Median Open Days', 'Longest Open Days']
+
+# Report labels for revision families
+REVISION_FAMILY_LABELS = {'P': 'P revisions', 'C': 'C revisions', 'other': 'Other revisions'}
+
+
+def _span_days(spans: pd.DataFrame, snapshots: pd.DataFrame) -> pd.DataFrame:
+    """Add 'since', 'days', 'open' and 'known_start' columns to history spans."""
+    dates = pd.Series(pd.to_datetime(snapshots['snapshot_date']).to_numpy(), index=snapshots['id'])
+    next_dates = pd.Series(dates.to_numpy()[1:], index=dates.index[:-1])
+
+    since = spans['first_snapshot_id'].map(dates)
+    ended = spans['last_snapshot_id'].map(next_dates)
+    return spans.assign(
+        since=since,
+        days=(ended.fillna(dates.iloc[-1]) - since).dt.days,
+        open=ended.isna(),
+        known_start=spans['first_snapshot_id'] != dates.index[0],
+    )
+
+
+def _summarize_days(spans: pd.DataFrame, group_column: str, order) -> pd.DataFrame:
+    """Aggregate completed and open span durations per group."""
+    completed = spans[~spans['open'] & spans['known_start']].groupby(group_column)['days']
+    still_open = spans[spans['open']].groupby(group_column)['days']
+    table = pd.DataFrame({
+        'Completed': completed.size(),
+        'Median Days': completed.median(),
+        'Mean Days': completed.mean().round(1),
+        'Longest Days': completed.max(),
+        'Open': still_open.size(),
+        'Median Open Days': still_open.median(),
+        'Longest Open Days': still_open.max(),
+    })
+    table = table.reindex([group for group in order if group in table.index])
+    table[['Completed', 'Open']] = table[['Completed', 'Open']].fillna(0).astype(int)
+    return table
+
+
+def _status_categories(statuses: pd.Series, config: Dict):
+    """Status categories (configured order) for raw statuses, or the statuses themselves."""
+    mapper = get_status_mapper(config)
+    if mapper is None:
+        return statuses, sorted(statuses.dropna().unique())
+    return mapper.map_series(statuses), mapper.category_order()
+
+
+@traced('turnaround.status')
+def calculate_status_turnaround(spans: pd.DataFrame, snapshots: pd.DataFrame, config: Dict) -> pd.DataFrame:
+    """
+    How long documents stay in each status category.
+
+    Args:
+        spans: DataFrame from DocumentDatabase.get_history_spans
+        snapshots: DataFrame from DocumentDatabase.get_snapshot_index
+        config: Project configuration dictionary (STATUS_MAPPINGS)
+
+    Returns:
+        DataFrame with a 'Status' column and TURNAROUND_COLUMNS, one row per
+        status category in configured order
+    """
+    spans = _span_days(spans, snapshots)
+    spans['category'], order = _status_categories(spans['status'], config)
+    table = _summarize_days(spans, 'category', order)
+    return table.rename_axis('Status').reset_index()
+
+
+@traced('turnaround.revision')
+def calculate_revision_turnaround(spans: pd.DataFrame, snapshots: pd.DataFrame) -> pd.DataFrame:
+    """
+    How long a revision stays current before the next one is issued.
+
+    Args:
+        spans: DataFrame from DocumentDatabase.get_history_spans
+        snapshots: DataFrame from DocumentDatabase.get_snapshot_index
+
+    Returns:
+        DataFrame with a 'Revisions' column and TURNAROUND_COLUMNS, one row per
+        revision family (P, C, other)
+    """
+    # Status changes within a revision don't end it
+    revisions = spans.groupby(['doc_ref', 'revision'], dropna=False, sort=False).agg(
+        first_snapshot_id=('first_snapshot_id', 'min'),
+        last_snapshot_id=('last_snapshot_id', 'max'),
+    ).reset_index()
+    revisions = _span_days(revisions, snapshots)
+    revisions['family'] = revisions['revision'].fillna('').map(revision_family)
+    table = _summarize_days(revisions, 'family', list(REVISION_FAMILY_LABELS))
+    table.index = table.index.map(REVISION_FAMILY_LABELS)
+    return table.rename_axis('Revisions').reset_index()
+
+
+def get_open_status_ages(spans: pd.DataFrame, snapshots: pd.DataFrame, config: Dict) -> pd.DataFrame:
+    """
+    How long each document in the latest snapshot has had its current revision and status.
+
+    Args:
+        spans: DataFrame from DocumentDatabase.get_history_spans
+        snapshots: DataFrame from DocumentDatabase.get_snapshot_index
+        config: Project configuration dictionary (STATUS_MAPPINGS)
+
+    Returns:
+        DataFrame with 'Doc Ref', 'Rev', 'Status', 'Status Category', 'Since'
+        and 'Days', longest first ('Since' is the first snapshot date for
+        documents unchanged since the project's first snapshot)
+    """
+    spans = _span_days(spans, snapshots)
+    spans = spans[spans['open']]
+    categories, _ = _status_categories(spans['status'], config)
+    ages = pd.DataFrame({
+        'Doc Ref': spans['doc_ref'],
+        'Rev': spans['revision'],
+        'Status': spans['status'],
+        'Status Category': categories,
+        'Since': spans['since'].dt.strftime('%Y-%m-%d'),
+        'Days': spans['days'],
+    })
+    return ages.sort_values(['Days', 'Doc Ref'], ascending=[False, True], kind='stable').reset_index(drop=True)
@@ -1,8 +1,9 @@
 import os
+import hashlib
+import json
 from pathlib import Path
 import importlib.util
 import sys
-import pandas as pd
 
 # Base directories
 BASE_DIR = Path(__file__).parent
@@ -10,10 +11,23 @@ INPUT_DIR = BASE_DIR / "input"
 DATA_DIR = BASE_DIR / "data"
 REPORTS_DIR = BASE_DIR / "reports"
 CONFIGS_DIR = BASE_DIR / "configs"
+# Accommodation data files written by scripts/update_accommodation_data.py
+ACCOMMODATION_DIR = DATA_DIR / "accommodation"
 
-# Create directories if they don't exist
-for directory in [INPUT_DIR, DATA_DIR, REPORTS_DIR, CONFIGS_DIR]:
-    directory.mkdir(exist_ok=True)
+
+def ensure_directories():
+    """Create the input/data/reports/configs directories if they don't exist.
+    
+    Called by the entry points (main.py, scripts/db_manager.py) rather than on
+    import, so importing config has no side effects.
+    """
+    for directory in [INPUT_DIR, DATA_DIR, REPORTS_DIR, CONFIGS_DIR]:
+        directory.mkdir(exist_ok=True)
+
+
+# Report worker processes for parallel report generation (reports/scheduler.py).
+# None = one per CPU; 1 = run report jobs one after another in this process
+REPORT_WORKERS = None
 
 # Project detection settings
 PROJECT_CODES = {
@@ -26,6 +40,8 @@ PROJECT_CODES = {
 
 def detect_project_from_file(file_path):
     """Detect project from the Doc Ref in the Excel file or CSV file."""
+    import pandas as pd
+    
     try:
         file_path_str = str(file_path).lower()
         
@@ -113,6 +129,7 @@ def load_project_config(project_name, input_file=None):
         'CERTIFICATE_SETTINGS': module.CERTIFICATE_SETTINGS if hasattr(module, 'CERTIFICATE_SETTINGS') else DEFAULT_SETTINGS.get('CERTIFICATE_SETTINGS', {}),
         'CERTIFICATE_TRACKING': module.CERTIFICATE_TRACKING if hasattr(module, 'CERTIFICATE_TRACKING') else DEFAULT_SETTINGS.get('CERTIFICATE_TRACKING', {}),
         'ACCOMMODATION_DATA': module.ACCOMMODATION_DATA if hasattr(module, 'ACCOMMODATION_DATA') else DEFAULT_SETTINGS.get('ACCOMMODATION_DATA', {}),
+        'ACCOMMODATION_DATA_FILE': str(ACCOMMODATION_DIR / f"{project_name}.json"),
         'DRAWING_SETTINGS': module.DRAWING_SETTINGS if hasattr(module, 'DRAWING_SETTINGS') else DEFAULT_SETTINGS.get('DRAWING_SETTINGS', {}),
         'TECHNICAL_SUBMITTAL_SETTINGS': module.TECHNICAL_SUBMITTAL_SETTINGS if hasattr(module, 'TECHNICAL_SUBMITTAL_SETTINGS') else DEFAULT_SETTINGS.get('TECHNICAL_SUBMITTAL_SETTINGS', {}),
         'PROJECT_TITLE': getattr(module, 'PROJECT_TITLE', project_name),
@@ -123,6 +140,45 @@ def load_project_config(project_name, input_file=None):
     }
     return settings
 
+def get_accommodation_data(config):
+    """Get a project's accommodation data (phases, blocks, apartment lookup).
+    
+    Configs that still define ACCOMMODATION_DATA use it; otherwise the data
+    file written by scripts/update_accommodation_data.py is read, the first
+    time it is needed.
+    
+    Args:
+        config: Project configuration dictionary
+        
+    Returns:
+        dict: ACCOMMODATION_DATA, empty if the project has none. Shared
+        between callers, so don't modify it.
+    """
+    if config.get('ACCOMMODATION_DATA'):
+        return config['ACCOMMODATION_DATA']
+    data_file = config.get('ACCOMMODATION_DATA_FILE')
+    if not data_file:
+        return {}
+    from data.accommodation import load_accommodation_data
+    return load_accommodation_data(data_file) or {}
+
+def get_config_fingerprint(config, sections):
+    """Get a stable fingerprint of selected configuration sections.
+    
+    Used to detect when data derived from the config (e.g. stored document
+    classifications) is out of date.
+    
+    Args:
+        config: Project configuration dictionary
+        sections: Names of the config sections to include
+        
+    Returns:
+        str: Hex digest that changes whenever any of the sections change
+    """
+    payload = {section: config.get(section) for section in sorted(sections)}
+    serialized = json.dumps(payload, sort_keys=True, default=str)
+    return hashlib.sha1(serialized.encode('utf-8')).hexdigest()
+
 # Default settings (used if no project is specified)
 DEFAULT_SETTINGS = {
     'EXCEL_SETTINGS': {
@@ -156,7 +212,8 @@ DEFAULT_SETTINGS = {
         "weekly_summary": True,
         "change_report": True,
         "output_format": "excel",
-        "include_charts": True
+        "include_charts": True,
+        "writer_backend": "write_only"  # 'write_only' (streamed data sheets) or 'openpyxl' - see reports/writers.py
     },
     'FILE_TYPE_SETTINGS': {
         "column_name": "File Type",  # Default file type column name
@@ -143,898 +143,10 @@ ACCOMMODATION_SCHEDULE_CONFIG = {
     }
 }
 
-# Accommodation Data (Auto-generated - DO NOT EDIT MANUALLY)
-# Run scripts/update_accommodation_data.py to regenerate this section
+# Accommodation data is stored in data/accommodation/HollowayPark.json
+# Run scripts/update_accommodation_data.py to regenerate it
 
 
-
-
-# Accommodation Data - Auto-generated by update_accommodation_data.py
-# Last updated: 2025-10-21
-# Source: HP Accommodation Schedule 201025.xlsx
-ACCOMMODATION_DATA = {
-    'total_apartments': 429,
-    'last_updated': '2025-10-21',
-    'source_file': 'HP Accommodation Schedule 201025.xlsx',
-    
-    'phases': {
-        'C': {
-            'apartment_count': 155,
-            'apartments': ['C1-01-01', 'C1-01-02', 'C1-01-03', 'C1-01-04', 'C1-01-05', 'C1-01-06', 'C1-01-07', 'C1-02-01', 'C1-02-02', 'C1-02-03', 'C1-02-04', 'C1-02-05', 'C1-02-06', 'C1-02-07', 'C1-02-08', 'C1-03-01', 'C1-03-02', 'C1-03-03', 'C1-03-04', 'C1-03-05', 'C1-03-06', 'C1-03-07', 'C1-03-08', 'C1-04-01', 'C1-04-02', 'C1-04-03', 'C1-04-04', 'C1-04-05', 'C1-04-06', 'C1-04-07', 'C1-04-08', 'C1-05-01', 'C1-05-02', 'C1-05-03', 'C1-05-04', 'C1-05-05', 'C1-05-06', 'C1-05-07', 'C1-05-08', 'C1-06-01', 'C1-06-02', 'C1-06-03', 'C1-06-04', 'C1-06-05', 'C1-06-06', 'C1-06-07', 'C1-06-08', 'C1-07-01', 'C1-07-02', 'C1-07-03', 'C1-07-04', 'C1-07-05', 'C1-07-06', 'C1-07-07', 'C1-07-08', 'C1-08-01', 'C1-08-02', 'C1-08-03', 'C1-08-04', 'C1-08-05', 'C1-08-06', 'C1-08-07', 'C1-08-08', 'C1-09-01', 'C1-09-02', 'C1-09-03', 'C1-09-04', 'C1-09-05', 'C1-09-06', 'C1-09-07', 'C1-09-08', 'C1-10-01', 'C1-10-02', 'C1-10-03', 'C1-10-04', 'C1-10-05', 'C1-10-06', 'C1-10-07', 'C1-10-08', 'C1-11-01', 'C1-11-02', 'C1-11-03', 'C1-11-04', 'C1-11-05', 'C1-11-06', 'C1-12-01', 'C1-12-02', 'C1-12-03', 'C1-12-04', 'C2-01-01', 'C2-01-02', 'C2-01-03', 'C2-01-04', 'C2-01-05', 'C2-01-06', 'C2-01-07', 'C2-01-08', 'C2-02-01', 'C2-02-02', 'C2-02-03', 'C2-02-04', 'C2-02-05', 'C2-02-06', 'C2-02-07', 'C2-02-08', 'C2-03-01', 'C2-03-02', 'C2-03-03', 'C2-03-04', 'C2-03-05', 'C2-03-06', 'C2-03-07', 'C2-03-08', 'C2-04-01', 'C2-04-02', 'C2-04-03', 'C2-04-04', 'C2-04-05', 'C2-04-06', 'C2-04-07', 'C2-04-08', 'C2-05-01', 'C2-05-02', 'C2-05-03', 'C2-05-04', 'C2-05-05', 'C2-05-06', 'C2-05-07', 'C2-05-08', 'C2-06-01', 'C2-06-02', 'C2-06-03', 'C2-06-04', 'C2-06-05', 'C2-06-06', 'C2-06-07', 'C2-06-08', 'C2-07-01', 'C2-07-02', 'C2-07-03', 'C2-07-04', 'C2-07-05', 'C2-07-06', 'C2-07-07', 'C2-07-08', 'C2-08-01', 'C2-08-02', 'C2-08-03', 'C2-08-04', 'C2-08-05', 'C2-08-06', 'C2-09-01', 'C2-09-02', 'C2-09-03', 'C2-09-04'],
-            'blocks': {
-                'C-1': {
-                    'apartment_count': 89,
-                    'apartments': ['C1-01-01', 'C1-01-02', 'C1-01-03', 'C1-01-04', 'C1-01-05', 'C1-01-06', 'C1-01-07', 'C1-02-01', 'C1-02-02', 'C1-02-03', 'C1-02-04', 'C1-02-05', 'C1-02-06', 'C1-02-07', 'C1-02-08', 'C1-03-01', 'C1-03-02', 'C1-03-03', 'C1-03-04', 'C1-03-05', 'C1-03-06', 'C1-03-07', 'C1-03-08', 'C1-04-01', 'C1-04-02', 'C1-04-03', 'C1-04-04', 'C1-04-05', 'C1-04-06', 'C1-04-07', 'C1-04-08', 'C1-05-01', 'C1-05-02', 'C1-05-03', 'C1-05-04', 'C1-05-05', 'C1-05-06', 'C1-05-07', 'C1-05-08', 'C1-06-01', 'C1-06-02', 'C1-06-03', 'C1-06-04', 'C1-06-05', 'C1-06-06', 'C1-06-07', 'C1-06-08', 'C1-07-01', 'C1-07-02', 'C1-07-03', 'C1-07-04', 'C1-07-05', 'C1-07-06', 'C1-07-07', 'C1-07-08', 'C1-08-01', 'C1-08-02', 'C1-08-03', 'C1-08-04', 'C1-08-05', 'C1-08-06', 'C1-08-07', 'C1-08-08', 'C1-09-01', 'C1-09-02', 'C1-09-03', 'C1-09-04', 'C1-09-05', 'C1-09-06', 'C1-09-07', 'C1-09-08', 'C1-10-01', 'C1-10-02', 'C1-10-03', 'C1-10-04', 'C1-10-05', 'C1-10-06', 'C1-10-07', 'C1-10-08', 'C1-11-01', 'C1-11-02', 'C1-11-03', 'C1-11-04', 'C1-11-05', 'C1-11-06', 'C1-12-01', 'C1-12-02', 'C1-12-03', 'C1-12-04'],
-                    'floors': [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12]
-                },
-                'C-2': {
-                    'apartment_count': 66,
-                    'apartments': ['C2-01-01', 'C2-01-02', 'C2-01-03', 'C2-01-04', 'C2-01-05', 'C2-01-06', 'C2-01-07', 'C2-01-08', 'C2-02-01', 'C2-02-02', 'C2-02-03', 'C2-02-04', 'C2-02-05', 'C2-02-06', 'C2-02-07', 'C2-02-08', 'C2-03-01', 'C2-03-02', 'C2-03-03', 'C2-03-04', 'C2-03-05', 'C2-03-06', 'C2-03-07', 'C2-03-08', 'C2-04-01', 'C2-04-02', 'C2-04-03', 'C2-04-04', 'C2-04-05', 'C2-04-06', 'C2-04-07', 'C2-04-08', 'C2-05-01', 'C2-05-02', 'C2-05-03', 'C2-05-04', 'C2-05-05', 'C2-05-06', 'C2-05-07', 'C2-05-08', 'C2-06-01', 'C2-06-02', 'C2-06-03', 'C2-06-04', 'C2-06-05', 'C2-06-06', 'C2-06-07', 'C2-06-08', 'C2-07-01', 'C2-07-02', 'C2-07-03', 'C2-07-04', 'C2-07-05', 'C2-07-06', 'C2-07-07', 'C2-07-08', 'C2-08-01', 'C2-08-02', 'C2-08-03', 'C2-08-04', 'C2-08-05', 'C2-08-06', 'C2-09-01', 'C2-09-02', 'C2-09-03', 'C2-09-04'],
-                    'floors': [1, 2, 3, 4, 5, 6, 7, 8, 9]
-                },
-            }
-        },
-        'D': {
-            'apartment_count': 183,
-            'apartments': ['D1-01-01', 'D1-01-02', 'D1-01-03', 'D1-01-04', 'D1-01-05', 'D1-01-06', 'D1-01-07', 'D1-01-08', 'D1-02-01', 'D1-02-02', 'D1-02-03', 'D1-02-04', 'D1-02-05', 'D1-02-06', 'D1-02-07', 'D1-02-08', 'D1-03-01', 'D1-03-02', 'D1-03-03', 'D1-03-04', 'D1-03-05', 'D1-03-06', 'D1-03-07', 'D1-03-08', 'D1-04-01', 'D1-04-02', 'D1-04-03', 'D1-04-04', 'D1-04-05', 'D1-04-06', 'D1-04-07', 'D1-04-08', 'D1-05-01', 'D1-05-02', 'D1-05-03', 'D1-05-04', 'D1-05-05', 'D1-05-06', 'D1-05-07', 'D1-05-08', 'D1-06-01', 'D1-06-02', 'D1-06-03', 'D1-06-04', 'D1-06-05', 'D1-06-06', 'D1-06-07', 'D1-06-08', 'D1-07-01', 'D1-07-02', 'D1-07-03', 'D1-07-04', 'D1-07-05', 'D1-07-06', 'D1-07-07', 'D1-07-08', 'D1-08-01', 'D1-08-02', 'D1-08-03', 'D1-08-04', 'D1-LG-01', 'D1-LG-02', 'D1-UG-01', 'D1-UG-02', 'D1-UG-03', 'D1-UG-04', 'D1-UG-05', 'D1-UG-06', 'D1-UG-07', 'D1-UG-08', 'D2-01-01', 'D2-01-02', 'D2-01-03', 'D2-01-04', 'D2-01-05', 'D2-01-06', 'D2-01-07', 'D2-01-08', 'D2-02-01', 'D2-02-02', 'D2-02-03', 'D2-02-04', 'D2-02-05', 'D2-02-06', 'D2-02-07', 'D2-02-08', 'D2-03-01', 'D2-03-02', 'D2-03-03', 'D2-03-04', 'D2-03-05', 'D2-03-06', 'D2-03-07', 'D2-03-08', 'D2-04-01', 'D2-04-02', 'D2-04-03', 'D2-04-04', 'D2-04-05', 'D2-04-06', 'D2-04-07', 'D2-04-08', 'D2-05-01', 'D2-05-02', 'D2-05-03', 'D2-05-04', 'D2-05-05', 'D2-05-06', 'D2-05-07', 'D2-05-08', 'D2-06-01', 'D2-06-02', 'D2-06-03', 'D2-06-04', 'D2-06-05', 'D2-06-06', 'D2-06-07', 'D2-06-08', 'D2-07-01', 'D2-07-02', 'D2-07-03', 'D2-07-04', 'D2-UG-01', 'D2-UG-02', 'D2-UG-03', 'D2-UG-04', 'D3-01-01', 'D3-01-02', 'D3-01-03', 'D3-01-04', 'D3-01-05', 'D3-01-06', 'D3-01-07', 'D3-01-08', 'D3-02-01', 'D3-02-02', 'D3-02-03', 'D3-02-04', 'D3-02-05', 'D3-02-06', 'D3-02-07', 'D3-02-08', 'D3-03-01', 'D3-03-02', 'D3-03-03', 'D3-03-04', 'D3-03-05', 'D3-03-06', 'D3-03-07', 'D3-03-08', 'D3-04-01', 'D3-04-02', 'D3-04-03', 'D3-04-04', 'D3-04-05', 'D3-04-06', 'D3-04-07', 'D3-04-08', 'D3-05-01', 'D3-05-02', 'D3-05-03', 'D3-05-04', 'D3-05-05', 'D3-05-06', 'D3-05-07', 'D3-05-08', 'D3-06-01', 'D3-06-02', 'D3-06-03', 'D3-06-04', 'D3-06-05', 'D3-06-06', 'D3-06-07', 'D3-06-08', 'D3-LG-01', 'D3-LG-02', 'D3-UG-01', 'D3-UG-02', 'D3-UG-03', 'D3-UG-04', 'D3-UG-05', 'D3-UG-06', 'D3-UG-07'],
-            'blocks': {
-                'D1': {
-                    'apartment_count': 70,
-                    'apartments': ['D1-01-01', 'D1-01-02', 'D1-01-03', 'D1-01-04', 'D1-01-05', 'D1-01-06', 'D1-01-07', 'D1-01-08', 'D1-02-01', 'D1-02-02', 'D1-02-03', 'D1-02-04', 'D1-02-05', 'D1-02-06', 'D1-02-07', 'D1-02-08', 'D1-03-01', 'D1-03-02', 'D1-03-03', 'D1-03-04', 'D1-03-05', 'D1-03-06', 'D1-03-07', 'D1-03-08', 'D1-04-01', 'D1-04-02', 'D1-04-03', 'D1-04-04', 'D1-04-05', 'D1-04-06', 'D1-04-07', 'D1-04-08', 'D1-05-01', 'D1-05-02', 'D1-05-03', 'D1-05-04', 'D1-05-05', 'D1-05-06', 'D1-05-07', 'D1-05-08', 'D1-06-01', 'D1-06-02', 'D1-06-03', 'D1-06-04', 'D1-06-05', 'D1-06-06', 'D1-06-07', 'D1-06-08', 'D1-07-01', 'D1-07-02', 'D1-07-03', 'D1-07-04', 'D1-07-05', 'D1-07-06', 'D1-07-07', 'D1-07-08', 'D1-08-01', 'D1-08-02', 'D1-08-03', 'D1-08-04', 'D1-LG-01', 'D1-LG-02', 'D1-UG-01', 'D1-UG-02', 'D1-UG-03', 'D1-UG-04', 'D1-UG-05', 'D1-UG-06', 'D1-UG-07', 'D1-UG-08'],
-                    'floors': [0, 1, 2, 3, 4, 5, 6, 7, 8]
-                },
-                'D2': {
-                    'apartment_count': 56,
-                    'apartments': ['D2-01-01', 'D2-01-02', 'D2-01-03', 'D2-01-04', 'D2-01-05', 'D2-01-06', 'D2-01-07', 'D2-01-08', 'D2-02-01', 'D2-02-02', 'D2-02-03', 'D2-02-04', 'D2-02-05', 'D2-02-06', 'D2-02-07', 'D2-02-08', 'D2-03-01', 'D2-03-02', 'D2-03-03', 'D2-03-04', 'D2-03-05', 'D2-03-06', 'D2-03-07', 'D2-03-08', 'D2-04-01', 'D2-04-02', 'D2-04-03', 'D2-04-04', 'D2-04-05', 'D2-04-06', 'D2-04-07', 'D2-04-08', 'D2-05-01', 'D2-05-02', 'D2-05-03', 'D2-05-04', 'D2-05-05', 'D2-05-06', 'D2-05-07', 'D2-05-08', 'D2-06-01', 'D2-06-02', 'D2-06-03', 'D2-06-04', 'D2-06-05', 'D2-06-06', 'D2-06-07', 'D2-06-08', 'D2-07-01', 'D2-07-02', 'D2-07-03', 'D2-07-04', 'D2-UG-01', 'D2-UG-02', 'D2-UG-03', 'D2-UG-04'],
-                    'floors': [0, 1, 2, 3, 4, 5, 6, 7]
-                },
-                'D3': {
-                    'apartment_count': 57,
-                    'apartments': ['D3-01-01', 'D3-01-02', 'D3-01-03', 'D3-01-04', 'D3-01-05', 'D3-01-06', 'D3-01-07', 'D3-01-08', 'D3-02-01', 'D3-02-02', 'D3-02-03', 'D3-02-04', 'D3-02-05', 'D3-02-06', 'D3-02-07', 'D3-02-08', 'D3-03-01', 'D3-03-02', 'D3-03-03', 'D3-03-04', 'D3-03-05', 'D3-03-06', 'D3-03-07', 'D3-03-08', 'D3-04-01', 'D3-04-02', 'D3-04-03', 'D3-04-04', 'D3-04-05', 'D3-04-06', 'D3-04-07', 'D3-04-08', 'D3-05-01', 'D3-05-02', 'D3-05-03', 'D3-05-04', 'D3-05-05', 'D3-05-06', 'D3-05-07', 'D3-05-08', 'D3-06-01', 'D3-06-02', 'D3-06-03', 'D3-06-04', 'D3-06-05', 'D3-06-06', 'D3-06-07', 'D3-06-08', 'D3-LG-01', 'D3-LG-02', 'D3-UG-01', 'D3-UG-02', 'D3-UG-03', 'D3-UG-04', 'D3-UG-05', 'D3-UG-06', 'D3-UG-07'],
-                    'floors': [0, 1, 2, 3, 4, 5, 6]
-                },
-            }
-        },
-        'E': {
-            'apartment_count': 91,
-            'apartments': ['E1-00-01', 'E1-00-02', 'E1-01-01', 'E1-01-02', 'E1-01-03', 'E1-01-04', 'E1-01-05', 'E1-01-06', 'E1-01-07', 'E1-01-08', 'E1-01-09', 'E1-01-10', 'E1-01-11', 'E1-01-12', 'E1-02-01', 'E1-02-02', 'E1-02-03', 'E1-02-04', 'E1-02-05', 'E1-02-06', 'E1-02-07', 'E1-02-08', 'E1-02-09', 'E1-02-10', 'E1-02-11', 'E1-02-12', 'E1-03-01', 'E1-03-02', 'E1-03-03', 'E1-03-04', 'E1-03-05', 'E1-03-06', 'E1-03-07', 'E1-03-08', 'E1-03-09', 'E1-03-10', 'E1-03-11', 'E1-03-12', 'E1-04-01', 'E1-04-02', 'E1-04-03', 'E1-04-04', 'E1-04-05', 'E1-04-06', 'E1-04-07', 'E1-04-08', 'E1-04-09', 'E1-04-10', 'E1-04-11', 'E1-04-12', 'E1-05-01', 'E1-05-02', 'E1-05-03', 'E1-05-04', 'E1-05-05', 'E1-06-01', 'E1-06-02', 'E1-06-03', 'E1-06-04', 'E1-06-05', 'E2-00-01', 'E2-01-01', 'E2-01-02', 'E2-01-03', 'E2-01-04', 'E2-01-05', 'E2-02-01', 'E2-02-02', 'E2-02-03', 'E2-02-04', 'E2-02-05', 'E2-03-01', 'E2-03-02', 'E2-03-03', 'E2-03-04', 'E2-03-05', 'E2-04-01', 'E2-04-02', 'E2-04-03', 'E2-04-04', 'E2-04-05', 'E2-05-01', 'E2-05-02', 'E2-05-03', 'E2-05-04', 'E2-05-05', 'E2-06-01', 'E2-06-02', 'E2-06-03', 'E2-06-04', 'E2-06-05'],
-            'blocks': {
-                'E1': {
-                    'apartment_count': 60,
-                    'apartments': ['E1-00-01', 'E1-00-02', 'E1-01-01', 'E1-01-02', 'E1-01-03', 'E1-01-04', 'E1-01-05', 'E1-01-06', 'E1-01-07', 'E1-01-08', 'E1-01-09', 'E1-01-10', 'E1-01-11', 'E1-01-12', 'E1-02-01', 'E1-02-02', 'E1-02-03', 'E1-02-04', 'E1-02-05', 'E1-02-06', 'E1-02-07', 'E1-02-08', 'E1-02-09', 'E1-02-10', 'E1-02-11', 'E1-02-12', 'E1-03-01', 'E1-03-02', 'E1-03-03', 'E1-03-04', 'E1-03-05', 'E1-03-06', 'E1-03-07', 'E1-03-08', 'E1-03-09', 'E1-03-10', 'E1-03-11', 'E1-03-12', 'E1-04-01', 'E1-04-02', 'E1-04-03', 'E1-04-04', 'E1-04-05', 'E1-04-06', 'E1-04-07', 'E1-04-08', 'E1-04-09', 'E1-04-10', 'E1-04-11', 'E1-04-12', 'E1-05-01', 'E1-05-02', 'E1-05-03', 'E1-05-04', 'E1-05-05', 'E1-06-01', 'E1-06-02', 'E1-06-03', 'E1-06-04', 'E1-06-05'],
-                    'floors': [0, 1, 2, 3, 4, 5, 6]
-                },
-                'E2': {
-                    'apartment_count': 31,
-                    'apartments': ['E2-00-01', 'E2-01-01', 'E2-01-02', 'E2-01-03', 'E2-01-04', 'E2-01-05', 'E2-02-01', 'E2-02-02', 'E2-02-03', 'E2-02-04', 'E2-02-05', 'E2-03-01', 'E2-03-02', 'E2-03-03', 'E2-03-04', 'E2-03-05', 'E2-04-01', 'E2-04-02', 'E2-04-03', 'E2-04-04', 'E2-04-05', 'E2-05-01', 'E2-05-02', 'E2-05-03', 'E2-05-04', 'E2-05-05', 'E2-06-01', 'E2-06-02', 'E2-06-03', 'E2-06-04', 'E2-06-05'],
-                    'floors': [0, 1, 2, 3, 4, 5, 6]
-                },
-            }
-        },
-    },
-    
-    'apartment_types': {
-        'C-1': {
-            'count': 12,
-            'bedrooms': 3,
-            'apartments': ['C1-01-01', 'C1-02-01', 'C1-03-01', 'C1-04-01', 'C1-05-01', 'C1-06-01', 'C1-07-01', 'C1-08-01', 'C1-09-01', 'C1-10-01', 'C1-11-01', 'C1-12-01']
-        },
-        'C-13': {
-            'count': 19,
-            'bedrooms': 2,
-            'apartments': ['C1-01-02', 'C1-02-02', 'C1-03-02', 'C1-04-02', 'C1-05-02', 'C1-06-02', 'C1-07-02', 'C1-08-02', 'C1-09-02', 'C1-10-02', 'C1-11-02', 'C2-01-02', 'C2-02-02', 'C2-03-02', 'C2-04-02', 'C2-05-02', 'C2-06-02', 'C2-07-02', 'C2-08-02']
-        },
-        'C-10': {
-            'count': 17,
-            'bedrooms': 2,
-            'apartments': ['C1-01-03', 'C1-02-03', 'C1-03-03', 'C1-04-03', 'C1-05-03', 'C1-06-03', 'C1-07-03', 'C1-08-03', 'C1-09-03', 'C1-10-03', 'C2-01-03', 'C2-02-03', 'C2-03-03', 'C2-04-03', 'C2-05-03', 'C2-06-03', 'C2-07-03']
-        },
-        'C-3': {
-            'count': 17,
-            'bedrooms': 1,
-            'apartments': ['C1-01-04', 'C1-02-04', 'C1-03-04', 'C1-04-04', 'C1-05-04', 'C1-06-04', 'C1-07-04', 'C1-08-04', 'C1-09-04', 'C1-10-04', 'C2-01-04', 'C2-02-04', 'C2-03-04', 'C2-04-04', 'C2-05-04', 'C2-06-04', 'C2-07-04']
-        },
-        'C-6': {
-            'count': 1,
-            'bedrooms': 4,
-            'apartments': ['C1-01-05']
-        },
-        'C-14': {
-            'count': 19,
-            'bedrooms': 2,
-            'apartments': ['C1-01-06', 'C1-02-07', 'C1-03-07', 'C1-04-07', 'C1-05-07', 'C1-06-07', 'C1-07-07', 'C1-08-07', 'C1-09-07', 'C1-10-07', 'C1-11-05', 'C2-01-07', 'C2-02-07', 'C2-03-07', 'C2-04-07', 'C2-05-07', 'C2-06-07', 'C2-07-07', 'C2-08-05']
-        },
-        'C-4': {
-            'count': 21,
-            'bedrooms': 3,
-            'apartments': ['C1-01-07', 'C1-02-08', 'C1-03-08', 'C1-04-08', 'C1-05-08', 'C1-06-08', 'C1-07-08', 'C1-08-08', 'C1-09-08', 'C1-10-08', 'C1-11-06', 'C1-12-04', 'C2-01-08', 'C2-02-08', 'C2-03-08', 'C2-04-08', 'C2-05-08', 'C2-06-08', 'C2-07-08', 'C2-08-06', 'C2-09-04']
-        },
-        'C-3H': {
-            'count': 16,
-            'bedrooms': 1,
-            'apartments': ['C1-02-05', 'C1-03-05', 'C1-04-05', 'C1-05-05', 'C1-06-05', 'C1-07-05', 'C1-08-05', 'C1-09-05', 'C1-10-05', 'C2-01-05', 'C2-02-05', 'C2-03-05', 'C2-04-05', 'C2-05-05', 'C2-06-05', 'C2-07-05']
-        },
-        'C-2': {
-            'count': 16,
-            'bedrooms': 2,
-            'apartments': ['C1-02-06', 'C1-03-06', 'C1-04-06', 'C1-05-06', 'C1-06-06', 'C1-07-06', 'C1-08-06', 'C1-09-06', 'C1-10-06', 'C2-01-06', 'C2-02-06', 'C2-03-06', 'C2-04-06', 'C2-05-06', 'C2-06-06', 'C2-07-06']
-        },
-        'C-7': {
-            'count': 2,
-            'bedrooms': 2,
-            'apartments': ['C1-11-03', 'C2-08-03']
-        },
-        'C-12': {
-            'count': 2,
-            'bedrooms': 2,
-            'apartments': ['C1-11-04', 'C2-08-04']
-        },
-        'C-8': {
-            'count': 2,
-            'bedrooms': 2,
-            'apartments': ['C1-12-02', 'C2-09-02']
-        },
-        'C-11': {
-            'count': 2,
-            'bedrooms': 2,
-            'apartments': ['C1-12-03', 'C2-09-03']
-        },
-        'C-5': {
-            'count': 2,
-            'bedrooms': 2,
-            'apartments': ['C2-01-01', 'C2-02-01']
-        },
-        'C-15': {
-            'count': 7,
-            'bedrooms': 3,
-            'apartments': ['C2-03-01', 'C2-04-01', 'C2-05-01', 'C2-06-01', 'C2-07-01', 'C2-08-01', 'C2-09-01']
-        },
-        'D-3': {
-            'count': 21,
-            'bedrooms': 2,
-            'apartments': ['D1-01-01', 'D1-02-01', 'D1-03-01', 'D1-04-01', 'D1-05-01', 'D1-06-01', 'D1-07-01', 'D1-UG-01', 'D2-01-01', 'D2-02-01', 'D2-03-01', 'D2-04-01', 'D2-05-01', 'D2-06-01', 'D3-01-01', 'D3-02-01', 'D3-03-01', 'D3-04-01', 'D3-05-01', 'D3-06-01', 'D3-UG-01']
-        },
-        'D-4': {
-            'count': 20,
-            'bedrooms': 2,
-            'apartments': ['D1-01-02', 'D1-02-02', 'D1-03-02', 'D1-04-02', 'D1-05-02', 'D1-06-02', 'D1-07-02', 'D1-UG-02', 'D2-01-02', 'D2-02-02', 'D2-03-02', 'D2-04-02', 'D2-05-02', 'D2-06-02', 'D2-UG-02', 'D3-01-06', 'D3-02-06', 'D3-03-06', 'D3-04-06', 'D3-05-06']
-        },
-        'D-4H': {
-            'count': 20,
-            'bedrooms': 2,
-            'apartments': ['D1-01-03', 'D1-02-03', 'D1-03-03', 'D1-04-03', 'D1-05-03', 'D1-06-03', 'D1-07-03', 'D1-UG-03', 'D2-01-03', 'D2-02-03', 'D2-03-03', 'D2-04-03', 'D2-05-03', 'D2-06-03', 'D3-01-07', 'D3-02-07', 'D3-03-07', 'D3-04-07', 'D3-05-07', 'D3-UG-06']
-        },
-        'D-8': {
-            'count': 1,
-            'bedrooms': 2,
-            'apartments': ['D1-01-04']
-        },
-        'D-8H': {
-            'count': 1,
-            'bedrooms': 2,
-            'apartments': ['D1-01-05']
-        },
-        'D-18': {
-            'count': 13,
-            'bedrooms': 2,
-            'apartments': ['D1-01-06', 'D1-02-06', 'D1-03-06', 'D1-04-06', 'D1-05-06', 'D1-06-06', 'D1-07-06', 'D2-01-06', 'D2-02-06', 'D2-03-06', 'D2-04-06', 'D2-05-06', 'D2-06-06']
-        },
-        'D-20H': {
-            'count': 14,
-            'bedrooms': 2,
-            'apartments': ['D1-01-07', 'D1-02-07', 'D1-03-07', 'D1-04-07', 'D1-05-07', 'D1-06-07', 'D1-07-07', 'D2-01-07', 'D2-02-07', 'D2-03-07', 'D2-04-07', 'D2-05-07', 'D2-06-07', 'D2-UG-03']
-        },
-        'D-3H': {
-            'count': 21,
-            'bedrooms': 2,
-            'apartments': ['D1-01-08', 'D1-02-08', 'D1-03-08', 'D1-04-08', 'D1-05-08', 'D1-06-08', 'D1-07-08', 'D1-UG-08', 'D2-01-08', 'D2-02-08', 'D2-03-08', 'D2-04-08', 'D2-05-08', 'D2-06-08', 'D3-01-08', 'D3-02-08', 'D3-03-08', 'D3-04-08', 'D3-05-08', 'D3-06-08', 'D3-UG-07']
-        },
-        'D-9': {
-            'count': 12,
-            'bedrooms': 3,
-            'apartments': ['D1-02-04', 'D1-03-04', 'D1-04-04', 'D1-05-04', 'D1-06-04', 'D1-07-04', 'D3-01-04', 'D3-02-04', 'D3-03-04', 'D3-04-04', 'D3-05-04', 'D3-06-04']
-        },
-        'D-9H': {
-            'count': 12,
-            'bedrooms': 3,
-            'apartments': ['D1-02-05', 'D1-03-05', 'D1-04-05', 'D1-05-05', 'D1-06-05', 'D1-07-05', 'D3-01-05', 'D3-02-05', 'D3-03-05', 'D3-04-05', 'D3-05-05', 'D3-06-05']
-        },
-        'D-10': {
-            'count': 2,
-            'bedrooms': 1,
-            'apartments': ['D1-08-01', 'D2-07-01']
-        },
-        'D-23': {
-            'count': 1,
-            'bedrooms': 1,
-            'apartments': ['D1-08-02']
-        },
-        'D-11': {
-            'count': 1,
-            'bedrooms': 1,
-            'apartments': ['D1-08-03']
-        },
-        'D-10H': {
-            'count': 2,
-            'bedrooms': 1,
-            'apartments': ['D1-08-04', 'D2-07-04']
-        },
-        'D-1': {
-            'count': 1,
-            'bedrooms': 1,
-            'apartments': ['D1-LG-01']
-        },
-        'D-2': {
-            'count': 1,
-            'bedrooms': 1,
-            'apartments': ['D1-LG-02']
-        },
-        'D-5': {
-            'count': 2,
-            'bedrooms': 1,
-            'apartments': ['D1-UG-04', 'D3-UG-04']
-        },
-        'D-5H': {
-            'count': 1,
-            'bedrooms': 1,
-            'apartments': ['D1-UG-05']
-        },
-        'D-6H': {
-            'count': 1,
-            'bedrooms': 2,
-            'apartments': ['D1-UG-06']
-        },
-        'D-7H': {
-            'count': 1,
-            'bedrooms': 1,
-            'apartments': ['D1-UG-07']
-        },
-        'D-12': {
-            'count': 6,
-            'bedrooms': 2,
-            'apartments': ['D2-01-04', 'D2-02-04', 'D2-03-04', 'D2-04-04', 'D2-05-04', 'D2-06-04']
-        },
-        'D-12H': {
-            'count': 6,
-            'bedrooms': 2,
-            'apartments': ['D2-01-05', 'D2-02-05', 'D2-03-05', 'D2-04-05', 'D2-05-05', 'D2-06-05']
-        },
-        'D-22': {
-            'count': 1,
-            'bedrooms': 2,
-            'apartments': ['D2-07-02']
-        },
-        'D-13': {
-            'count': 1,
-            'bedrooms': 2,
-            'apartments': ['D2-07-03']
-        },
-        'D-17': {
-            'count': 1,
-            'bedrooms': 1,
-            'apartments': ['D2-UG-01']
-        },
-        'D-17H': {
-            'count': 1,
-            'bedrooms': 1,
-            'apartments': ['D2-UG-04']
-        },
-        'D-20': {
-            'count': 5,
-            'bedrooms': 2,
-            'apartments': ['D3-01-02', 'D3-02-02', 'D3-03-02', 'D3-04-02', 'D3-05-02']
-        },
-        'D-18H': {
-            'count': 5,
-            'bedrooms': 2,
-            'apartments': ['D3-01-03', 'D3-02-03', 'D3-03-03', 'D3-04-03', 'D3-05-03']
-        },
-        'D-21': {
-            'count': 1,
-            'bedrooms': 2,
-            'apartments': ['D3-06-02']
-        },
-        'D-19': {
-            'count': 1,
-            'bedrooms': 2,
-            'apartments': ['D3-06-03']
-        },
-        'D-16': {
-            'count': 1,
-            'bedrooms': 2,
-            'apartments': ['D3-06-06']
-        },
-        'D-16H': {
-            'count': 1,
-            'bedrooms': 2,
-            'apartments': ['D3-06-07']
-        },
-        'D-14': {
-            'count': 1,
-            'bedrooms': 1,
-            'apartments': ['D3-LG-01']
-        },
-        'D-14H': {
-            'count': 1,
-            'bedrooms': 1,
-            'apartments': ['D3-LG-02']
-        },
-        'D-7': {
-            'count': 1,
-            'bedrooms': 1,
-            'apartments': ['D3-UG-02']
-        },
-        'D-6': {
-            'count': 1,
-            'bedrooms': 2,
-            'apartments': ['D3-UG-03']
-        },
-        'D-15': {
-            'count': 1,
-            'bedrooms': 2,
-            'apartments': ['D3-UG-05']
-        },
-        'E-15': {
-            'count': 1,
-            'bedrooms': 1,
-            'apartments': ['E1-00-01']
-        },
-        'E-16': {
-            'count': 1,
-            'bedrooms': 1,
-            'apartments': ['E1-00-02']
-        },
-        'E-1': {
-            'count': 4,
-            'bedrooms': 1,
-            'apartments': ['E1-01-01', 'E1-02-01', 'E1-03-01', 'E1-04-01']
-        },
-        'E-2': {
-            'count': 4,
-            'bedrooms': 1,
-            'apartments': ['E1-01-02', 'E1-02-02', 'E1-03-02', 'E1-04-02']
-        },
-        'E-3': {
-            'count': 4,
-            'bedrooms': 1,
-            'apartments': ['E1-01-03', 'E1-02-03', 'E1-03-03', 'E1-04-03']
-        },
-        'E-4': {
-            'count': 4,
-            'bedrooms': 1,
-            'apartments': ['E1-01-04', 'E1-02-04', 'E1-03-04', 'E1-04-04']
-        },
-        'E-5': {
-            'count': 4,
-            'bedrooms': 1,
-            'apartments': ['E1-01-05', 'E1-02-05', 'E1-03-05', 'E1-04-05']
-        },
-        'E-6': {
-            'count': 4,
-            'bedrooms': 1,
-            'apartments': ['E1-01-06', 'E1-02-06', 'E1-03-06', 'E1-04-06']
-        },
-        'E-7': {
-            'count': 4,
-            'bedrooms': 1,
-            'apartments': ['E1-01-07', 'E1-02-07', 'E1-03-07', 'E1-04-07']
-        },
-        'E-8': {
-            'count': 4,
-            'bedrooms': 1,
-            'apartments': ['E1-01-08', 'E1-02-08', 'E1-03-08', 'E1-04-08']
-        },
-        'E-9': {
-            'count': 4,
-            'bedrooms': 1,
-            'apartments': ['E1-01-09', 'E1-02-09', 'E1-03-09', 'E1-04-09']
-        },
-        'E-10': {
-            'count': 6,
-            'bedrooms': 1,
-            'apartments': ['E1-01-10', 'E1-02-10', 'E1-03-10', 'E1-04-10', 'E1-05-03', 'E1-06-03']
-        },
-        'E-11': {
-            'count': 6,
-            'bedrooms': 1,
-            'apartments': ['E1-01-11', 'E1-02-11', 'E1-03-11', 'E1-04-11', 'E1-05-04', 'E1-06-04']
-        },
-        'E-12': {
-            'count': 6,
-            'bedrooms': 1,
-            'apartments': ['E1-01-12', 'E1-02-12', 'E1-03-12', 'E1-04-12', 'E1-05-05', 'E1-06-05']
-        },
-        'E-14': {
-            'count': 2,
-            'bedrooms': 1,
-            'apartments': ['E1-05-01', 'E1-06-01']
-        },
-        'E-13': {
-            'count': 2,
-            'bedrooms': 1,
-            'apartments': ['E1-05-02', 'E1-06-02']
-        },
-        'E-20': {
-            'count': 1,
-            'bedrooms': 2,
-            'apartments': ['E2-00-01']
-        },
-        'E-21': {
-            'count': 6,
-            'bedrooms': 2,
-            'apartments': ['E2-01-01', 'E2-02-01', 'E2-03-01', 'E2-04-01', 'E2-05-01', 'E2-06-01']
-        },
-        'E-22': {
-            'count': 6,
-            'bedrooms': 2,
-            'apartments': ['E2-01-05', 'E2-02-05', 'E2-03-05', 'E2-04-05', 'E2-05-05', 'E2-06-05']
-        },
-        'E-23': {
-            'count': 6,
-            'bedrooms': 1,
-            'apartments': ['E2-01-02', 'E2-02-02', 'E2-03-02', 'E2-04-02', 'E2-05-02', 'E2-06-02']
-        },
-        'E-24': {
-            'count': 6,
-            'bedrooms': 2,
-            'apartments': ['E2-01-04', 'E2-02-04', 'E2-03-04', 'E2-04-04', 'E2-05-04', 'E2-06-04']
-        },
-        'E-25': {
-            'count': 6,
-            'bedrooms': 2,
-            'apartments': ['E2-01-03', 'E2-02-03', 'E2-03-03', 'E2-04-03', 'E2-05-03', 'E2-06-03']
-        },
-    },
-    
-    'tenures': {
-        'Rented': {
-            'count': 215,
-            'apartments': ['C1-01-01', 'C1-01-02', 'C1-01-03', 'C1-01-04', 'C1-01-05', 'C1-01-06', 'C1-01-07', 'C1-02-01', 'C1-02-02', 'C1-02-03', 'C1-02-04', 'C1-02-05', 'C1-02-06', 'C1-02-07', 'C1-02-08', 'C1-03-01', 'C1-03-02', 'C1-03-03', 'C1-03-04', 'C1-03-05', 'C1-03-06', 'C1-03-07', 'C1-03-08', 'C1-04-01', 'C1-04-02', 'C1-04-03', 'C1-04-04', 'C1-04-05', 'C1-04-06', 'C1-04-07', 'C1-04-08', 'C1-05-01', 'C1-05-02', 'C1-05-03', 'C1-05-04', 'C1-05-05', 'C1-05-06', 'C1-05-07', 'C1-05-08', 'C1-06-01', 'C1-06-02', 'C1-06-03', 'C1-06-04', 'C1-06-05', 'C1-06-06', 'C1-06-07', 'C1-06-08', 'C1-07-01', 'C1-07-02', 'C1-07-03', 'C1-07-04', 'C1-07-05', 'C1-07-06', 'C1-07-07', 'C1-07-08', 'C1-08-01', 'C1-08-02', 'C1-08-03', 'C1-08-04', 'C1-08-05', 'C1-08-06', 'C1-08-07', 'C1-08-08', 'C1-09-01', 'C1-09-02', 'C1-09-03', 'C1-09-04', 'C1-09-05', 'C1-09-06', 'C1-09-07', 'C1-09-08', 'C1-10-01', 'C1-10-02', 'C1-10-03', 'C1-10-04', 'C1-10-05', 'C1-10-06', 'C1-10-07', 'C1-10-08', 'C1-11-01', 'C1-11-02', 'C1-11-03', 'C1-11-04', 'C1-11-05', 'C1-11-06', 'C1-12-01', 'C1-12-02', 'C1-12-03', 'C1-12-04', 'C2-01-01', 'C2-01-02', 'C2-01-03', 'C2-01-04', 'C2-01-05', 'C2-01-06', 'C2-01-07', 'C2-01-08', 'C2-02-01', 'C2-02-02', 'C2-02-03', 'C2-02-04', 'C2-02-05', 'C2-02-06', 'C2-02-07', 'C2-02-08', 'C2-03-01', 'C2-03-02', 'C2-03-03', 'C2-03-04', 'C2-03-05', 'C2-03-06', 'C2-03-07', 'C2-03-08', 'C2-04-01', 'C2-04-02', 'C2-04-03', 'C2-04-04', 'C2-04-05', 'C2-04-06', 'C2-04-07', 'C2-04-08', 'C2-05-01', 'C2-05-02', 'C2-05-03', 'C2-05-04', 'C2-05-05', 'C2-05-06', 'C2-05-07', 'C2-05-08', 'C2-06-01', 'C2-06-02', 'C2-06-03', 'C2-06-04', 'C2-06-05', 'C2-06-06', 'C2-06-07', 'C2-06-08', 'C2-07-01', 'C2-07-02', 'C2-07-03', 'C2-07-04', 'C2-07-05', 'C2-07-06', 'C2-07-07', 'C2-07-08', 'C2-08-01', 'C2-08-02', 'C2-08-03', 'C2-08-04', 'C2-08-05', 'C2-08-06', 'C2-09-01', 'C2-09-02', 'C2-09-03', 'C2-09-04', 'E1-00-01', 'E1-00-02', 'E1-01-01', 'E1-01-02', 'E1-01-03', 'E1-01-04', 'E1-01-05', 'E1-01-06', 'E1-01-07', 'E1-01-08', 'E1-01-09', 'E1-01-10', 'E1-01-11', 'E1-01-12', 'E1-02-01', 'E1-02-02', 'E1-02-03', 'E1-02-04', 'E1-02-05', 'E1-02-06', 'E1-02-07', 'E1-02-08', 'E1-02-09', 'E1-02-10', 'E1-02-11', 'E1-02-12', 'E1-03-01', 'E1-03-02', 'E1-03-03', 'E1-03-04', 'E1-03-05', 'E1-03-06', 'E1-03-07', 'E1-03-08', 'E1-03-09', 'E1-03-10', 'E1-03-11', 'E1-03-12', 'E1-04-01', 'E1-04-02', 'E1-04-03', 'E1-04-04', 'E1-04-05', 'E1-04-06', 'E1-04-07', 'E1-04-08', 'E1-04-09', 'E1-04-10', 'E1-04-11', 'E1-04-12', 'E1-05-01', 'E1-05-02', 'E1-05-03', 'E1-05-04', 'E1-05-05', 'E1-06-01', 'E1-06-02', 'E1-06-03', 'E1-06-04', 'E1-06-05']
-        },
-        'Shared Ownership': {
-            'count': 18,
-            'apartments': ['D1-01-01', 'D1-01-02', 'D1-01-03', 'D1-01-04', 'D1-01-05', 'D1-01-06', 'D1-01-07', 'D1-01-08', 'D1-LG-01', 'D1-LG-02', 'D1-UG-01', 'D1-UG-02', 'D1-UG-03', 'D1-UG-04', 'D1-UG-05', 'D1-UG-06', 'D1-UG-07', 'D1-UG-08']
-        },
-        'Market Accomodation': {
-            'count': 196,
-            'apartments': ['D1-02-01', 'D1-02-02', 'D1-02-03', 'D1-02-04', 'D1-02-05', 'D1-02-06', 'D1-02-07', 'D1-02-08', 'D1-03-01', 'D1-03-02', 'D1-03-03', 'D1-03-04', 'D1-03-05', 'D1-03-06', 'D1-03-07', 'D1-03-08', 'D1-04-01', 'D1-04-02', 'D1-04-03', 'D1-04-04', 'D1-04-05', 'D1-04-06', 'D1-04-07', 'D1-04-08', 'D1-05-01', 'D1-05-02', 'D1-05-03', 'D1-05-04', 'D1-05-05', 'D1-05-06', 'D1-05-07', 'D1-05-08', 'D1-06-01', 'D1-06-02', 'D1-06-03', 'D1-06-04', 'D1-06-05', 'D1-06-06', 'D1-06-07', 'D1-06-08', 'D1-07-01', 'D1-07-02', 'D1-07-03', 'D1-07-04', 'D1-07-05', 'D1-07-06', 'D1-07-07', 'D1-07-08', 'D1-08-01', 'D1-08-02', 'D1-08-03', 'D1-08-04', 'D2-01-01', 'D2-01-02', 'D2-01-03', 'D2-01-04', 'D2-01-05', 'D2-01-06', 'D2-01-07', 'D2-01-08', 'D2-02-01', 'D2-02-02', 'D2-02-03', 'D2-02-04', 'D2-02-05', 'D2-02-06', 'D2-02-07', 'D2-02-08', 'D2-03-01', 'D2-03-02', 'D2-03-03', 'D2-03-04', 'D2-03-05', 'D2-03-06', 'D2-03-07', 'D2-03-08', 'D2-04-01', 'D2-04-02', 'D2-04-03', 'D2-04-04', 'D2-04-05', 'D2-04-06', 'D2-04-07', 'D2-04-08', 'D2-05-01', 'D2-05-02', 'D2-05-03', 'D2-05-04', 'D2-05-05', 'D2-05-06', 'D2-05-07', 'D2-05-08', 'D2-06-01', 'D2-06-02', 'D2-06-03', 'D2-06-04', 'D2-06-05', 'D2-06-06', 'D2-06-07', 'D2-06-08', 'D2-07-01', 'D2-07-02', 'D2-07-03', 'D2-07-04', 'D2-UG-01', 'D2-UG-02', 'D2-UG-03', 'D2-UG-04', 'D3-01-01', 'D3-01-02', 'D3-01-03', 'D3-01-04', 'D3-01-05', 'D3-01-06', 'D3-01-07', 'D3-01-08', 'D3-02-01', 'D3-02-02', 'D3-02-03', 'D3-02-04', 'D3-02-05', 'D3-02-06', 'D3-02-07', 'D3-02-08', 'D3-03-01', 'D3-03-02', 'D3-03-03', 'D3-03-04', 'D3-03-05', 'D3-03-06', 'D3-03-07', 'D3-03-08', 'D3-04-01', 'D3-04-02', 'D3-04-03', 'D3-04-04', 'D3-04-05', 'D3-04-06', 'D3-04-07', 'D3-04-08', 'D3-05-01', 'D3-05-02', 'D3-05-03', 'D3-05-04', 'D3-05-05', 'D3-05-06', 'D3-05-07', 'D3-05-08', 'D3-06-01', 'D3-06-02', 'D3-06-03', 'D3-06-04', 'D3-06-05', 'D3-06-06', 'D3-06-07', 'D3-06-08', 'D3-LG-01', 'D3-LG-02', 'D3-UG-01', 'D3-UG-02', 'D3-UG-03', 'D3-UG-04', 'D3-UG-05', 'D3-UG-06', 'D3-UG-07', 'E2-00-01', 'E2-01-01', 'E2-01-02', 'E2-01-03', 'E2-01-04', 'E2-01-05', 'E2-02-01', 'E2-02-02', 'E2-02-03', 'E2-02-04', 'E2-02-05', 'E2-03-01', 'E2-03-02', 'E2-03-03', 'E2-03-04', 'E2-03-05', 'E2-04-01', 'E2-04-02', 'E2-04-03', 'E2-04-04', 'E2-04-05', 'E2-05-01', 'E2-05-02', 'E2-05-03', 'E2-05-04', 'E2-05-05', 'E2-06-01', 'E2-06-02', 'E2-06-03', 'E2-06-04', 'E2-06-05']
-        },
-    },
-    
-    'apartment_lookup': {
-        # Full apartment lookup dictionary with 429 apartments
-        'C1-01-01': {'phase': 'C', 'block': 'C-1', 'floor': 1, 'type': 'C-1', 'bedrooms': 3, 'tenure': 'Rented'},
-        'C1-01-02': {'phase': 'C', 'block': 'C-1', 'floor': 1, 'type': 'C-13', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C1-01-03': {'phase': 'C', 'block': 'C-1', 'floor': 1, 'type': 'C-10', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C1-01-04': {'phase': 'C', 'block': 'C-1', 'floor': 1, 'type': 'C-3', 'bedrooms': 1, 'tenure': 'Rented'},
-        'C1-01-05': {'phase': 'C', 'block': 'C-1', 'floor': 1, 'type': 'C-6', 'bedrooms': 4, 'tenure': 'Rented'},
-        'C1-01-06': {'phase': 'C', 'block': 'C-1', 'floor': 1, 'type': 'C-14', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C1-01-07': {'phase': 'C', 'block': 'C-1', 'floor': 1, 'type': 'C-4', 'bedrooms': 3, 'tenure': 'Rented'},
-        'C1-02-01': {'phase': 'C', 'block': 'C-1', 'floor': 2, 'type': 'C-1', 'bedrooms': 3, 'tenure': 'Rented'},
-        'C1-02-02': {'phase': 'C', 'block': 'C-1', 'floor': 2, 'type': 'C-13', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C1-02-03': {'phase': 'C', 'block': 'C-1', 'floor': 2, 'type': 'C-10', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C1-02-04': {'phase': 'C', 'block': 'C-1', 'floor': 2, 'type': 'C-3', 'bedrooms': 1, 'tenure': 'Rented'},
-        'C1-02-05': {'phase': 'C', 'block': 'C-1', 'floor': 2, 'type': 'C-3H', 'bedrooms': 1, 'tenure': 'Rented'},
-        'C1-02-06': {'phase': 'C', 'block': 'C-1', 'floor': 2, 'type': 'C-2', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C1-02-07': {'phase': 'C', 'block': 'C-1', 'floor': 2, 'type': 'C-14', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C1-02-08': {'phase': 'C', 'block': 'C-1', 'floor': 2, 'type': 'C-4', 'bedrooms': 3, 'tenure': 'Rented'},
-        'C1-03-01': {'phase': 'C', 'block': 'C-1', 'floor': 3, 'type': 'C-1', 'bedrooms': 3, 'tenure': 'Rented'},
-        'C1-03-02': {'phase': 'C', 'block': 'C-1', 'floor': 3, 'type': 'C-13', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C1-03-03': {'phase': 'C', 'block': 'C-1', 'floor': 3, 'type': 'C-10', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C1-03-04': {'phase': 'C', 'block': 'C-1', 'floor': 3, 'type': 'C-3', 'bedrooms': 1, 'tenure': 'Rented'},
-        'C1-03-05': {'phase': 'C', 'block': 'C-1', 'floor': 3, 'type': 'C-3H', 'bedrooms': 1, 'tenure': 'Rented'},
-        'C1-03-06': {'phase': 'C', 'block': 'C-1', 'floor': 3, 'type': 'C-2', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C1-03-07': {'phase': 'C', 'block': 'C-1', 'floor': 3, 'type': 'C-14', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C1-03-08': {'phase': 'C', 'block': 'C-1', 'floor': 3, 'type': 'C-4', 'bedrooms': 3, 'tenure': 'Rented'},
-        'C1-04-01': {'phase': 'C', 'block': 'C-1', 'floor': 4, 'type': 'C-1', 'bedrooms': 3, 'tenure': 'Rented'},
-        'C1-04-02': {'phase': 'C', 'block': 'C-1', 'floor': 4, 'type': 'C-13', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C1-04-03': {'phase': 'C', 'block': 'C-1', 'floor': 4, 'type': 'C-10', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C1-04-04': {'phase': 'C', 'block': 'C-1', 'floor': 4, 'type': 'C-3', 'bedrooms': 1, 'tenure': 'Rented'},
-        'C1-04-05': {'phase': 'C', 'block': 'C-1', 'floor': 4, 'type': 'C-3H', 'bedrooms': 1, 'tenure': 'Rented'},
-        'C1-04-06': {'phase': 'C', 'block': 'C-1', 'floor': 4, 'type': 'C-2', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C1-04-07': {'phase': 'C', 'block': 'C-1', 'floor': 4, 'type': 'C-14', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C1-04-08': {'phase': 'C', 'block': 'C-1', 'floor': 4, 'type': 'C-4', 'bedrooms': 3, 'tenure': 'Rented'},
-        'C1-05-01': {'phase': 'C', 'block': 'C-1', 'floor': 5, 'type': 'C-1', 'bedrooms': 3, 'tenure': 'Rented'},
-        'C1-05-02': {'phase': 'C', 'block': 'C-1', 'floor': 5, 'type': 'C-13', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C1-05-03': {'phase': 'C', 'block': 'C-1', 'floor': 5, 'type': 'C-10', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C1-05-04': {'phase': 'C', 'block': 'C-1', 'floor': 5, 'type': 'C-3', 'bedrooms': 1, 'tenure': 'Rented'},
-        'C1-05-05': {'phase': 'C', 'block': 'C-1', 'floor': 5, 'type': 'C-3H', 'bedrooms': 1, 'tenure': 'Rented'},
-        'C1-05-06': {'phase': 'C', 'block': 'C-1', 'floor': 5, 'type': 'C-2', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C1-05-07': {'phase': 'C', 'block': 'C-1', 'floor': 5, 'type': 'C-14', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C1-05-08': {'phase': 'C', 'block': 'C-1', 'floor': 5, 'type': 'C-4', 'bedrooms': 3, 'tenure': 'Rented'},
-        'C1-06-01': {'phase': 'C', 'block': 'C-1', 'floor': 6, 'type': 'C-1', 'bedrooms': 3, 'tenure': 'Rented'},
-        'C1-06-02': {'phase': 'C', 'block': 'C-1', 'floor': 6, 'type': 'C-13', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C1-06-03': {'phase': 'C', 'block': 'C-1', 'floor': 6, 'type': 'C-10', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C1-06-04': {'phase': 'C', 'block': 'C-1', 'floor': 6, 'type': 'C-3', 'bedrooms': 1, 'tenure': 'Rented'},
-        'C1-06-05': {'phase': 'C', 'block': 'C-1', 'floor': 6, 'type': 'C-3H', 'bedrooms': 1, 'tenure': 'Rented'},
-        'C1-06-06': {'phase': 'C', 'block': 'C-1', 'floor': 6, 'type': 'C-2', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C1-06-07': {'phase': 'C', 'block': 'C-1', 'floor': 6, 'type': 'C-14', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C1-06-08': {'phase': 'C', 'block': 'C-1', 'floor': 6, 'type': 'C-4', 'bedrooms': 3, 'tenure': 'Rented'},
-        'C1-07-01': {'phase': 'C', 'block': 'C-1', 'floor': 7, 'type': 'C-1', 'bedrooms': 3, 'tenure': 'Rented'},
-        'C1-07-02': {'phase': 'C', 'block': 'C-1', 'floor': 7, 'type': 'C-13', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C1-07-03': {'phase': 'C', 'block': 'C-1', 'floor': 7, 'type': 'C-10', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C1-07-04': {'phase': 'C', 'block': 'C-1', 'floor': 7, 'type': 'C-3', 'bedrooms': 1, 'tenure': 'Rented'},
-        'C1-07-05': {'phase': 'C', 'block': 'C-1', 'floor': 7, 'type': 'C-3H', 'bedrooms': 1, 'tenure': 'Rented'},
-        'C1-07-06': {'phase': 'C', 'block': 'C-1', 'floor': 7, 'type': 'C-2', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C1-07-07': {'phase': 'C', 'block': 'C-1', 'floor': 7, 'type': 'C-14', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C1-07-08': {'phase': 'C', 'block': 'C-1', 'floor': 7, 'type': 'C-4', 'bedrooms': 3, 'tenure': 'Rented'},
-        'C1-08-01': {'phase': 'C', 'block': 'C-1', 'floor': 8, 'type': 'C-1', 'bedrooms': 3, 'tenure': 'Rented'},
-        'C1-08-02': {'phase': 'C', 'block': 'C-1', 'floor': 8, 'type': 'C-13', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C1-08-03': {'phase': 'C', 'block': 'C-1', 'floor': 8, 'type': 'C-10', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C1-08-04': {'phase': 'C', 'block': 'C-1', 'floor': 8, 'type': 'C-3', 'bedrooms': 1, 'tenure': 'Rented'},
-        'C1-08-05': {'phase': 'C', 'block': 'C-1', 'floor': 8, 'type': 'C-3H', 'bedrooms': 1, 'tenure': 'Rented'},
-        'C1-08-06': {'phase': 'C', 'block': 'C-1', 'floor': 8, 'type': 'C-2', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C1-08-07': {'phase': 'C', 'block': 'C-1', 'floor': 8, 'type': 'C-14', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C1-08-08': {'phase': 'C', 'block': 'C-1', 'floor': 8, 'type': 'C-4', 'bedrooms': 3, 'tenure': 'Rented'},
-        'C1-09-01': {'phase': 'C', 'block': 'C-1', 'floor': 9, 'type': 'C-1', 'bedrooms': 3, 'tenure': 'Rented'},
-        'C1-09-02': {'phase': 'C', 'block': 'C-1', 'floor': 9, 'type': 'C-13', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C1-09-03': {'phase': 'C', 'block': 'C-1', 'floor': 9, 'type': 'C-10', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C1-09-04': {'phase': 'C', 'block': 'C-1', 'floor': 9, 'type': 'C-3', 'bedrooms': 1, 'tenure': 'Rented'},
-        'C1-09-05': {'phase': 'C', 'block': 'C-1', 'floor': 9, 'type': 'C-3H', 'bedrooms': 1, 'tenure': 'Rented'},
-        'C1-09-06': {'phase': 'C', 'block': 'C-1', 'floor': 9, 'type': 'C-2', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C1-09-07': {'phase': 'C', 'block': 'C-1', 'floor': 9, 'type': 'C-14', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C1-09-08': {'phase': 'C', 'block': 'C-1', 'floor': 9, 'type': 'C-4', 'bedrooms': 3, 'tenure': 'Rented'},
-        'C1-10-01': {'phase': 'C', 'block': 'C-1', 'floor': 10, 'type': 'C-1', 'bedrooms': 3, 'tenure': 'Rented'},
-        'C1-10-02': {'phase': 'C', 'block': 'C-1', 'floor': 10, 'type': 'C-13', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C1-10-03': {'phase': 'C', 'block': 'C-1', 'floor': 10, 'type': 'C-10', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C1-10-04': {'phase': 'C', 'block': 'C-1', 'floor': 10, 'type': 'C-3', 'bedrooms': 1, 'tenure': 'Rented'},
-        'C1-10-05': {'phase': 'C', 'block': 'C-1', 'floor': 10, 'type': 'C-3H', 'bedrooms': 1, 'tenure': 'Rented'},
-        'C1-10-06': {'phase': 'C', 'block': 'C-1', 'floor': 10, 'type': 'C-2', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C1-10-07': {'phase': 'C', 'block': 'C-1', 'floor': 10, 'type': 'C-14', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C1-10-08': {'phase': 'C', 'block': 'C-1', 'floor': 10, 'type': 'C-4', 'bedrooms': 3, 'tenure': 'Rented'},
-        'C1-11-01': {'phase': 'C', 'block': 'C-1', 'floor': 11, 'type': 'C-1', 'bedrooms': 3, 'tenure': 'Rented'},
-        'C1-11-02': {'phase': 'C', 'block': 'C-1', 'floor': 11, 'type': 'C-13', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C1-11-03': {'phase': 'C', 'block': 'C-1', 'floor': 11, 'type': 'C-7', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C1-11-04': {'phase': 'C', 'block': 'C-1', 'floor': 11, 'type': 'C-12', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C1-11-05': {'phase': 'C', 'block': 'C-1', 'floor': 11, 'type': 'C-14', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C1-11-06': {'phase': 'C', 'block': 'C-1', 'floor': 11, 'type': 'C-4', 'bedrooms': 3, 'tenure': 'Rented'},
-        'C1-12-01': {'phase': 'C', 'block': 'C-1', 'floor': 12, 'type': 'C-1', 'bedrooms': 3, 'tenure': 'Rented'},
-        'C1-12-02': {'phase': 'C', 'block': 'C-1', 'floor': 12, 'type': 'C-8', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C1-12-03': {'phase': 'C', 'block': 'C-1', 'floor': 12, 'type': 'C-11', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C1-12-04': {'phase': 'C', 'block': 'C-1', 'floor': 12, 'type': 'C-4', 'bedrooms': 3, 'tenure': 'Rented'},
-        'C2-01-01': {'phase': 'C', 'block': 'C-2', 'floor': 1, 'type': 'C-5', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C2-01-02': {'phase': 'C', 'block': 'C-2', 'floor': 1, 'type': 'C-13', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C2-01-03': {'phase': 'C', 'block': 'C-2', 'floor': 1, 'type': 'C-10', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C2-01-04': {'phase': 'C', 'block': 'C-2', 'floor': 1, 'type': 'C-3', 'bedrooms': 1, 'tenure': 'Rented'},
-        'C2-01-05': {'phase': 'C', 'block': 'C-2', 'floor': 1, 'type': 'C-3H', 'bedrooms': 1, 'tenure': 'Rented'},
-        'C2-01-06': {'phase': 'C', 'block': 'C-2', 'floor': 1, 'type': 'C-2', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C2-01-07': {'phase': 'C', 'block': 'C-2', 'floor': 1, 'type': 'C-14', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C2-01-08': {'phase': 'C', 'block': 'C-2', 'floor': 1, 'type': 'C-4', 'bedrooms': 3, 'tenure': 'Rented'},
-        'C2-02-01': {'phase': 'C', 'block': 'C-2', 'floor': 2, 'type': 'C-5', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C2-02-02': {'phase': 'C', 'block': 'C-2', 'floor': 2, 'type': 'C-13', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C2-02-03': {'phase': 'C', 'block': 'C-2', 'floor': 2, 'type': 'C-10', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C2-02-04': {'phase': 'C', 'block': 'C-2', 'floor': 2, 'type': 'C-3', 'bedrooms': 1, 'tenure': 'Rented'},
-        'C2-02-05': {'phase': 'C', 'block': 'C-2', 'floor': 2, 'type': 'C-3H', 'bedrooms': 1, 'tenure': 'Rented'},
-        'C2-02-06': {'phase': 'C', 'block': 'C-2', 'floor': 2, 'type': 'C-2', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C2-02-07': {'phase': 'C', 'block': 'C-2', 'floor': 2, 'type': 'C-14', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C2-02-08': {'phase': 'C', 'block': 'C-2', 'floor': 2, 'type': 'C-4', 'bedrooms': 3, 'tenure': 'Rented'},
-        'C2-03-01': {'phase': 'C', 'block': 'C-2', 'floor': 3, 'type': 'C-15', 'bedrooms': 3, 'tenure': 'Rented'},
-        'C2-03-02': {'phase': 'C', 'block': 'C-2', 'floor': 3, 'type': 'C-13', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C2-03-03': {'phase': 'C', 'block': 'C-2', 'floor': 3, 'type': 'C-10', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C2-03-04': {'phase': 'C', 'block': 'C-2', 'floor': 3, 'type': 'C-3', 'bedrooms': 1, 'tenure': 'Rented'},
-        'C2-03-05': {'phase': 'C', 'block': 'C-2', 'floor': 3, 'type': 'C-3H', 'bedrooms': 1, 'tenure': 'Rented'},
-        'C2-03-06': {'phase': 'C', 'block': 'C-2', 'floor': 3, 'type': 'C-2', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C2-03-07': {'phase': 'C', 'block': 'C-2', 'floor': 3, 'type': 'C-14', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C2-03-08': {'phase': 'C', 'block': 'C-2', 'floor': 3, 'type': 'C-4', 'bedrooms': 3, 'tenure': 'Rented'},
-        'C2-04-01': {'phase': 'C', 'block': 'C-2', 'floor': 4, 'type': 'C-15', 'bedrooms': 3, 'tenure': 'Rented'},
-        'C2-04-02': {'phase': 'C', 'block': 'C-2', 'floor': 4, 'type': 'C-13', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C2-04-03': {'phase': 'C', 'block': 'C-2', 'floor': 4, 'type': 'C-10', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C2-04-04': {'phase': 'C', 'block': 'C-2', 'floor': 4, 'type': 'C-3', 'bedrooms': 1, 'tenure': 'Rented'},
-        'C2-04-05': {'phase': 'C', 'block': 'C-2', 'floor': 4, 'type': 'C-3H', 'bedrooms': 1, 'tenure': 'Rented'},
-        'C2-04-06': {'phase': 'C', 'block': 'C-2', 'floor': 4, 'type': 'C-2', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C2-04-07': {'phase': 'C', 'block': 'C-2', 'floor': 4, 'type': 'C-14', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C2-04-08': {'phase': 'C', 'block': 'C-2', 'floor': 4, 'type': 'C-4', 'bedrooms': 3, 'tenure': 'Rented'},
-        'C2-05-01': {'phase': 'C', 'block': 'C-2', 'floor': 5, 'type': 'C-15', 'bedrooms': 3, 'tenure': 'Rented'},
-        'C2-05-02': {'phase': 'C', 'block': 'C-2', 'floor': 5, 'type': 'C-13', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C2-05-03': {'phase': 'C', 'block': 'C-2', 'floor': 5, 'type': 'C-10', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C2-05-04': {'phase': 'C', 'block': 'C-2', 'floor': 5, 'type': 'C-3', 'bedrooms': 1, 'tenure': 'Rented'},
-        'C2-05-05': {'phase': 'C', 'block': 'C-2', 'floor': 5, 'type': 'C-3H', 'bedrooms': 1, 'tenure': 'Rented'},
-        'C2-05-06': {'phase': 'C', 'block': 'C-2', 'floor': 5, 'type': 'C-2', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C2-05-07': {'phase': 'C', 'block': 'C-2', 'floor': 5, 'type': 'C-14', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C2-05-08': {'phase': 'C', 'block': 'C-2', 'floor': 5, 'type': 'C-4', 'bedrooms': 3, 'tenure': 'Rented'},
-        'C2-06-01': {'phase': 'C', 'block': 'C-2', 'floor': 6, 'type': 'C-15', 'bedrooms': 3, 'tenure': 'Rented'},
-        'C2-06-02': {'phase': 'C', 'block': 'C-2', 'floor': 6, 'type': 'C-13', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C2-06-03': {'phase': 'C', 'block': 'C-2', 'floor': 6, 'type': 'C-10', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C2-06-04': {'phase': 'C', 'block': 'C-2', 'floor': 6, 'type': 'C-3', 'bedrooms': 1, 'tenure': 'Rented'},
-        'C2-06-05': {'phase': 'C', 'block': 'C-2', 'floor': 6, 'type': 'C-3H', 'bedrooms': 1, 'tenure': 'Rented'},
-        'C2-06-06': {'phase': 'C', 'block': 'C-2', 'floor': 6, 'type': 'C-2', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C2-06-07': {'phase': 'C', 'block': 'C-2', 'floor': 6, 'type': 'C-14', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C2-06-08': {'phase': 'C', 'block': 'C-2', 'floor': 6, 'type': 'C-4', 'bedrooms': 3, 'tenure': 'Rented'},
-        'C2-07-01': {'phase': 'C', 'block': 'C-2', 'floor': 7, 'type': 'C-15', 'bedrooms': 3, 'tenure': 'Rented'},
-        'C2-07-02': {'phase': 'C', 'block': 'C-2', 'floor': 7, 'type': 'C-13', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C2-07-03': {'phase': 'C', 'block': 'C-2', 'floor': 7, 'type': 'C-10', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C2-07-04': {'phase': 'C', 'block': 'C-2', 'floor': 7, 'type': 'C-3', 'bedrooms': 1, 'tenure': 'Rented'},
-        'C2-07-05': {'phase': 'C', 'block': 'C-2', 'floor': 7, 'type': 'C-3H', 'bedrooms': 1, 'tenure': 'Rented'},
-        'C2-07-06': {'phase': 'C', 'block': 'C-2', 'floor': 7, 'type': 'C-2', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C2-07-07': {'phase': 'C', 'block': 'C-2', 'floor': 7, 'type': 'C-14', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C2-07-08': {'phase': 'C', 'block': 'C-2', 'floor': 7, 'type': 'C-4', 'bedrooms': 3, 'tenure': 'Rented'},
-        'C2-08-01': {'phase': 'C', 'block': 'C-2', 'floor': 8, 'type': 'C-15', 'bedrooms': 3, 'tenure': 'Rented'},
-        'C2-08-02': {'phase': 'C', 'block': 'C-2', 'floor': 8, 'type': 'C-13', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C2-08-03': {'phase': 'C', 'block': 'C-2', 'floor': 8, 'type': 'C-7', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C2-08-04': {'phase': 'C', 'block': 'C-2', 'floor': 8, 'type': 'C-12', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C2-08-05': {'phase': 'C', 'block': 'C-2', 'floor': 8, 'type': 'C-14', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C2-08-06': {'phase': 'C', 'block': 'C-2', 'floor': 8, 'type': 'C-4', 'bedrooms': 3, 'tenure': 'Rented'},
-        'C2-09-01': {'phase': 'C', 'block': 'C-2', 'floor': 9, 'type': 'C-15', 'bedrooms': 3, 'tenure': 'Rented'},
-        'C2-09-02': {'phase': 'C', 'block': 'C-2', 'floor': 9, 'type': 'C-8', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C2-09-03': {'phase': 'C', 'block': 'C-2', 'floor': 9, 'type': 'C-11', 'bedrooms': 2, 'tenure': 'Rented'},
-        'C2-09-04': {'phase': 'C', 'block': 'C-2', 'floor': 9, 'type': 'C-4', 'bedrooms': 3, 'tenure': 'Rented'},
-        'D1-01-01': {'phase': 'D', 'block': 'D1', 'floor': 1, 'type': 'D-3', 'bedrooms': 2, 'tenure': 'Shared Ownership'},
-        'D1-01-02': {'phase': 'D', 'block': 'D1', 'floor': 1, 'type': 'D-4', 'bedrooms': 2, 'tenure': 'Shared Ownership'},
-        'D1-01-03': {'phase': 'D', 'block': 'D1', 'floor': 1, 'type': 'D-4H', 'bedrooms': 2, 'tenure': 'Shared Ownership'},
-        'D1-01-04': {'phase': 'D', 'block': 'D1', 'floor': 1, 'type': 'D-8', 'bedrooms': 2, 'tenure': 'Shared Ownership'},
-        'D1-01-05': {'phase': 'D', 'block': 'D1', 'floor': 1, 'type': 'D-8H', 'bedrooms': 2, 'tenure': 'Shared Ownership'},
-        'D1-01-06': {'phase': 'D', 'block': 'D1', 'floor': 1, 'type': 'D-18', 'bedrooms': 2, 'tenure': 'Shared Ownership'},
-        'D1-01-07': {'phase': 'D', 'block': 'D1', 'floor': 1, 'type': 'D-20H', 'bedrooms': 2, 'tenure': 'Shared Ownership'},
-        'D1-01-08': {'phase': 'D', 'block': 'D1', 'floor': 1, 'type': 'D-3H', 'bedrooms': 2, 'tenure': 'Shared Ownership'},
-        'D1-02-01': {'phase': 'D', 'block': 'D1', 'floor': 2, 'type': 'D-3', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D1-02-02': {'phase': 'D', 'block': 'D1', 'floor': 2, 'type': 'D-4', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D1-02-03': {'phase': 'D', 'block': 'D1', 'floor': 2, 'type': 'D-4H', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D1-02-04': {'phase': 'D', 'block': 'D1', 'floor': 2, 'type': 'D-9', 'bedrooms': 3, 'tenure': 'Market Accomodation'},
-        'D1-02-05': {'phase': 'D', 'block': 'D1', 'floor': 2, 'type': 'D-9H', 'bedrooms': 3, 'tenure': 'Market Accomodation'},
-        'D1-02-06': {'phase': 'D', 'block': 'D1', 'floor': 2, 'type': 'D-18', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D1-02-07': {'phase': 'D', 'block': 'D1', 'floor': 2, 'type': 'D-20H', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D1-02-08': {'phase': 'D', 'block': 'D1', 'floor': 2, 'type': 'D-3H', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D1-03-01': {'phase': 'D', 'block': 'D1', 'floor': 3, 'type': 'D-3', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D1-03-02': {'phase': 'D', 'block': 'D1', 'floor': 3, 'type': 'D-4', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D1-03-03': {'phase': 'D', 'block': 'D1', 'floor': 3, 'type': 'D-4H', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D1-03-04': {'phase': 'D', 'block': 'D1', 'floor': 3, 'type': 'D-9', 'bedrooms': 3, 'tenure': 'Market Accomodation'},
-        'D1-03-05': {'phase': 'D', 'block': 'D1', 'floor': 3, 'type': 'D-9H', 'bedrooms': 3, 'tenure': 'Market Accomodation'},
-        'D1-03-06': {'phase': 'D', 'block': 'D1', 'floor': 3, 'type': 'D-18', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D1-03-07': {'phase': 'D', 'block': 'D1', 'floor': 3, 'type': 'D-20H', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D1-03-08': {'phase': 'D', 'block': 'D1', 'floor': 3, 'type': 'D-3H', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D1-04-01': {'phase': 'D', 'block': 'D1', 'floor': 4, 'type': 'D-3', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D1-04-02': {'phase': 'D', 'block': 'D1', 'floor': 4, 'type': 'D-4', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D1-04-03': {'phase': 'D', 'block': 'D1', 'floor': 4, 'type': 'D-4H', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D1-04-04': {'phase': 'D', 'block': 'D1', 'floor': 4, 'type': 'D-9', 'bedrooms': 3, 'tenure': 'Market Accomodation'},
-        'D1-04-05': {'phase': 'D', 'block': 'D1', 'floor': 4, 'type': 'D-9H', 'bedrooms': 3, 'tenure': 'Market Accomodation'},
-        'D1-04-06': {'phase': 'D', 'block': 'D1', 'floor': 4, 'type': 'D-18', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D1-04-07': {'phase': 'D', 'block': 'D1', 'floor': 4, 'type': 'D-20H', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D1-04-08': {'phase': 'D', 'block': 'D1', 'floor': 4, 'type': 'D-3H', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D1-05-01': {'phase': 'D', 'block': 'D1', 'floor': 5, 'type': 'D-3', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D1-05-02': {'phase': 'D', 'block': 'D1', 'floor': 5, 'type': 'D-4', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D1-05-03': {'phase': 'D', 'block': 'D1', 'floor': 5, 'type': 'D-4H', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D1-05-04': {'phase': 'D', 'block': 'D1', 'floor': 5, 'type': 'D-9', 'bedrooms': 3, 'tenure': 'Market Accomodation'},
-        'D1-05-05': {'phase': 'D', 'block': 'D1', 'floor': 5, 'type': 'D-9H', 'bedrooms': 3, 'tenure': 'Market Accomodation'},
-        'D1-05-06': {'phase': 'D', 'block': 'D1', 'floor': 5, 'type': 'D-18', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D1-05-07': {'phase': 'D', 'block': 'D1', 'floor': 5, 'type': 'D-20H', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D1-05-08': {'phase': 'D', 'block': 'D1', 'floor': 5, 'type': 'D-3H', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D1-06-01': {'phase': 'D', 'block': 'D1', 'floor': 6, 'type': 'D-3', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D1-06-02': {'phase': 'D', 'block': 'D1', 'floor': 6, 'type': 'D-4', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D1-06-03': {'phase': 'D', 'block': 'D1', 'floor': 6, 'type': 'D-4H', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D1-06-04': {'phase': 'D', 'block': 'D1', 'floor': 6, 'type': 'D-9', 'bedrooms': 3, 'tenure': 'Market Accomodation'},
-        'D1-06-05': {'phase': 'D', 'block': 'D1', 'floor': 6, 'type': 'D-9H', 'bedrooms': 3, 'tenure': 'Market Accomodation'},
-        'D1-06-06': {'phase': 'D', 'block': 'D1', 'floor': 6, 'type': 'D-18', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D1-06-07': {'phase': 'D', 'block': 'D1', 'floor': 6, 'type': 'D-20H', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D1-06-08': {'phase': 'D', 'block': 'D1', 'floor': 6, 'type': 'D-3H', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D1-07-01': {'phase': 'D', 'block': 'D1', 'floor': 7, 'type': 'D-3', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D1-07-02': {'phase': 'D', 'block': 'D1', 'floor': 7, 'type': 'D-4', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D1-07-03': {'phase': 'D', 'block': 'D1', 'floor': 7, 'type': 'D-4H', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D1-07-04': {'phase': 'D', 'block': 'D1', 'floor': 7, 'type': 'D-9', 'bedrooms': 3, 'tenure': 'Market Accomodation'},
-        'D1-07-05': {'phase': 'D', 'block': 'D1', 'floor': 7, 'type': 'D-9H', 'bedrooms': 3, 'tenure': 'Market Accomodation'},
-        'D1-07-06': {'phase': 'D', 'block': 'D1', 'floor': 7, 'type': 'D-18', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D1-07-07': {'phase': 'D', 'block': 'D1', 'floor': 7, 'type': 'D-20H', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D1-07-08': {'phase': 'D', 'block': 'D1', 'floor': 7, 'type': 'D-3H', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D1-08-01': {'phase': 'D', 'block': 'D1', 'floor': 8, 'type': 'D-10', 'bedrooms': 1, 'tenure': 'Market Accomodation'},
-        'D1-08-02': {'phase': 'D', 'block': 'D1', 'floor': 8, 'type': 'D-23', 'bedrooms': 1, 'tenure': 'Market Accomodation'},
-        'D1-08-03': {'phase': 'D', 'block': 'D1', 'floor': 8, 'type': 'D-11', 'bedrooms': 1, 'tenure': 'Market Accomodation'},
-        'D1-08-04': {'phase': 'D', 'block': 'D1', 'floor': 8, 'type': 'D-10H', 'bedrooms': 1, 'tenure': 'Market Accomodation'},
-        'D1-LG-01': {'phase': 'D', 'block': 'D1', 'floor': 0, 'type': 'D-1', 'bedrooms': 1, 'tenure': 'Shared Ownership'},
-        'D1-LG-02': {'phase': 'D', 'block': 'D1', 'floor': 0, 'type': 'D-2', 'bedrooms': 1, 'tenure': 'Shared Ownership'},
-        'D1-UG-01': {'phase': 'D', 'block': 'D1', 'floor': 0, 'type': 'D-3', 'bedrooms': 2, 'tenure': 'Shared Ownership'},
-        'D1-UG-02': {'phase': 'D', 'block': 'D1', 'floor': 0, 'type': 'D-4', 'bedrooms': 2, 'tenure': 'Shared Ownership'},
-        'D1-UG-03': {'phase': 'D', 'block': 'D1', 'floor': 0, 'type': 'D-4H', 'bedrooms': 2, 'tenure': 'Shared Ownership'},
-        'D1-UG-04': {'phase': 'D', 'block': 'D1', 'floor': 0, 'type': 'D-5', 'bedrooms': 1, 'tenure': 'Shared Ownership'},
-        'D1-UG-05': {'phase': 'D', 'block': 'D1', 'floor': 0, 'type': 'D-5H', 'bedrooms': 1, 'tenure': 'Shared Ownership'},
-        'D1-UG-06': {'phase': 'D', 'block': 'D1', 'floor': 0, 'type': 'D-6H', 'bedrooms': 2, 'tenure': 'Shared Ownership'},
-        'D1-UG-07': {'phase': 'D', 'block': 'D1', 'floor': 0, 'type': 'D-7H', 'bedrooms': 1, 'tenure': 'Shared Ownership'},
-        'D1-UG-08': {'phase': 'D', 'block': 'D1', 'floor': 0, 'type': 'D-3H', 'bedrooms': 2, 'tenure': 'Shared Ownership'},
-        'D2-01-01': {'phase': 'D', 'block': 'D2', 'floor': 1, 'type': 'D-3', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D2-01-02': {'phase': 'D', 'block': 'D2', 'floor': 1, 'type': 'D-4', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D2-01-03': {'phase': 'D', 'block': 'D2', 'floor': 1, 'type': 'D-4H', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D2-01-04': {'phase': 'D', 'block': 'D2', 'floor': 1, 'type': 'D-12', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D2-01-05': {'phase': 'D', 'block': 'D2', 'floor': 1, 'type': 'D-12H', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D2-01-06': {'phase': 'D', 'block': 'D2', 'floor': 1, 'type': 'D-18', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D2-01-07': {'phase': 'D', 'block': 'D2', 'floor': 1, 'type': 'D-20H', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D2-01-08': {'phase': 'D', 'block': 'D2', 'floor': 1, 'type': 'D-3H', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D2-02-01': {'phase': 'D', 'block': 'D2', 'floor': 2, 'type': 'D-3', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D2-02-02': {'phase': 'D', 'block': 'D2', 'floor': 2, 'type': 'D-4', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D2-02-03': {'phase': 'D', 'block': 'D2', 'floor': 2, 'type': 'D-4H', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D2-02-04': {'phase': 'D', 'block': 'D2', 'floor': 2, 'type': 'D-12', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D2-02-05': {'phase': 'D', 'block': 'D2', 'floor': 2, 'type': 'D-12H', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D2-02-06': {'phase': 'D', 'block': 'D2', 'floor': 2, 'type': 'D-18', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D2-02-07': {'phase': 'D', 'block': 'D2', 'floor': 2, 'type': 'D-20H', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D2-02-08': {'phase': 'D', 'block': 'D2', 'floor': 2, 'type': 'D-3H', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D2-03-01': {'phase': 'D', 'block': 'D2', 'floor': 3, 'type': 'D-3', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D2-03-02': {'phase': 'D', 'block': 'D2', 'floor': 3, 'type': 'D-4', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D2-03-03': {'phase': 'D', 'block': 'D2', 'floor': 3, 'type': 'D-4H', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D2-03-04': {'phase': 'D', 'block': 'D2', 'floor': 3, 'type': 'D-12', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D2-03-05': {'phase': 'D', 'block': 'D2', 'floor': 3, 'type': 'D-12H', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D2-03-06': {'phase': 'D', 'block': 'D2', 'floor': 3, 'type': 'D-18', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D2-03-07': {'phase': 'D', 'block': 'D2', 'floor': 3, 'type': 'D-20H', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D2-03-08': {'phase': 'D', 'block': 'D2', 'floor': 3, 'type': 'D-3H', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D2-04-01': {'phase': 'D', 'block': 'D2', 'floor': 4, 'type': 'D-3', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D2-04-02': {'phase': 'D', 'block': 'D2', 'floor': 4, 'type': 'D-4', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D2-04-03': {'phase': 'D', 'block': 'D2', 'floor': 4, 'type': 'D-4H', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D2-04-04': {'phase': 'D', 'block': 'D2', 'floor': 4, 'type': 'D-12', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D2-04-05': {'phase': 'D', 'block': 'D2', 'floor': 4, 'type': 'D-12H', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D2-04-06': {'phase': 'D', 'block': 'D2', 'floor': 4, 'type': 'D-18', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D2-04-07': {'phase': 'D', 'block': 'D2', 'floor': 4, 'type': 'D-20H', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D2-04-08': {'phase': 'D', 'block': 'D2', 'floor': 4, 'type': 'D-3H', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D2-05-01': {'phase': 'D', 'block': 'D2', 'floor': 5, 'type': 'D-3', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D2-05-02': {'phase': 'D', 'block': 'D2', 'floor': 5, 'type': 'D-4', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D2-05-03': {'phase': 'D', 'block': 'D2', 'floor': 5, 'type': 'D-4H', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D2-05-04': {'phase': 'D', 'block': 'D2', 'floor': 5, 'type': 'D-12', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D2-05-05': {'phase': 'D', 'block': 'D2', 'floor': 5, 'type': 'D-12H', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D2-05-06': {'phase': 'D', 'block': 'D2', 'floor': 5, 'type': 'D-18', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D2-05-07': {'phase': 'D', 'block': 'D2', 'floor': 5, 'type': 'D-20H', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D2-05-08': {'phase': 'D', 'block': 'D2', 'floor': 5, 'type': 'D-3H', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D2-06-01': {'phase': 'D', 'block': 'D2', 'floor': 6, 'type': 'D-3', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D2-06-02': {'phase': 'D', 'block': 'D2', 'floor': 6, 'type': 'D-4', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D2-06-03': {'phase': 'D', 'block': 'D2', 'floor': 6, 'type': 'D-4H', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D2-06-04': {'phase': 'D', 'block': 'D2', 'floor': 6, 'type': 'D-12', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D2-06-05': {'phase': 'D', 'block': 'D2', 'floor': 6, 'type': 'D-12H', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D2-06-06': {'phase': 'D', 'block': 'D2', 'floor': 6, 'type': 'D-18', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D2-06-07': {'phase': 'D', 'block': 'D2', 'floor': 6, 'type': 'D-20H', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D2-06-08': {'phase': 'D', 'block': 'D2', 'floor': 6, 'type': 'D-3H', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D2-07-01': {'phase': 'D', 'block': 'D2', 'floor': 7, 'type': 'D-10', 'bedrooms': 1, 'tenure': 'Market Accomodation'},
-        'D2-07-02': {'phase': 'D', 'block': 'D2', 'floor': 7, 'type': 'D-22', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D2-07-03': {'phase': 'D', 'block': 'D2', 'floor': 7, 'type': 'D-13', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D2-07-04': {'phase': 'D', 'block': 'D2', 'floor': 7, 'type': 'D-10H', 'bedrooms': 1, 'tenure': 'Market Accomodation'},
-        'D2-UG-01': {'phase': 'D', 'block': 'D2', 'floor': 0, 'type': 'D-17', 'bedrooms': 1, 'tenure': 'Market Accomodation'},
-        'D2-UG-02': {'phase': 'D', 'block': 'D2', 'floor': 0, 'type': 'D-4', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D2-UG-03': {'phase': 'D', 'block': 'D2', 'floor': 0, 'type': 'D-20H', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D2-UG-04': {'phase': 'D', 'block': 'D2', 'floor': 0, 'type': 'D-17H', 'bedrooms': 1, 'tenure': 'Market Accomodation'},
-        'D3-01-01': {'phase': 'D', 'block': 'D3', 'floor': 1, 'type': 'D-3', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D3-01-02': {'phase': 'D', 'block': 'D3', 'floor': 1, 'type': 'D-20', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D3-01-03': {'phase': 'D', 'block': 'D3', 'floor': 1, 'type': 'D-18H', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D3-01-04': {'phase': 'D', 'block': 'D3', 'floor': 1, 'type': 'D-9', 'bedrooms': 3, 'tenure': 'Market Accomodation'},
-        'D3-01-05': {'phase': 'D', 'block': 'D3', 'floor': 1, 'type': 'D-9H', 'bedrooms': 3, 'tenure': 'Market Accomodation'},
-        'D3-01-06': {'phase': 'D', 'block': 'D3', 'floor': 1, 'type': 'D-4', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D3-01-07': {'phase': 'D', 'block': 'D3', 'floor': 1, 'type': 'D-4H', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D3-01-08': {'phase': 'D', 'block': 'D3', 'floor': 1, 'type': 'D-3H', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D3-02-01': {'phase': 'D', 'block': 'D3', 'floor': 2, 'type': 'D-3', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D3-02-02': {'phase': 'D', 'block': 'D3', 'floor': 2, 'type': 'D-20', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D3-02-03': {'phase': 'D', 'block': 'D3', 'floor': 2, 'type': 'D-18H', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D3-02-04': {'phase': 'D', 'block': 'D3', 'floor': 2, 'type': 'D-9', 'bedrooms': 3, 'tenure': 'Market Accomodation'},
-        'D3-02-05': {'phase': 'D', 'block': 'D3', 'floor': 2, 'type': 'D-9H', 'bedrooms': 3, 'tenure': 'Market Accomodation'},
-        'D3-02-06': {'phase': 'D', 'block': 'D3', 'floor': 2, 'type': 'D-4', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D3-02-07': {'phase': 'D', 'block': 'D3', 'floor': 2, 'type': 'D-4H', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D3-02-08': {'phase': 'D', 'block': 'D3', 'floor': 2, 'type': 'D-3H', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D3-03-01': {'phase': 'D', 'block': 'D3', 'floor': 3, 'type': 'D-3', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D3-03-02': {'phase': 'D', 'block': 'D3', 'floor': 3, 'type': 'D-20', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D3-03-03': {'phase': 'D', 'block': 'D3', 'floor': 3, 'type': 'D-18H', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D3-03-04': {'phase': 'D', 'block': 'D3', 'floor': 3, 'type': 'D-9', 'bedrooms': 3, 'tenure': 'Market Accomodation'},
-        'D3-03-05': {'phase': 'D', 'block': 'D3', 'floor': 3, 'type': 'D-9H', 'bedrooms': 3, 'tenure': 'Market Accomodation'},
-        'D3-03-06': {'phase': 'D', 'block': 'D3', 'floor': 3, 'type': 'D-4', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D3-03-07': {'phase': 'D', 'block': 'D3', 'floor': 3, 'type': 'D-4H', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D3-03-08': {'phase': 'D', 'block': 'D3', 'floor': 3, 'type': 'D-3H', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D3-04-01': {'phase': 'D', 'block': 'D3', 'floor': 4, 'type': 'D-3', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D3-04-02': {'phase': 'D', 'block': 'D3', 'floor': 4, 'type': 'D-20', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D3-04-03': {'phase': 'D', 'block': 'D3', 'floor': 4, 'type': 'D-18H', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D3-04-04': {'phase': 'D', 'block': 'D3', 'floor': 4, 'type': 'D-9', 'bedrooms': 3, 'tenure': 'Market Accomodation'},
-        'D3-04-05': {'phase': 'D', 'block': 'D3', 'floor': 4, 'type': 'D-9H', 'bedrooms': 3, 'tenure': 'Market Accomodation'},
-        'D3-04-06': {'phase': 'D', 'block': 'D3', 'floor': 4, 'type': 'D-4', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D3-04-07': {'phase': 'D', 'block': 'D3', 'floor': 4, 'type': 'D-4H', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D3-04-08': {'phase': 'D', 'block': 'D3', 'floor': 4, 'type': 'D-3H', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D3-05-01': {'phase': 'D', 'block': 'D3', 'floor': 5, 'type': 'D-3', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D3-05-02': {'phase': 'D', 'block': 'D3', 'floor': 5, 'type': 'D-20', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D3-05-03': {'phase': 'D', 'block': 'D3', 'floor': 5, 'type': 'D-18H', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D3-05-04': {'phase': 'D', 'block': 'D3', 'floor': 5, 'type': 'D-9', 'bedrooms': 3, 'tenure': 'Market Accomodation'},
-        'D3-05-05': {'phase': 'D', 'block': 'D3', 'floor': 5, 'type': 'D-9H', 'bedrooms': 3, 'tenure': 'Market Accomodation'},
-        'D3-05-06': {'phase': 'D', 'block': 'D3', 'floor': 5, 'type': 'D-4', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D3-05-07': {'phase': 'D', 'block': 'D3', 'floor': 5, 'type': 'D-4H', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D3-05-08': {'phase': 'D', 'block': 'D3', 'floor': 5, 'type': 'D-3H', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D3-06-01': {'phase': 'D', 'block': 'D3', 'floor': 6, 'type': 'D-3', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D3-06-02': {'phase': 'D', 'block': 'D3', 'floor': 6, 'type': 'D-21', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D3-06-03': {'phase': 'D', 'block': 'D3', 'floor': 6, 'type': 'D-19', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D3-06-04': {'phase': 'D', 'block': 'D3', 'floor': 6, 'type': 'D-9', 'bedrooms': 3, 'tenure': 'Market Accomodation'},
-        'D3-06-05': {'phase': 'D', 'block': 'D3', 'floor': 6, 'type': 'D-9H', 'bedrooms': 3, 'tenure': 'Market Accomodation'},
-        'D3-06-06': {'phase': 'D', 'block': 'D3', 'floor': 6, 'type': 'D-16', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D3-06-07': {'phase': 'D', 'block': 'D3', 'floor': 6, 'type': 'D-16H', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D3-06-08': {'phase': 'D', 'block': 'D3', 'floor': 6, 'type': 'D-3H', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D3-LG-01': {'phase': 'D', 'block': 'D3', 'floor': 0, 'type': 'D-14', 'bedrooms': 1, 'tenure': 'Market Accomodation'},
-        'D3-LG-02': {'phase': 'D', 'block': 'D3', 'floor': 0, 'type': 'D-14H', 'bedrooms': 1, 'tenure': 'Market Accomodation'},
-        'D3-UG-01': {'phase': 'D', 'block': 'D3', 'floor': 0, 'type': 'D-3', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D3-UG-02': {'phase': 'D', 'block': 'D3', 'floor': 0, 'type': 'D-7', 'bedrooms': 1, 'tenure': 'Market Accomodation'},
-        'D3-UG-03': {'phase': 'D', 'block': 'D3', 'floor': 0, 'type': 'D-6', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D3-UG-04': {'phase': 'D', 'block': 'D3', 'floor': 0, 'type': 'D-5', 'bedrooms': 1, 'tenure': 'Market Accomodation'},
-        'D3-UG-05': {'phase': 'D', 'block': 'D3', 'floor': 0, 'type': 'D-15', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D3-UG-06': {'phase': 'D', 'block': 'D3', 'floor': 0, 'type': 'D-4H', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'D3-UG-07': {'phase': 'D', 'block': 'D3', 'floor': 0, 'type': 'D-3H', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'E1-00-01': {'phase': 'E', 'block': 'E1', 'floor': 0, 'type': 'E-15', 'bedrooms': 1, 'tenure': 'Rented'},
-        'E1-00-02': {'phase': 'E', 'block': 'E1', 'floor': 0, 'type': 'E-16', 'bedrooms': 1, 'tenure': 'Rented'},
-        'E1-01-01': {'phase': 'E', 'block': 'E1', 'floor': 1, 'type': 'E-1', 'bedrooms': 1, 'tenure': 'Rented'},
-        'E1-01-02': {'phase': 'E', 'block': 'E1', 'floor': 1, 'type': 'E-2', 'bedrooms': 1, 'tenure': 'Rented'},
-        'E1-01-03': {'phase': 'E', 'block': 'E1', 'floor': 1, 'type': 'E-3', 'bedrooms': 1, 'tenure': 'Rented'},
-        'E1-01-04': {'phase': 'E', 'block': 'E1', 'floor': 1, 'type': 'E-4', 'bedrooms': 1, 'tenure': 'Rented'},
-        'E1-01-05': {'phase': 'E', 'block': 'E1', 'floor': 1, 'type': 'E-5', 'bedrooms': 1, 'tenure': 'Rented'},
-        'E1-01-06': {'phase': 'E', 'block': 'E1', 'floor': 1, 'type': 'E-6', 'bedrooms': 1, 'tenure': 'Rented'},
-        'E1-01-07': {'phase': 'E', 'block': 'E1', 'floor': 1, 'type': 'E-7', 'bedrooms': 1, 'tenure': 'Rented'},
-        'E1-01-08': {'phase': 'E', 'block': 'E1', 'floor': 1, 'type': 'E-8', 'bedrooms': 1, 'tenure': 'Rented'},
-        'E1-01-09': {'phase': 'E', 'block': 'E1', 'floor': 1, 'type': 'E-9', 'bedrooms': 1, 'tenure': 'Rented'},
-        'E1-01-10': {'phase': 'E', 'block': 'E1', 'floor': 1, 'type': 'E-10', 'bedrooms': 1, 'tenure': 'Rented'},
-        'E1-01-11': {'phase': 'E', 'block': 'E1', 'floor': 1, 'type': 'E-11', 'bedrooms': 1, 'tenure': 'Rented'},
-        'E1-01-12': {'phase': 'E', 'block': 'E1', 'floor': 1, 'type': 'E-12', 'bedrooms': 1, 'tenure': 'Rented'},
-        'E1-02-01': {'phase': 'E', 'block': 'E1', 'floor': 2, 'type': 'E-1', 'bedrooms': 1, 'tenure': 'Rented'},
-        'E1-02-02': {'phase': 'E', 'block': 'E1', 'floor': 2, 'type': 'E-2', 'bedrooms': 1, 'tenure': 'Rented'},
-        'E1-02-03': {'phase': 'E', 'block': 'E1', 'floor': 2, 'type': 'E-3', 'bedrooms': 1, 'tenure': 'Rented'},
-        'E1-02-04': {'phase': 'E', 'block': 'E1', 'floor': 2, 'type': 'E-4', 'bedrooms': 1, 'tenure': 'Rented'},
-        'E1-02-05': {'phase': 'E', 'block': 'E1', 'floor': 2, 'type': 'E-5', 'bedrooms': 1, 'tenure': 'Rented'},
-        'E1-02-06': {'phase': 'E', 'block': 'E1', 'floor': 2, 'type': 'E-6', 'bedrooms': 1, 'tenure': 'Rented'},
-        'E1-02-07': {'phase': 'E', 'block': 'E1', 'floor': 2, 'type': 'E-7', 'bedrooms': 1, 'tenure': 'Rented'},
-        'E1-02-08': {'phase': 'E', 'block': 'E1', 'floor': 2, 'type': 'E-8', 'bedrooms': 1, 'tenure': 'Rented'},
-        'E1-02-09': {'phase': 'E', 'block': 'E1', 'floor': 2, 'type': 'E-9', 'bedrooms': 1, 'tenure': 'Rented'},
-        'E1-02-10': {'phase': 'E', 'block': 'E1', 'floor': 2, 'type': 'E-10', 'bedrooms': 1, 'tenure': 'Rented'},
-        'E1-02-11': {'phase': 'E', 'block': 'E1', 'floor': 2, 'type': 'E-11', 'bedrooms': 1, 'tenure': 'Rented'},
-        'E1-02-12': {'phase': 'E', 'block': 'E1', 'floor': 2, 'type': 'E-12', 'bedrooms': 1, 'tenure': 'Rented'},
-        'E1-03-01': {'phase': 'E', 'block': 'E1', 'floor': 3, 'type': 'E-1', 'bedrooms': 1, 'tenure': 'Rented'},
-        'E1-03-02': {'phase': 'E', 'block': 'E1', 'floor': 3, 'type': 'E-2', 'bedrooms': 1, 'tenure': 'Rented'},
-        'E1-03-03': {'phase': 'E', 'block': 'E1', 'floor': 3, 'type': 'E-3', 'bedrooms': 1, 'tenure': 'Rented'},
-        'E1-03-04': {'phase': 'E', 'block': 'E1', 'floor': 3, 'type': 'E-4', 'bedrooms': 1, 'tenure': 'Rented'},
-        'E1-03-05': {'phase': 'E', 'block': 'E1', 'floor': 3, 'type': 'E-5', 'bedrooms': 1, 'tenure': 'Rented'},
-        'E1-03-06': {'phase': 'E', 'block': 'E1', 'floor': 3, 'type': 'E-6', 'bedrooms': 1, 'tenure': 'Rented'},
-        'E1-03-07': {'phase': 'E', 'block': 'E1', 'floor': 3, 'type': 'E-7', 'bedrooms': 1, 'tenure': 'Rented'},
-        'E1-03-08': {'phase': 'E', 'block': 'E1', 'floor': 3, 'type': 'E-8', 'bedrooms': 1, 'tenure': 'Rented'},
-        'E1-03-09': {'phase': 'E', 'block': 'E1', 'floor': 3, 'type': 'E-9', 'bedrooms': 1, 'tenure': 'Rented'},
-        'E1-03-10': {'phase': 'E', 'block': 'E1', 'floor': 3, 'type': 'E-10', 'bedrooms': 1, 'tenure': 'Rented'},
-        'E1-03-11': {'phase': 'E', 'block': 'E1', 'floor': 3, 'type': 'E-11', 'bedrooms': 1, 'tenure': 'Rented'},
-        'E1-03-12': {'phase': 'E', 'block': 'E1', 'floor': 3, 'type': 'E-12', 'bedrooms': 1, 'tenure': 'Rented'},
-        'E1-04-01': {'phase': 'E', 'block': 'E1', 'floor': 4, 'type': 'E-1', 'bedrooms': 1, 'tenure': 'Rented'},
-        'E1-04-02': {'phase': 'E', 'block': 'E1', 'floor': 4, 'type': 'E-2', 'bedrooms': 1, 'tenure': 'Rented'},
-        'E1-04-03': {'phase': 'E', 'block': 'E1', 'floor': 4, 'type': 'E-3', 'bedrooms': 1, 'tenure': 'Rented'},
-        'E1-04-04': {'phase': 'E', 'block': 'E1', 'floor': 4, 'type': 'E-4', 'bedrooms': 1, 'tenure': 'Rented'},
-        'E1-04-05': {'phase': 'E', 'block': 'E1', 'floor': 4, 'type': 'E-5', 'bedrooms': 1, 'tenure': 'Rented'},
-        'E1-04-06': {'phase': 'E', 'block': 'E1', 'floor': 4, 'type': 'E-6', 'bedrooms': 1, 'tenure': 'Rented'},
-        'E1-04-07': {'phase': 'E', 'block': 'E1', 'floor': 4, 'type': 'E-7', 'bedrooms': 1, 'tenure': 'Rented'},
-        'E1-04-08': {'phase': 'E', 'block': 'E1', 'floor': 4, 'type': 'E-8', 'bedrooms': 1, 'tenure': 'Rented'},
-        'E1-04-09': {'phase': 'E', 'block': 'E1', 'floor': 4, 'type': 'E-9', 'bedrooms': 1, 'tenure': 'Rented'},
-        'E1-04-10': {'phase': 'E', 'block': 'E1', 'floor': 4, 'type': 'E-10', 'bedrooms': 1, 'tenure': 'Rented'},
-        'E1-04-11': {'phase': 'E', 'block': 'E1', 'floor': 4, 'type': 'E-11', 'bedrooms': 1, 'tenure': 'Rented'},
-        'E1-04-12': {'phase': 'E', 'block': 'E1', 'floor': 4, 'type': 'E-12', 'bedrooms': 1, 'tenure': 'Rented'},
-        'E1-05-01': {'phase': 'E', 'block': 'E1', 'floor': 5, 'type': 'E-14', 'bedrooms': 1, 'tenure': 'Rented'},
-        'E1-05-02': {'phase': 'E', 'block': 'E1', 'floor': 5, 'type': 'E-13', 'bedrooms': 1, 'tenure': 'Rented'},
-        'E1-05-03': {'phase': 'E', 'block': 'E1', 'floor': 5, 'type': 'E-10', 'bedrooms': 1, 'tenure': 'Rented'},
-        'E1-05-04': {'phase': 'E', 'block': 'E1', 'floor': 5, 'type': 'E-11', 'bedrooms': 1, 'tenure': 'Rented'},
-        'E1-05-05': {'phase': 'E', 'block': 'E1', 'floor': 5, 'type': 'E-12', 'bedrooms': 1, 'tenure': 'Rented'},
-        'E1-06-01': {'phase': 'E', 'block': 'E1', 'floor': 6, 'type': 'E-14', 'bedrooms': 1, 'tenure': 'Rented'},
-        'E1-06-02': {'phase': 'E', 'block': 'E1', 'floor': 6, 'type': 'E-13', 'bedrooms': 1, 'tenure': 'Rented'},
-        'E1-06-03': {'phase': 'E', 'block': 'E1', 'floor': 6, 'type': 'E-10', 'bedrooms': 1, 'tenure': 'Rented'},
-        'E1-06-04': {'phase': 'E', 'block': 'E1', 'floor': 6, 'type': 'E-11', 'bedrooms': 1, 'tenure': 'Rented'},
-        'E1-06-05': {'phase': 'E', 'block': 'E1', 'floor': 6, 'type': 'E-12', 'bedrooms': 1, 'tenure': 'Rented'},
-        'E2-00-01': {'phase': 'E', 'block': 'E2', 'floor': 0, 'type': 'E-20', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'E2-01-01': {'phase': 'E', 'block': 'E2', 'floor': 1, 'type': 'E-21', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'E2-02-01': {'phase': 'E', 'block': 'E2', 'floor': 2, 'type': 'E-21', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'E2-03-01': {'phase': 'E', 'block': 'E2', 'floor': 3, 'type': 'E-21', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'E2-04-01': {'phase': 'E', 'block': 'E2', 'floor': 4, 'type': 'E-21', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'E2-05-01': {'phase': 'E', 'block': 'E2', 'floor': 5, 'type': 'E-21', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'E2-06-01': {'phase': 'E', 'block': 'E2', 'floor': 6, 'type': 'E-21', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'E2-01-05': {'phase': 'E', 'block': 'E2', 'floor': 1, 'type': 'E-22', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'E2-02-05': {'phase': 'E', 'block': 'E2', 'floor': 2, 'type': 'E-22', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'E2-03-05': {'phase': 'E', 'block': 'E2', 'floor': 3, 'type': 'E-22', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'E2-04-05': {'phase': 'E', 'block': 'E2', 'floor': 4, 'type': 'E-22', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'E2-05-05': {'phase': 'E', 'block': 'E2', 'floor': 5, 'type': 'E-22', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'E2-06-05': {'phase': 'E', 'block': 'E2', 'floor': 6, 'type': 'E-22', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'E2-01-02': {'phase': 'E', 'block': 'E2', 'floor': 1, 'type': 'E-23', 'bedrooms': 1, 'tenure': 'Market Accomodation'},
-        'E2-02-02': {'phase': 'E', 'block': 'E2', 'floor': 2, 'type': 'E-23', 'bedrooms': 1, 'tenure': 'Market Accomodation'},
-        'E2-03-02': {'phase': 'E', 'block': 'E2', 'floor': 3, 'type': 'E-23', 'bedrooms': 1, 'tenure': 'Market Accomodation'},
-        'E2-04-02': {'phase': 'E', 'block': 'E2', 'floor': 4, 'type': 'E-23', 'bedrooms': 1, 'tenure': 'Market Accomodation'},
-        'E2-05-02': {'phase': 'E', 'block': 'E2', 'floor': 5, 'type': 'E-23', 'bedrooms': 1, 'tenure': 'Market Accomodation'},
-        'E2-06-02': {'phase': 'E', 'block': 'E2', 'floor': 6, 'type': 'E-23', 'bedrooms': 1, 'tenure': 'Market Accomodation'},
-        'E2-01-04': {'phase': 'E', 'block': 'E2', 'floor': 1, 'type': 'E-24', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'E2-02-04': {'phase': 'E', 'block': 'E2', 'floor': 2, 'type': 'E-24', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'E2-03-04': {'phase': 'E', 'block': 'E2', 'floor': 3, 'type': 'E-24', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'E2-04-04': {'phase': 'E', 'block': 'E2', 'floor': 4, 'type': 'E-24', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'E2-05-04': {'phase': 'E', 'block': 'E2', 'floor': 5, 'type': 'E-24', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'E2-06-04': {'phase': 'E', 'block': 'E2', 'floor': 6, 'type': 'E-24', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'E2-01-03': {'phase': 'E', 'block': 'E2', 'floor': 1, 'type': 'E-25', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'E2-02-03': {'phase': 'E', 'block': 'E2', 'floor': 2, 'type': 'E-25', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'E2-03-03': {'phase': 'E', 'block': 'E2', 'floor': 3, 'type': 'E-25', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'E2-04-03': {'phase': 'E', 'block': 'E2', 'floor': 4, 'type': 'E-25', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'E2-05-03': {'phase': 'E', 'block': 'E2', 'floor': 5, 'type': 'E-25', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-        'E2-06-03': {'phase': 'E', 'block': 'E2', 'floor': 6, 'type': 'E-25', 'bedrooms': 2, 'tenure': 'Market Accomodation'},
-    }
-}
-
 # Custom status mapping for Holloway Park
 # This project uses a dual-column status system:
 # - Column F: 'Status' (can be 'Construction', 'IFC-pending', etc.)
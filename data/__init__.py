@@ -1,11 +1,42 @@
 """Data storage and database operations module."""
 
-from .database import DocumentDatabase
-from .schema import DATABASE_SCHEMA, SCHEMA_VERSION
+from utils.lazy_imports import lazy_exports
+
+# Submodules are imported on first use of one of their names
+_SUBMODULE_EXPORTS = {
+    'database': [
+        'DocumentDatabase'
+    ],
+    'archive': [
+        'export_project_archive',
+        'restore_project_archive',
+        'read_archive_manifest'
+    ],
+    'accommodation': [
+        'load_accommodation_data',
+        'save_accommodation_data'
+    ],
+    'encoding': [
+        'encode_column',
+        'decode_column'
+    ],
+    'schema': [
+        'DATABASE_SCHEMA',
+        'SCHEMA_VERSION'
+    ]
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _SUBMODULE_EXPORTS)
 
 __all__ = [
     'DocumentDatabase',
+    'export_project_archive',
+    'restore_project_archive',
+    'read_archive_manifest',
+    'load_accommodation_data',
+    'save_accommodation_data',
+    'encode_column',
+    'decode_column',
     'DATABASE_SCHEMA',
     'SCHEMA_VERSION'
 ]
-
@@ -0,0 +1,191 @@
+"""Accommodation data files, kept next to the database instead of in the project configs.
+
+scripts/update_accommodation_data.py parses a project's accommodation schedule
+into ACCOMMODATION_DATA (phases, blocks, apartment types, tenures and the
+per-apartment lookup) and saves it to data/accommodation/<Project>.json.
+The file is only read when a report needs the data (certificate tracking),
+through config.get_accommodation_data().
+
+The apartment lists are what made the data large, so they are stored
+range-encoded: a run of consecutive apartments (101, 102, 103 or 'C1-01-01',
+'C1-01-02', 'C1-01-03' - the same prefix with the trailing number counting up)
+becomes a [first, count] pair, and other apartments are stored as they are.
+The apartment lookup is stored column by column, each column as its distinct
+values plus one code per apartment.
+"""
+
+import json
+import os
+import re
+from pathlib import Path
+
+from .encoding import decode_column, encode_column
+
+
+# Bumped when the layout of the file changes
+ACCOMMODATION_FORMAT = 1
+
+ACCOMMODATION_SUFFIX = '.json'
+
+# Apartment numbers whose trailing number can count up ('C1-01-07' -> 'C1-01-08')
+_NUMBERED_PATTERN = re.compile(r'^(.*?)(\d+)$')
+
+# Loaded files, by path: (modification time, data)
+_loaded = {}
+
+
+def _next_apartment(apartment):
+    """The apartment a run continues with after apartment (None if it can't be counted up)."""
+    if isinstance(apartment, bool):
+        return None
+    if isinstance(apartment, int):
+        return apartment + 1
+    if isinstance(apartment, str):
+        match = _NUMBERED_PATTERN.match(apartment)
+        if match:
+            prefix, number = match.groups()
+            return f"{prefix}{int(number) + 1:0{len(number)}d}"
+    return None
+
+
+def encode_apartments(apartments):
+    """Range-encode a list of apartments: runs become [first, count], others stay as they are."""
+    encoded = []
+    index = 0
+    while index < len(apartments):
+        first = apartments[index]
+        count = 1
+        following = _next_apartment(first)
+        while (following is not None and index + count < len(apartments)
+               and type(apartments[index + count]) is type(first) and apartments[index + count] == following):
+            count += 1
+            following = _next_apartment(following)
+        encoded.append([first, count] if count > 1 else first)
+        index += count
+    return encoded
+
+
+def decode_apartments(encoded):
+    """The list of apartments encoded by encode_apartments()."""
+    apartments = []
+    for item in encoded:
+        if not isinstance(item, list):
+            apartments.append(item)
+            continue
+        apartment, count = item
+        for _ in range(count):
+            apartments.append(apartment)
+            apartment = _next_apartment(apartment)
+    return apartments
+
+
+def _map_apartment_lists(data, function):
+    """Copy of nested dictionaries with function applied to every 'apartments' list."""
+    return {
+        key: function(value) if key == 'apartments' and isinstance(value, list)
+        else _map_apartment_lists(value, function) if isinstance(value, dict)
+        else value
+        for key, value in data.items()
+    }
+
+
+def encode_accommodation_data(data):
+    """
+    The stored form of an ACCOMMODATION_DATA dictionary.
+
+    Args:
+        data: ACCOMMODATION_DATA, as built by scripts/update_accommodation_data.py
+
+    Returns:
+        JSON-serializable dictionary with range-encoded apartment lists and a
+        column-encoded apartment lookup
+    """
+    lookup = data.get('apartment_lookup', {})
+    fields = list(dict.fromkeys(field for entry in lookup.values() for field in entry))
+    stored = _map_apartment_lists({key: value for key, value in data.items() if key != 'apartment_lookup'},
+                                  encode_apartments)
+    stored['apartment_lookup'] = {
+        'apartments': encode_apartments(list(lookup)),
+        'fields': {field: encode_column([entry.get(field) for entry in lookup.values()]) for field in fields},
+    }
+    return {'format': ACCOMMODATION_FORMAT, **stored}
+
+
+def decode_accommodation_data(stored):
+    """
+    ACCOMMODATION_DATA from its stored form.
+
+    Args:
+        stored: Dictionary written by encode_accommodation_data()
+
+    Returns:
+        ACCOMMODATION_DATA dictionary
+
+    Raises:
+        ValueError: If the data was written in a newer format
+    """
+    if stored.get('format', ACCOMMODATION_FORMAT) > ACCOMMODATION_FORMAT:
+        raise ValueError(f"Accommodation data format {stored['format']} is newer than this code understands")
+
+    stored = {key: value for key, value in stored.items() if key != 'format'}
+    lookup = stored.pop('apartment_lookup', None)
+    data = _map_apartment_lists(stored, decode_apartments)
+    if lookup is not None:
+        fields = {field: decode_column(column) for field, column in lookup['fields'].items()}
+        data['apartment_lookup'] = {
+            apartment: {field: values[index] for field, values in fields.items()}
+            for index, apartment in enumerate(decode_apartments(lookup['apartments']))
+        }
+    return data
+
+
+def save_accommodation_data(data, path):
+    """
+    Write ACCOMMODATION_DATA to a file.
+
+    The file is written next to path and moved into place when complete.
+
+    Args:
+        data: ACCOMMODATION_DATA dictionary
+        path: Path of the file to write
+
+    Raises:
+        ValueError: If the data would not read back the same (e.g. values
+            JSON cannot hold, such as tuples or non-string keys)
+    """
+    path = Path(path)
+    stored = encode_accommodation_data(data)
+    serialized = json.dumps(stored, separators=(',', ':'), ensure_ascii=False)
+    if decode_accommodation_data(json.loads(serialized)) != data:
+        raise ValueError(f"Accommodation data for {path.stem} does not survive being stored as JSON")
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(path.name + '.tmp')
+    temp_path.write_text(serialized, encoding='utf-8')
+    os.replace(temp_path, path)
+
+
+def load_accommodation_data(path):
+    """
+    Read a file written by save_accommodation_data().
+
+    Files are read once per process and again only when they change; the
+    returned dictionary is shared, so callers must not modify it.
+
+    Args:
+        path: Path of the file
+
+    Returns:
+        ACCOMMODATION_DATA dictionary, or None if the file does not exist
+    """
+    path = Path(path)
+    try:
+        modified = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+    cached = _loaded.get(path)
+    if cached is None or cached[0] != modified:
+        data = decode_accommodation_data(json.loads(path.read_text(encoding='utf-8')))
+        cached = _loaded[path] = (modified, data)
+    return cached[1]
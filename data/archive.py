@@ -0,0 +1,209 @@
+"""Compressed project archives, for rebuilding the database without the source registers.
+
+An archive is a zip file holding one project's stored data:
+
+- manifest.json: archive format, project, schema version, export time and the
+  document count of each stored snapshot (documents are kept in snapshot order)
+- documents.json: the document rows, column by column, with their classification
+- tables.json: the project's rows of the other tables - the processing ledger,
+  classification state, detected changes, document history and the counts of
+  compacted snapshots
+
+Every column is stored dictionary-encoded (its distinct values and one code
+per row), since references, titles and folder paths repeat in every snapshot;
+deflate compresses the codes. Restoring inserts the rows through
+DocumentDatabase.insert_documents(), without parsing or classifying registers.
+"""
+
+import json
+import os
+import zipfile
+from datetime import datetime
+from pathlib import Path
+
+from .database import ATTRIBUTE_COLUMNS, DOCUMENT_COLUMNS, PROJECT_TABLES
+from .encoding import decode_column, encode_column
+from .schema import SCHEMA_VERSION
+from utils.tracing import traced
+
+
+# Bumped when the layout of the archive members changes
+ARCHIVE_FORMAT = 1
+
+ARCHIVE_SUFFIX = '.zip'
+
+# Tables archived with the documents (import run checkpoints are not)
+ARCHIVE_TABLES = [table_name for table_name in PROJECT_TABLES if table_name != 'import_checkpoints']
+
+
+def _write_member(archive, name, data):
+    archive.writestr(name, json.dumps(data, separators=(',', ':')))
+
+
+def _read_member(archive, name):
+    return json.loads(archive.read(name))
+
+
+def read_archive_manifest(archive_path):
+    """Read an archive's manifest.
+
+    Args:
+        archive_path: Path to the archive
+
+    Returns:
+        Dictionary with 'format', 'project_name', 'schema_version',
+        'exported_at' and 'snapshots' ([snapshot_date, snapshot_time,
+        document count] lists in chronological order)
+    """
+    with zipfile.ZipFile(archive_path) as archive:
+        return _read_member(archive, 'manifest.json')
+
+
+@traced('archive.export')
+def export_project_archive(db, project_name, archive_path):
+    """Write a project's stored snapshots and ledger to a compressed archive.
+
+    The archive is written next to archive_path and moved into place when
+    complete, so an existing archive is only replaced by a whole one.
+
+    Args:
+        db: Open DocumentDatabase
+        project_name: Name of the project
+        archive_path: Path of the archive to write
+
+    Returns:
+        Dictionary with the 'snapshots' and 'documents' archived and the
+        archive size in 'bytes'
+    """
+    archive_path = Path(archive_path)
+    documents = db.get_project_documents(project_name)
+    snapshots = [
+        [snapshot_date, snapshot_time, int(count)]
+        for (snapshot_date, snapshot_time), count
+        in documents.groupby(['snapshot_date', 'snapshot_time'], sort=False).size().items()
+    ]
+
+    tables = {}
+    cursor = db.conn.cursor()
+    cursor.row_factory = None
+    for table_name in ARCHIVE_TABLES:
+        cursor.execute(f"SELECT * FROM {table_name} WHERE project_name = ? ORDER BY rowid", (project_name,))
+        names = [description[0] for description in cursor.description]
+        rows = cursor.fetchall()
+        tables[table_name] = {
+            name: encode_column(values)
+            for name, values in zip(names, zip(*rows) if rows else [()] * len(names))
+            if name != 'project_name'
+        }
+
+    manifest = {
+        'format': ARCHIVE_FORMAT,
+        'project_name': project_name,
+        'schema_version': SCHEMA_VERSION,
+        'exported_at': datetime.now().isoformat(timespec='seconds'),
+        'snapshots': snapshots,
+    }
+
+    archive_path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = archive_path.with_name(archive_path.name + '.tmp')
+    with zipfile.ZipFile(temp_path, 'w', compression=zipfile.ZIP_DEFLATED, compresslevel=9) as archive:
+        _write_member(archive, 'manifest.json', manifest)
+        _write_member(archive, 'documents.json', {
+            column: encode_column(documents[column].tolist())
+            for column in documents.columns if column not in ('snapshot_date', 'snapshot_time')
+        })
+        _write_member(archive, 'tables.json', tables)
+    os.replace(temp_path, archive_path)
+
+    return {
+        'snapshots': len(snapshots),
+        'documents': len(documents),
+        'bytes': archive_path.stat().st_size,
+    }
+
+
+def _restore_table(db, project_name, table_name, columns, snapshot_ids):
+    """Insert a table's archived rows, mapping archived snapshot ids to new ones."""
+    stored_columns = {row[1] for row in db.conn.execute(f"PRAGMA table_info({table_name})")}
+    # Row ids are assigned again
+    names = [name for name in columns if name in stored_columns and name != 'id']
+    values = [decode_column(columns[name]) for name in names]
+    if table_name == 'document_history':
+        for name in ('first_snapshot_id', 'last_snapshot_id'):
+            index = names.index(name)
+            values[index] = [snapshot_ids[snapshot_id] for snapshot_id in values[index]]
+
+    query = f"""
+        INSERT INTO {table_name} (project_name, {', '.join(names)})
+        VALUES ({', '.join(['?'] * (len(names) + 1))})
+    """
+    if table_name != 'snapshots':
+        db.conn.executemany(query, [(project_name,) + row for row in zip(*values)])
+        return
+
+    for snapshot_id, row in zip(decode_column(columns['id']), zip(*values)):
+        snapshot_ids[snapshot_id] = db.conn.execute(query, (project_name,) + row).lastrowid
+
+
+@traced('archive.restore')
+def restore_project_archive(db, archive_path):
+    """Replace a project's data with the contents of an archive.
+
+    The project's existing rows are deleted and the archived ones inserted in
+    one transaction. Snapshots whose rows were all classified with the same
+    config keep their classification; others are reclassified by the next
+    update.
+
+    Args:
+        db: Open DocumentDatabase (with a current schema)
+        archive_path: Path to an archive written by export_project_archive()
+
+    Returns:
+        Dictionary with the 'project_name' and the 'snapshots' and
+        'documents' restored
+
+    Raises:
+        ValueError: If the archive's format or schema version is newer than
+            this code understands
+    """
+    import pandas as pd
+
+    with zipfile.ZipFile(archive_path) as archive:
+        manifest = _read_member(archive, 'manifest.json')
+        if manifest['format'] > ARCHIVE_FORMAT or manifest['schema_version'] > SCHEMA_VERSION:
+            raise ValueError(f"{archive_path} was written by a newer version (archive format "
+                             f"{manifest['format']}, schema version {manifest['schema_version']})")
+        documents = pd.DataFrame({column: decode_column(values)
+                                  for column, values in _read_member(archive, 'documents.json').items()})
+        tables = _read_member(archive, 'tables.json')
+
+    project_name = manifest['project_name']
+    document_columns = [column for _, column in DOCUMENT_COLUMNS]
+    restored = 0
+
+    with db.transaction():
+        db.delete_project(project_name)
+
+        for snapshot_date, snapshot_time, count in manifest['snapshots']:
+            snapshot_documents = documents.iloc[restored:restored + count]
+            restored += count
+            fingerprints = snapshot_documents['attributes_fingerprint'].unique()
+            if len(fingerprints) == 1 and pd.notna(fingerprints[0]):
+                db.insert_documents(project_name, snapshot_date, snapshot_time,
+                                    snapshot_documents[document_columns],
+                                    attributes_df=snapshot_documents[ATTRIBUTE_COLUMNS],
+                                    fingerprint=fingerprints[0])
+            else:
+                db.insert_documents(project_name, snapshot_date, snapshot_time,
+                                    snapshot_documents[document_columns])
+
+        snapshot_ids = {}
+        for table_name in ARCHIVE_TABLES:
+            if table_name in tables:
+                _restore_table(db, project_name, table_name, tables[table_name], snapshot_ids)
+
+    return {
+        'project_name': project_name,
+        'snapshots': len(manifest['snapshots']),
+        'documents': restored,
+    }
@@ -1,252 +1,1810 @@
 """Database operations for document tracking."""
 
+import hashlib
+import json
 import sqlite3
-import pandas as pd
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime
-from .schema import DATABASE_SCHEMA, SCHEMA_VERSION
+from .schema import DATABASE_SCHEMA, SCHEMA_VERSION, DOCUMENT_COLUMN_MIGRATIONS
+from utils.folders import parse_folder
+from utils.revisions import parse_revision
+from utils.tracing import traced
+
+
+# Stored document columns and the standardized DataFrame columns they come from
+DOCUMENT_COLUMNS = [
+    ('doc_ref', 'Doc Ref'),
+    ('doc_title', 'Doc Title'),
+    ('revision', 'Rev'),
+    ('status', 'Status'),
+    ('file_type', 'File Type'),  # Now expects standardized column from COLUMN_MAPPINGS
+    ('purpose_of_issue', 'Purpose of Issue'),
+    ('date_wet', 'Date (WET)'),
+    ('last_status_change_wet', 'Last Status Change (WET)'),
+    ('last_updated_wet', 'Last Updated (WET)'),
+    ('doc_path', 'Doc Path'),
+    ('publisher', 'Publisher'),
+]
+
+# Classification columns computed at ingest (see analyzers/document_attributes.py)
+ATTRIBUTE_COLUMNS = ['doc_class', 'category', 'apartment_number', 'phase', 'block']
+
+# Revision key columns parsed at ingest (see utils/revisions.py)
+REVISION_KEY_COLUMNS = ['rev_family', 'rev_number', 'rev_suffix']
+
+# Low-cardinality documents columns and the document_rows columns storing
+# them as value codes (see the value_codes table); the documents view decodes them
+ENCODED_COLUMNS = {
+    'project_name': 'project_id',
+    'revision': 'revision_id',
+    'status': 'status_id',
+    'file_type': 'file_type_id',
+    'purpose_of_issue': 'purpose_of_issue_id',
+    'publisher': 'publisher_id',
+    # Folder paths, with attributes per folder in the folders table
+    'doc_path': 'folder_id',
+}
+
+
+def _document_select(columns):
+    """SELECT list for (documents column, DataFrame column) pairs.
+    
+    Encoded columns are selected as their value codes, for
+    DocumentDatabase._read_documents() to decode (cheaper than decoding every
+    row in SQLite).
+    """
+    return ', '.join(f"{ENCODED_COLUMNS.get(name, name)} AS '{column}'" for name, column in columns)
+
+
+def _encoded(columns):
+    """DataFrame columns of (documents column, DataFrame column) pairs that hold value codes."""
+    return [column for name, column in columns if name in ENCODED_COLUMNS]
+
+
+# Stored document change columns and the DataFrame columns of
+# analyzers.change_detection.detect_changes
+DOCUMENT_CHANGE_COLUMNS = [
+    ('doc_ref', 'Doc Ref'),
+    ('doc_title', 'Doc Title'),
+    ('change_type', 'Change'),
+    ('old_revision', 'Previous Rev'),
+    ('new_revision', 'Rev'),
+    ('old_status', 'Previous Status'),
+    ('new_status', 'Status'),
+    ('changed_columns', 'Changed Columns'),
+]
+
+# Columns returned to reports
+REPORT_COLUMNS = [
+    ('doc_ref', 'Doc Ref'),
+    ('doc_title', 'Doc Title'),
+    ('revision', 'Rev'),
+    ('status', 'Status'),
+    ('file_type', 'File Type'),
+    ('date_wet', 'Date (WET)'),
+    ('doc_path', 'Doc Path'),
+    ('publisher', 'Publisher'),
+]
+
+# Stored apartment certificate attributes, returned alongside REPORT_COLUMNS on request
+ATTRIBUTE_SELECT = """,
+    documents.category, documents.apartment_number, documents.phase, documents.block
+"""
+
+# Folder attributes (utils.folders.FOLDER_COLUMNS) joined from the folders
+# table, returned alongside the stored attributes
+FOLDER_SELECT = """,
+    folders.landlords AS folder_landlords, folders.block AS folder_block,
+    folders.superseded AS folder_superseded
+"""
+
+# Pseudo document class for the main summary report: drawings, or every
+# non-certificate/non-submittal document when a snapshot has no drawings
+# (mirrors the fallback in utils.document_filters.filter_drawings_and_schematics)
+MAIN_REPORT_CLASS = 'main'
+
+# Document classes whose counts are kept for compacted snapshots: the main
+# report's and certificates (utils.document_filters.DOC_CLASS_CERTIFICATE)
+COMPACTED_REPORT_CLASSES = [MAIN_REPORT_CLASS, 'certificate']
+
+# Tables holding a project's rows by project_name, besides its document rows
+# (the processing ledger, classification state and data derived from the documents)
+PROJECT_TABLES = [
+    'processing_history',
+    'classification_state',
+    'change_detection_state',
+    'document_changes',
+    'snapshots',
+    'document_history',
+    'compacted_snapshots',
+    'snapshot_counts',
+    'import_checkpoints',
+]
+
+# Connection pragmas by storage profile (see DocumentDatabase.connect).
+# WAL journaling lets read-only report connections keep reading while an
+# import writes. The journal mode is stored in the database file, so it is
+# only set by read-write connections.
+STORAGE_PROFILES = {
+    # Read-write connections
+    'default': {
+        'journal_mode': 'WAL',
+        'synchronous': 'FULL',
+        'temp_store': 'MEMORY',
+        'cache_size': -16000,  # KiB
+        'mmap_size': 268435456,
+    },
+    # Imports and stored-data refreshes. With WAL, NORMAL only syncs at
+    # checkpoints: a power loss can drop the latest commits but cannot
+    # corrupt the database.
+    'bulk_import': {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'temp_store': 'MEMORY',
+        'cache_size': -65536,
+        'mmap_size': 268435456,
+    },
+    # Read-only connections (report workers)
+    'read_only': {
+        'temp_store': 'MEMORY',
+        'cache_size': -32000,
+        'mmap_size': 268435456,
+    },
+}
 
 
 class DocumentDatabase:
     """SQLite database manager for document tracking."""
     
-    def __init__(self, db_path='data/documents.db'):
-        """Initialize database connection.
+    def __init__(self, db_path='data/documents.db', read_only=False, storage_profile=None):
+        """Initialize database connection.
+        
+        Args:
+            db_path: Path to SQLite database file
+            read_only: Open an existing database read-only (e.g. one connection
+                per report worker process); writes raise sqlite3.OperationalError
+            storage_profile: Name of a STORAGE_PROFILES entry or a dict of pragmas
+                (default: 'read_only' for read-only connections, else 'default')
+        """
+        self.db_path = Path(db_path)
+        self.read_only = read_only
+        if storage_profile is None:
+            storage_profile = 'read_only' if read_only else 'default'
+        if isinstance(storage_profile, str):
+            storage_profile = STORAGE_PROFILES[storage_profile]
+        self.storage_profile = storage_profile
+        if not read_only:
+            self.db_path.parent.mkdir(exist_ok=True)
+        self.conn = None
+        self.connect()
+    
+    @classmethod
+    def open_read_only(cls, db_path='data/documents.db'):
+        """Open a read-only connection for a report worker.
+        
+        Safe to use while an import is writing to the database: in WAL mode
+        readers see the last committed snapshot and are never blocked.
+        
+        Args:
+            db_path: Path to an existing SQLite database file
+            
+        Returns:
+            DocumentDatabase: Read-only connection with the 'read_only' storage profile
+        """
+        return cls(db_path, read_only=True, storage_profile='read_only')
+    
+    def connect(self):
+        """Establish database connection and apply the storage profile pragmas."""
+        if self.read_only:
+            self.conn = sqlite3.connect(f"{self.db_path.resolve().as_uri()}?mode=ro", uri=True)
+        else:
+            self.conn = sqlite3.connect(self.db_path)
+        self.conn.row_factory = sqlite3.Row  # Enable column access by name
+        
+        for pragma, value in self.storage_profile.items():
+            if self.read_only and pragma == 'journal_mode':
+                continue
+            self.conn.execute(f"PRAGMA {pragma} = {value}")
+        
+        # Status mappings loaded into this connection's temp tables
+        self._status_mappings_loaded = set()
+        self._in_transaction = False
+        # Value codes by column, loaded as they are needed (see _encode_values)
+        self._value_codes = {}
+        # Values by code, reloaded when a code is missing (see _decode)
+        self._values = None
+    
+    def close(self):
+        """Close database connection."""
+        if self.conn:
+            self.conn.close()
+            self.conn = None
+    
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+    
+    @contextmanager
+    def transaction(self):
+        """Group writes into one transaction, committed when the block ends.
+        
+        Methods that normally commit their own writes leave committing to the
+        transaction, so either all of the block's writes are stored or, if it
+        raises, none are. Nested blocks join the outer transaction.
+        """
+        if self._in_transaction:
+            yield self
+            return
+        
+        self._in_transaction = True
+        try:
+            yield self
+            self.conn.commit()
+        except BaseException:
+            self.conn.rollback()
+            # Value codes added in the transaction were rolled back too
+            self._value_codes = {}
+            raise
+        finally:
+            self._in_transaction = False
+    
+    def _commit(self):
+        """Commit unless inside transaction()."""
+        if not self._in_transaction:
+            self.conn.commit()
+    
+    def initialize_schema(self):
+        """Create database schema if it doesn't exist."""
+        self.ensure_schema()
+        print(f"Database schema initialized at {self.db_path}")
+    
+    def ensure_schema(self):
+        """Create missing tables and add columns introduced by later schema versions.
+        
+        Safe to call on every run - existing data is never lost. Documents
+        stored in a documents table (before schema version 9) are moved to
+        document_rows, behind the documents view.
+        """
+        cursor = self.conn.cursor()
+        
+        cursor.execute("SELECT type FROM sqlite_master WHERE name = 'documents'")
+        row = cursor.fetchone()
+        if row is not None and row[0] == 'view':
+            # Recreated by the schema script, so it follows document_rows changes
+            cursor.execute("DROP VIEW documents")
+            self._migrate_document_paths()
+        elif row is not None and row[0] == 'table':
+            # Add columns missing from an older documents table before its rows are moved
+            cursor.execute("PRAGMA table_info(documents)")
+            existing_columns = {row[1] for row in cursor.fetchall()}
+            for column_name, column_type in DOCUMENT_COLUMN_MIGRATIONS:
+                if column_name not in existing_columns:
+                    cursor.execute(f"ALTER TABLE documents ADD COLUMN {column_name} {column_type}")
+            cursor.execute("ALTER TABLE documents RENAME TO documents_legacy")
+        
+        cursor.executescript(DATABASE_SCHEMA)
+        self.conn.commit()
+        
+        cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'documents_legacy'")
+        if cursor.fetchone() is not None:
+            self._migrate_legacy_documents()
+        
+        self.backfill_revision_keys()
+        self.backfill_folders()
+    
+    def _migrate_document_paths(self):
+        """Store document_rows paths as folder value codes (schema version 9 databases).
+        
+        The table is rebuilt (renamed, recreated by the schema script and
+        copied) rather than altered: ALTER TABLE ... DROP COLUMN needs SQLite 3.35.
+        """
+        cursor = self.conn.cursor()
+        cursor.execute("PRAGMA table_info(document_rows)")
+        old_columns = [row[1] for row in cursor.fetchall()]
+        if 'doc_path' not in old_columns:
+            return
+        
+        print("ℹ Moving document paths to the folders table (schema version 10)...")
+        cursor.execute("""
+            INSERT OR IGNORE INTO value_codes (column_name, value)
+            SELECT DISTINCT 'doc_path', doc_path FROM document_rows WHERE doc_path IS NOT NULL
+        """)
+        cursor.execute("ALTER TABLE document_rows RENAME TO document_rows_v9")
+        # Index names stay with the renamed table - free them for the new one
+        cursor.execute("""
+            SELECT name FROM sqlite_master
+            WHERE type = 'index' AND tbl_name = 'document_rows_v9' AND sql IS NOT NULL
+        """)
+        for (index_name,) in cursor.fetchall():
+            cursor.execute(f"DROP INDEX {index_name}")
+        cursor.executescript(DATABASE_SCHEMA)
+        
+        columns = ', '.join(column for column in old_columns if column != 'doc_path')
+        cursor.execute(f"""
+            INSERT INTO document_rows ({columns}, folder_id)
+            SELECT {columns}, (
+                SELECT id FROM value_codes WHERE column_name = 'doc_path' AND value = document_rows_v9.doc_path
+            )
+            FROM document_rows_v9
+        """)
+        cursor.execute("DROP TABLE document_rows_v9")
+        self.conn.commit()
+        
+        # Return the paths' pages to the file system
+        self.conn.execute("VACUUM")
+    
+    def _migrate_legacy_documents(self):
+        """Move rows from a pre-version-9 documents table into document_rows (keeping their ids)."""
+        print("ℹ Moving documents to dictionary-encoded storage (schema version 9)...")
+        cursor = self.conn.cursor()
+        for column_name in ENCODED_COLUMNS:
+            cursor.execute(f"""
+                INSERT OR IGNORE INTO value_codes (column_name, value)
+                SELECT DISTINCT ?, {column_name} FROM documents_legacy WHERE {column_name} IS NOT NULL
+            """, (column_name,))
+        
+        columns = (['project_name', 'snapshot_date', 'snapshot_time'] + [name for name, _ in DOCUMENT_COLUMNS]
+                   + ATTRIBUTE_COLUMNS + ['attributes_fingerprint'] + REVISION_KEY_COLUMNS + ['created_at'])
+        values = [
+            f"(SELECT id FROM value_codes WHERE column_name = '{name}' AND value = d.{name})"
+            if name in ENCODED_COLUMNS else f"d.{name}"
+            for name in columns
+        ]
+        cursor.execute(f"""
+            INSERT INTO document_rows (id, {', '.join(ENCODED_COLUMNS.get(name, name) for name in columns)})
+            SELECT d.id, {', '.join(values)}
+            FROM documents_legacy d
+        """)
+        cursor.execute("DROP TABLE documents_legacy")
+        self.conn.commit()
+        
+        # Return the old table's pages to the file system
+        self.conn.execute("VACUUM")
+    
+    def _encode_values(self, column_name, values):
+        """Value codes for a column's values, adding values seen for the first time.
+        
+        Args:
+            column_name: One of ENCODED_COLUMNS
+            values: Iterable of values (None stays None)
+            
+        Returns:
+            list: Value codes, in the order of values
+        """
+        values = list(values)
+        codes = self._value_codes.get(column_name)
+        if codes is None:
+            cursor = self.conn.execute("SELECT value, id FROM value_codes WHERE column_name = ?", (column_name,))
+            codes = self._value_codes[column_name] = dict(cursor.fetchall())
+        
+        new_values = [value for value in dict.fromkeys(values) if value is not None and value not in codes]
+        if new_values:
+            self.conn.executemany("INSERT OR IGNORE INTO value_codes (column_name, value) VALUES (?, ?)",
+                                  [(column_name, value) for value in new_values])
+            placeholders = ', '.join(['?'] * len(new_values))
+            cursor = self.conn.execute(f"""
+                SELECT value, id FROM value_codes WHERE column_name = ? AND value IN ({placeholders})
+            """, [column_name] + new_values)
+            codes.update(cursor.fetchall())
+        
+        return [codes.get(value) for value in values]
+    
+    def _load_values(self):
+        """Load the array of values indexed by value code (None where no code)."""
+        import numpy as np
+        
+        rows = self.conn.execute("SELECT id, value FROM value_codes").fetchall()
+        self._values = np.full(max((row[0] for row in rows), default=0) + 1, None, dtype=object)
+        self._values[[row[0] for row in rows]] = [row[1] for row in rows]
+    
+    def _decode(self, codes):
+        """Values for a column of value codes (None stays None)."""
+        import numpy as np
+        
+        codes = np.array(codes, dtype=float)
+        missing = np.isnan(codes)
+        codes = np.where(missing, 0, codes).astype(np.int64)
+        
+        # Codes added since the values were loaded are past the end or decode as None
+        if (self._values is None or codes.max() >= len(self._values)
+                or (self._values[codes[~missing]] == None).any()):  # noqa: E711 (elementwise)
+            self._load_values()
+        decoded = self._values[codes]
+        decoded[missing] = None
+        return decoded
+    
+    def _read_documents(self, query, params, encoded_columns):
+        """Read document rows into a DataFrame, decoding value codes.
+        
+        Builds the DataFrame from the fetched rows rather than with
+        pd.read_sql_query, which spends longer converting the code columns
+        than the decoding takes.
+        
+        Args:
+            query: SELECT with encoded columns from _document_select()
+            params: Query parameters
+            encoded_columns: Columns of the query holding value codes
+            
+        Returns:
+            DataFrame: One column per selected column, with the same dtypes
+            pd.read_sql_query would give
+        """
+        import pandas as pd
+        
+        cursor = self.conn.cursor()
+        cursor.row_factory = None
+        cursor.execute(query, params)
+        names = [description[0] for description in cursor.description]
+        rows = cursor.fetchall()
+        if not rows:
+            return pd.DataFrame(columns=names)
+        
+        data = dict(zip(names, zip(*rows)))
+        for column in encoded_columns:
+            data[column] = self._decode(data[column])
+        return pd.DataFrame({name: list(values) if isinstance(values, tuple) else values
+                             for name, values in data.items()})
+    
+    def backfill_revision_keys(self):
+        """Parse revision key columns for rows stored before they existed.
+        
+        Keys are parsed from the cleaned revision (utils.data_cleaning), so
+        rows keyed on the raw value - Cyrillic letters, trailing dots - are
+        parsed again.
+        
+        Returns:
+            int: Number of rows updated
+        """
+        from utils.data_cleaning import clean_revision
+        
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            SELECT DISTINCT document_rows.revision_id, value_codes.value
+            FROM document_rows
+            LEFT JOIN value_codes ON value_codes.id = document_rows.revision_id
+            WHERE document_rows.rev_family IS NULL
+        """)
+        revisions = cursor.fetchall()
+        
+        # One update per distinct revision value, not per row
+        cursor.executemany("""
+            UPDATE document_rows SET rev_family = ?, rev_number = ?, rev_suffix = ?
+            WHERE revision_id IS ? AND rev_family IS NULL
+        """, [parse_revision(clean_revision(revision)) + (revision_id,) for revision_id, revision in revisions])
+        updated = max(cursor.rowcount, 0)
+        
+        cursor.execute("SELECT id, value FROM value_codes WHERE column_name = 'revision'")
+        recleaned = [(revision_id, parse_revision(clean_revision(revision)))
+                     for revision_id, revision in cursor.fetchall()
+                     if parse_revision(clean_revision(revision)) != parse_revision(revision)]
+        for revision_id, keys in recleaned:
+            cursor.execute("""
+                UPDATE document_rows SET rev_family = ?, rev_number = ?, rev_suffix = ?
+                WHERE revision_id = ?
+                  AND (rev_family IS NOT ? OR rev_number IS NOT ? OR rev_suffix IS NOT ?)
+            """, keys + (revision_id,) + keys)
+            updated += cursor.rowcount
+        
+        self.conn.commit()
+        return updated
+    
+    def backfill_folders(self):
+        """Parse the attributes of folders stored without them (see utils/folders.py).
+        
+        Returns:
+            int: Number of folders added
+        """
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            SELECT id, value FROM value_codes
+            WHERE column_name = 'doc_path'
+              AND id NOT IN (SELECT id FROM folders)
+        """)
+        folders = cursor.fetchall()
+        if not folders:
+            return 0
+        
+        cursor.executemany("INSERT INTO folders (id, landlords, block, superseded) VALUES (?, ?, ?, ?)",
+                           [(folder_id,) + parse_folder(path) for folder_id, path in folders])
+        self._commit()
+        return len(folders)
+    
+    def wipe_database(self):
+        """Wipe all data from the database (keeps schema)."""
+        cursor = self.conn.cursor()
+        
+        # Get all table names
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
+        tables = cursor.fetchall()
+        
+        # Delete data from each table
+        for table in tables:
+            table_name = table[0]
+            if table_name != 'sqlite_sequence':
+                cursor.execute(f"DELETE FROM {table_name}")
+                print(f"Wiped table: {table_name}")
+        
+        self.conn.commit()
+        print("Database wiped successfully")
+    
+    def rebuild_database(self):
+        """Drop all tables and rebuild schema."""
+        cursor = self.conn.cursor()
+        
+        # Get all table names
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
+        tables = cursor.fetchall()
+        
+        # Drop each table (skip sqlite internal tables)
+        for table in tables:
+            table_name = table[0]
+            # Skip SQLite internal tables
+            if table_name.startswith('sqlite_'):
+                continue
+            cursor.execute(f"DROP TABLE IF EXISTS {table_name}")
+            print(f"Dropped table: {table_name}")
+        
+        # Drop all views and indices
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='view'")
+        for view in cursor.fetchall():
+            cursor.execute(f"DROP VIEW IF EXISTS {view[0]}")
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='index' AND name NOT LIKE 'sqlite_%'")
+        indices = cursor.fetchall()
+        for index in indices:
+            index_name = index[0]
+            cursor.execute(f"DROP INDEX IF EXISTS {index_name}")
+        
+        self.conn.commit()
+        
+        # Recreate schema
+        self.initialize_schema()
+        print("Database rebuilt successfully")
+    
+    @staticmethod
+    def prepare_documents(documents_df):
+        """Clean a document listing into the stored column layout.
+        
+        Args:
+            documents_df: DataFrame with standardized column names
+            
+        Returns:
+            DataFrame: One string column per stored field (missing values as '')
+        """
+        import pandas as pd
+        
+        # Helper function to clean strings and handle encoding issues
+        def clean_string(value):
+            if pd.isna(value) or value == 'nan':
+                return ''
+            s = str(value)
+            # Replace common problematic characters
+            s = s.encode('utf-8', errors='ignore').decode('utf-8')
+            return s
+        
+        prepared = pd.DataFrame(index=documents_df.index)
+        for _, column in DOCUMENT_COLUMNS:
+            if column in documents_df.columns:
+                prepared[column] = documents_df[column].map(clean_string).astype(object)
+            else:
+                prepared[column] = ''
+        return prepared
+    
+    @traced('db.insert_documents')
+    def insert_documents(self, project_name, snapshot_date, snapshot_time, documents_df,
+                         attributes_df=None, fingerprint=None):
+        """Insert document records into database.
+        
+        Args:
+            project_name: Name of the project
+            snapshot_date: Date of the snapshot (YYYY-MM-DD)
+            snapshot_time: Time of the snapshot (HH:MM)
+            documents_df: DataFrame containing document data
+            attributes_df: Optional classification (ATTRIBUTE_COLUMNS) aligned with documents_df
+            fingerprint: Config fingerprint the attributes were computed with
+            
+        Returns:
+            int: Number of documents inserted
+        """
+        from utils.data_cleaning import clean_revision
+        
+        prepared = self.prepare_documents(documents_df)
+        
+        if attributes_df is None:
+            attribute_rows = [(None,) * len(ATTRIBUTE_COLUMNS)] * len(prepared)
+            fingerprint = None
+        else:
+            attribute_rows = self._attribute_rows(attributes_df.loc[prepared.index])
+        
+        # Low-cardinality columns are stored as value codes
+        project_id = self._encode_values('project_name', [project_name])[0]
+        columns = [
+            self._encode_values(name, prepared[column]) if name in ENCODED_COLUMNS else prepared[column].tolist()
+            for name, column in DOCUMENT_COLUMNS
+        ]
+        
+        rows = [
+            (project_id, snapshot_date, snapshot_time) + values + tuple(attributes)
+            + parse_revision(clean_revision(revision)) + (fingerprint,)
+            for values, attributes, revision in zip(zip(*columns), attribute_rows, prepared['Rev'])
+        ]
+        
+        stored_columns = [name for name, _ in DOCUMENT_COLUMNS] + ATTRIBUTE_COLUMNS + REVISION_KEY_COLUMNS
+        placeholders = ', '.join(['?'] * (len(stored_columns) + 4))
+        
+        cursor = self.conn.cursor()
+        cursor.executemany(f"""
+            INSERT INTO document_rows (
+                project_id, snapshot_date, snapshot_time,
+                {', '.join(ENCODED_COLUMNS.get(name, name) for name in stored_columns)}, attributes_fingerprint
+            ) VALUES ({placeholders})
+        """, rows)
+        
+        # Folders seen for the first time get their attributes
+        self.backfill_folders()
+        self._commit()
+        return len(rows)
+    
+    @staticmethod
+    def _attribute_rows(attributes_df):
+        """Convert an attributes DataFrame into SQLite-ready tuples."""
+        import pandas as pd
+        
+        def clean_value(value):
+            if value is None or pd.isna(value):
+                return None
+            return value
+        
+        rows = []
+        for doc_class, category, apartment_number, phase, block in attributes_df[ATTRIBUTE_COLUMNS].itertuples(index=False, name=None):
+            apartment_number = clean_value(apartment_number)
+            rows.append((
+                clean_value(doc_class),
+                clean_value(category),
+                int(apartment_number) if apartment_number is not None else None,
+                clean_value(phase),
+                clean_value(block)
+            ))
+        return rows
+    
+    def get_classification_fingerprint(self, project_name):
+        """Get the config fingerprint a project's documents were classified with.
+        
+        Args:
+            project_name: Name of the project
+            
+        Returns:
+            str: Fingerprint, or None if the project has never been classified
+        """
+        try:
+            cursor = self.conn.execute("""
+                SELECT fingerprint FROM classification_state WHERE project_name = ?
+            """, (project_name,))
+        except sqlite3.OperationalError:
+            # Database predates classification (run --init to migrate)
+            return None
+        row = cursor.fetchone()
+        return row[0] if row else None
+    
+    def is_classification_current(self, project_name, fingerprint):
+        """Check whether stored classifications match the given config fingerprint.
+        
+        Args:
+            project_name: Name of the project
+            fingerprint: Current classification config fingerprint
+            
+        Returns:
+            bool: True if doc_class/category columns can be queried directly
+        """
+        return self.get_classification_fingerprint(project_name) == fingerprint
+    
+    def set_classification_fingerprint(self, project_name, fingerprint):
+        """Record that all of a project's documents are classified with fingerprint.
+        
+        Args:
+            project_name: Name of the project
+            fingerprint: Classification config fingerprint
+        """
+        self.conn.execute("""
+            INSERT OR REPLACE INTO classification_state (project_name, fingerprint, classified_at)
+            VALUES (?, ?, CURRENT_TIMESTAMP)
+        """, (project_name, fingerprint))
+        self._commit()
+    
+    def get_unclassified_snapshots(self, project_name, fingerprint):
+        """Get snapshots containing rows not classified with the given fingerprint.
+        
+        Args:
+            project_name: Name of the project
+            fingerprint: Current classification config fingerprint
+            
+        Returns:
+            list: (snapshot_date, snapshot_time) tuples in chronological order
+        """
+        cursor = self.conn.execute("""
+            SELECT DISTINCT snapshot_date, snapshot_time
+            FROM documents
+            WHERE project_name = ?
+              AND (attributes_fingerprint IS NULL OR attributes_fingerprint != ?)
+            ORDER BY snapshot_date, snapshot_time
+        """, (project_name, fingerprint))
+        return [(row[0], row[1]) for row in cursor.fetchall()]
+    
+    @traced('db.get_documents_to_classify')
+    def get_documents_to_classify(self, project_name, snapshot_date, snapshot_time, fingerprint):
+        """Get stored rows of a snapshot that need (re)classification.
+        
+        Args:
+            project_name: Name of the project
+            snapshot_date: Date in YYYY-MM-DD format
+            snapshot_time: Time in HH:MM format
+            fingerprint: Current classification config fingerprint
+            
+        Returns:
+            DataFrame: Standardized document columns indexed by row id
+        """
+        query = f"""
+            SELECT id, {_document_select(DOCUMENT_COLUMNS)}
+            FROM documents
+            WHERE project_name = ?
+              AND snapshot_date = ?
+              AND snapshot_time = ?
+              AND (attributes_fingerprint IS NULL OR attributes_fingerprint != ?)
+        """
+        df = self._read_documents(query, (project_name, snapshot_date, snapshot_time, fingerprint),
+                                  _encoded(DOCUMENT_COLUMNS))
+        return df.set_index('id')
+    
+    @traced('db.update_document_attributes')
+    def update_document_attributes(self, attributes_df, fingerprint):
+        """Store classification results for existing rows.
+        
+        Args:
+            attributes_df: ATTRIBUTE_COLUMNS indexed by document row id
+            fingerprint: Config fingerprint the attributes were computed with
+            
+        Returns:
+            int: Number of rows updated
+        """
+        rows = [
+            attributes + (fingerprint, int(doc_id))
+            for doc_id, attributes in zip(attributes_df.index, self._attribute_rows(attributes_df))
+        ]
+        self.conn.executemany(f"""
+            UPDATE document_rows
+            SET {', '.join(f'{name} = ?' for name in ATTRIBUTE_COLUMNS)},
+                attributes_fingerprint = ?
+            WHERE id = ?
+        """, rows)
+        self._commit()
+        return len(rows)
+    
+    def mark_file_processed(self, project_name, file_path, file_name, snapshot_date, snapshot_time, record_count):
+        """Mark a file as processed.
+        
+        Args:
+            project_name: Name of the project
+            file_path: Full path to the file
+            file_name: Name of the file
+            snapshot_date: Date from the file
+            snapshot_time: Time from the file
+            record_count: Number of records processed
+        """
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            INSERT OR REPLACE INTO processing_history
+            (project_name, file_path, file_name, snapshot_date, snapshot_time, record_count)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """, (project_name, str(file_path), file_name, snapshot_date, snapshot_time, record_count))
+        self._commit()
+    
+    def is_file_processed(self, project_name, file_name):
+        """Check if a file has been processed.
+        
+        Args:
+            project_name: Name of the project
+            file_name: Name of the file
+            
+        Returns:
+            bool: True if file has been processed
+        """
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            SELECT COUNT(*) FROM processing_history
+            WHERE project_name = ? AND file_name = ?
+        """, (project_name, file_name))
+        result = cursor.fetchone()
+        return result[0] > 0
+    
+    def delete_file_documents(self, project_name, file_name):
+        """Delete the documents imported from a file, before it is imported again.
+        
+        Removes the rows of the snapshot the processing history records for
+        the file (or its kept counts, if it was compacted), and the derived
+        data that depends on them: change detection state from that snapshot
+        on, and the document history from that snapshot on (both are rebuilt
+        by the next refresh).
+        
+        Args:
+            project_name: Name of the project
+            file_name: Name of the file
+            
+        Returns:
+            int: Number of documents deleted
+        """
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            SELECT snapshot_date, snapshot_time FROM processing_history
+            WHERE project_name = ? AND file_name = ?
+        """, (project_name, file_name))
+        snapshot = cursor.fetchone()
+        if snapshot is None:
+            return 0
+        
+        cursor.execute("""
+            DELETE FROM document_rows
+            WHERE id IN (
+                SELECT id FROM documents
+                WHERE project_name = ? AND snapshot_date = ? AND snapshot_time = ?
+            )
+        """, (project_name, snapshot[0], snapshot[1]))
+        deleted = cursor.rowcount
+        
+        cursor.execute("""
+            DELETE FROM change_detection_state
+            WHERE project_name = ? AND (snapshot_date, snapshot_time) >= (?, ?)
+        """, (project_name, snapshot[0], snapshot[1]))
+        # Marks the snapshot stale, so the next refresh rebuilds the history from it
+        cursor.execute("""
+            UPDATE snapshots SET document_count = NULL
+            WHERE project_name = ? AND snapshot_date = ? AND snapshot_time = ?
+        """, (project_name, snapshot[0], snapshot[1]))
+        # A compacted snapshot gets its rows back
+        for table_name in ('compacted_snapshots', 'snapshot_counts'):
+            cursor.execute(f"""
+                DELETE FROM {table_name}
+                WHERE project_name = ? AND snapshot_date = ? AND snapshot_time = ?
+            """, (project_name, snapshot[0], snapshot[1]))
+        
+        self._commit()
+        return deleted
+    
+    def start_import_run(self):
+        """Record the start of a backfill.
+        
+        Returns:
+            int: The import run id
+        """
+        cursor = self.conn.cursor()
+        cursor.execute("INSERT INTO import_runs DEFAULT VALUES")
+        self._commit()
+        return cursor.lastrowid
+    
+    def get_unfinished_import_run(self):
+        """Get the most recent import run that did not complete.
+        
+        Returns:
+            dict: 'id', 'started_at' and 'files' (number of files imported),
+            or None if the latest run completed (or there are none)
+        """
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            SELECT import_runs.id, import_runs.started_at, import_runs.completed_at,
+                   COUNT(import_checkpoints.file_name)
+            FROM import_runs
+            LEFT JOIN import_checkpoints ON import_checkpoints.run_id = import_runs.id
+            GROUP BY import_runs.id
+            ORDER BY import_runs.id DESC
+            LIMIT 1
+        """)
+        row = cursor.fetchone()
+        if row is None or row[2] is not None:
+            return None
+        return {'id': row[0], 'started_at': row[1], 'files': row[3]}
+    
+    def get_import_checkpoints(self, run_id, project_name):
+        """Get the files an import run has imported for a project.
+        
+        Args:
+            run_id: Import run id
+            project_name: Name of the project
+            
+        Returns:
+            set: File names
+        """
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            SELECT file_name FROM import_checkpoints
+            WHERE run_id = ? AND project_name = ?
+        """, (run_id, project_name))
+        return {row[0] for row in cursor.fetchall()}
+    
+    def checkpoint_file(self, run_id, project_name, file_name):
+        """Record that an import run has imported a file.
+        
+        Args:
+            run_id: Import run id
+            project_name: Name of the project
+            file_name: Name of the file
+        """
+        self.conn.execute("""
+            INSERT OR REPLACE INTO import_checkpoints (run_id, project_name, file_name)
+            VALUES (?, ?, ?)
+        """, (run_id, project_name, file_name))
+        self._commit()
+    
+    def finish_import_run(self, run_id):
+        """Mark an import run as completed.
+        
+        Args:
+            run_id: Import run id
+        """
+        self.conn.execute("UPDATE import_runs SET completed_at = CURRENT_TIMESTAMP WHERE id = ?", (run_id,))
+        self._commit()
+    
+    @traced('db.get_latest_documents')
+    def get_latest_documents(self, project_name):
+        """Get the most recent document snapshot for a project.
+        
+        Args:
+            project_name: Name of the project
+            
+        Returns:
+            DataFrame: Latest document data
+        """
+        query = f"""
+            SELECT {_document_select(REPORT_COLUMNS)}
+            FROM documents
+            WHERE project_name = ?
+              AND (snapshot_date, snapshot_time) = (
+                  SELECT snapshot_date, snapshot_time
+                  FROM documents
+                  WHERE project_name = ?
+                  ORDER BY snapshot_date DESC, snapshot_time DESC
+                  LIMIT 1
+              )
+        """
+        
+        return self._read_documents(query, (project_name, project_name), _encoded(REPORT_COLUMNS))
+    
+    @traced('db.get_documents_for_snapshot')
+    def get_documents_for_snapshot(self, project_name, snapshot_date, snapshot_time,
+                                   doc_class=None, include_attributes=False):
+        """Get documents for a specific snapshot.
+        
+        Args:
+            project_name: Name of the project
+            snapshot_date: Date in YYYY-MM-DD format
+            snapshot_time: Time in HH:MM format
+            doc_class: Optional stored document class to return ('certificate',
+                'technical_submittal', 'drawing', 'other') or MAIN_REPORT_CLASS.
+                Only meaningful once the project's classification is current.
+            include_attributes: Also return category, apartment_number, phase and
+                block, and the folder attributes of each document's folder
+                (FOLDER_COLUMNS, joined from the folders table)
+            
+        Returns:
+            DataFrame: Document data for this snapshot
+        """
+        select = _document_select(REPORT_COLUMNS)
+        joins = ''
+        if include_attributes:
+            select += ATTRIBUTE_SELECT + FOLDER_SELECT
+            joins = 'LEFT JOIN folders ON folders.id = documents.folder_id'
+        class_clause, class_params = self._class_clause(project_name, snapshot_date, snapshot_time, doc_class)
+        params = [project_name, snapshot_date, snapshot_time] + class_params
+        
+        query = f"""
+            SELECT {select}
+            FROM documents
+            {joins}
+            WHERE project_name = ?
+              AND snapshot_date = ?
+              AND snapshot_time = ?
+              {class_clause}
+        """
+        
+        df = self._read_documents(query, params, _encoded(REPORT_COLUMNS))
+        if include_attributes:
+            df['apartment_number'] = df['apartment_number'].astype('Int64')
+            for column in ('folder_landlords', 'folder_superseded'):
+                df[column] = df[column].fillna(0).astype(bool)
+            df['folder_block'] = df['folder_block'].astype(object)
+        return df
+    
+    @traced('db.get_snapshot_register')
+    def get_snapshot_register(self, project_name, snapshot_date, snapshot_time):
+        """Get every stored listing column of one snapshot.
+        
+        Args:
+            project_name: Name of the project
+            snapshot_date: Date in YYYY-MM-DD format
+            snapshot_time: Time in HH:MM format
+            
+        Returns:
+            DataFrame: Standardized document columns (DOCUMENT_COLUMNS) in file order
+        """
+        query = f"""
+            SELECT {_document_select(DOCUMENT_COLUMNS)}
+            FROM documents
+            WHERE project_name = ?
+              AND snapshot_date = ?
+              AND snapshot_time = ?
+            ORDER BY id
+        """
+        return self._read_documents(query, (project_name, snapshot_date, snapshot_time), _encoded(DOCUMENT_COLUMNS))
+    
+    def get_snapshots(self, project_name, include_compacted=False):
+        """Get a project's snapshots.
+        
+        Args:
+            project_name: Name of the project
+            include_compacted: Also return compacted snapshots (report counts
+                only - see compact_snapshot)
+            
+        Returns:
+            list: (snapshot_date, snapshot_time) tuples in chronological order
+        """
+        query = """
+            SELECT DISTINCT snapshot_date, snapshot_time
+            FROM documents
+            WHERE project_name = ?
+        """
+        params = [project_name]
+        if include_compacted:
+            query += """
+            UNION
+            SELECT snapshot_date, snapshot_time
+            FROM compacted_snapshots
+            WHERE project_name = ?
+            """
+            params.append(project_name)
+        cursor = self.conn.execute(query + " ORDER BY snapshot_date, snapshot_time", params)
+        return [(row[0], row[1]) for row in cursor.fetchall()]
+    
+    def get_previous_snapshot(self, project_name, snapshot_date, snapshot_time):
+        """Get the snapshot imported for a project just before the given one.
+        
+        Compacted snapshots count (see compact_snapshot), so the changes
+        detected against one are still found by get_document_changes().
+        
+        Args:
+            project_name: Name of the project
+            snapshot_date: Date in YYYY-MM-DD format
+            snapshot_time: Time in HH:MM format
+            
+        Returns:
+            tuple: (snapshot_date, snapshot_time), or None for the first snapshot
+        """
+        cursor = self.conn.execute("""
+            SELECT snapshot_date, snapshot_time
+            FROM documents
+            WHERE project_name = ?
+              AND (snapshot_date, snapshot_time) < (?, ?)
+            UNION
+            SELECT snapshot_date, snapshot_time
+            FROM compacted_snapshots
+            WHERE project_name = ?
+              AND (snapshot_date, snapshot_time) < (?, ?)
+            ORDER BY snapshot_date DESC, snapshot_time DESC
+            LIMIT 1
+        """, (project_name, snapshot_date, snapshot_time) * 2)
+        row = cursor.fetchone()
+        return (row[0], row[1]) if row else None
+    
+    def get_change_detection_state(self, project_name):
+        """Get the snapshot pairs and fingerprints a project's changes were detected with.
+        
+        Args:
+            project_name: Name of the project
+            
+        Returns:
+            dict: (snapshot_date, snapshot_time) -> (previous snapshot tuple or None, fingerprint)
+        """
+        try:
+            cursor = self.conn.execute("""
+                SELECT snapshot_date, snapshot_time, previous_snapshot_date, previous_snapshot_time, fingerprint
+                FROM change_detection_state
+                WHERE project_name = ?
+            """, (project_name,))
+        except sqlite3.OperationalError:
+            # Database predates change detection (run --init to migrate)
+            return {}
+        return {
+            (row[0], row[1]): ((row[2], row[3]) if row[2] else None, row[4])
+            for row in cursor.fetchall()
+        }
+    
+    @traced('db.replace_document_changes')
+    def replace_document_changes(self, project_name, snapshot_date, snapshot_time,
+                                 previous_snapshot, changes_df, fingerprint):
+        """Store the changes detected for a snapshot, replacing any stored before.
+        
+        Args:
+            project_name: Name of the project
+            snapshot_date: Date in YYYY-MM-DD format
+            snapshot_time: Time in HH:MM format
+            previous_snapshot: (snapshot_date, snapshot_time) compared against, or None
+            changes_df: DataFrame from analyzers.change_detection.detect_changes (None if no previous snapshot)
+            fingerprint: Config fingerprint the changes were detected with
+            
+        Returns:
+            int: Number of changes stored
+        """
+        rows = []
+        if changes_df is not None:
+            columns = [column for _, column in DOCUMENT_CHANGE_COLUMNS]
+            rows = [
+                (project_name, snapshot_date, snapshot_time) + values
+                for values in changes_df[columns].itertuples(index=False, name=None)
+            ]
+        previous_date, previous_time = previous_snapshot or (None, None)
+        
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            DELETE FROM document_changes
+            WHERE project_name = ? AND snapshot_date = ? AND snapshot_time = ?
+        """, (project_name, snapshot_date, snapshot_time))
+        cursor.executemany(f"""
+            INSERT INTO document_changes (
+                project_name, snapshot_date, snapshot_time,
+                {', '.join(name for name, _ in DOCUMENT_CHANGE_COLUMNS)}
+            ) VALUES ({', '.join(['?'] * (len(DOCUMENT_CHANGE_COLUMNS) + 3))})
+        """, rows)
+        cursor.execute("""
+            INSERT OR REPLACE INTO change_detection_state (
+                project_name, snapshot_date, snapshot_time,
+                previous_snapshot_date, previous_snapshot_time, fingerprint, change_count, detected_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
+        """, (project_name, snapshot_date, snapshot_time, previous_date, previous_time, fingerprint, len(rows)))
+        
+        self._commit()
+        return len(rows)
+    
+    @traced('db.get_document_changes')
+    def get_document_changes(self, project_name, snapshot_date, snapshot_time, fingerprint=None):
+        """Get the changes stored for a snapshot.
+        
+        Args:
+            project_name: Name of the project
+            snapshot_date: Date in YYYY-MM-DD format
+            snapshot_time: Time in HH:MM format
+            fingerprint: Optional current change detection fingerprint - changes
+                detected with a different one are treated as missing
+            
+        Returns:
+            DataFrame: Changes since the previous snapshot (detect_changes columns),
+            or None if they have not been detected against the current previous snapshot
+        """
+        import pandas as pd
+        
+        state = self.get_change_detection_state(project_name).get((snapshot_date, snapshot_time))
+        if state is None:
+            return None
+        previous_snapshot, stored_fingerprint = state
+        if previous_snapshot != self.get_previous_snapshot(project_name, snapshot_date, snapshot_time):
+            return None
+        if fingerprint is not None and stored_fingerprint != fingerprint:
+            return None
+        
+        select = ', '.join(f"{name} AS '{column}'" for name, column in DOCUMENT_CHANGE_COLUMNS)
+        query = f"""
+            SELECT {select}
+            FROM document_changes
+            WHERE project_name = ?
+              AND snapshot_date = ?
+              AND snapshot_time = ?
+            ORDER BY id
+        """
+        return pd.read_sql_query(query, self.conn, params=(project_name, snapshot_date, snapshot_time))
+    
+    @traced('db.update_document_history')
+    def update_document_history(self, project_name):
+        """Bring a project's snapshot index and document history up to date.
+        
+        New snapshots later than every indexed one extend the history: spans
+        whose document keeps its revision and status are continued, the rest
+        are closed and new spans opened. If the indexed snapshots no longer
+        match the stored ones (an older file was imported later, or a snapshot
+        was re-imported) the history is rebuilt from the first snapshot that
+        differs. Compacted snapshots stay indexed: their documents are read
+        back from the history when it is rebuilt past them.
+        
+        Args:
+            project_name: Name of the project
+            
+        Returns:
+            int: Number of snapshots added to the history
+        """
+        import pandas as pd
+        
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            SELECT snapshot_date, snapshot_time, COUNT(*)
+            FROM documents
+            WHERE project_name = ?
+            GROUP BY snapshot_date, snapshot_time
+            UNION ALL
+            SELECT c.snapshot_date, c.snapshot_time, c.document_count
+            FROM compacted_snapshots c
+            JOIN snapshots s
+              ON s.project_name = c.project_name
+             AND s.snapshot_date = c.snapshot_date
+             AND s.snapshot_time = c.snapshot_time
+            WHERE c.project_name = ?
+            ORDER BY 1, 2
+        """, (project_name, project_name))
+        stored = [tuple(row) for row in cursor.fetchall()]
+        
+        cursor.execute("""
+            SELECT id, snapshot_date, snapshot_time, document_count
+            FROM snapshots
+            WHERE project_name = ?
+            ORDER BY id
+        """, (project_name,))
+        indexed = cursor.fetchall()
+        
+        matching = 0
+        while (matching < min(len(stored), len(indexed))
+               and stored[matching] == tuple(indexed[matching])[1:]):
+            matching += 1
+        
+        kept_documents = {}
+        if matching < len(indexed):
+            # Compacted snapshots have no rows to rebuild from - keep their documents
+            snapshot_ids = {(row[1], row[2]): row[0] for row in indexed}
+            for snapshot in self.get_compacted_snapshots(project_name):
+                snapshot_id = snapshot_ids.get(snapshot)
+                if snapshot_id is not None and snapshot_id >= indexed[matching][0]:
+                    kept_documents[snapshot] = pd.read_sql_query("""
+                        SELECT doc_ref, revision, status
+                        FROM document_history
+                        WHERE project_name = ? AND first_snapshot_id <= ? AND last_snapshot_id >= ?
+                    """, self.conn, params=(project_name, snapshot_id, snapshot_id))
+            self._truncate_document_history(project_name, indexed[matching][0],
+                                            indexed[matching - 1][0] if matching else None)
+            indexed = indexed[:matching]
+        
+        previous_id = indexed[-1][0] if indexed else None
+        for snapshot_date, snapshot_time, document_count in stored[len(indexed):]:
+            previous_id = self._extend_document_history(project_name, snapshot_date, snapshot_time,
+                                                        document_count, previous_id,
+                                                        kept_documents.get((snapshot_date, snapshot_time)))
+        
+        self._commit()
+        return len(stored) - len(indexed)
+    
+    def _truncate_document_history(self, project_name, first_dropped_id, previous_id):
+        """Drop indexed snapshots from first_dropped_id on, ending their spans at previous_id (no commit)."""
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            DELETE FROM document_history
+            WHERE project_name = ? AND first_snapshot_id >= ?
+        """, (project_name, first_dropped_id))
+        cursor.execute("""
+            UPDATE document_history SET last_snapshot_id = ?
+            WHERE project_name = ? AND last_snapshot_id >= ?
+        """, (previous_id, project_name, first_dropped_id))
+        cursor.execute("DELETE FROM snapshots WHERE project_name = ? AND id >= ?",
+                       (project_name, first_dropped_id))
+    
+    def _extend_document_history(self, project_name, snapshot_date, snapshot_time, document_count, previous_id,
+                                 current=None):
+        """Add a snapshot after previous_id to the history (no commit).
         
-        Args:
-            db_path: Path to SQLite database file
+        current holds the snapshot's 'doc_ref', 'revision' and 'status'; it is
+        read from the stored documents when not given.
+        
+        Returns:
+            int: The new snapshot id
         """
-        self.db_path = Path(db_path)
-        self.db_path.parent.mkdir(exist_ok=True)
-        self.conn = None
-        self.connect()
+        import pandas as pd
+        
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            INSERT INTO snapshots (project_name, snapshot_date, snapshot_time, document_count)
+            VALUES (?, ?, ?, ?)
+        """, (project_name, snapshot_date, snapshot_time, document_count))
+        snapshot_id = cursor.lastrowid
+        
+        if current is None:
+            current = pd.read_sql_query("""
+                SELECT DISTINCT doc_ref, revision, status
+                FROM documents
+                WHERE project_name = ? AND snapshot_date = ? AND snapshot_time = ?
+            """, self.conn, params=(project_name, snapshot_date, snapshot_time))
+        
+        if previous_id is not None:
+            open_spans = pd.read_sql_query("""
+                SELECT id, doc_ref, revision, status
+                FROM document_history
+                WHERE project_name = ? AND last_snapshot_id = ?
+            """, self.conn, params=(project_name, previous_id))
+            current = current.merge(open_spans, on=['doc_ref', 'revision', 'status'], how='left')
+            continued = current['id'].notna()
+            cursor.executemany("UPDATE document_history SET last_snapshot_id = ? WHERE id = ?",
+                               [(snapshot_id, int(span_id)) for span_id in current.loc[continued, 'id']])
+            current = current[~continued]
+        
+        cursor.executemany("""
+            INSERT INTO document_history
+            (project_name, doc_ref, revision, status, first_snapshot_id, last_snapshot_id)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """, [(project_name, doc_ref, revision, status, snapshot_id, snapshot_id)
+              for doc_ref, revision, status in current[['doc_ref', 'revision', 'status']].itertuples(index=False)])
+        return snapshot_id
     
-    def connect(self):
-        """Establish database connection."""
-        self.conn = sqlite3.connect(self.db_path)
-        self.conn.row_factory = sqlite3.Row  # Enable column access by name
+    def get_snapshot_index(self, project_name):
+        """Get a project's indexed snapshots (see update_document_history).
+        
+        Args:
+            project_name: Name of the project
+            
+        Returns:
+            DataFrame: 'id', 'snapshot_date', 'snapshot_time' and 'document_count',
+            in chronological order
+        """
+        import pandas as pd
+        
+        try:
+            return pd.read_sql_query("""
+                SELECT id, snapshot_date, snapshot_time, document_count
+                FROM snapshots
+                WHERE project_name = ?
+                ORDER BY id
+            """, self.conn, params=(project_name,))
+        except pd.errors.DatabaseError:
+            # Database predates the document history (run --init to migrate)
+            return pd.DataFrame(columns=['id', 'snapshot_date', 'snapshot_time', 'document_count'])
     
-    def close(self):
-        """Close database connection."""
-        if self.conn:
-            self.conn.close()
-            self.conn = None
+    def get_snapshot_as_of(self, project_name, as_of):
+        """Get the latest indexed snapshot taken on or before a date.
+        
+        Args:
+            project_name: Name of the project
+            as_of: 'YYYY-MM-DD' (any time that day) or 'YYYY-MM-DD HH:MM'
+            
+        Returns:
+            tuple: (snapshot id, snapshot_date, snapshot_time), or None if there is none
+        """
+        as_of_date, _, as_of_time = as_of.partition(' ')
+        cursor = self.conn.execute("""
+            SELECT id, snapshot_date, snapshot_time
+            FROM snapshots
+            WHERE project_name = ?
+              AND (snapshot_date, snapshot_time) <= (?, ?)
+            ORDER BY id DESC
+            LIMIT 1
+        """, (project_name, as_of_date, as_of_time or '99:99'))
+        row = cursor.fetchone()
+        return tuple(row) if row else None
     
-    def __enter__(self):
-        """Context manager entry."""
-        return self
+    @traced('db.get_documents_as_of')
+    def get_documents_as_of(self, project_name, as_of):
+        """Get the register as it was on a date, from the document history.
+        
+        Args:
+            project_name: Name of the project
+            as_of: 'YYYY-MM-DD' (any time that day) or 'YYYY-MM-DD HH:MM'
+            
+        Returns:
+            DataFrame: 'Doc Ref', 'Rev', 'Status' and 'Since' (date the document
+            reached that revision and status), empty if no snapshot is that old
+        """
+        import pandas as pd
+        
+        snapshot = self.get_snapshot_as_of(project_name, as_of)
+        snapshot_id = snapshot[0] if snapshot else -1
+        return pd.read_sql_query("""
+            SELECT h.doc_ref AS 'Doc Ref', h.revision AS 'Rev', h.status AS 'Status',
+                   f.snapshot_date AS 'Since'
+            FROM document_history h
+            JOIN snapshots f ON f.id = h.first_snapshot_id
+            WHERE h.project_name = ?
+              AND h.first_snapshot_id <= ?
+              AND h.last_snapshot_id >= ?
+            ORDER BY h.doc_ref
+        """, self.conn, params=(project_name, snapshot_id, snapshot_id))
     
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        """Context manager exit."""
-        self.close()
+    @traced('db.get_document_history')
+    def get_document_history(self, project_name, doc_ref):
+        """Get the revisions and statuses a document has had.
+        
+        Args:
+            project_name: Name of the project
+            doc_ref: Document reference
+            
+        Returns:
+            DataFrame: 'Rev', 'Status', 'First Seen', 'Last Seen' and 'Snapshots'
+            per span, oldest first ('First Seen'/'Last Seen' as 'YYYY-MM-DD HH:MM')
+        """
+        import pandas as pd
+        
+        return pd.read_sql_query("""
+            SELECT h.revision AS 'Rev', h.status AS 'Status',
+                   f.snapshot_date || ' ' || f.snapshot_time AS 'First Seen',
+                   l.snapshot_date || ' ' || l.snapshot_time AS 'Last Seen',
+                   (SELECT COUNT(*) FROM snapshots s
+                    WHERE s.project_name = h.project_name
+                      AND s.id BETWEEN h.first_snapshot_id AND h.last_snapshot_id) AS 'Snapshots'
+            FROM document_history h
+            JOIN snapshots f ON f.id = h.first_snapshot_id
+            JOIN snapshots l ON l.id = h.last_snapshot_id
+            WHERE h.project_name = ? AND h.doc_ref = ?
+            ORDER BY h.first_snapshot_id, h.id
+        """, self.conn, params=(project_name, doc_ref))
     
-    def initialize_schema(self):
-        """Create database schema if it doesn't exist."""
-        cursor = self.conn.cursor()
-        cursor.executescript(DATABASE_SCHEMA)
-        self.conn.commit()
-        print(f"Database schema initialized at {self.db_path}")
+    def get_first_seen(self, project_name, doc_ref, revision=None, status=None):
+        """Get when a document first appeared, or first reached a revision and/or status.
+        
+        Args:
+            project_name: Name of the project
+            doc_ref: Document reference
+            revision: Optional revision (e.g. 'C01')
+            status: Optional status
+            
+        Returns:
+            tuple: (snapshot_date, snapshot_time), or None if it never did
+        """
+        conditions = ''
+        params = [project_name, doc_ref]
+        if revision is not None:
+            conditions += ' AND h.revision = ?'
+            params.append(revision)
+        if status is not None:
+            conditions += ' AND h.status = ?'
+            params.append(status)
+        
+        cursor = self.conn.execute(f"""
+            SELECT f.snapshot_date, f.snapshot_time
+            FROM document_history h
+            JOIN snapshots f ON f.id = h.first_snapshot_id
+            WHERE h.project_name = ? AND h.doc_ref = ? {conditions}
+            ORDER BY h.first_snapshot_id
+            LIMIT 1
+        """, params)
+        row = cursor.fetchone()
+        return tuple(row) if row else None
     
-    def wipe_database(self):
-        """Wipe all data from the database (keeps schema)."""
-        cursor = self.conn.cursor()
+    @traced('db.get_history_spans')
+    def get_history_spans(self, project_name):
+        """Get every span of a project's document history.
         
-        # Get all table names
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-        tables = cursor.fetchall()
+        Args:
+            project_name: Name of the project
+            
+        Returns:
+            DataFrame: 'doc_ref', 'revision', 'status', 'first_snapshot_id' and
+            'last_snapshot_id' (ids from get_snapshot_index)
+        """
+        import pandas as pd
         
-        # Delete data from each table
-        for table in tables:
-            table_name = table[0]
-            if table_name != 'sqlite_sequence':
-                cursor.execute(f"DELETE FROM {table_name}")
-                print(f"Wiped table: {table_name}")
+        return pd.read_sql_query("""
+            SELECT doc_ref, revision, status, first_snapshot_id, last_snapshot_id
+            FROM document_history
+            WHERE project_name = ?
+        """, self.conn, params=(project_name,))
+    
+    @staticmethod
+    def _class_clause(project_name, snapshot_date, snapshot_time, doc_class):
+        """WHERE clause selecting a stored document class (see get_documents_for_snapshot).
         
-        self.conn.commit()
-        print("Database wiped successfully")
+        Returns:
+            tuple: (SQL to append to a WHERE clause, its parameters)
+        """
+        if doc_class == MAIN_REPORT_CLASS:
+            return """
+              AND doc_class = CASE WHEN EXISTS (
+                  SELECT 1 FROM documents
+                  WHERE project_name = ? AND snapshot_date = ? AND snapshot_time = ?
+                    AND doc_class = 'drawing'
+              ) THEN 'drawing' ELSE 'other' END
+            """, [project_name, snapshot_date, snapshot_time]
+        if doc_class is not None:
+            return "AND doc_class = ?", [doc_class]
+        return '', []
     
-    def rebuild_database(self):
-        """Drop all tables and rebuild schema."""
-        cursor = self.conn.cursor()
+    def _load_status_mapping(self, status_lookup):
+        """Load a status -> category lookup into the connection's temp status_mappings table.
         
-        # Get all table names
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-        tables = cursor.fetchall()
+        Each distinct lookup is loaded once per connection.
         
-        # Drop each table (skip sqlite internal tables)
-        for table in tables:
-            table_name = table[0]
-            # Skip SQLite internal tables
-            if table_name.startswith('sqlite_'):
-                continue
-            cursor.execute(f"DROP TABLE IF EXISTS {table_name}")
-            print(f"Dropped table: {table_name}")
+        Args:
+            status_lookup: Dictionary of raw status -> category (see utils.status_mapping.StatusMapper)
+            
+        Returns:
+            str: Key selecting the lookup's rows in temp.status_mappings
+        """
+        mapping_key = hashlib.sha1(json.dumps(sorted(status_lookup.items())).encode('utf-8')).hexdigest()
+        if mapping_key not in self._status_mappings_loaded:
+            self.conn.execute("""
+                CREATE TEMP TABLE IF NOT EXISTS status_mappings (
+                    mapping_key TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    category TEXT NOT NULL,
+                    PRIMARY KEY (mapping_key, status)
+                )
+            """)
+            self.conn.executemany("INSERT OR REPLACE INTO temp.status_mappings VALUES (?, ?, ?)",
+                                  [(mapping_key, status, category) for status, category in status_lookup.items()])
+            self._status_mappings_loaded.add(mapping_key)
+        return mapping_key
+    
+    def _snapshot_counts_source(self, project_name, snapshot_date, snapshot_time, doc_class):
+        """Subquery of a snapshot's grouped counts (see get_snapshot_counts).
         
-        # Drop all indices
-        cursor.execute("SELECT name FROM sqlite_master WHERE type='index' AND name NOT LIKE 'sqlite_%'")
-        indices = cursor.fetchall()
-        for index in indices:
-            index_name = index[0]
-            cursor.execute(f"DROP INDEX IF EXISTS {index_name}")
+        Stored snapshots are grouped on their value codes, decoded once per
+        group, with the revision keys stored at ingest; compacted snapshots
+        read the counts kept in snapshot_counts (without revision keys).
         
-        self.conn.commit()
+        Returns:
+            tuple: (SQL selecting revision, status, file_type, count, position
+            and the REVISION_KEY_COLUMNS, its parameters)
+        """
+        if self.is_snapshot_compacted(project_name, snapshot_date, snapshot_time):
+            if doc_class not in COMPACTED_REPORT_CLASSES:
+                raise ValueError(f"Snapshot {snapshot_date} {snapshot_time} of {project_name} is compacted - "
+                                 f"only counts for {', '.join(COMPACTED_REPORT_CLASSES)} are kept")
+            return """
+                SELECT revision, status, file_type, count, position,
+                       NULL AS rev_family, NULL AS rev_number, NULL AS rev_suffix
+                FROM snapshot_counts
+                WHERE project_name = ?
+                  AND snapshot_date = ?
+                  AND snapshot_time = ?
+                  AND report_class = ?
+            """, [project_name, snapshot_date, snapshot_time, doc_class]
         
-        # Recreate schema
-        self.initialize_schema()
-        print("Database rebuilt successfully")
+        class_clause, class_params = self._class_clause(project_name, snapshot_date, snapshot_time, doc_class)
+        return f"""
+            SELECT r.value AS revision, s.value AS status, f.value AS file_type,
+                   g.count AS count, g.first_id AS position,
+                   g.rev_family AS rev_family, g.rev_number AS rev_number, g.rev_suffix AS rev_suffix
+            FROM (
+                SELECT revision_id, status_id, file_type_id, rev_family, rev_number, rev_suffix,
+                       COUNT(*) AS count, MIN(id) AS first_id
+                FROM documents
+                WHERE project_name = ?
+                  AND snapshot_date = ?
+                  AND snapshot_time = ?
+                  {class_clause}
+                GROUP BY revision_id, status_id, file_type_id, rev_family, rev_number, rev_suffix
+            ) g
+            LEFT JOIN value_codes r ON r.id = g.revision_id
+            LEFT JOIN value_codes s ON s.id = g.status_id
+            LEFT JOIN value_codes f ON f.id = g.file_type_id
+        """, [project_name, snapshot_date, snapshot_time] + class_params
     
-    def insert_documents(self, project_name, snapshot_date, snapshot_time, documents_df):
-        """Insert document records into database.
+    @traced('db.get_snapshot_counts')
+    def get_snapshot_counts(self, project_name, snapshot_date, snapshot_time, doc_class=None,
+                            status_lookup=None, unmapped_category=None):
+        """Count a snapshot's documents by revision, status and file type in SQLite.
+        
+        The GROUP BY runs in the database, so no row-level DataFrame is built.
+        Groups are returned in order of first appearance, as a pandas groupby
+        of get_documents_for_snapshot() with the same doc_class would give them.
+        Compacted snapshots return the counts kept when they were compacted.
         
         Args:
             project_name: Name of the project
-            snapshot_date: Date of the snapshot (YYYY-MM-DD)
-            snapshot_time: Time of the snapshot (HH:MM)
-            documents_df: DataFrame containing document data
+            snapshot_date: Date in YYYY-MM-DD format
+            snapshot_time: Time in HH:MM format
+            doc_class: Optional stored document class or MAIN_REPORT_CLASS
+                (see get_documents_for_snapshot)
+            status_lookup: Optional dictionary of raw status -> category
+                (STATUS_MAPPINGS) joined in to add a 'status_category' column
+            unmapped_category: Category for statuses missing from status_lookup
             
         Returns:
-            int: Number of documents inserted
+            DataFrame: 'revision', 'status', 'file_type', 'count' and the
+            REVISION_KEY_COLUMNS parsed at ingest (NULL for compacted
+            snapshots), plus 'status_category' when status_lookup is given
+            
+        Raises:
+            ValueError: If the snapshot is compacted and doc_class is not one
+                of COMPACTED_REPORT_CLASSES
         """
-        cursor = self.conn.cursor()
-        inserted = 0
+        import pandas as pd
         
-        for _, row in documents_df.iterrows():
-            try:
-                # Helper function to clean strings and handle encoding issues
-                def clean_string(value):
-                    if pd.isna(value) or value == 'nan':
-                        return ''
-                    s = str(value)
-                    # Replace common problematic characters
-                    s = s.encode('utf-8', errors='ignore').decode('utf-8')
-                    return s
-                
-                cursor.execute("""
-                    INSERT INTO documents (
-                        project_name, snapshot_date, snapshot_time,
-                        doc_ref, doc_title, revision, status, file_type,
-                        purpose_of_issue, date_wet, last_status_change_wet,
-                        last_updated_wet, doc_path, publisher
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    project_name,
-                    snapshot_date,
-                    snapshot_time,
-                    clean_string(row.get('Doc Ref', '')),
-                    clean_string(row.get('Doc Title', '')),
-                    clean_string(row.get('Rev', '')),
-                    clean_string(row.get('Status', '')),
-                    clean_string(row.get('File Type', '')),  # Now expects standardized column from COLUMN_MAPPINGS
-                    clean_string(row.get('Purpose of Issue', '')),
-                    clean_string(row.get('Date (WET)', '')),
-                    clean_string(row.get('Last Status Change (WET)', '')),
-                    clean_string(row.get('Last Updated (WET)', '')),
-                    clean_string(row.get('Doc Path', '')),
-                    clean_string(row.get('Publisher', ''))
-                ))
-                inserted += 1
-            except Exception as e:
-                print(f"Error inserting document {row.get('Doc Ref', 'unknown')}: {str(e)}")
-                continue
+        source, source_params = self._snapshot_counts_source(project_name, snapshot_date, snapshot_time, doc_class)
+        category_select = ''
+        mapping_join = ''
+        select_params = []
+        join_params = []
+        if status_lookup is not None:
+            category_select = """,
+                COALESCE(m.category, CASE WHEN c.status IS NULL THEN NULL ELSE ? END) AS status_category"""
+            mapping_join = "LEFT JOIN temp.status_mappings m ON m.mapping_key = ? AND m.status = c.status"
+            select_params = [unmapped_category]
+            join_params = [self._load_status_mapping(status_lookup)]
+        # Placeholders in query order: the SELECT list, the counts, then the joins
+        params = select_params + source_params + join_params
         
-        self.conn.commit()
-        return inserted
+        query = f"""
+            SELECT c.revision AS revision, c.status AS status, c.file_type AS file_type,
+                   c.count AS count, c.rev_family AS rev_family, c.rev_number AS rev_number,
+                   c.rev_suffix AS rev_suffix{category_select}
+            FROM ({source}) c
+            {mapping_join}
+            ORDER BY c.position
+        """
+        return pd.read_sql_query(query, self.conn, params=params)
     
-    def mark_file_processed(self, project_name, file_path, file_name, snapshot_date, snapshot_time, record_count):
-        """Mark a file as processed.
+    def is_snapshot_compacted(self, project_name, snapshot_date, snapshot_time):
+        """Check whether a snapshot's document rows were dropped by compact_snapshot().
         
         Args:
             project_name: Name of the project
-            file_path: Full path to the file
-            file_name: Name of the file
-            snapshot_date: Date from the file
-            snapshot_time: Time from the file
-            record_count: Number of records processed
+            snapshot_date: Date in YYYY-MM-DD format
+            snapshot_time: Time in HH:MM format
+            
+        Returns:
+            bool: True if only the snapshot's report counts are kept
         """
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            INSERT OR REPLACE INTO processing_history
-            (project_name, file_path, file_name, snapshot_date, snapshot_time, record_count)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """, (project_name, str(file_path), file_name, snapshot_date, snapshot_time, record_count))
-        self.conn.commit()
+        cursor = self.conn.execute("""
+            SELECT 1 FROM compacted_snapshots
+            WHERE project_name = ? AND snapshot_date = ? AND snapshot_time = ?
+        """, (project_name, snapshot_date, snapshot_time))
+        return cursor.fetchone() is not None
     
-    def is_file_processed(self, project_name, file_name):
-        """Check if a file has been processed.
+    def get_compacted_snapshots(self, project_name):
+        """Get a project's compacted snapshots.
         
         Args:
             project_name: Name of the project
-            file_name: Name of the file
             
         Returns:
-            bool: True if file has been processed
+            list: (snapshot_date, snapshot_time) tuples in chronological order
         """
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            SELECT COUNT(*) FROM processing_history
-            WHERE project_name = ? AND file_name = ?
-        """, (project_name, file_name))
-        result = cursor.fetchone()
-        return result[0] > 0
+        cursor = self.conn.execute("""
+            SELECT snapshot_date, snapshot_time
+            FROM compacted_snapshots
+            WHERE project_name = ?
+            ORDER BY snapshot_date, snapshot_time
+        """, (project_name,))
+        return [(row[0], row[1]) for row in cursor.fetchall()]
     
-    def get_latest_documents(self, project_name):
-        """Get the most recent document snapshot for a project.
+    def get_snapshot_document_counts(self, project_name):
+        """Get the number of stored documents in each of a project's snapshots.
         
         Args:
             project_name: Name of the project
             
         Returns:
-            DataFrame: Latest document data
+            dict: (snapshot_date, snapshot_time) -> document count
         """
-        query = """
-            SELECT doc_ref AS 'Doc Ref',
-                   doc_title AS 'Doc Title',
-                   revision AS 'Rev',
-                   status AS 'Status',
-                   file_type AS 'File Type',
-                   date_wet AS 'Date (WET)',
-                   doc_path AS 'Doc Path',
-                   publisher AS 'Publisher'
+        cursor = self.conn.execute("""
+            SELECT snapshot_date, snapshot_time, COUNT(*)
             FROM documents
             WHERE project_name = ?
-              AND (snapshot_date, snapshot_time) = (
-                  SELECT snapshot_date, snapshot_time
-                  FROM documents
-                  WHERE project_name = ?
-                  ORDER BY snapshot_date DESC, snapshot_time DESC
-                  LIMIT 1
-              )
+            GROUP BY snapshot_date, snapshot_time
+        """, (project_name,))
+        return {(row[0], row[1]): row[2] for row in cursor.fetchall()}
+    
+    def get_report_state(self, project_name):
+        """Get a fingerprint of the stored data a project's reports are built from.
+        
+        Covers the imported files, the project's document rows (count and
+        latest id), its indexed snapshots (ids included) and its compacted
+        snapshots - everything an import, re-import, compaction or document
+        history rebuild changes - without reading the documents.
+        
+        Args:
+            project_name: Name of the project
+            
+        Returns:
+            str: Hex digest, or None if the database predates the snapshot
+            tables (run --init to migrate)
         """
+        def rows(query):
+            return [list(row) for row in self.conn.execute(query, (project_name,)).fetchall()]
         
-        return pd.read_sql_query(query, self.conn, params=(project_name, project_name))
+        try:
+            state = {
+                'snapshots': rows("""
+                    SELECT id, snapshot_date, snapshot_time, document_count
+                    FROM snapshots WHERE project_name = ? ORDER BY id
+                """),
+                'compacted': rows("""
+                    SELECT snapshot_date, snapshot_time, classification_fingerprint
+                    FROM compacted_snapshots WHERE project_name = ?
+                    ORDER BY snapshot_date, snapshot_time
+                """),
+                'files': rows("""
+                    SELECT id, file_name, snapshot_date, snapshot_time, record_count
+                    FROM processing_history WHERE project_name = ? ORDER BY id
+                """),
+                'rows': rows("""
+                    SELECT COUNT(*), MAX(r.id)
+                    FROM document_rows r
+                    JOIN value_codes c ON c.column_name = 'project_name' AND c.id = r.project_id
+                    WHERE c.value = ?
+                """)[0],
+            }
+        except sqlite3.OperationalError:
+            return None
+        return hashlib.sha1(json.dumps(state).encode('utf-8')).hexdigest()
     
-    def get_documents_for_snapshot(self, project_name, snapshot_date, snapshot_time):
-        """Get documents for a specific snapshot.
+    @traced('db.compact_snapshot')
+    def compact_snapshot(self, project_name, snapshot_date, snapshot_time, fingerprint):
+        """Keep only a snapshot's report counts, dropping its document rows.
+        
+        The counts of each of COMPACTED_REPORT_CLASSES are stored in
+        snapshot_counts, so get_snapshot_counts() (and the progression
+        reports) still return them. The processing history, document history
+        and detected changes are kept (update_document_history
+        keeps the snapshot indexed); the file is not imported again unless
+        forced. Needs the project's stored classification to be current.
         
         Args:
             project_name: Name of the project
             snapshot_date: Date in YYYY-MM-DD format
             snapshot_time: Time in HH:MM format
+            fingerprint: Classification fingerprint the counts are computed with
             
         Returns:
-            DataFrame: Document data for this snapshot
-        """
-        query = """
-            SELECT doc_ref AS 'Doc Ref',
-                   doc_title AS 'Doc Title',
-                   revision AS 'Rev',
-                   status AS 'Status',
-                   file_type AS 'File Type',
-                   date_wet AS 'Date (WET)',
-                   doc_path AS 'Doc Path',
-                   publisher AS 'Publisher'
-            FROM documents
-            WHERE project_name = ?
-              AND snapshot_date = ?
-              AND snapshot_time = ?
+            int: Number of document rows dropped
         """
+        with self.transaction():
+            for report_class in COMPACTED_REPORT_CLASSES:
+                source, params = self._snapshot_counts_source(project_name, snapshot_date, snapshot_time,
+                                                              report_class)
+                self.conn.execute(f"""
+                    INSERT INTO snapshot_counts (
+                        project_name, snapshot_date, snapshot_time, report_class,
+                        position, revision, status, file_type, count
+                    )
+                    SELECT ?, ?, ?, ?, ROW_NUMBER() OVER (ORDER BY c.position),
+                           c.revision, c.status, c.file_type, c.count
+                    FROM ({source}) c
+                """, [project_name, snapshot_date, snapshot_time, report_class] + params)
+            
+            cursor = self.conn.execute("""
+                DELETE FROM document_rows
+                WHERE id IN (
+                    SELECT id FROM documents
+                    WHERE project_name = ? AND snapshot_date = ? AND snapshot_time = ?
+                )
+            """, (project_name, snapshot_date, snapshot_time))
+            dropped = cursor.rowcount
+            
+            self.conn.execute("""
+                INSERT INTO compacted_snapshots (
+                    project_name, snapshot_date, snapshot_time, document_count, classification_fingerprint
+                ) VALUES (?, ?, ?, ?, ?)
+            """, (project_name, snapshot_date, snapshot_time, dropped, fingerprint))
+        return dropped
+    
+    def get_document_storage_bytes(self):
+        """Get the bytes used by the document rows and their indices.
         
-        return pd.read_sql_query(query, self.conn, params=(project_name, snapshot_date, snapshot_time))
+        Falls back to the whole database file size when SQLite is built
+        without the dbstat table.
+        
+        Returns:
+            int: Size in bytes
+        """
+        try:
+            cursor = self.conn.execute("""
+                SELECT SUM(pgsize) FROM dbstat
+                WHERE name = 'document_rows' OR name LIKE 'idx_document_rows_%'
+            """)
+        except sqlite3.OperationalError:
+            cursor = self.conn.execute(
+                "SELECT page_count * page_size FROM pragma_page_count(), pragma_page_size()"
+            )
+        return cursor.fetchone()[0] or 0
+    
+    def reclaim_space(self):
+        """Return free pages to the file system (VACUUM) and refresh the query planner statistics (ANALYZE)."""
+        self.conn.commit()
+        self.conn.execute("VACUUM")
+        self.conn.execute("ANALYZE")
+        self.conn.commit()
     
     def get_project_stats(self, project_name):
         """Get statistics for a project.
@@ -290,13 +1848,75 @@ class DocumentDatabase:
         """, (project_name,))
         date_range = cursor.fetchone()
         
+        # Snapshots kept as report counts only
+        cursor.execute("SELECT COUNT(*) FROM compacted_snapshots WHERE project_name = ?", (project_name,))
+        compacted_snapshots = cursor.fetchone()[0]
+        
         return {
             'total_snapshots': total_snapshots,
+            'compacted_snapshots': compacted_snapshots,
             'latest_document_count': latest_doc_count,
             'first_snapshot': date_range[0],
             'last_snapshot': date_range[1]
         }
     
+    @traced('db.get_project_documents')
+    def get_project_documents(self, project_name):
+        """Get every stored document row of a project, as imported and classified.
+        
+        Args:
+            project_name: Name of the project
+            
+        Returns:
+            DataFrame: 'snapshot_date', 'snapshot_time', the standardized
+            document columns, ATTRIBUTE_COLUMNS and 'attributes_fingerprint',
+            in snapshot and import order
+        """
+        query = f"""
+            SELECT snapshot_date, snapshot_time, {_document_select(DOCUMENT_COLUMNS)},
+                   {', '.join(ATTRIBUTE_COLUMNS)}, attributes_fingerprint
+            FROM documents
+            WHERE project_name = ?
+            ORDER BY snapshot_date, snapshot_time, id
+        """
+        return self._read_documents(query, (project_name,), _encoded(DOCUMENT_COLUMNS))
+    
+    def delete_project(self, project_name):
+        """Delete a project's document rows and its rows in PROJECT_TABLES.
+        
+        Args:
+            project_name: Name of the project
+            
+        Returns:
+            int: Number of document rows deleted
+        """
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            DELETE FROM document_rows
+            WHERE project_id = (
+                SELECT id FROM value_codes WHERE column_name = 'project_name' AND value = ?
+            )
+        """, (project_name,))
+        deleted = cursor.rowcount
+        for table_name in PROJECT_TABLES:
+            cursor.execute(f"DELETE FROM {table_name} WHERE project_name = ?", (project_name,))
+        
+        self._commit()
+        return deleted
+    
+    def has_documents(self, project_name):
+        """Check whether any snapshot has been imported for a project.
+        
+        Args:
+            project_name: Name of the project
+            
+        Returns:
+            bool: True if the project has documents
+        """
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT 1 FROM documents WHERE project_name = ? LIMIT 1", (project_name,))
+        return cursor.fetchone() is not None
+    
     def get_all_projects(self):
         """Get list of all projects in the database.
         
@@ -304,12 +1924,18 @@ class DocumentDatabase:
             list: Project names
         """
         cursor = self.conn.cursor()
-        cursor.execute("SELECT DISTINCT project_name FROM documents ORDER BY project_name")
+        cursor.execute("""
+            SELECT value FROM value_codes
+            WHERE column_name = 'project_name'
+              AND EXISTS (SELECT 1 FROM document_rows WHERE project_id = value_codes.id)
+            ORDER BY value
+        """)
         return [row[0] for row in cursor.fetchall()]
     
     # DEPRECATED: The following functions used old summary tables and are no longer needed
     # All counting is now done dynamically - see analyzers/dynamic_counting.py
     
+    @traced('db.get_monthly_summaries')
     def get_monthly_summaries(self, project_name, exclude_current_month=True):
         """Get last snapshot of each completed month.
         
@@ -320,6 +1946,8 @@ class DocumentDatabase:
         Returns:
             DataFrame: Summary data with one row per month (last snapshot)
         """
+        import pandas as pd
+        
         # Get all unique months
         query = """
             SELECT DISTINCT 
@@ -377,6 +2005,7 @@ class DocumentDatabase:
         
         return pd.DataFrame(monthly_data)
     
+    @traced('db.get_last_n_weeks')
     def get_last_n_weeks(self, project_name, n=4):
         """Get last N weeks of snapshots.
         
@@ -387,6 +2016,8 @@ class DocumentDatabase:
         Returns:
             DataFrame: Summary data for last N snapshots
         """
+        import pandas as pd
+        
         # Get last N snapshots
         query = """
             SELECT DISTINCT snapshot_date, snapshot_time
@@ -422,6 +2053,7 @@ class DocumentDatabase:
         
         return pd.DataFrame(weekly_data)
     
+    @traced('db.get_condensed_summary')
     def get_condensed_summary(self, project_name, num_recent_weeks=4):
         """Get condensed summary: monthly summaries + last N weeks.
         
@@ -434,6 +2066,8 @@ class DocumentDatabase:
         Returns:
             DataFrame: Combined monthly summaries and recent weeks
         """
+        import pandas as pd
+        
         # Get last N weeks first
         weekly_df = self.get_last_n_weeks(project_name, num_recent_weeks)
         
@@ -493,6 +2127,8 @@ class DocumentDatabase:
         Returns:
             dict: Summary data for this snapshot
         """
+        import pandas as pd
+        
         record = {}
         
         # Get revision counts
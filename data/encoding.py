@@ -0,0 +1,23 @@
+"""Dictionary encoding of stored columns.
+
+Columns written to the project archives (data/archive.py) and accommodation
+data files (data/accommodation.py) repeat the same values on many rows, so
+they are stored as their distinct values plus one code per row.
+"""
+
+
+def encode_column(values):
+    """Dictionary-encode a column: {'values': distinct values, 'codes': one per row}."""
+    codes = {}
+    encoded = []
+    for value in values:
+        if isinstance(value, float) and value != value:
+            value = None  # NaN
+        encoded.append(codes.setdefault(value, len(codes)))
+    return {'values': list(codes), 'codes': encoded}
+
+
+def decode_column(column):
+    """Values of a column encoded by encode_column()."""
+    values = column['values']
+    return [values[code] for code in column['codes']]
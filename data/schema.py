@@ -2,30 +2,110 @@
 
 # SQLite database schema
 DATABASE_SCHEMA = """
--- Document snapshots table
--- Stores one record per document per snapshot date
-CREATE TABLE IF NOT EXISTS documents (
+-- Value codes table
+-- Integer codes for the low-cardinality document columns (ENCODED_COLUMNS in
+-- data/database.py); document_rows stores the codes
+CREATE TABLE IF NOT EXISTS value_codes (
+    id INTEGER PRIMARY KEY,
+    column_name TEXT NOT NULL,   -- documents column the value belongs to
+    value TEXT NOT NULL,
+    
+    UNIQUE(column_name, value)
+);
+
+-- Folders table
+-- Attributes read from each distinct folder path (doc_path value code) once,
+-- see utils/folders.py. Join on document_rows.folder_id to filter by them.
+CREATE TABLE IF NOT EXISTS folders (
+    id INTEGER PRIMARY KEY REFERENCES value_codes(id),
+    landlords INTEGER NOT NULL,  -- in a Landlords (communal) folder
+    block TEXT,                  -- letter of a 'Block - X' folder
+    superseded INTEGER NOT NULL  -- in an SS (superseded) folder
+);
+
+-- Document rows table
+-- Stores one record per document per snapshot date, with project, revision,
+-- status, file type, purpose of issue, publisher and folder path as value
+-- codes. Read through the documents view, which decodes them.
+CREATE TABLE IF NOT EXISTS document_rows (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
-    project_name TEXT NOT NULL,
+    project_id INTEGER NOT NULL REFERENCES value_codes(id),
     snapshot_date DATE NOT NULL,
     snapshot_time TIME NOT NULL,
     doc_ref TEXT NOT NULL,
     doc_title TEXT,
-    revision TEXT,
-    status TEXT,
-    file_type TEXT,
-    purpose_of_issue TEXT,
+    revision_id INTEGER REFERENCES value_codes(id),
+    status_id INTEGER REFERENCES value_codes(id),
+    file_type_id INTEGER REFERENCES value_codes(id),
+    purpose_of_issue_id INTEGER REFERENCES value_codes(id),
     date_wet TEXT,
     last_status_change_wet TEXT,
     last_updated_wet TEXT,
-    doc_path TEXT,
-    publisher TEXT,
+    folder_id INTEGER REFERENCES value_codes(id),  -- doc_path
+    publisher_id INTEGER REFERENCES value_codes(id),
+    
+    -- Classification computed at ingest (see analyzers/document_attributes.py)
+    doc_class TEXT,              -- certificate, technical_submittal, drawing, other
+    category TEXT,               -- apartment certificate category (certificates only)
+    apartment_number INTEGER,
+    phase TEXT,
+    block TEXT,
+    attributes_fingerprint TEXT, -- config fingerprint the row was classified with
+    
+    -- Revision parsed at ingest (see utils/revisions.py)
+    rev_family TEXT,             -- leading letter: P, C, A...
+    rev_number INTEGER,          -- numeric part (P01 -> 1), NULL if none
+    rev_suffix TEXT,             -- anything after the number (P1A -> A)
+    
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
     
     -- No UNIQUE constraint - allow all rows from source files
     -- Database should faithfully represent source data including duplicates
 );
 
+-- Documents view
+-- document_rows with the value codes decoded (the codes are kept alongside
+-- for integer grouping). The project is joined so WHERE project_name = ?
+-- can use the project_id indices; the other values are looked up only when
+-- a query selects them.
+CREATE VIEW IF NOT EXISTS documents AS
+SELECT
+    r.id,
+    c_project.value AS project_name,
+    r.snapshot_date,
+    r.snapshot_time,
+    r.doc_ref,
+    r.doc_title,
+    (SELECT value FROM value_codes WHERE id = r.revision_id) AS revision,
+    (SELECT value FROM value_codes WHERE id = r.status_id) AS status,
+    (SELECT value FROM value_codes WHERE id = r.file_type_id) AS file_type,
+    (SELECT value FROM value_codes WHERE id = r.purpose_of_issue_id) AS purpose_of_issue,
+    r.date_wet,
+    r.last_status_change_wet,
+    r.last_updated_wet,
+    (SELECT value FROM value_codes WHERE id = r.folder_id) AS doc_path,
+    (SELECT value FROM value_codes WHERE id = r.publisher_id) AS publisher,
+    r.doc_class,
+    r.category,
+    r.apartment_number,
+    r.phase,
+    r.block,
+    r.attributes_fingerprint,
+    r.rev_family,
+    r.rev_number,
+    r.rev_suffix,
+    r.created_at,
+    r.project_id,
+    r.revision_id,
+    r.status_id,
+    r.file_type_id,
+    r.purpose_of_issue_id,
+    r.publisher_id,
+    r.folder_id
+FROM document_rows r
+JOIN value_codes c_project
+    ON c_project.column_name = 'project_name' AND c_project.id = r.project_id;
+
 -- Processing history table
 -- Tracks which files have been processed
 CREATE TABLE IF NOT EXISTS processing_history (
@@ -41,20 +121,173 @@ CREATE TABLE IF NOT EXISTS processing_history (
     UNIQUE(project_name, file_name)
 );
 
+-- Classification state table
+-- Records the config fingerprint each project's rows were last classified with
+CREATE TABLE IF NOT EXISTS classification_state (
+    project_name TEXT PRIMARY KEY,
+    fingerprint TEXT NOT NULL,
+    classified_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+-- Document changes table
+-- Documents added, removed or changed since the project's previous snapshot
+-- (see analyzers/change_detection.py)
+CREATE TABLE IF NOT EXISTS document_changes (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    project_name TEXT NOT NULL,
+    snapshot_date DATE NOT NULL,
+    snapshot_time TIME NOT NULL,
+    doc_ref TEXT NOT NULL,
+    doc_title TEXT,
+    change_type TEXT NOT NULL,   -- added, removed, revised, status_changed, modified
+    old_revision TEXT,
+    new_revision TEXT,
+    old_status TEXT,
+    new_status TEXT,
+    changed_columns TEXT         -- comma-separated tracked columns that changed
+);
+
+-- Change detection state table
+-- Records which snapshot pair and config fingerprint each snapshot's changes
+-- were detected with, so they can be recomputed when either changes
+CREATE TABLE IF NOT EXISTS change_detection_state (
+    project_name TEXT NOT NULL,
+    snapshot_date DATE NOT NULL,
+    snapshot_time TIME NOT NULL,
+    previous_snapshot_date DATE,
+    previous_snapshot_time TIME,
+    fingerprint TEXT NOT NULL,
+    change_count INTEGER,
+    detected_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    
+    PRIMARY KEY (project_name, snapshot_date, snapshot_time)
+);
+
+-- Snapshots table
+-- One row per imported snapshot of a project. Within a project ids increase
+-- with snapshot date/time (the document history is rebuilt from an older
+-- snapshot imported after a newer one, with new ids from there on)
+CREATE TABLE IF NOT EXISTS snapshots (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    project_name TEXT NOT NULL,
+    snapshot_date DATE NOT NULL,
+    snapshot_time TIME NOT NULL,
+    document_count INTEGER,
+    
+    UNIQUE(project_name, snapshot_date, snapshot_time)
+);
+
+-- Document history table
+-- One row per span of consecutive snapshots in which a document kept the same
+-- revision and status (see DocumentDatabase.update_document_history)
+CREATE TABLE IF NOT EXISTS document_history (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    project_name TEXT NOT NULL,
+    doc_ref TEXT NOT NULL,
+    revision TEXT,
+    status TEXT,
+    first_snapshot_id INTEGER NOT NULL REFERENCES snapshots(id),
+    last_snapshot_id INTEGER NOT NULL REFERENCES snapshots(id)
+);
+
+-- Import runs table
+-- One row per backfill (db_manager --backfill); completed_at stays NULL until
+-- every file has been imported, so an interrupted run can be resumed
+CREATE TABLE IF NOT EXISTS import_runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    completed_at TIMESTAMP
+);
+
+-- Import checkpoints table
+-- Files an import run has imported, committed with the file's documents
+CREATE TABLE IF NOT EXISTS import_checkpoints (
+    run_id INTEGER NOT NULL REFERENCES import_runs(id),
+    project_name TEXT NOT NULL,
+    file_name TEXT NOT NULL,
+    imported_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    
+    PRIMARY KEY (run_id, project_name, file_name)
+);
+
+-- Compacted snapshots table
+-- Snapshots whose document rows were dropped by the retention policy
+-- (scripts/db_manager.py --compact). Their report counts are kept in
+-- snapshot_counts, computed with the classification fingerprint recorded here.
+CREATE TABLE IF NOT EXISTS compacted_snapshots (
+    project_name TEXT NOT NULL,
+    snapshot_date DATE NOT NULL,
+    snapshot_time TIME NOT NULL,
+    document_count INTEGER NOT NULL,
+    classification_fingerprint TEXT,
+    compacted_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    
+    PRIMARY KEY (project_name, snapshot_date, snapshot_time)
+);
+
+-- Snapshot counts table
+-- Document counts by revision, status and file type of compacted snapshots,
+-- per report document class (what DocumentDatabase.get_snapshot_counts returns)
+CREATE TABLE IF NOT EXISTS snapshot_counts (
+    project_name TEXT NOT NULL,
+    snapshot_date DATE NOT NULL,
+    snapshot_time TIME NOT NULL,
+    report_class TEXT NOT NULL,  -- 'main' (MAIN_REPORT_CLASS) or 'certificate'
+    position INTEGER NOT NULL,   -- order of the group's first document in the snapshot
+    revision TEXT,
+    status TEXT,
+    file_type TEXT,
+    count INTEGER NOT NULL,
+    
+    PRIMARY KEY (project_name, snapshot_date, snapshot_time, report_class, position)
+);
+
 -- Indices for performance
-CREATE INDEX IF NOT EXISTS idx_documents_project_date 
-    ON documents(project_name, snapshot_date);
+CREATE INDEX IF NOT EXISTS idx_document_rows_project_date 
+    ON document_rows(project_id, snapshot_date);
+
+CREATE INDEX IF NOT EXISTS idx_document_rows_status 
+    ON document_rows(status_id);
+
+CREATE INDEX IF NOT EXISTS idx_document_rows_revision 
+    ON document_rows(revision_id);
+
+CREATE INDEX IF NOT EXISTS idx_document_rows_file_type 
+    ON document_rows(file_type_id);
 
-CREATE INDEX IF NOT EXISTS idx_documents_status 
-    ON documents(status);
+CREATE INDEX IF NOT EXISTS idx_document_rows_snapshot_class 
+    ON document_rows(project_id, snapshot_date, snapshot_time, doc_class);
 
-CREATE INDEX IF NOT EXISTS idx_documents_revision 
-    ON documents(revision);
+CREATE INDEX IF NOT EXISTS idx_document_rows_revision_key 
+    ON document_rows(project_id, rev_family, rev_number, rev_suffix);
 
-CREATE INDEX IF NOT EXISTS idx_documents_file_type 
-    ON documents(file_type);
+CREATE INDEX IF NOT EXISTS idx_document_changes_snapshot 
+    ON document_changes(project_name, snapshot_date, snapshot_time);
+
+CREATE INDEX IF NOT EXISTS idx_document_history_doc 
+    ON document_history(project_name, doc_ref, first_snapshot_id);
+
+CREATE INDEX IF NOT EXISTS idx_document_history_span 
+    ON document_history(project_name, first_snapshot_id, last_snapshot_id);
+
+CREATE INDEX IF NOT EXISTS idx_document_history_last 
+    ON document_history(project_name, last_snapshot_id);
 """
 
+# Columns added after the original documents table - applied with ALTER TABLE
+# to a pre-version-9 documents table before its rows are moved to document_rows
+DOCUMENT_COLUMN_MIGRATIONS = [
+    ('doc_class', 'TEXT'),
+    ('category', 'TEXT'),
+    ('apartment_number', 'INTEGER'),
+    ('phase', 'TEXT'),
+    ('block', 'TEXT'),
+    ('attributes_fingerprint', 'TEXT'),
+    ('rev_family', 'TEXT'),
+    ('rev_number', 'INTEGER'),
+    ('rev_suffix', 'TEXT'),
+]
+
 # Version tracking for schema migrations
-SCHEMA_VERSION = 3  # Removed summary tables - fully dynamic counting system
+SCHEMA_VERSION = 11  # Compacted snapshots and their report counts
 
@@ -1,33 +1,60 @@
 """Main orchestration script for MBS Document Reporter.
 
 Database-driven document register processing and reporting.
+
+Usage:
+    # Interactive menu
+    python main.py
+    
+    # Non-interactive run (all projects, all reports)
+    python main.py run
+    
+    # Selected projects (codes or names) and report types, 4 worker processes
+    python main.py run --projects GP,NM --reports summary,progression --jobs 4
+    
+    # Use the database as it is and profile every report job
+    python main.py run --skip-update --profile
+    
+    # Time every pipeline stage and save a trace profile to output/traces
+    python main.py run --trace
+    
+    # Regenerate every report, including those whose inputs are unchanged
+    python main.py run --force
+
+Reports are only regenerated when their inputs (imported snapshots, project
+config, report code version) changed since they were last written to the
+output directory - see reports/cache.py.
+
+Exit codes (run): 0 = all reports generated, unchanged or skipped, 1 = a report failed,
+2 = invalid arguments.
 """
 
+import sys
+import time
+import argparse
 import warnings
-import pandas as pd
-from datetime import datetime, timedelta
+from datetime import datetime
 from pathlib import Path
-from openpyxl import load_workbook
-from openpyxl.styles import Font, PatternFill
-from config import load_project_config
+from config import ensure_directories
 
 # Suppress warnings
 warnings.filterwarnings('ignore', category=UserWarning, module='openpyxl')
 warnings.filterwarnings('ignore', category=FutureWarning)
 
-# Import from modular structure
-from analyzers import create_summary_row
-from utils.document_filters import get_main_report_data
-from reports import (
-    save_excel_with_retry,
-    generate_progression_report,
-    fill_empty_cells_with_zeros_in_file,
-    save_certificate_report_with_retry
+# Import from modular structure. pandas, openpyxl and the report modules are
+# imported inside the report functions, so the menu and --help start fast.
+from reports.scheduler import (
+    JOB_FAILED,
+    REPORT_TYPES,
+    build_report_jobs,
+    run_report_jobs,
+    print_job_summary
 )
-from utils import slugify
-from utils.document_filters import filter_certificates, get_document_type_summary
+from reports.cache import get_report_output_path
+from utils.tracing import span, enable_tracing, print_trace_summary, write_trace_profile
 from data import DocumentDatabase
-from scripts.db_manager import update_database_with_new_files
+from data.database import MAIN_REPORT_CLASS
+from scripts.db_manager import update_database_with_new_files, PROJECT_NAMES
 
 
 def show_menu():
@@ -111,7 +138,7 @@ def get_report_type_selection():
     """Get report type selection from user.
     
     Returns:
-        str: Report type ('summary', 'progression', 'condensed', 'certificates') or None if cancelled
+        str: Report type ('summary', 'progression', 'condensed', 'certificates', 'turnaround') or None if cancelled
     """
     print("\n" + "="*60)
     print("Select Report Type:")
@@ -120,24 +147,143 @@ def get_report_type_selection():
     print("2. Detailed Progression Report")
     print("3. Condensed Progression Report")
     print("4. Certificate Report")
-    print("5. Cancel")
+    print("5. Turnaround Report")
+    print("6. Cancel")
     print("="*60)
     
-    choice = input("\nEnter your choice (1-5): ").strip()
+    choice = input("\nEnter your choice (1-6): ").strip()
     
     report_map = {
         '1': 'summary',
         '2': 'progression',
         '3': 'condensed',
-        '4': 'certificates'
+        '4': 'certificates',
+        '5': 'turnaround'
     }
     
-    if choice == '5':
+    if choice == '6':
         return None
     
     return report_map.get(choice)
 
 
+def has_current_classification(project_name, config, db):
+    """Check whether the stored document classes match the project config.
+    
+    Args:
+        project_name: Name of the project
+        config: Project configuration
+        db: Database connection
+        
+    Returns:
+        bool: True if reports can select documents by stored doc_class
+    """
+    from analyzers import get_classification_fingerprint
+    
+    return db.is_classification_current(project_name, get_classification_fingerprint(config))
+
+
+def load_report_documents(project_name, config, db, snapshot_date, snapshot_time, doc_class,
+                          use_stored_classes, include_attributes=False):
+    """Load one snapshot's documents for a report.
+    
+    Uses the classification stored at ingest when it is current, otherwise
+    filters the full snapshot with the project config.
+    
+    Args:
+        project_name: Name of the project
+        config: Project configuration
+        db: Database connection
+        snapshot_date: Date in YYYY-MM-DD format
+        snapshot_time: Time in HH:MM format
+        doc_class: DOC_CLASS_CERTIFICATE or MAIN_REPORT_CLASS
+        use_stored_classes: Result of has_current_classification()
+        include_attributes: Include stored apartment certificate attributes
+        
+    Returns:
+        DataFrame: Documents for the report
+    """
+    from utils.document_filters import filter_certificates, get_main_report_data, DOC_CLASS_CERTIFICATE
+    
+    if use_stored_classes:
+        return db.get_documents_for_snapshot(project_name, snapshot_date, snapshot_time,
+                                             doc_class=doc_class,
+                                             include_attributes=include_attributes)
+    
+    snapshot_docs = db.get_documents_for_snapshot(project_name, snapshot_date, snapshot_time)
+    if doc_class == DOC_CLASS_CERTIFICATE:
+        return filter_certificates(snapshot_docs, config)
+    return get_main_report_data(snapshot_docs, config)
+
+
+def load_report_profile(project_name, config, db, snapshot_date, snapshot_time, doc_class,
+                        use_stored_classes):
+    """Aggregate one snapshot's report documents into a SnapshotProfile.
+    
+    When the stored classification is current the documents are selected and
+    counted with a GROUP BY in the database; otherwise they are loaded and
+    filtered with load_report_documents() and counted in pandas. Compacted
+    snapshots only have their stored counts, which are always used.
+    
+    Args:
+        project_name: Name of the project
+        config: Project configuration
+        db: Database connection
+        snapshot_date: Date in YYYY-MM-DD format
+        snapshot_time: Time in HH:MM format
+        doc_class: DOC_CLASS_CERTIFICATE or MAIN_REPORT_CLASS
+        use_stored_classes: Result of has_current_classification()
+        
+    Returns:
+        SnapshotProfile: Counts for the report
+    """
+    from analyzers import build_snapshot_profile, build_snapshot_profile_from_database
+    
+    if use_stored_classes or db.is_snapshot_compacted(project_name, snapshot_date, snapshot_time):
+        return build_snapshot_profile_from_database(db, project_name, snapshot_date, snapshot_time,
+                                                    doc_class, config)
+    
+    documents = load_report_documents(project_name, config, db, snapshot_date, snapshot_time, doc_class,
+                                      use_stored_classes)
+    return build_snapshot_profile(documents, config)
+
+
+def load_snapshot_changes(project_name, config, db, snapshot_date, snapshot_time):
+    """Get the document changes between a snapshot and the one before it.
+    
+    Uses the changes stored at ingest, detecting them on the fly if they are
+    missing or out of date (changes against a compacted snapshot, which has
+    no rows to compare with, are used as stored).
+    
+    Args:
+        project_name: Name of the project
+        config: Project configuration
+        db: Database connection
+        snapshot_date: Date in YYYY-MM-DD format
+        snapshot_time: Time in HH:MM format
+        
+    Returns:
+        DataFrame: Changes with readable change labels, or None for the first snapshot
+    """
+    from analyzers import detect_changes, format_changes, get_change_detection_fingerprint
+    
+    previous_snapshot = db.get_previous_snapshot(project_name, snapshot_date, snapshot_time)
+    if previous_snapshot is None:
+        return None
+    
+    changes = db.get_document_changes(project_name, snapshot_date, snapshot_time,
+                                      fingerprint=get_change_detection_fingerprint(config))
+    if changes is None and db.is_snapshot_compacted(project_name, *previous_snapshot):
+        # No rows left to compare with - keep the changes detected before compaction
+        changes = db.get_document_changes(project_name, snapshot_date, snapshot_time)
+        return format_changes(changes) if changes is not None else None
+    if changes is None:
+        changes = detect_changes(db.get_snapshot_register(project_name, *previous_snapshot),
+                                 db.get_snapshot_register(project_name, snapshot_date, snapshot_time),
+                                 config)
+    return format_changes(changes)
+
+
 def generate_summary_report(project_name, config, output_dir, db):
     """Generate summary report for a project using dynamic counting.
     
@@ -150,21 +296,13 @@ def generate_summary_report(project_name, config, output_dir, db):
     Returns:
         bool: True if successful
     """
-    project_slug = slugify(project_name)
-    summary_output = output_dir / f"{project_slug}_summary.xlsx"
+    import pandas as pd
+    from analyzers import create_summary_row, build_snapshot_profile
+    from reports import save_excel_with_retry
     
-    # Get latest snapshot data
-    latest_data_df = db.get_latest_documents(project_name)
+    summary_output = get_report_output_path(output_dir, project_name, 'summary')
     
-    if latest_data_df.empty:
-        print(f"  ✗ No data for {project_name}")
-        return False
-    
-    # Apply drawing filters for main report
-    filtered_data = get_main_report_data(latest_data_df, config)
-    
-    # Create a single-row summary DataFrame with dynamic counts
-    # Get snapshot date/time from the latest data
+    # Get latest snapshot date/time
     cursor = db.conn.cursor()
     cursor.execute("""
         SELECT snapshot_date, snapshot_time 
@@ -176,17 +314,29 @@ def generate_summary_report(project_name, config, output_dir, db):
     
     result = cursor.fetchone()
     if not result:
-        print(f"  ✗ No snapshot found for {project_name}")
+        print(f"  ✗ No data for {project_name}")
         return False
     
     snapshot_date, snapshot_time = result
     
+    # Latest snapshot filtered to main report documents (drawings/schematics)
+    filtered_data = load_report_documents(
+        project_name, config, db, snapshot_date, snapshot_time, MAIN_REPORT_CLASS,
+        has_current_classification(project_name, config, db)
+    )
+    
+    # Aggregate the snapshot once - shared by the summary row and every report section
+    profile = build_snapshot_profile(filtered_data, config)
+    
     # Create summary row using dynamic counting
-    summary_row = create_summary_row(snapshot_date, snapshot_time, filtered_data, config)
+    summary_row = create_summary_row(snapshot_date, snapshot_time, filtered_data, config, profile)
     summary_df = pd.DataFrame([summary_row])
     
+    changes_df = load_snapshot_changes(project_name, config, db, snapshot_date, snapshot_time)
+    
     # Generate the report
-    if save_excel_with_retry(summary_df, None, filtered_data, summary_output, config):
+    if save_excel_with_retry(summary_df, changes_df, filtered_data, summary_output, config,
+                             snapshot_profile=profile):
         print(f"  ✓ Summary report: {summary_output}")
         return True
     else:
@@ -206,53 +356,50 @@ def generate_progression_report_full(project_name, config, output_dir, db):
     Returns:
         bool: True if successful
     """
-    project_slug = slugify(project_name)
-    progression_output = output_dir / f"{project_slug}_progression.xlsx"
+    import pandas as pd
+    from analyzers import create_summary_row
+    from reports import generate_progression_report, fill_empty_cells_with_zeros_in_file
+    
+    progression_output = get_report_output_path(output_dir, project_name, 'progression')
     
     # Delete existing report to rebuild from scratch
     if progression_output.exists():
         progression_output.unlink()
     
-    # Get all snapshots from database (just dates/times)
-    query = """
-        SELECT DISTINCT snapshot_date, snapshot_time 
-        FROM documents 
-        WHERE project_name = ?
-        ORDER BY snapshot_date, snapshot_time
-    """
-    cursor = db.conn.execute(query, (project_name,))
-    snapshots = cursor.fetchall()
+    # Get all snapshots from database (just dates/times), compacted ones included
+    snapshots = db.get_snapshots(project_name, include_compacted=True)
     
     if not snapshots:
         print(f"  ℹ No snapshots found")
         return False
     
+    use_stored_classes = has_current_classification(project_name, config, db)
+    
     # Process each snapshot with dynamic counting
     for snapshot_date, snapshot_time in snapshots:
-        # Get raw documents for this snapshot
-        snapshot_docs = db.get_documents_for_snapshot(project_name, snapshot_date, snapshot_time)
-        
-        if snapshot_docs.empty:
-            continue
-        
-        # Filter to main report documents (drawings/schematics only)
-        filtered_docs = get_main_report_data(snapshot_docs, config)
-        
-        # Convert database date format to display format
-        try:
-            date_obj = datetime.strptime(snapshot_date, '%Y-%m-%d')
-            display_date = date_obj.strftime('%d-%b-%Y')
-        except:
-            display_date = snapshot_date
-        
-        # Create dynamic summary row for this snapshot
-        summary_row = create_summary_row(display_date, snapshot_time, filtered_docs, config)
-        snapshot_summary_df = pd.DataFrame([summary_row])
-        
-        # Generate progression report (adds one column)
-        if not generate_progression_report(snapshot_summary_df, progression_output, config, filtered_docs):
-            print(f"  ✗ Failed column: {display_date} {snapshot_time}")
-            return False
+        with span('snapshot', snapshot=f"{snapshot_date} {snapshot_time}"):
+            # Counts of the main report documents for this snapshot (drawings/schematics only)
+            profile = load_report_profile(
+                project_name, config, db, snapshot_date, snapshot_time, MAIN_REPORT_CLASS,
+                use_stored_classes
+            )
+            
+            # Convert database date format to display format
+            try:
+                date_obj = datetime.strptime(snapshot_date, '%Y-%m-%d')
+                display_date = date_obj.strftime('%d-%b-%Y')
+            except:
+                display_date = snapshot_date
+            
+            # Create dynamic summary row for this snapshot
+            summary_row = create_summary_row(display_date, snapshot_time, None, config, profile)
+            snapshot_summary_df = pd.DataFrame([summary_row])
+            
+            # Generate progression report (adds one column)
+            if not generate_progression_report(snapshot_summary_df, progression_output, config,
+                                               snapshot_profile=profile):
+                print(f"  ✗ Failed column: {display_date} {snapshot_time}")
+                return False
     
     fill_empty_cells_with_zeros_in_file(str(progression_output))
     print(f"  ✓ Progression report: {progression_output}")
@@ -272,16 +419,14 @@ def generate_condensed_report(project_name, config, output_dir, db, num_weeks=4)
     Returns:
         bool: True if successful
     """
-    # Get all snapshots for this project
-    cursor = db.conn.cursor()
-    cursor.execute("""
-        SELECT DISTINCT snapshot_date, snapshot_time
-        FROM documents
-        WHERE project_name = ?
-        ORDER BY snapshot_date, snapshot_time
-    """, (project_name,))
+    import pandas as pd
+    from openpyxl import load_workbook
+    from analyzers import create_summary_row
+    from reports import generate_progression_report, fill_empty_cells_with_zeros_in_file
+    from styles import register_named_styles
     
-    all_snapshots = cursor.fetchall()
+    # Get all snapshots for this project, compacted ones included
+    all_snapshots = db.get_snapshots(project_name, include_compacted=True)
     
     if not all_snapshots:
         print(f"  ℹ No data for condensed report")
@@ -330,58 +475,58 @@ def generate_condensed_report(project_name, config, output_dir, db, num_weeks=4)
         print(f"  ℹ No data for condensed report")
         return False
     
-    project_slug = slugify(project_name)
-    condensed_output = output_dir / f"{project_slug}_progression_condensed.xlsx"
+    condensed_output = get_report_output_path(output_dir, project_name, 'condensed')
     
     # Delete existing report
     if condensed_output.exists():
         condensed_output.unlink()
     
+    use_stored_classes = has_current_classification(project_name, config, db)
+    
     # Process each snapshot with dynamic counting
     for snapshot_date, snapshot_time, is_monthly in condensed_snapshots:
         
         if not snapshot_date or not snapshot_time:
             continue
         
-        # Get raw documents for this snapshot
-        snapshot_docs = db.get_documents_for_snapshot(project_name, snapshot_date, snapshot_time)
-        
-        if snapshot_docs.empty:
-            continue
-        
-        # Filter to main report documents (drawings/schematics only)
-        filtered_docs = get_main_report_data(snapshot_docs, config)
-        
-        # Convert database date format to display format
-        # Monthly: "Jun-2025", Weekly: "07-Oct-2025"
-        try:
-            date_obj = datetime.strptime(snapshot_date, '%Y-%m-%d')
-            if is_monthly:
-                display_date = date_obj.strftime('%b-%Y')  # "Jun-2025" for monthly
-            else:
-                display_date = date_obj.strftime('%d-%b-%Y')  # "07-Oct-2025" for weekly
-        except:
-            display_date = snapshot_date
-        
-        # Create dynamic summary row for this snapshot
-        summary_row = create_summary_row(display_date, snapshot_time, filtered_docs, config)
-        snapshot_summary_df = pd.DataFrame([summary_row])
-        
-        # Generate progression report (adds one column)
-        if generate_progression_report(snapshot_summary_df, condensed_output, config, filtered_docs):
-            # Apply blue formatting to monthly columns
-            if is_monthly:
-                try:
-                    book = load_workbook(condensed_output)
-                    if 'Progression' in book.sheetnames:
-                        sheet = book['Progression']
-                        last_col = sheet.max_column
-                        date_cell = sheet.cell(row=1, column=last_col)
-                        date_cell.font = Font(name='Calibri', size=11, bold=True, color='FFFFFF')
-                        date_cell.fill = PatternFill(start_color='4472C4', end_color='4472C4', fill_type='solid')
-                        book.save(condensed_output)
-                except:
-                    pass
+        with span('snapshot', snapshot=f"{snapshot_date} {snapshot_time}"):
+            # Counts of the main report documents for this snapshot (drawings/schematics only)
+            profile = load_report_profile(
+                project_name, config, db, snapshot_date, snapshot_time, MAIN_REPORT_CLASS,
+                use_stored_classes
+            )
+            
+            # Convert database date format to display format
+            # Monthly: "Jun-2025", Weekly: "07-Oct-2025"
+            try:
+                date_obj = datetime.strptime(snapshot_date, '%Y-%m-%d')
+                if is_monthly:
+                    display_date = date_obj.strftime('%b-%Y')  # "Jun-2025" for monthly
+                else:
+                    display_date = date_obj.strftime('%d-%b-%Y')  # "07-Oct-2025" for weekly
+            except:
+                display_date = snapshot_date
+            
+            # Create dynamic summary row for this snapshot
+            summary_row = create_summary_row(display_date, snapshot_time, None, config, profile)
+            snapshot_summary_df = pd.DataFrame([summary_row])
+            
+            # Generate progression report (adds one column)
+            if generate_progression_report(snapshot_summary_df, condensed_output, config,
+                                           snapshot_profile=profile):
+                # Apply blue formatting to monthly columns
+                if is_monthly:
+                    try:
+                        book = load_workbook(condensed_output)
+                        if 'Progression' in book.sheetnames:
+                            sheet = book['Progression']
+                            last_col = sheet.max_column
+                            date_cell = sheet.cell(row=1, column=last_col)
+                            register_named_styles(book, ['Report Monthly Header'])
+                            date_cell.style = 'Report Monthly Header'
+                            book.save(condensed_output)
+                    except:
+                        pass
     
     fill_empty_cells_with_zeros_in_file(str(condensed_output))
     print(f"  ✓ Condensed report: {condensed_output}")
@@ -400,6 +545,11 @@ def generate_certificate_report_full(project_name, config, output_dir, db):
     Returns:
         bool: True if successful
     """
+    import pandas as pd
+    from analyzers import create_summary_row
+    from reports import save_certificate_report_with_retry
+    from utils.document_filters import DOC_CLASS_CERTIFICATE
+    
     cert_settings = config.get('CERTIFICATE_SETTINGS', {})
     
     if not cert_settings.get('enabled', False):
@@ -410,44 +560,40 @@ def generate_certificate_report_full(project_name, config, output_dir, db):
         print(f"  ℹ Certificate report generation not enabled")
         return False
     
-    # Get latest documents
-    latest_data_df = db.get_latest_documents(project_name)
+    # Get all snapshots and build certificate summary dynamically
+    snapshots = db.get_snapshots(project_name, include_compacted=True)
     
-    if latest_data_df.empty:
+    if not snapshots:
         print(f"  ℹ No data found")
         return False
     
-    # Filter for certificates only
-    cert_data = filter_certificates(latest_data_df, config)
+    use_stored_classes = has_current_classification(project_name, config, db)
+    
+    # Latest certificates (with stored apartment attributes when available)
+    latest_date, latest_time = snapshots[-1]
+    cert_data = load_report_documents(
+        project_name, config, db, latest_date, latest_time, DOC_CLASS_CERTIFICATE,
+        use_stored_classes, include_attributes=True
+    )
     
     if cert_data.empty:
         print(f"  ℹ No certificate documents found")
         return False
     
-    # Get all snapshots and build certificate summary dynamically
-    cursor = db.conn.cursor()
-    cursor.execute("""
-        SELECT DISTINCT snapshot_date, snapshot_time
-        FROM documents
-        WHERE project_name = ?
-        ORDER BY snapshot_date, snapshot_time
-    """, (project_name,))
-    
-    snapshots = cursor.fetchall()
-    
     # Build certificate summary using dynamic counting
     cert_summary_rows = []
     for snapshot_date, snapshot_time in snapshots:
-        # Get documents for this snapshot
-        snapshot_docs = db.get_documents_for_snapshot(project_name, snapshot_date, snapshot_time)
-        
-        # Filter for certificates only
-        snapshot_certs = filter_certificates(snapshot_docs, config)
-        
-        if not snapshot_certs.empty:
-            # Use dynamic counting via create_summary_row
-            summary_row = create_summary_row(snapshot_date, snapshot_time, snapshot_certs, config)
-            cert_summary_rows.append(summary_row)
+        with span('snapshot', snapshot=f"{snapshot_date} {snapshot_time}"):
+            # Certificate counts for this snapshot
+            profile = load_report_profile(
+                project_name, config, db, snapshot_date, snapshot_time, DOC_CLASS_CERTIFICATE,
+                use_stored_classes
+            )
+            
+            if not profile.empty:
+                # Use dynamic counting via create_summary_row
+                summary_row = create_summary_row(snapshot_date, snapshot_time, None, config, profile)
+                cert_summary_rows.append(summary_row)
     
     if not cert_summary_rows:
         print(f"  ℹ No certificate data in snapshots")
@@ -457,8 +603,7 @@ def generate_certificate_report_full(project_name, config, output_dir, db):
     cols = ['Date', 'Time'] + [c for c in cert_summary_df.columns if c not in ['Date', 'Time']]
     cert_summary_df = cert_summary_df[cols]
     
-    project_slug = slugify(project_name)
-    cert_output = output_dir / f"{project_slug}_certificates.xlsx"
+    cert_output = get_report_output_path(output_dir, project_name, 'certificates')
     
     if save_certificate_report_with_retry(cert_summary_df, cert_data, cert_output, config):
         print(f"  ✓ Certificate report: {cert_output}")
@@ -468,6 +613,83 @@ def generate_certificate_report_full(project_name, config, output_dir, db):
         return False
 
 
+def generate_turnaround_report(project_name, config, output_dir, db):
+    """Generate turnaround report for a project from the document history.
+    
+    Args:
+        project_name: Name of the project
+        config: Project configuration
+        output_dir: Output directory path
+        db: Database connection
+        
+    Returns:
+        bool: True if successful
+    """
+    from analyzers import calculate_status_turnaround, calculate_revision_turnaround, get_open_status_ages
+    from reports import save_turnaround_report
+    
+    snapshots = db.get_snapshot_index(project_name)
+    if snapshots.empty and db.has_documents(project_name):
+        print(f"  ℹ Document history not built yet - run scripts/db_manager.py --update")
+        return False
+    if len(snapshots) < 2:
+        print(f"  ℹ Turnaround needs a document history of at least two snapshots")
+        return False
+    
+    spans = db.get_history_spans(project_name)
+    status_df = calculate_status_turnaround(spans, snapshots, config)
+    revision_df = calculate_revision_turnaround(spans, snapshots)
+    status_ages_df = get_open_status_ages(spans, snapshots, config)
+    
+    turnaround_output = get_report_output_path(output_dir, project_name, 'turnaround')
+    
+    if save_turnaround_report(status_df, revision_df, status_ages_df, turnaround_output, config):
+        print(f"  ✓ Turnaround report: {turnaround_output}")
+        return True
+    else:
+        print(f"  ✗ Failed to save turnaround report")
+        return False
+
+
+# Report functions run by the report scheduler, by report type
+REPORT_FUNCTIONS = {
+    'summary': generate_summary_report,
+    'progression': generate_progression_report_full,
+    'condensed': generate_condensed_report,
+    'certificates': generate_certificate_report_full,
+    'turnaround': generate_turnaround_report,
+}
+
+
+def run_reports(project_names, report_types=None, workers=None, db_path='data/documents.db',
+                output_dir='output', profile_dir=None, force=False):
+    """Run report jobs for projects through the report scheduler and print the summary.
+    
+    Args:
+        project_names: Project names
+        report_types: Report types (default: all of REPORT_TYPES)
+        workers: Worker process count (default: config.REPORT_WORKERS / one per CPU)
+        db_path: Path to database file
+        output_dir: Report output directory
+        profile_dir: Optional directory for per-job cProfile stats
+        force: Regenerate reports whose inputs are unchanged since they were last written
+        
+    Returns:
+        list: Job results from run_report_jobs()
+    """
+    start = time.perf_counter()
+    jobs = build_report_jobs(project_names, report_types)
+    results = run_report_jobs(jobs, REPORT_FUNCTIONS, workers=workers, db_path=db_path,
+                              output_dir=output_dir, profile_dir=profile_dir, force=force)
+    
+    print(f"{'='*60}")
+    print("GENERATION COMPLETE")
+    print(f"{'='*60}")
+    print_job_summary(results, wall_seconds=time.perf_counter() - start)
+    print(f"{'='*60}")
+    return results
+
+
 def process_single_project_all_reports(project_name):
     """Generate all reports for a single project.
     
@@ -481,50 +703,21 @@ def process_single_project_all_reports(project_name):
     print(f"Processing: {project_name}")
     print(f"{'='*60}")
     
-    output_dir = Path('output')
-    output_dir.mkdir(exist_ok=True)
+    with DocumentDatabase() as db:
+        if not db.has_documents(project_name):
+            print(f"✗ No data for {project_name}")
+            print("  Run 'Update database' option first")
+            return False
     
-    try:
-        with DocumentDatabase() as db:
-            config = load_project_config(project_name)
-            
-            # Check if we have data
-            latest_data_df = db.get_latest_documents(project_name)
-            if latest_data_df.empty:
-                print(f"✗ No data for {project_name}")
-                print("  Run 'Update database' option first")
-                return False
-            
-            # Generate all reports
-            print("\nGenerating reports...")
-            success = True
-            
-            # 1. Summary Report (with dynamic counting)
-            if not generate_summary_report(project_name, config, output_dir, db):
-                success = False
-            
-            # 2. Detailed Progression Report (with dynamic counting)
-            if not generate_progression_report_full(project_name, config, output_dir, db):
-                success = False
-            
-            # 3. Condensed Progression Report (with dynamic counting)
-            generate_condensed_report(project_name, config, output_dir, db, num_weeks=4)
-            
-            # 4. Certificate Report (if enabled)
-            generate_certificate_report_full(project_name, config, output_dir, db)
-            
-            if success:
-                print(f"\n✓ All reports completed for {project_name}")
-            else:
-                print(f"\n⚠ Some reports failed for {project_name}")
-            
-            return success
-            
-    except Exception as e:
-        print(f"✗ Error processing {project_name}: {str(e)}")
-        import traceback
-        traceback.print_exc()
-        return False
+    print("\nGenerating reports...")
+    results = run_reports([project_name])
+    
+    success = all(result['status'] != JOB_FAILED for result in results)
+    if success:
+        print(f"\n✓ All reports completed for {project_name}")
+    else:
+        print(f"\n⚠ Some reports failed for {project_name}")
+    return success
 
 
 def process_all_projects_all_reports():
@@ -550,42 +743,27 @@ def process_all_projects_all_reports():
     
     with DocumentDatabase() as db:
         projects = db.get_all_projects()
-        
-        if not projects:
-            print("✗ No projects in database")
-            return
-        
-        print(f"Found {len(projects)} projects\n")
-        
-        success_count = 0
-        fail_count = 0
-        
-        for project_name in projects:
-            if process_single_project_all_reports(project_name):
-                success_count += 1
-            else:
-                fail_count += 1
-        
-        # Summary
-        print(f"\n{'='*60}")
-        print("PROCESSING COMPLETE")
-        print(f"{'='*60}")
-        print(f"✓ Successful: {success_count} projects")
-        if fail_count > 0:
-            print(f"✗ Failed: {fail_count} projects")
-        print(f"{'='*60}")
+    
+    if not projects:
+        print("✗ No projects in database")
+        return
+    
+    print(f"Found {len(projects)} projects\n")
+    results = run_reports(projects)
+    
+    failed_projects = sorted({result['project'] for result in results if result['status'] == JOB_FAILED})
+    print(f"✓ Successful: {len(projects) - len(failed_projects)} projects")
+    if failed_projects:
+        print(f"✗ Failed: {len(failed_projects)} projects ({', '.join(failed_projects)})")
 
 
 def generate_specific_report_for_projects(report_type, project_names):
     """Generate a specific report type for specified project(s).
     
     Args:
-        report_type: Type of report ('summary', 'progression', 'condensed', 'certificates')
+        report_type: Type of report ('summary', 'progression', 'condensed', 'certificates', 'turnaround')
         project_names: List of project names or ['ALL']
     """
-    output_dir = Path('output')
-    output_dir.mkdir(exist_ok=True)
-    
     # Update database first
     print("\nChecking for new files...")
     try:
@@ -596,85 +774,151 @@ def generate_specific_report_for_projects(report_type, project_names):
         print(f"⚠ Warning: {str(e)}")
     
     # Get list of projects
-    with DocumentDatabase() as db:
-        if 'ALL' in project_names:
+    if 'ALL' in project_names:
+        with DocumentDatabase() as db:
             projects = db.get_all_projects()
-            if not projects:
-                print("✗ No projects in database")
-                return
-            print(f"\nGenerating {report_type} reports for ALL {len(projects)} projects")
-        else:
-            projects = project_names
-            print(f"\nGenerating {report_type} report(s)")
+        if not projects:
+            print("✗ No projects in database")
+            return
+        print(f"\nGenerating {report_type} reports for ALL {len(projects)} projects")
+    else:
+        projects = project_names
+        print(f"\nGenerating {report_type} report(s)")
     
     print(f"{'='*60}\n")
+    run_reports(projects, [report_type])
+
+
+def resolve_project_names(values, db_path='data/documents.db'):
+    """Resolve --projects values to project names.
     
-    success_count = 0
-    fail_count = 0
-    skipped_count = 0
+    Args:
+        values: Project codes (GP, NM, ...), project names or 'ALL'
+        db_path: Path to database file (for 'ALL')
+        
+    Returns:
+        list: Project names
+        
+    Raises:
+        ValueError: If a value is not a known project code or name
+    """
+    if any(value.upper() == 'ALL' for value in values):
+        with DocumentDatabase(db_path) as db:
+            return db.get_all_projects()
+    
+    project_names = []
+    known_names = {name.lower(): name for name in PROJECT_NAMES.values()}
+    for value in values:
+        if value.upper() in PROJECT_NAMES:
+            project_names.append(PROJECT_NAMES[value.upper()])
+        elif value.lower() in known_names:
+            project_names.append(known_names[value.lower()])
+        else:
+            raise ValueError(f"Unknown project '{value}' (codes: {', '.join(PROJECT_NAMES)}; "
+                             f"names: {', '.join(PROJECT_NAMES.values())})")
+    return project_names
+
+
+def _split_list(value):
+    return [item.strip() for item in value.split(',') if item.strip()]
+
+
+def build_cli_parser():
+    """Argument parser for the non-interactive CLI."""
+    parser = argparse.ArgumentParser(
+        description='MBS Reports v2 - document register reporter',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+    subparsers = parser.add_subparsers(dest='command')
+    
+    run_parser = subparsers.add_parser('run', help='Generate reports without the interactive menu')
+    run_parser.add_argument('--projects', type=_split_list, default=['ALL'],
+                            help='Comma-separated project codes or names, or ALL (default: ALL)')
+    run_parser.add_argument('--reports', type=_split_list, default=list(REPORT_TYPES),
+                            help=f"Comma-separated report types: {', '.join(REPORT_TYPES)} (default: all)")
+    run_parser.add_argument('--jobs', type=int, default=None,
+                            help='Worker processes (default: REPORT_WORKERS in config.py, or one per CPU)')
+    run_parser.add_argument('--skip-update', action='store_true',
+                            help='Do not import new files before generating reports')
+    run_parser.add_argument('--force', action='store_true',
+                            help='Regenerate reports whose inputs are unchanged since the last run')
+    run_parser.add_argument('--profile', action='store_true',
+                            help='Profile each report job (stats saved to <output-dir>/profiles)')
+    run_parser.add_argument('--trace', action='store_true',
+                            help='Time each pipeline stage (profile saved to <output-dir>/traces)')
+    run_parser.add_argument('--db-path', type=str, default='data/documents.db',
+                            help='Path to database file (default: data/documents.db)')
+    run_parser.add_argument('--output-dir', type=str, default='output',
+                            help='Report output directory (default: output)')
+    return parser
+
+
+def run_cli(args):
+    """Run the non-interactive 'run' command.
     
-    # Process each project
-    for project_name in projects:
-        print(f"{'='*60}")
-        print(f"Project: {project_name}")
-        print(f"{'='*60}")
+    Args:
+        args: Parsed arguments from build_cli_parser()
         
+    Returns:
+        int: Exit code (0 = success, 1 = a report failed, 2 = invalid arguments)
+    """
+    ensure_directories()
+    
+    unknown_reports = [report for report in args.reports if report not in REPORT_TYPES]
+    if unknown_reports:
+        print(f"✗ Unknown report type(s): {', '.join(unknown_reports)}")
+        print(f"Valid report types: {', '.join(REPORT_TYPES)}")
+        return 2
+    if args.jobs is not None and args.jobs < 1:
+        print("✗ --jobs must be at least 1")
+        return 2
+    
+    if args.trace:
+        enable_tracing()
+    
+    if not args.skip_update:
+        print("\nChecking for new files...")
         try:
-            with DocumentDatabase() as db:
-                config = load_project_config(project_name)
-                
-                # Check if we have data
-                latest_data_df = db.get_latest_documents(project_name)
-                if latest_data_df.empty:
-                    print(f"✗ No data for {project_name}")
-                    skipped_count += 1
-                    continue
-                
-                # Generate requested report (all use dynamic counting now)
-                if report_type == 'summary':
-                    if generate_summary_report(project_name, config, output_dir, db):
-                        success_count += 1
-                    else:
-                        fail_count += 1
-                
-                elif report_type == 'progression':
-                    if generate_progression_report_full(project_name, config, output_dir, db):
-                        success_count += 1
-                    else:
-                        fail_count += 1
-                
-                elif report_type == 'condensed':
-                    if generate_condensed_report(project_name, config, output_dir, db, num_weeks=4):
-                        success_count += 1
-                    else:
-                        skipped_count += 1
-                
-                elif report_type == 'certificates':
-                    if generate_certificate_report_full(project_name, config, output_dir, db):
-                        success_count += 1
-                    else:
-                        skipped_count += 1
-        
+            with span('update database'):
+                stats = update_database_with_new_files(args.db_path)
+            if stats['files_imported'] > 0:
+                print(f"✓ Imported {stats['files_imported']} new files")
+            else:
+                print("✓ Database is up to date")
         except Exception as e:
-            print(f"✗ Error: {str(e)}")
-            fail_count += 1
-        
-        print()  # Empty line between projects
+            print(f"✗ Error updating database: {str(e)}")
+            print("Continuing with existing data...")
     
-    # Summary
-    print(f"{'='*60}")
-    print("GENERATION COMPLETE")
-    print(f"{'='*60}")
-    print(f"✓ Successful: {success_count}")
-    if skipped_count > 0:
-        print(f"ℹ Skipped: {skipped_count}")
-    if fail_count > 0:
-        print(f"✗ Failed: {fail_count}")
-    print(f"{'='*60}")
+    try:
+        projects = resolve_project_names(args.projects, args.db_path)
+    except ValueError as e:
+        print(f"✗ {e}")
+        return 2
+    
+    if not projects:
+        print("✗ No projects in database")
+        return 1
+    
+    print(f"\nGenerating {', '.join(args.reports)} for {', '.join(projects)}")
+    print(f"{'='*60}\n")
+    
+    profile_dir = Path(args.output_dir) / 'profiles' if args.profile else None
+    with span('reports'):
+        results = run_reports(projects, args.reports, workers=args.jobs, db_path=args.db_path,
+                              output_dir=args.output_dir, profile_dir=profile_dir, force=args.force)
+    
+    if args.trace:
+        print_trace_summary()
+        json_path, csv_path = write_trace_profile(Path(args.output_dir) / 'traces', 'main_run')
+        print(f"✓ Trace profile: {json_path} ({csv_path.name})")
+    
+    return 1 if any(result['status'] == JOB_FAILED for result in results) else 0
 
 
 def main():
     """Main function with interactive menu."""
+    ensure_directories()
     output_dir = Path('output')
     output_dir.mkdir(exist_ok=True)
     
@@ -732,5 +976,8 @@ def main():
 
 
 if __name__ == '__main__':
+    cli_args = build_cli_parser().parse_args()
+    if cli_args.command == 'run':
+        sys.exit(run_cli(cli_args))
     main()
 
@@ -1,6 +1,16 @@
 """Processors module for data loading and transformation."""
 
-from .data_loader import process_csv_file, load_document_listing
+from utils.lazy_imports import lazy_exports
+
+# Submodules are imported on first use of one of their names
+_SUBMODULE_EXPORTS = {
+    'data_loader': [
+        'process_csv_file',
+        'load_document_listing'
+    ]
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _SUBMODULE_EXPORTS)
 
 __all__ = [
     'process_csv_file',
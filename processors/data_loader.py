@@ -4,6 +4,7 @@ import warnings
 import pandas as pd
 from pathlib import Path
 from utils.data_cleaning import clean_revision
+from utils.tracing import span, traced
 
 # Suppress warnings
 warnings.filterwarnings('ignore', category=UserWarning)
@@ -23,7 +24,8 @@ def process_csv_file(file_path, config):
     try:
         # Read the CSV file
         csv_settings = config.get('CSV_SETTINGS', {})
-        df = pd.read_csv(file_path, **csv_settings)
+        with span('parse file', file=Path(file_path).name):
+            df = pd.read_csv(file_path, **csv_settings)
         
         # Apply MBS filtering if enabled
         mbs_filter = config.get('MBS_FILTER')
@@ -53,7 +55,8 @@ def process_csv_file(file_path, config):
                 from configs.HollowayPark import map_holloway_park_status
                 if 'Status' in df.columns or 'Design Status' in df.columns:
                     # Apply the custom status mapping function to each row
-                    df['Status'] = df.apply(map_holloway_park_status, axis=1)
+                    with span('status mapping'):
+                        df['Status'] = df.apply(map_holloway_park_status, axis=1)
                     print("Applied custom Holloway Park status mapping")
             except ImportError:
                 print("Warning: Could not import Holloway Park status mapping function")
@@ -64,7 +67,8 @@ def process_csv_file(file_path, config):
                 from configs.WestCromwellRoad import map_wcr_status
                 if 'Full Path' in df.columns:
                     # Apply the custom status mapping function to each row
-                    df['Status'] = df.apply(map_wcr_status, axis=1)
+                    with span('status mapping'):
+                        df['Status'] = df.apply(map_wcr_status, axis=1)
                     print("Applied custom West Cromwell Road status mapping")
             except ImportError:
                 print("Warning: Could not import West Cromwell Road status mapping function")
@@ -80,6 +84,7 @@ def process_csv_file(file_path, config):
         raise
 
 
+@traced('load listing')
 def load_document_listing(file_path, config):
     """Load a document listing file (Excel or CSV) based on file type.
     
@@ -105,7 +110,8 @@ def load_document_listing(file_path, config):
         else:
             # Process Excel file
             excel_settings = config.get('EXCEL_SETTINGS', {})
-            df = pd.read_excel(file_path, **excel_settings)
+            with span('parse file', file=file_path.name):
+                df = pd.read_excel(file_path, **excel_settings)
             
             # Apply column mappings if provided (same as CSV processing)
             column_mappings = config.get('COLUMN_MAPPINGS')
@@ -119,7 +125,8 @@ def load_document_listing(file_path, config):
                 try:
                     from configs.HollowayPark import map_holloway_park_status
                     if 'Status' in df.columns or 'Design Status' in df.columns:
-                        df['Status'] = df.apply(map_holloway_park_status, axis=1)
+                        with span('status mapping'):
+                            df['Status'] = df.apply(map_holloway_park_status, axis=1)
                         print("Applied custom Holloway Park status mapping")
                 except ImportError:
                     print("Warning: Could not import Holloway Park status mapping function")
@@ -129,7 +136,8 @@ def load_document_listing(file_path, config):
                 try:
                     from configs.WestCromwellRoad import map_wcr_status
                     if 'Full Path' in df.columns:
-                        df['Status'] = df.apply(map_wcr_status, axis=1)
+                        with span('status mapping'):
+                            df['Status'] = df.apply(map_wcr_status, axis=1)
                         print("Applied custom West Cromwell Road status mapping")
                 except ImportError:
                     print("Warning: Could not import West Cromwell Road status mapping function")
@@ -1,20 +1,55 @@
 """Reports module for generating summary and progression reports."""
 
-from .summary_report import save_excel_with_retry
-from .progression_report import (
-    generate_progression_report,
-    generate_condensed_progression_report,
-    fill_empty_cells_with_zeros_in_file,
-    detect_new_revision_types
-)
-from .certificate_report import save_certificate_report_with_retry
+from utils.lazy_imports import lazy_exports
+
+# Submodules are imported on first use of one of their names
+_SUBMODULE_EXPORTS = {
+    'summary_report': [
+        'save_excel_with_retry'
+    ],
+    'summary_model': [
+        'build_summary_model'
+    ],
+    'progression_report': [
+        'generate_progression_report',
+        'generate_condensed_progression_report',
+        'fill_empty_cells_with_zeros_in_file',
+        'detect_new_revision_types'
+    ],
+    'certificate_report': [
+        'save_certificate_report_with_retry'
+    ],
+    'turnaround_report': [
+        'save_turnaround_report'
+    ],
+    'cache': [
+        'REPORT_CODE_VERSION',
+        'get_report_output_path'
+    ],
+    'scheduler': [
+        'REPORT_TYPES',
+        'build_report_jobs',
+        'run_report_jobs',
+        'print_job_summary'
+    ]
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _SUBMODULE_EXPORTS)
 
 __all__ = [
     'save_excel_with_retry',
+    'build_summary_model',
     'generate_progression_report',
     'generate_condensed_progression_report',
     'fill_empty_cells_with_zeros_in_file',
     'detect_new_revision_types',
-    'save_certificate_report_with_retry'
+    'save_certificate_report_with_retry',
+    'save_turnaround_report',
+    'REPORT_CODE_VERSION',
+    'get_report_output_path',
+    'REPORT_TYPES',
+    'build_report_jobs',
+    'run_report_jobs',
+    'print_job_summary'
 ]
 
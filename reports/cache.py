@@ -0,0 +1,162 @@
+"""Report output cache - skip reports whose inputs have not changed.
+
+A weekly run regenerates every report of every project, although most
+projects have received no new export since the last run. Each report written
+by the report scheduler is recorded in <output_dir>/.report_cache/ with a key
+made from:
+
+- the project's stored data (DocumentDatabase.get_report_state: imported
+  files, document rows, indexed and compacted snapshots)
+- a fingerprint of the project config, plus the data files a report reads
+  (the accommodation data of the certificate report)
+- REPORT_CODE_VERSION
+
+When the key is unchanged and the report file is still the one that was
+written, the job is reported as unchanged instead of being run again. One
+entry file per project and report keeps parallel jobs from writing to the
+same file.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from config import get_config_fingerprint
+from utils import slugify
+
+
+# Bumped when a change to the report code changes what the reports contain,
+# so reports cached by an earlier version are regenerated
+REPORT_CODE_VERSION = 1
+
+# Output file of each report type, after the project's slug
+REPORT_FILE_SUFFIXES = {
+    'summary': '_summary.xlsx',
+    'progression': '_progression.xlsx',
+    'condensed': '_progression_condensed.xlsx',
+    'certificates': '_certificates.xlsx',
+    'turnaround': '_turnaround.xlsx',
+}
+
+# Config settings naming data files a report reads, by report type
+REPORT_DATA_FILES = {
+    'certificates': ['ACCOMMODATION_DATA_FILE'],
+}
+
+CACHE_DIR_NAME = '.report_cache'
+
+
+def get_report_output_path(output_dir, project_name, report_type):
+    """Path of the file a report job writes.
+
+    Args:
+        output_dir: Report output directory
+        project_name: Name of the project
+        report_type: Report type from REPORT_FILE_SUFFIXES
+
+    Returns:
+        Path: Report file
+    """
+    return Path(output_dir) / f"{slugify(project_name)}{REPORT_FILE_SUFFIXES[report_type]}"
+
+
+def _file_digest(path):
+    """sha1 of a file's contents (None if it does not exist)."""
+    try:
+        return hashlib.sha1(Path(path).read_bytes()).hexdigest()
+    except (FileNotFoundError, TypeError):
+        return None
+
+
+def get_report_cache_key(db, project_name, report_type, config):
+    """Key identifying the inputs of a report.
+
+    Args:
+        db: DocumentDatabase connection
+        project_name: Name of the project
+        report_type: Report type
+        config: Project configuration
+
+    Returns:
+        str: Hex digest, or None if the report can't be cached (database
+        without the snapshot tables)
+    """
+    report_state = db.get_report_state(project_name)
+    if report_state is None:
+        return None
+
+    key = {
+        'version': REPORT_CODE_VERSION,
+        'report': report_type,
+        'data': report_state,
+        'config': get_config_fingerprint(config, list(config)),
+        'files': {setting: _file_digest(config.get(setting)) for setting in REPORT_DATA_FILES.get(report_type, [])},
+    }
+    return hashlib.sha1(json.dumps(key, sort_keys=True).encode('utf-8')).hexdigest()
+
+
+def _entry_path(output_dir, project_name, report_type):
+    return Path(output_dir) / CACHE_DIR_NAME / f"{slugify(project_name)}_{report_type}.json"
+
+
+def _output_state(path):
+    """Size and modification time of a report file (None if it does not exist)."""
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def is_report_current(output_dir, project_name, report_type, cache_key):
+    """Check whether a report was last written from inputs with the same key.
+
+    Args:
+        output_dir: Report output directory
+        project_name: Name of the project
+        report_type: Report type
+        cache_key: Key from get_report_cache_key()
+
+    Returns:
+        bool: True if the report file is the one written for cache_key
+    """
+    if cache_key is None:
+        return False
+    try:
+        entry = json.loads(_entry_path(output_dir, project_name, report_type).read_text(encoding='utf-8'))
+    except (FileNotFoundError, ValueError):
+        return False
+    output_path = get_report_output_path(output_dir, project_name, report_type)
+    return entry.get('key') == cache_key and entry.get('output') == _output_state(output_path)
+
+
+def save_report_cache_entry(output_dir, project_name, report_type, cache_key):
+    """Record that a report was written from inputs with cache_key.
+
+    Args:
+        output_dir: Report output directory
+        project_name: Name of the project
+        report_type: Report type
+        cache_key: Key from get_report_cache_key() (nothing is recorded if None)
+    """
+    output_state = _output_state(get_report_output_path(output_dir, project_name, report_type))
+    if cache_key is None or output_state is None:
+        return
+
+    path = _entry_path(output_dir, project_name, report_type)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = path.with_name(path.name + '.tmp')
+    temp_path.write_text(json.dumps({'key': cache_key, 'output': output_state}), encoding='utf-8')
+    os.replace(temp_path, path)
+
+
+def clear_report_cache_entry(output_dir, project_name, report_type):
+    """Forget a report's cache entry (before it is regenerated, so a failed run is not skipped next time).
+
+    Args:
+        output_dir: Report output directory
+        project_name: Name of the project
+        report_type: Report type
+    """
+    _entry_path(output_dir, project_name, report_type).unlink(missing_ok=True)
@@ -5,8 +5,7 @@ import pandas as pd
 from datetime import datetime
 from pathlib import Path
 import time
-from openpyxl import load_workbook
-from openpyxl.styles import PatternFill, Font, Alignment, Border, Side
+from openpyxl.styles import PatternFill, Font, Alignment
 from openpyxl.worksheet.page import PageMargins
 from openpyxl.chart import PieChart, Reference, BarChart
 from openpyxl.chart.label import DataLabelList
@@ -15,7 +14,10 @@ from openpyxl.drawing.fill import ColorChoice, PatternFillProperties, SolidColor
 
 from styles.formatting import (
     OVERALL_SUMMARY_STYLES,
-    apply_status_style
+    apply_status_style,
+    CERTIFICATE_TABLE_NAMED_STYLES,
+    register_named_styles,
+    get_progress_style_name
 )
 from utils.status_mapping import (
     get_status_category,
@@ -24,10 +26,14 @@ from utils.status_mapping import (
     get_status_display_order
 )
 from analyzers.document_tracker import (
-    categorize_documents,
     get_apartment_certificate_summary,
     get_uncategorized_certificates_in_blocks
 )
+from analyzers.document_attributes import CATEGORY_COLUMNS, get_categorized_documents
+from analyzers.snapshot_profile import build_snapshot_profile
+from utils.folders import FOLDER_COLUMNS, document_folder_attributes
+from config import get_accommodation_data
+from .writers import data_sheet, styled_sheet, get_writer_backend, write_report_workbook
 
 # Suppress openpyxl warnings
 warnings.filterwarnings('ignore', category=UserWarning, module='openpyxl')
@@ -97,14 +103,11 @@ def add_apartment_certificate_tracking(ws, latest_data, config, start_row=5, max
         return start_row
     
     # Check if accommodation data is available
-    accom_data = config.get('ACCOMMODATION_DATA', {})
+    accom_data = get_accommodation_data(config)
     has_accom_data = bool(accom_data and accom_data.get('apartment_lookup'))
     
     # Categorize certificates
-    categorized = categorize_documents(latest_data, apartment_certs, cert_tracking)
-    
-    # Get accommodation data for accurate counts
-    accom_data = config.get('ACCOMMODATION_DATA', {})
+    categorized = get_categorized_documents(latest_data, apartment_certs, cert_tracking)
     
     # Get summary statistics (will use accommodation data if available)
     summary = get_apartment_certificate_summary(categorized, apartment_certs, cert_tracking, accom_data)
@@ -113,6 +116,8 @@ def add_apartment_certificate_tracking(ws, latest_data, config, start_row=5, max
     end_col = 5 + max_blocks_per_phase + 2  # Start at E (5), add blocks, add 2 for spacing
     end_col_letter = ws.cell(row=1, column=end_col).column_letter
     
+    register_named_styles(ws.parent, CERTIFICATE_TABLE_NAMED_STYLES)
+    
     # Section header - dynamic based on max blocks
     ws[f'A{start_row}'] = 'APARTMENT CERTIFICATE TRACKING'
     ws[f'A{start_row}'].font = Font(name='Calibri', size=14, bold=True, color='FFFFFF')
@@ -159,15 +164,7 @@ def add_apartment_certificate_tracking(ws, latest_data, config, start_row=5, max
     for col_idx, header in enumerate(headers, 1):
         cell = ws.cell(row=start_row, column=col_idx)
         cell.value = header
-        cell.font = Font(name='Calibri', size=11, bold=True)
-        cell.fill = PatternFill(start_color='D9E1F2', end_color='D9E1F2', fill_type='solid')
-        cell.alignment = Alignment(horizontal='center', vertical='center')
-        cell.border = Border(
-            left=Side(style='thin'),
-            right=Side(style='thin'),
-            top=Side(style='thin'),
-            bottom=Side(style='thin')
-        )
+        cell.style = 'Report Table Header'
     
     # Merge the progress bar header across the remaining columns
     if max_blocks_per_phase > 0:
@@ -177,15 +174,7 @@ def add_apartment_certificate_tracking(ws, latest_data, config, start_row=5, max
         # Update the merged cell content
         progress_bar_cell = ws.cell(row=start_row, column=progress_bar_start_col)
         progress_bar_cell.value = 'Progress Bar'
-        progress_bar_cell.font = Font(name='Calibri', size=11, bold=True)
-        progress_bar_cell.fill = PatternFill(start_color='D9E1F2', end_color='D9E1F2', fill_type='solid')
-        progress_bar_cell.alignment = Alignment(horizontal='center', vertical='center')
-        progress_bar_cell.border = Border(
-            left=Side(style='thin'),
-            right=Side(style='thin'),
-            top=Side(style='thin'),
-            bottom=Side(style='thin')
-        )
+        progress_bar_cell.style = 'Report Table Header'
     
     start_row += 1
     
@@ -201,35 +190,20 @@ def add_apartment_certificate_tracking(ws, latest_data, config, start_row=5, max
         
         # Certificate type name
         ws[f'A{start_row}'] = display_name
-        ws[f'A{start_row}'].font = Font(name='Calibri', size=10)
-        ws[f'A{start_row}'].alignment = Alignment(horizontal='left', vertical='center')
+        ws[f'A{start_row}'].style = 'Report Table Label'
         
         # Apartments completed
         ws[f'B{start_row}'] = f"{apartments_with_docs}/{max_apartments}"
-        ws[f'B{start_row}'].font = Font(name='Calibri', size=10)
-        ws[f'B{start_row}'].alignment = Alignment(horizontal='center', vertical='center')
+        ws[f'B{start_row}'].style = 'Report Table Value'
         
         # Progress percentage
         ws[f'C{start_row}'] = f"{progress_pct}%"
-        ws[f'C{start_row}'].font = Font(name='Calibri', size=10, bold=True)
-        ws[f'C{start_row}'].alignment = Alignment(horizontal='center', vertical='center')
-        
-        # Color code based on progress
-        if progress_pct >= 80:
-            fill_color = '25E82C'  # Green
-        elif progress_pct >= 50:
-            fill_color = 'EDDDA1'  # Yellow
-        elif progress_pct >= 25:
-            fill_color = 'FFA500'  # Orange
-        else:
-            fill_color = 'ED1111'  # Red
-        
-        ws[f'C{start_row}'].fill = PatternFill(start_color=fill_color, end_color=fill_color, fill_type='solid')
+        # Color coded based on progress (green/yellow/orange/red)
+        ws[f'C{start_row}'].style = get_progress_style_name(progress_pct)
         
         # Document count
         ws[f'D{start_row}'] = doc_count
-        ws[f'D{start_row}'].font = Font(name='Calibri', size=10)
-        ws[f'D{start_row}'].alignment = Alignment(horizontal='center', vertical='center')
+        ws[f'D{start_row}'].style = 'Report Table Value'
         
         # Progress bar (horizontal bar using block characters) - dynamic width
         # Scale bar length with available space (more blocks = longer bar)
@@ -241,17 +215,7 @@ def add_apartment_certificate_tracking(ws, latest_data, config, start_row=5, max
         progress_bar_end_col_letter = ws.cell(row=1, column=end_col).column_letter
         ws.merge_cells(f'E{start_row}:{progress_bar_end_col_letter}{start_row}')
         ws[f'E{start_row}'] = f"{'█' * filled_blocks}{'░' * empty_blocks} {progress_pct}%"
-        ws[f'E{start_row}'].font = Font(name='Courier New', size=10)
-        ws[f'E{start_row}'].alignment = Alignment(horizontal='left', vertical='center')
-        
-        # Add borders
-        for col in ['A', 'B', 'C', 'D', 'E']:
-            ws[f'{col}{start_row}'].border = Border(
-                left=Side(style='thin'),
-                right=Side(style='thin'),
-                top=Side(style='thin'),
-                bottom=Side(style='thin')
-            )
+        ws[f'E{start_row}'].style = 'Report Table Bar'
         
         start_row += 1
     
@@ -334,7 +298,7 @@ def add_apartment_certificate_tracking(ws, latest_data, config, start_row=5, max
     return start_row
 
 
-def add_data_quality_section(ws, latest_data, config, start_row=5):
+def add_data_quality_section(ws, latest_data, config, start_row=5, snapshot_profile=None):
     """
     Add data quality section showing rejected and uncategorized certificates.
     
@@ -343,6 +307,8 @@ def add_data_quality_section(ws, latest_data, config, start_row=5):
         latest_data: DataFrame with latest certificate data
         config: Project configuration
         start_row: Starting row for the section
+        snapshot_profile: Optional SnapshotProfile of latest_data grouped by
+            certificate 'category' (built if not given)
         
     Returns:
         int: Next available row after this section
@@ -365,42 +331,51 @@ def add_data_quality_section(ws, latest_data, config, start_row=5):
     start_row += 1
     
     # Get rejected certificates (Status C)
-    status_mappings = config.get('STATUS_MAPPINGS', {})
-    status_c_values = []
+    categorized = None
+    if apartment_certs:
+        categorized = get_categorized_documents(latest_data, apartment_certs, cert_tracking)
     
-    if 'Status C' in status_mappings:
-        status_c_values = status_mappings['Status C'].get('statuses', [])
+    if snapshot_profile is None:
+        snapshot_profile = build_snapshot_profile(
+            categorized if categorized is not None else latest_data, config, extra_columns=['category']
+        )
     
-    # Filter for rejected certificates using config
-    if status_c_values and 'Status' in latest_data.columns:
-        rejected = latest_data[latest_data['Status'].isin(status_c_values)]
+    # Count rejected certificates using config
+    status_mappings = config.get('STATUS_MAPPINGS') or {}
+    use_status_mappings = bool(status_mappings.get('Status C', {}).get('statuses')) and 'Status' in latest_data.columns
+    if use_status_mappings:
+        rejected_count = snapshot_profile.category_total('Status C')
     else:
         # Fallback: look for common rejected status terms
-        rejected = latest_data[latest_data['Status'].str.contains('reject|Reject|REJECT|C-', case=False, na=False)]
+        rejected_mask = latest_data['Status'].str.contains('reject|Reject|REJECT|C-', case=False, na=False)
+        rejected_count = int(rejected_mask.sum())
     
-    if rejected.empty:
+    if rejected_count == 0:
         ws[f'A{start_row}'] = '  ✓ No rejected certificates'
         ws[f'A{start_row}'].font = Font(name='Calibri', size=10, italic=True, color='25E82C')
         start_row += 2
     else:
         ws[f'A{start_row}'] = f'  Total Rejected:'
-        ws[f'B{start_row}'] = len(rejected)
+        ws[f'B{start_row}'] = rejected_count
         ws[f'A{start_row}'].font = Font(name='Calibri', size=10, bold=True)
         ws[f'B{start_row}'].font = Font(name='Calibri', size=10, bold=True, color='ED1111')
         start_row += 1
         
         if apartment_certs:
-            # Categorize rejected certificates
-            categorized_rejected = categorize_documents(rejected, apartment_certs, cert_tracking)
+            # Rejected count by certificate type (status category x certificate category)
+            if use_status_mappings:
+                rejected_by_type = snapshot_profile.status_crosstab('category', fold_unmapped=False).loc['Status C']
+            else:
+                rejected_by_type = categorized[rejected_mask]['category'].value_counts()
             
             # Show rejected count by certificate type
             for cert_key, cert_config in apartment_certs.items():
                 display_name = cert_config.get('display_name', cert_key)
-                rejected_for_type = categorized_rejected[categorized_rejected['category'] == cert_key]
+                rejected_for_type = int(rejected_by_type.get(cert_key, 0))
                 
-                if len(rejected_for_type) > 0:
+                if rejected_for_type > 0:
                     ws[f'A{start_row}'] = f'    {display_name}:'
-                    ws[f'B{start_row}'] = len(rejected_for_type)
+                    ws[f'B{start_row}'] = rejected_for_type
                     ws[f'A{start_row}'].font = Font(name='Calibri', size=9)
                     ws[f'B{start_row}'].font = Font(name='Calibri', size=9, color='ED1111')
                     ws[f'B{start_row}'].alignment = Alignment(horizontal='left')
@@ -414,7 +389,6 @@ def add_data_quality_section(ws, latest_data, config, start_row=5):
     start_row += 1
     
     if apartment_certs:
-        categorized = categorize_documents(latest_data, apartment_certs, cert_tracking)
         uncategorized = get_uncategorized_certificates_in_blocks(latest_data, categorized)
         
         if uncategorized.empty:
@@ -467,7 +441,13 @@ def add_uncategorized_detailed_tab(wb, latest_data, config):
         return  # No apartment tracking configured
     
     # Create detailed uncategorized tab
-    ws = wb.create_sheet("Uncategorized Analysis")
+    write_uncategorized_analysis(wb.create_sheet("Uncategorized Analysis"), latest_data, config)
+
+
+def write_uncategorized_analysis(ws, latest_data, config):
+    """Render the uncategorized certificates analysis onto an empty worksheet"""
+    cert_tracking = config.get('CERTIFICATE_TRACKING', {})
+    apartment_certs = cert_tracking.get('apartment_certificates', {})
     
     # Title
     ws['A1'] = 'UNCATEGORIZED CERTIFICATES - DETAILED ANALYSIS'
@@ -481,8 +461,7 @@ def add_uncategorized_detailed_tab(wb, latest_data, config):
     cert_data = filter_certificates(latest_data, config)
     
     # Categorize documents
-    from analyzers.document_tracker import categorize_documents, get_uncategorized_certificates_in_blocks
-    categorized = categorize_documents(cert_data, apartment_certs, cert_tracking)
+    categorized = get_categorized_documents(cert_data, apartment_certs, cert_tracking)
     uncategorized = get_uncategorized_certificates_in_blocks(cert_data, categorized)
     
     if uncategorized.empty:
@@ -584,291 +563,297 @@ def add_uncategorized_detailed_tab(wb, latest_data, config):
     # Analysis section removed to prevent column A from being too wide
 
 
-def save_certificate_report(summary_df, latest_data, output_file, config):
+def write_certificate_overall_summary(overall_summary, summary_df, latest_data, config):
     """
-    Save a comprehensive certificate report to Excel.
+    Render the certificate Overall Summary sheet.
     
     Args:
+        overall_summary: Empty worksheet to fill
         summary_df: DataFrame with summary data (revision/status counts over time)
         latest_data: DataFrame with the latest certificate data
-        output_file: Path to the output Excel file
         config: Project configuration dictionary
-        
-    Returns:
-        bool: True if successful, False otherwise
     """
-    try:
-        # Create Excel writer
-        with pd.ExcelWriter(output_file, engine='openpyxl') as writer:
-            # Write Summary Data sheet
-            summary_df.to_excel(writer, sheet_name='Summary Data', index=False)
-            
-            # Write Latest Certificate Data sheet
-            latest_data.to_excel(writer, sheet_name='Latest Certificate Data', index=False)
-        
-        # Load the workbook to add the Overall Summary sheet
-        wb = load_workbook(output_file)
-        
-        # Create Overall Summary sheet at the beginning
-        if 'Overall Summary' in wb.sheetnames:
-            del wb['Overall Summary']
-        overall_summary = wb.create_sheet('Overall Summary', 0)
-        
-        # Set up page layout for A4 landscape
-        overall_summary.page_setup.orientation = 'landscape'
-        overall_summary.page_setup.paperSize = 9  # A4
-        overall_summary.page_setup.fitToWidth = 1
-        overall_summary.page_setup.fitToHeight = 0
-        overall_summary.page_margins = PageMargins(left=0.5, right=0.5, top=0.75, bottom=0.75)
-        
-        # Add title and project info
-        project_title = config.get('PROJECT_TITLE', 'Project')
-        cert_settings = config.get('CERTIFICATE_SETTINGS', {})
-        
-        overall_summary['A1'] = f"{project_title} - Certificate Report"
-        overall_summary['A1'].font = Font(name='Calibri', size=16, bold=True)
-        overall_summary['A1'].alignment = Alignment(horizontal='left', vertical='center')
-        
-        # Get latest row from summary
-        latest_row = summary_df.iloc[-1] if not summary_df.empty else {}
-        latest_date = latest_row.get('Date', 'N/A')
-        latest_time = latest_row.get('Time', 'N/A')
-        
-        overall_summary['A2'] = f"Report Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}"
-        overall_summary['A2'].font = Font(name='Calibri', size=10, italic=True)
-        
-        overall_summary['A3'] = f"Latest Data: {latest_date} {latest_time}"
-        overall_summary['A3'].font = Font(name='Calibri', size=10, italic=True)
-        
-        # Add apartment certificate tracking section if configured
-        cert_tracking = config.get('CERTIFICATE_TRACKING', {})
-        apartment_certs = cert_tracking.get('apartment_certificates', {})
-        
-        if apartment_certs:
-            # Calculate max blocks per phase for dynamic column sizing
-            accom_data = config.get('ACCOMMODATION_DATA', {})
-            max_blocks_per_phase = 0
-            if 'phases' in accom_data:
-                for phase_config in accom_data['phases'].values():
-                    phase_blocks = len(phase_config.get('blocks', []))
-                    max_blocks_per_phase = max(max_blocks_per_phase, phase_blocks)
-            
-            # Add apartment certificate tracking with progress bars
-            next_row = add_apartment_certificate_tracking(overall_summary, latest_data, config, start_row=5, max_blocks_per_phase=max_blocks_per_phase)
-            
-            # Add separator
-            overall_summary[f'A{next_row}'] = ''
-            next_row += 1
+    register_named_styles(overall_summary.parent, [], config)
+    
+    # Set up page layout for A4 landscape
+    overall_summary.page_setup.orientation = 'landscape'
+    overall_summary.page_setup.paperSize = 9  # A4
+    overall_summary.page_setup.fitToWidth = 1
+    overall_summary.page_setup.fitToHeight = 0
+    overall_summary.page_margins = PageMargins(left=0.5, right=0.5, top=0.75, bottom=0.75)
+    
+    # Add title and project info
+    project_title = config.get('PROJECT_TITLE', 'Project')
+    cert_settings = config.get('CERTIFICATE_SETTINGS', {})
+    
+    overall_summary['A1'] = f"{project_title} - Certificate Report"
+    overall_summary['A1'].font = Font(name='Calibri', size=16, bold=True)
+    overall_summary['A1'].alignment = Alignment(horizontal='left', vertical='center')
+    
+    # Get latest row from summary
+    latest_row = summary_df.iloc[-1] if not summary_df.empty else {}
+    latest_date = latest_row.get('Date', 'N/A')
+    latest_time = latest_row.get('Time', 'N/A')
+    
+    overall_summary['A2'] = f"Report Generated: {datetime.now().strftime('%Y-%m-%d %H:%M')}"
+    overall_summary['A2'].font = Font(name='Calibri', size=10, italic=True)
+    
+    overall_summary['A3'] = f"Latest Data: {latest_date} {latest_time}"
+    overall_summary['A3'].font = Font(name='Calibri', size=10, italic=True)
+    
+    # Add apartment certificate tracking section if configured
+    cert_tracking = config.get('CERTIFICATE_TRACKING', {})
+    apartment_certs = cert_tracking.get('apartment_certificates', {})
+    
+    if apartment_certs:
+        # Calculate max blocks per phase for dynamic column sizing
+        accom_data = get_accommodation_data(config)
+        max_blocks_per_phase = 0
+        if 'phases' in accom_data:
+            for phase_config in accom_data['phases'].values():
+                phase_blocks = len(phase_config.get('blocks', []))
+                max_blocks_per_phase = max(max_blocks_per_phase, phase_blocks)
+        
+        # Add apartment certificate tracking with progress bars
+        next_row = add_apartment_certificate_tracking(overall_summary, latest_data, config, start_row=5, max_blocks_per_phase=max_blocks_per_phase)
+        
+        # Add separator
+        overall_summary[f'A{next_row}'] = ''
+        next_row += 1
+        
+        # Add "Landlord/Communal Certificates" section header
+        overall_summary[f'A{next_row}'] = 'LANDLORD/COMMUNAL CERTIFICATES'
+        overall_summary[f'A{next_row}'].font = Font(name='Calibri', size=14, bold=True, color='FFFFFF')
+        overall_summary[f'A{next_row}'].fill = PatternFill(start_color='70AD47', end_color='70AD47', fill_type='solid')
+        overall_summary[f'A{next_row}'].alignment = Alignment(horizontal='left', vertical='center')
+        overall_summary.merge_cells(f'A{next_row}:D{next_row}')
+        next_row += 2
+        
+        # Count landlord/communal certificates across all blocks
+        landlord_certs = latest_data[document_folder_attributes(latest_data)['landlords'].to_numpy()]
+        
+        # Show count of landlord/communal certificates
+        overall_summary[f'A{next_row}'] = 'Landlord/Communal Certificates:'
+        overall_summary[f'B{next_row}'] = len(landlord_certs)
+        overall_summary[f'A{next_row}'].font = OVERALL_SUMMARY_STYLES['total_cell']['font']
+        overall_summary[f'B{next_row}'].font = OVERALL_SUMMARY_STYLES['total_cell']['font']
+        overall_summary[f'B{next_row}'].alignment = Alignment(horizontal='center')
+        next_row += 2
+        
+        # Add rejected certificates section
+        current_row = add_data_quality_section(overall_summary, latest_data, config, next_row)
+    else:
+        # No apartment tracking - simplified format
+        # Add total certificate count
+        total_certs = len(latest_data)
+        overall_summary['A5'] = 'Total Certificates:'
+        overall_summary['B5'] = total_certs
+        overall_summary['A5'].font = OVERALL_SUMMARY_STYLES['total_cell']['font']
+        overall_summary['A5'].alignment = OVERALL_SUMMARY_STYLES['total_cell']['alignment']
+        overall_summary['A5'].fill = OVERALL_SUMMARY_STYLES['total_cell']['fill']
+        overall_summary['B5'].font = OVERALL_SUMMARY_STYLES['total_cell']['font']
+        overall_summary['B5'].alignment = OVERALL_SUMMARY_STYLES['total_cell']['alignment']
+        overall_summary['B5'].fill = OVERALL_SUMMARY_STYLES['total_cell']['fill']
+        
+        # Add rejected certificates section
+        current_row = add_data_quality_section(overall_summary, latest_data, config, 7)
+    
+    # Revision/status summaries removed - apartment tracking and rejected certificates are more valuable
+    # The detailed revision/status data is still available in the "Summary Data" sheet if needed
+    
+    # Function to add revision and status summary
+    def add_certificate_revision_summary(start_row, rev_columns, title):
+        """Add a certificate revision summary section with status breakdown"""
+        if not rev_columns:
+            return start_row
+        
+        # Add section header
+        overall_summary[f'A{start_row}'] = title
+        overall_summary[f'A{start_row}'].font = OVERALL_SUMMARY_STYLES['section_header']['font']
+        overall_summary[f'A{start_row}'].alignment = OVERALL_SUMMARY_STYLES['section_header']['alignment']
+        overall_summary[f'A{start_row}'].fill = OVERALL_SUMMARY_STYLES['section_header']['fill']
+        
+        # Add headers
+        overall_summary[f'A{start_row + 1}'] = 'Revision'
+        overall_summary[f'B{start_row + 1}'] = 'Count'
+        overall_summary[f'C{start_row + 1}'] = 'Status'
+        overall_summary[f'D{start_row + 1}'] = 'Count'
+        
+        # Style headers
+        for col in ['A', 'B', 'C', 'D']:
+            overall_summary[f'{col}{start_row + 1}'].font = OVERALL_SUMMARY_STYLES['column_header']['font']
+            overall_summary[f'{col}{start_row + 1}'].alignment = OVERALL_SUMMARY_STYLES['column_header']['alignment']
+            overall_summary[f'{col}{start_row + 1}'].fill = OVERALL_SUMMARY_STYLES['column_header']['fill']
+            overall_summary[f'{col}{start_row + 1}'].border = OVERALL_SUMMARY_STYLES['border']
+        
+        # Get status counts for all revisions in this group
+        status_counts = {}
+        total_count = 0
+        
+        for rev_col in rev_columns:
+            rev_name = rev_col.replace('Rev_', '')
             
-            # Add "Landlord/Communal Certificates" section header
-            overall_summary[f'A{next_row}'] = 'LANDLORD/COMMUNAL CERTIFICATES'
-            overall_summary[f'A{next_row}'].font = Font(name='Calibri', size=14, bold=True, color='FFFFFF')
-            overall_summary[f'A{next_row}'].fill = PatternFill(start_color='70AD47', end_color='70AD47', fill_type='solid')
-            overall_summary[f'A{next_row}'].alignment = Alignment(horizontal='left', vertical='center')
-            overall_summary.merge_cells(f'A{next_row}:D{next_row}')
-            next_row += 2
+            # Get count from summary data
+            count = latest_row.get(rev_col, 0)
+            # Handle NaN values from pandas
+            total_count += 0 if pd.isna(count) else count
             
-            # Count landlord/communal certificates across all blocks
-            landlord_certs_mask = latest_data['Doc Path'].fillna('').astype(str).str.contains(r'\\Landlords\\', case=False, na=False, regex=True)
-            landlord_certs = latest_data[landlord_certs_mask]
+            # Count statuses for this revision
+            rev_data = latest_data[latest_data['Rev'] == rev_name]
             
-            # Show count of landlord/communal certificates
-            overall_summary[f'A{next_row}'] = 'Landlord/Communal Certificates:'
-            overall_summary[f'B{next_row}'] = len(landlord_certs)
-            overall_summary[f'A{next_row}'].font = OVERALL_SUMMARY_STYLES['total_cell']['font']
-            overall_summary[f'B{next_row}'].font = OVERALL_SUMMARY_STYLES['total_cell']['font']
-            overall_summary[f'B{next_row}'].alignment = Alignment(horizontal='center')
-            next_row += 2
+            # Use get_grouped_status_counts to properly group raw status values
+            if not rev_data.empty:
+                grouped_counts = get_grouped_status_counts(rev_data['Status'], config)
+                for status, status_count in grouped_counts.items():
+                    status_counts[status] = status_counts.get(status, 0) + status_count
+        
+        # Add revision data
+        row = start_row + 2
+        for rev_col in rev_columns:
+            rev_name = rev_col.replace('Rev_', '')
             
-            # Add rejected certificates section
-            current_row = add_data_quality_section(overall_summary, latest_data, config, next_row)
-        else:
-            # No apartment tracking - simplified format
-            # Add total certificate count
-            total_certs = len(latest_data)
-            overall_summary['A5'] = 'Total Certificates:'
-            overall_summary['B5'] = total_certs
-            overall_summary['A5'].font = OVERALL_SUMMARY_STYLES['total_cell']['font']
-            overall_summary['A5'].alignment = OVERALL_SUMMARY_STYLES['total_cell']['alignment']
-            overall_summary['A5'].fill = OVERALL_SUMMARY_STYLES['total_cell']['fill']
-            overall_summary['B5'].font = OVERALL_SUMMARY_STYLES['total_cell']['font']
-            overall_summary['B5'].alignment = OVERALL_SUMMARY_STYLES['total_cell']['alignment']
-            overall_summary['B5'].fill = OVERALL_SUMMARY_STYLES['total_cell']['fill']
+            # Get the count from the summary data
+            count = latest_row.get(rev_col, 0)
+            # Handle NaN values from pandas
+            count = 0 if pd.isna(count) else count
             
-            # Add rejected certificates section
-            current_row = add_data_quality_section(overall_summary, latest_data, config, 7)
+            # Only add revision row if there are actually documents with this revision
+            if count > 0:
+                # Add revision name and count
+                overall_summary[f'A{row}'] = rev_name
+                overall_summary[f'B{row}'] = count
+                overall_summary[f'A{row}'].font = OVERALL_SUMMARY_STYLES['data_cell']['font']
+                overall_summary[f'A{row}'].alignment = OVERALL_SUMMARY_STYLES['data_cell']['alignment']
+                overall_summary[f'A{row}'].fill = OVERALL_SUMMARY_STYLES['data_cell']['fill']
+                overall_summary[f'A{row}'].border = OVERALL_SUMMARY_STYLES['border']
+                overall_summary[f'B{row}'].font = OVERALL_SUMMARY_STYLES['data_cell']['font']
+                overall_summary[f'B{row}'].alignment = OVERALL_SUMMARY_STYLES['data_cell']['alignment']
+                overall_summary[f'B{row}'].fill = OVERALL_SUMMARY_STYLES['data_cell']['fill']
+                overall_summary[f'B{row}'].border = OVERALL_SUMMARY_STYLES['border']
+                row += 1
+        
+        # Add total row for revisions
+        overall_summary[f'A{row}'] = 'Total'
+        overall_summary[f'B{row}'] = total_count
+        overall_summary[f'A{row}'].font = OVERALL_SUMMARY_STYLES['total_cell']['font']
+        overall_summary[f'A{row}'].alignment = OVERALL_SUMMARY_STYLES['total_cell']['alignment']
+        overall_summary[f'A{row}'].fill = OVERALL_SUMMARY_STYLES['total_cell']['fill']
+        overall_summary[f'A{row}'].border = OVERALL_SUMMARY_STYLES['border']
+        overall_summary[f'B{row}'].font = OVERALL_SUMMARY_STYLES['total_cell']['font']
+        overall_summary[f'B{row}'].alignment = OVERALL_SUMMARY_STYLES['total_cell']['alignment']
+        overall_summary[f'B{row}'].fill = OVERALL_SUMMARY_STYLES['total_cell']['fill']
+        overall_summary[f'B{row}'].border = OVERALL_SUMMARY_STYLES['border']
+        row += 1
         
-        # Revision/status summaries removed - apartment tracking and rejected certificates are more valuable
-        # The detailed revision/status data is still available in the "Summary Data" sheet if needed
+        # Add status summary
+        status_row = start_row + 2
+        total_status_count = 0
         
-        # Function to add revision and status summary
-        def add_certificate_revision_summary(start_row, rev_columns, title):
-            """Add a certificate revision summary section with status breakdown"""
-            if not rev_columns:
-                return start_row
-            
-            # Add section header
-            overall_summary[f'A{start_row}'] = title
-            overall_summary[f'A{start_row}'].font = OVERALL_SUMMARY_STYLES['section_header']['font']
-            overall_summary[f'A{start_row}'].alignment = OVERALL_SUMMARY_STYLES['section_header']['alignment']
-            overall_summary[f'A{start_row}'].fill = OVERALL_SUMMARY_STYLES['section_header']['fill']
-            
-            # Add headers
-            overall_summary[f'A{start_row + 1}'] = 'Revision'
-            overall_summary[f'B{start_row + 1}'] = 'Count'
-            overall_summary[f'C{start_row + 1}'] = 'Status'
-            overall_summary[f'D{start_row + 1}'] = 'Count'
-            
-            # Style headers
-            for col in ['A', 'B', 'C', 'D']:
-                overall_summary[f'{col}{start_row + 1}'].font = OVERALL_SUMMARY_STYLES['column_header']['font']
-                overall_summary[f'{col}{start_row + 1}'].alignment = OVERALL_SUMMARY_STYLES['column_header']['alignment']
-                overall_summary[f'{col}{start_row + 1}'].fill = OVERALL_SUMMARY_STYLES['column_header']['fill']
-                overall_summary[f'{col}{start_row + 1}'].border = OVERALL_SUMMARY_STYLES['border']
-            
-            # Get status counts for all revisions in this group
-            status_counts = {}
-            total_count = 0
-            
-            for rev_col in rev_columns:
-                rev_name = rev_col.replace('Rev_', '')
-                
-                # Get count from summary data
-                count = latest_row.get(rev_col, 0)
-                # Handle NaN values from pandas
-                total_count += 0 if pd.isna(count) else count
-                
-                # Count statuses for this revision
-                rev_data = latest_data[latest_data['Rev'] == rev_name]
-                
-                # Use get_grouped_status_counts to properly group raw status values
-                if not rev_data.empty:
-                    grouped_counts = get_grouped_status_counts(rev_data['Status'], config)
-                    for status, status_count in grouped_counts.items():
-                        status_counts[status] = status_counts.get(status, 0) + status_count
-            
-            # Add revision data
-            row = start_row + 2
-            for rev_col in rev_columns:
-                rev_name = rev_col.replace('Rev_', '')
-                
-                # Get the count from the summary data
-                count = latest_row.get(rev_col, 0)
-                # Handle NaN values from pandas
-                count = 0 if pd.isna(count) else count
-                
-                # Only add revision row if there are actually documents with this revision
-                if count > 0:
-                    # Add revision name and count
-                    overall_summary[f'A{row}'] = rev_name
-                    overall_summary[f'B{row}'] = count
-                    overall_summary[f'A{row}'].font = OVERALL_SUMMARY_STYLES['data_cell']['font']
-                    overall_summary[f'A{row}'].alignment = OVERALL_SUMMARY_STYLES['data_cell']['alignment']
-                    overall_summary[f'A{row}'].fill = OVERALL_SUMMARY_STYLES['data_cell']['fill']
-                    overall_summary[f'A{row}'].border = OVERALL_SUMMARY_STYLES['border']
-                    overall_summary[f'B{row}'].font = OVERALL_SUMMARY_STYLES['data_cell']['font']
-                    overall_summary[f'B{row}'].alignment = OVERALL_SUMMARY_STYLES['data_cell']['alignment']
-                    overall_summary[f'B{row}'].fill = OVERALL_SUMMARY_STYLES['data_cell']['fill']
-                    overall_summary[f'B{row}'].border = OVERALL_SUMMARY_STYLES['border']
-                    row += 1
-            
-            # Add total row for revisions
-            overall_summary[f'A{row}'] = 'Total'
-            overall_summary[f'B{row}'] = total_count
-            overall_summary[f'A{row}'].font = OVERALL_SUMMARY_STYLES['total_cell']['font']
-            overall_summary[f'A{row}'].alignment = OVERALL_SUMMARY_STYLES['total_cell']['alignment']
-            overall_summary[f'A{row}'].fill = OVERALL_SUMMARY_STYLES['total_cell']['fill']
-            overall_summary[f'A{row}'].border = OVERALL_SUMMARY_STYLES['border']
-            overall_summary[f'B{row}'].font = OVERALL_SUMMARY_STYLES['total_cell']['font']
-            overall_summary[f'B{row}'].alignment = OVERALL_SUMMARY_STYLES['total_cell']['alignment']
-            overall_summary[f'B{row}'].fill = OVERALL_SUMMARY_STYLES['total_cell']['fill']
-            overall_summary[f'B{row}'].border = OVERALL_SUMMARY_STYLES['border']
-            row += 1
-            
-            # Add status summary
-            status_row = start_row + 2
-            total_status_count = 0
+        # Create ordered list using project-specific categories
+        ordered_statuses = []
+        
+        # Build ordered list using project-specific display order
+        if config and 'STATUS_DISPLAY_ORDER' in config:
+            display_order = config['STATUS_DISPLAY_ORDER']
             
-            # Create ordered list using project-specific categories
-            ordered_statuses = []
+            # Add statuses in the order defined by STATUS_DISPLAY_ORDER
+            for category in display_order:
+                if category in status_counts:
+                    ordered_statuses.append((category, status_counts[category]))
             
-            # Build ordered list using project-specific display order
-            if config and 'STATUS_DISPLAY_ORDER' in config:
-                display_order = config['STATUS_DISPLAY_ORDER']
-                
-                # Add statuses in the order defined by STATUS_DISPLAY_ORDER
-                for category in display_order:
-                    if category in status_counts:
-                        ordered_statuses.append((category, status_counts[category]))
-                
-                # Add any remaining statuses that weren't in display order
-                for status, count in status_counts.items():
-                    if status not in display_order:
-                        ordered_statuses.append((status, count))
-            else:
-                # Fallback to alphabetical order if no display order defined
-                ordered_statuses = sorted(status_counts.items())
+            # Add any remaining statuses that weren't in display order
+            for status, count in status_counts.items():
+                if status not in display_order:
+                    ordered_statuses.append((status, count))
+        else:
+            # Fallback to alphabetical order if no display order defined
+            ordered_statuses = sorted(status_counts.items())
+        
+        for status, count in ordered_statuses:
+            total_status_count += count
             
-            for status, count in ordered_statuses:
-                total_status_count += count
-                
-                # Add status name with conditional formatting
-                status_cell = overall_summary[f'C{status_row}']
-                status_cell.value = status
-                style = apply_status_style(status_cell, status, config)
-                status_cell.alignment = OVERALL_SUMMARY_STYLES['data_cell']['alignment']
-                status_cell.border = OVERALL_SUMMARY_STYLES['border']
-                
-                # Add count with matching style
-                count_cell = overall_summary[f'D{status_row}']
-                count_cell.value = count
-                count_cell.font = Font(
-                    name=style['font'].name,
-                    size=style['font'].size,
-                    bold=style['font'].bold,
-                    italic=style['font'].italic,
-                    color=style['font'].color
-                )
-                count_cell.fill = style['fill']
-                count_cell.alignment = OVERALL_SUMMARY_STYLES['data_cell']['alignment']
-                count_cell.border = OVERALL_SUMMARY_STYLES['border']
-                
-                status_row += 1
+            # Add status name with conditional formatting
+            status_cell = overall_summary[f'C{status_row}']
+            status_cell.value = status
+            style = apply_status_style(status_cell, status, config)
+            status_cell.alignment = OVERALL_SUMMARY_STYLES['data_cell']['alignment']
+            status_cell.border = OVERALL_SUMMARY_STYLES['border']
             
-            # Add total row for status counts
-            overall_summary[f'C{status_row}'] = 'Total'
-            overall_summary[f'D{status_row}'] = total_status_count
-            overall_summary[f'C{status_row}'].font = OVERALL_SUMMARY_STYLES['total_cell']['font']
-            overall_summary[f'C{status_row}'].alignment = OVERALL_SUMMARY_STYLES['total_cell']['alignment']
-            overall_summary[f'C{status_row}'].fill = OVERALL_SUMMARY_STYLES['total_cell']['fill']
-            overall_summary[f'C{status_row}'].border = OVERALL_SUMMARY_STYLES['border']
-            overall_summary[f'D{status_row}'].font = OVERALL_SUMMARY_STYLES['total_cell']['font']
-            overall_summary[f'D{status_row}'].alignment = OVERALL_SUMMARY_STYLES['total_cell']['alignment']
-            overall_summary[f'D{status_row}'].fill = OVERALL_SUMMARY_STYLES['total_cell']['fill']
-            overall_summary[f'D{status_row}'].border = OVERALL_SUMMARY_STYLES['border']
+            # Add count with matching style
+            count_cell = overall_summary[f'D{status_row}']
+            count_cell.value = count
+            count_cell.font = Font(
+                name=style['font'].name,
+                size=style['font'].size,
+                bold=style['font'].bold,
+                italic=style['font'].italic,
+                color=style['font'].color
+            )
+            count_cell.fill = style['fill']
+            count_cell.alignment = OVERALL_SUMMARY_STYLES['data_cell']['alignment']
+            count_cell.border = OVERALL_SUMMARY_STYLES['border']
             
-            return max(row, status_row) + 2
-        
-        # Revision/status summaries and pie chart removed
-        # Data quality section provides more actionable insights
-        # Historical revision/status data remains available in "Summary Data" sheet
+            status_row += 1
+        
+        # Add total row for status counts
+        overall_summary[f'C{status_row}'] = 'Total'
+        overall_summary[f'D{status_row}'] = total_status_count
+        overall_summary[f'C{status_row}'].font = OVERALL_SUMMARY_STYLES['total_cell']['font']
+        overall_summary[f'C{status_row}'].alignment = OVERALL_SUMMARY_STYLES['total_cell']['alignment']
+        overall_summary[f'C{status_row}'].fill = OVERALL_SUMMARY_STYLES['total_cell']['fill']
+        overall_summary[f'C{status_row}'].border = OVERALL_SUMMARY_STYLES['border']
+        overall_summary[f'D{status_row}'].font = OVERALL_SUMMARY_STYLES['total_cell']['font']
+        overall_summary[f'D{status_row}'].alignment = OVERALL_SUMMARY_STYLES['total_cell']['alignment']
+        overall_summary[f'D{status_row}'].fill = OVERALL_SUMMARY_STYLES['total_cell']['fill']
+        overall_summary[f'D{status_row}'].border = OVERALL_SUMMARY_STYLES['border']
+        
+        return max(row, status_row) + 2
+    
+    # Revision/status summaries and pie chart removed
+    # Data quality section provides more actionable insights
+    # Historical revision/status data remains available in "Summary Data" sheet
+    
+    # Adjust column widths
+    overall_summary.column_dimensions['A'].width = 30  # Certificate type / Revision
+    overall_summary.column_dimensions['B'].width = 15  # Apartments / Count
+    overall_summary.column_dimensions['C'].width = 12  # Progress % / Status
+    overall_summary.column_dimensions['D'].width = 12  # Documents / Count
+    overall_summary.column_dimensions['E'].width = 8   # Progress bar part 1
+    overall_summary.column_dimensions['F'].width = 8   # Progress bar part 2
+    overall_summary.column_dimensions['G'].width = 8   # Progress bar part 3
+
+
+def save_certificate_report(summary_df, latest_data, output_file, config):
+    """
+    Save a comprehensive certificate report to Excel.
+    
+    Args:
+        summary_df: DataFrame with summary data (revision/status counts over time)
+        latest_data: DataFrame with the latest certificate data
+        output_file: Path to the output Excel file
+        config: Project configuration dictionary
         
-        # Adjust column widths
-        overall_summary.column_dimensions['A'].width = 30  # Certificate type / Revision
-        overall_summary.column_dimensions['B'].width = 15  # Apartments / Count
-        overall_summary.column_dimensions['C'].width = 12  # Progress % / Status
-        overall_summary.column_dimensions['D'].width = 12  # Documents / Count
-        overall_summary.column_dimensions['E'].width = 8   # Progress bar part 1
-        overall_summary.column_dimensions['F'].width = 8   # Progress bar part 2
-        overall_summary.column_dimensions['G'].width = 8   # Progress bar part 3
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    try:
+        sheets = [
+            styled_sheet('Overall Summary',
+                         lambda ws: write_certificate_overall_summary(ws, summary_df, latest_data, config)),
+            data_sheet('Summary Data', summary_df),
+            # Latest Certificate Data is written without the stored category and folder attributes
+            data_sheet('Latest Certificate Data',
+                       latest_data.drop(columns=CATEGORY_COLUMNS + FOLDER_COLUMNS, errors='ignore')),
+        ]
         
         # Add detailed uncategorized analysis tab if apartment tracking is enabled
         apartment_certs = config.get('CERTIFICATE_TRACKING', {}).get('apartment_certificates', {})
         if apartment_certs:
-            add_uncategorized_detailed_tab(wb, latest_data, config)
+            sheets.append(styled_sheet('Uncategorized Analysis',
+                                       lambda ws: write_uncategorized_analysis(ws, latest_data, config)))
         
-        # Save the workbook
-        wb.save(output_file)
+        # Write the workbook in one pass
+        write_report_workbook(output_file, sheets, get_writer_backend(config))
         return True
         
     except Exception as e:
@@ -4,15 +4,20 @@ import warnings
 import os
 import pandas as pd
 from openpyxl import load_workbook, Workbook
-from openpyxl.styles import PatternFill, Font, Alignment
 from openpyxl.worksheet.page import PageMargins
 
-from styles.formatting import PROGRESSION_STATUS_ORDER
+from styles.formatting import PROGRESSION_STATUS_ORDER, PROGRESSION_NAMED_STYLES, register_named_styles
 from utils.status_mapping import (
     get_status_category,
     get_status_display_order,
-    get_grouped_status_counts
+    get_grouped_status_counts,
+    get_status_mapper,
+    StatusMapper,
+    UNMAPPED_CATEGORY
 )
+from utils.revisions import group_revisions, revision_sort_key, sort_revisions
+from analyzers.snapshot_profile import build_snapshot_profile
+from utils.tracing import span, traced
 
 # Suppress openpyxl warnings
 warnings.filterwarnings('ignore', category=UserWarning, module='openpyxl')
@@ -61,6 +66,7 @@ def generate_condensed_progression_report(summary_df, output_file, config, lates
             try:
                 book = load_workbook(output_file)
                 if 'Progression' in book.sheetnames:
+                    register_named_styles(book, ['Report Monthly Header'])
                     sheet = book['Progression']
                     
                     # Find the column we just added (last data column)
@@ -69,8 +75,7 @@ def generate_condensed_progression_report(summary_df, output_file, config, lates
                     
                     # Make the date header bold and highlighted for monthly columns
                     date_cell = sheet.cell(row=1, column=last_col)
-                    date_cell.font = Font(name='Calibri', size=11, bold=True, color='FFFFFF')
-                    date_cell.fill = PatternFill(start_color='4472C4', end_color='4472C4', fill_type='solid')
+                    date_cell.style = 'Report Monthly Header'
                     
                     book.save(output_file)
             except Exception as e:
@@ -123,9 +128,10 @@ def detect_new_revision_types(sheet, new_revisions, revision_type):
     new_revision_names = {rev.replace('Rev_', '') for rev in new_revisions}
     missing_revisions = new_revision_names - existing_revisions
     
-    return sorted(list(missing_revisions))
+    return sort_revisions(missing_revisions)
 
 
+@traced('progression.fill zeros')
 def fill_empty_cells_with_zeros_in_file(progression_report_path):
     """Open the progression report, fill empty cells in tables with zeros, and save.
     
@@ -138,6 +144,7 @@ def fill_empty_cells_with_zeros_in_file(progression_report_path):
         print("No 'Progression Report' sheet found.")
         return
     sheet = wb['Progression Report']
+    register_named_styles(wb, PROGRESSION_NAMED_STYLES)
     
     # Find all date headers and their column numbers
     date_columns = set()
@@ -175,15 +182,15 @@ def fill_empty_cells_with_zeros_in_file(progression_report_path):
                 if cell.value is None or cell.value == '':
                     sheet[f'{col_letter}{row}'] = 0
                     # Apply consistent formatting with other data cells
-                    sheet[f'{col_letter}{row}'].font = Font(name='Calibri', size=11)
-                    sheet[f'{col_letter}{row}'].alignment = Alignment(horizontal='center', vertical='center')
+                    sheet[f'{col_letter}{row}'].style = 'Report Zero'
                     total_cells_filled += 1
     
     wb.save(progression_report_path)
     print(f"Filled {total_cells_filled} empty cells in {progression_report_path}.")
 
 
-def generate_progression_report(summary_df, output_file, config, latest_data_df=None):
+@traced('progression.add column')
+def generate_progression_report(summary_df, output_file, config, latest_data_df=None, snapshot_profile=None):
     """Generate a report showing the progression of revisions and statuses over time.
     
     This function creates a comprehensive progression report that tracks:
@@ -199,20 +206,25 @@ def generate_progression_report(summary_df, output_file, config, latest_data_df=
         output_file: Path to output Excel file (will be created or updated)
         config: Project configuration dictionary
         latest_data_df: Optional DataFrame with detailed latest document data for filtering
+        snapshot_profile: Optional SnapshotProfile of latest_data_df (built if not given)
         
     Returns:
         bool: True if successful, False otherwise
     """
     try:
         # Starting progression report generation
+        if snapshot_profile is None and latest_data_df is not None:
+            snapshot_profile = build_snapshot_profile(latest_data_df, config)
         
         # Create a new workbook or load existing
         if os.path.exists(output_file):
-            wb = load_workbook(output_file)
+            with span('workbook load'):
+                wb = load_workbook(output_file)
         else:
             wb = Workbook()
             # Remove the default 'Sheet' worksheet
             wb.remove(wb['Sheet'])
+        register_named_styles(wb, PROGRESSION_NAMED_STYLES)
         
         # Get or create the Progression Report sheet
         if 'Progression Report' in wb.sheetnames:
@@ -238,8 +250,7 @@ def generate_progression_report(summary_df, output_file, config, latest_data_df=
             # Add title
             sheet.merge_cells('A1:Z1')
             sheet['A1'] = f"{config.get('PROJECT_TITLE', '')} Document Register Progression Report"
-            sheet['A1'].font = Font(name='Calibri', size=14, bold=True)
-            sheet['A1'].alignment = Alignment(horizontal='center', vertical='center')
+            sheet['A1'].style = 'Report Title'
         
         # Get all revision and status columns
         all_columns = summary_df.columns.tolist()
@@ -247,11 +258,10 @@ def generate_progression_report(summary_df, output_file, config, latest_data_df=
         status_columns = [col for col in all_columns if col.startswith('Status_')]
         
         # Sort revisions by type (P, C, other)
-        p_revs = sorted([col for col in rev_columns if col.startswith('Rev_P')], 
-                       key=lambda x: int(x.split('_')[1][1:]) if x.split('_')[1][1:].isdigit() else float('inf'))
-        c_revs = sorted([col for col in rev_columns if col.startswith('Rev_C')],
-                       key=lambda x: int(x.split('_')[1][1:]) if x.split('_')[1][1:].isdigit() else float('inf'))
-        other_revs = sorted([col for col in rev_columns if not (col.startswith('Rev_P') or col.startswith('Rev_C'))])
+        revision_groups = group_revisions(rev_columns)
+        p_revs = revision_groups['P']
+        c_revs = revision_groups['C']
+        other_revs = revision_groups['other']
         
         # Detect new revision types if this is an existing report
         if next_col > 2:  # Existing report
@@ -286,75 +296,42 @@ def generate_progression_report(summary_df, output_file, config, latest_data_df=
                     total += summary_df.iloc[-1].get(col, 0)
             return total
         
+        # Status categories are counted per revision family from the snapshot profile
+        # (unmapped statuses kept separate - they feed the 'Other Status' row)
+        if config and 'STATUS_MAPPINGS' in config:
+            status_mapper = get_status_mapper(config)
+        else:
+            # Fallback to hardcoded PROGRESSION_STATUS_ORDER
+            status_mapper = StatusMapper(PROGRESSION_STATUS_ORDER, statuses_key='status_terms')
+        
+        def get_crosstab_count(category, revision_type):
+            return snapshot_profile.status_count(category, 'family', revision_type,
+                                                 fold_unmapped=False, status_mapper=status_mapper)
+        
         # Function to get status count for a specific status group filtered by revision type
         def get_filtered_status_count(status_group, revision_type):
-            if latest_data_df is None:
+            if snapshot_profile is None:
                 # Fallback to unfiltered count if no latest data available
                 return get_status_count(status_group)
             
-            total = 0
-            
-            # Use config-based mappings if available
-            if config and 'STATUS_MAPPINGS' in config:
-                status_terms = config['STATUS_MAPPINGS'].get(status_group, {}).get('statuses', [])
-            else:
-                # Fallback to hardcoded PROGRESSION_STATUS_ORDER
-                status_terms = PROGRESSION_STATUS_ORDER.get(status_group, {}).get('status_terms', [])
-            
-            # Filter data by revision type
-            if revision_type == 'P':
-                filtered_data = latest_data_df[latest_data_df['Rev'].str.startswith('P', na=False)]
-            elif revision_type == 'C':
-                filtered_data = latest_data_df[latest_data_df['Rev'].str.startswith('C', na=False)]
-            else:
+            if revision_type not in ('P', 'C'):
                 # For other revision types, return 0 or handle as needed
                 return 0
             
-            # Count documents with statuses in the status_terms list
-            for status_term in status_terms:
-                count = len(filtered_data[filtered_data['Status'] == status_term])
-                total += count
-            
-            return total
+            return get_crosstab_count(status_group, revision_type)
         
         # Function to get count of uncategorized statuses for a revision type
         def get_other_status_count(revision_type):
-            if latest_data_df is None:
+            if snapshot_profile is None or revision_type not in ('P', 'C'):
                 return 0
             
-            # Filter data by revision type
-            if revision_type == 'P':
-                filtered_data = latest_data_df[latest_data_df['Rev'].str.startswith('P', na=False)]
-            elif revision_type == 'C':
-                filtered_data = latest_data_df[latest_data_df['Rev'].str.startswith('C', na=False)]
-            else:
+            # If there's an 'Other' category in the mapping, it's already counted
+            # So we return 0 to avoid double counting
+            if config and 'STATUS_MAPPINGS' in config and 'Other' in config['STATUS_MAPPINGS']:
                 return 0
             
-            # Get all defined status terms from config or fallback
-            all_defined_statuses = set()
-            
-            if config and 'STATUS_MAPPINGS' in config:
-                # If there's an 'Other' category in the mapping, it's already counted
-                # So we return 0 to avoid double counting
-                if 'Other' in config['STATUS_MAPPINGS']:
-                    return 0
-                
-                # Otherwise, collect all defined statuses from config
-                for status_group, mapping in config['STATUS_MAPPINGS'].items():
-                    all_defined_statuses.update(mapping.get('statuses', []))
-            else:
-                # Fallback to hardcoded PROGRESSION_STATUS_ORDER
-                for status_group in PROGRESSION_STATUS_ORDER.values():
-                    all_defined_statuses.update(status_group.get('status_terms', []))
-            
-            # Count documents with statuses not in the defined list
-            other_count = 0
-            for status in filtered_data['Status'].unique():
-                if status not in all_defined_statuses:
-                    count = len(filtered_data[filtered_data['Status'] == status])
-                    other_count += count
-            
-            return other_count
+            # Count documents with statuses not in any defined status list
+            return get_crosstab_count(UNMAPPED_CATEGORY, revision_type)
         
         # Start row for data
         current_row = 3
@@ -409,8 +386,7 @@ def generate_progression_report(summary_df, output_file, config, latest_data_df=
                         cell = sheet[f'{col_letter}{row}']
                         if cell.value is None or cell.value == '':
                             sheet[f'{col_letter}{row}'] = 0
-                            sheet[f'{col_letter}{row}'].font = Font(name='Calibri', size=11)
-                            sheet[f'{col_letter}{row}'].alignment = Alignment(horizontal='center', vertical='center')
+                            sheet[f'{col_letter}{row}'].style = 'Report Zero'
                             cells_filled += 1
         
         # Function to add a section header
@@ -418,8 +394,7 @@ def generate_progression_report(summary_df, output_file, config, latest_data_df=
             if next_col == 2:  # Only add headers for new sheets
                 sheet.merge_cells(f'A{row}:Z{row}')
                 sheet[f'A{row}'] = title
-                sheet[f'A{row}'].font = Font(name='Calibri', size=12, bold=True)
-                sheet[f'A{row}'].fill = PatternFill(start_color='F0F0F0', end_color='F0F0F0', fill_type='solid')
+                sheet[f'A{row}'].style = 'Report Section'
             else:
                 # For existing sheets, find the section header by name
                 section_row_found = None
@@ -453,8 +428,7 @@ def generate_progression_report(summary_df, output_file, config, latest_data_df=
             date_col = chr(ord('A') + next_col - 1)
             latest_data = summary_df.iloc[-1]  # Get the latest data
             sheet[f'{date_col}{row}'] = latest_data['Date']  # Only use the date
-            sheet[f'{date_col}{row}'].font = Font(name='Calibri', size=11, bold=True)
-            sheet[f'{date_col}{row}'].alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
+            sheet[f'{date_col}{row}'].style = 'Report Column Header'
             return row + 1
         
         # Function to add data rows with proper row matching
@@ -468,15 +442,13 @@ def generate_progression_report(summary_df, output_file, config, latest_data_df=
                 for col in columns:
                     # Add row header
                     sheet[f'A{row}'] = f"{title_prefix}{col.replace('Rev_', '').replace('Status_', '')}"
-                    sheet[f'A{row}'].font = Font(name='Calibri', size=11)
-                    sheet[f'A{row}'].alignment = Alignment(horizontal='left', vertical='center')
+                    sheet[f'A{row}'].style = 'Report Label'
                     
                     # Add data for the new column
                     date_col = chr(ord('A') + next_col - 1)
                     value = latest_data.get(col, 0)
                     sheet[f'{date_col}{row}'] = value
-                    sheet[f'{date_col}{row}'].font = Font(name='Calibri', size=11)
-                    sheet[f'{date_col}{row}'].alignment = Alignment(horizontal='center', vertical='center')
+                    sheet[f'{date_col}{row}'].style = 'Report Data'
                     
                     row += 1
             else:
@@ -515,8 +487,7 @@ def generate_progression_report(summary_df, output_file, config, latest_data_df=
                         cell = sheet[f'{date_col}{header_row}']
                         if not hasattr(cell, 'coordinate') or not cell.coordinate in sheet.merged_cells:
                             sheet[f'{date_col}{header_row}'] = value
-                            sheet[f'{date_col}{header_row}'].font = Font(name='Calibri', size=11)
-                            sheet[f'{date_col}{header_row}'].alignment = Alignment(horizontal='center', vertical='center')
+                            sheet[f'{date_col}{header_row}'].style = 'Report Data'
                         else:
                             print(f"  Warning: Skipping merged cell at {date_col}{header_row}")
                         
@@ -529,8 +500,7 @@ def generate_progression_report(summary_df, output_file, config, latest_data_df=
                         cell = sheet[f'{date_col}{header_row}']
                         if not hasattr(cell, 'coordinate') or not cell.coordinate in sheet.merged_cells:
                             sheet[f'{date_col}{header_row}'] = 0
-                            sheet[f'{date_col}{header_row}'].font = Font(name='Calibri', size=11)
-                            sheet[f'{date_col}{header_row}'].alignment = Alignment(horizontal='center', vertical='center')
+                            sheet[f'{date_col}{header_row}'].style = 'Report Zero'
                         else:
                             print(f"  Warning: Skipping merged cell at {date_col}{header_row}")
                 
@@ -541,28 +511,7 @@ def generate_progression_report(summary_df, output_file, config, latest_data_df=
                     print(f"INFO: Adding {len(new_revisions)} new revision(s) to existing progression report")
                     
                     # Sort new revisions properly (P01, P02, P10, P11, etc.)
-                    def sort_revision_key(rev):
-                        if rev.startswith('P') or rev.startswith('C'):
-                            # Extract the number part
-                            prefix = rev[0]  # P or C
-                            number_part = rev[1:]
-                            
-                            # Handle special cases like P_Certificates
-                            if '_' in number_part:
-                                # For special cases like P_Certificates, put them at the end
-                                return (prefix, float('inf'))
-                            
-                            try:
-                                # Convert to int for proper numeric sorting
-                                return (prefix, int(number_part))
-                            except ValueError:
-                                # If it's not a number, sort as string but after numeric ones
-                                return (prefix, float('inf'))
-                        else:
-                            # For other revisions, sort as string
-                            return ('Z', rev)  # Put at end
-                    
-                    sorted_new_revisions = sorted(new_revisions, key=sort_revision_key)
+                    sorted_new_revisions = sorted(new_revisions, key=revision_sort_key)
                     
                     # For each new revision, insert it at the appropriate position
                     for new_rev in sorted_new_revisions:
@@ -577,11 +526,11 @@ def generate_progression_report(summary_df, output_file, config, latest_data_df=
                                 section_revisions.append((header_row, rev_name))
                         
                         # Sort existing revisions
-                        section_revisions.sort(key=lambda x: sort_revision_key(x[1]))
+                        section_revisions.sort(key=lambda x: revision_sort_key(x[1]))
                         
                         # Find where to insert the new revision
                         for i, (header_row, rev_name) in enumerate(section_revisions):
-                            if sort_revision_key(new_rev) < sort_revision_key(rev_name):
+                            if revision_sort_key(new_rev) < revision_sort_key(rev_name):
                                 insert_position = header_row
                                 break
                         
@@ -636,15 +585,13 @@ def generate_progression_report(summary_df, output_file, config, latest_data_df=
                         
                         # Add the new revision header
                         sheet[f'A{insert_position}'] = f"{title_prefix}{new_rev}"
-                        sheet[f'A{insert_position}'].font = Font(name='Calibri', size=11)
-                        sheet[f'A{insert_position}'].alignment = Alignment(horizontal='left', vertical='center')
+                        sheet[f'A{insert_position}'].style = 'Report Label'
                         
                         # Add the data
                         date_col = chr(ord('A') + next_col - 1)
                         value = revision_data[new_rev]
                         sheet[f'{date_col}{insert_position}'] = value
-                        sheet[f'{date_col}{insert_position}'].font = Font(name='Calibri', size=11)
-                        sheet[f'{date_col}{insert_position}'].alignment = Alignment(horizontal='center', vertical='center')
+                        sheet[f'{date_col}{insert_position}'].style = 'Report Data'
                         
                         # Update existing_headers to include the new row
                         existing_headers.append((insert_position, f"{title_prefix}{new_rev}"))
@@ -684,15 +631,13 @@ def generate_progression_report(summary_df, output_file, config, latest_data_df=
                         display_name = status_mappings.get(status_group, {}).get('display_name', status_group)
                     
                     sheet[f'A{row}'] = display_name
-                    sheet[f'A{row}'].font = Font(name='Calibri', size=11)
-                    sheet[f'A{row}'].alignment = Alignment(horizontal='left', vertical='center')
+                    sheet[f'A{row}'].style = 'Report Label'
                 
                 # Add filtered data for the new column
                 date_col = chr(ord('A') + next_col - 1)
                 value = get_filtered_status_count(status_group, revision_type)
                 sheet[f'{date_col}{row}'] = value
-                sheet[f'{date_col}{row}'].font = Font(name='Calibri', size=11)
-                sheet[f'{date_col}{row}'].alignment = Alignment(horizontal='center', vertical='center')
+                sheet[f'{date_col}{row}'].style = 'Report Data'
                 
                 row += 1
             
@@ -704,15 +649,13 @@ def generate_progression_report(summary_df, output_file, config, latest_data_df=
                 # Add row header if it's a new sheet
                 if next_col == 2:
                     sheet[f'A{row}'] = 'Other Status'
-                    sheet[f'A{row}'].font = Font(name='Calibri', size=11)
-                    sheet[f'A{row}'].alignment = Alignment(horizontal='left', vertical='center')
+                    sheet[f'A{row}'].style = 'Report Label'
                 
                 # Add filtered data for the new column (always add, even if 0)
                 date_col = chr(ord('A') + next_col - 1)
                 other_count = get_other_status_count(revision_type)
                 sheet[f'{date_col}{row}'] = other_count
-                sheet[f'{date_col}{row}'].font = Font(name='Calibri', size=11)
-                sheet[f'{date_col}{row}'].alignment = Alignment(horizontal='center', vertical='center')
+                sheet[f'{date_col}{row}'].style = 'Report Data'
                 
                 row += 1
             
@@ -770,9 +713,7 @@ def generate_progression_report(summary_df, output_file, config, latest_data_df=
                 # New sheet - add row header
                 actual_row = start_row
                 sheet[f'A{actual_row}'] = label
-                sheet[f'A{actual_row}'].font = Font(name='Calibri', size=11, bold=True)
-                sheet[f'A{actual_row}'].alignment = Alignment(horizontal='left', vertical='center')
-                sheet[f'A{actual_row}'].fill = PatternFill(start_color='E6E6E6', end_color='E6E6E6', fill_type='solid')
+                sheet[f'A{actual_row}'].style = 'Report Total Label'
                 # Store the position for future use
                 total_row_positions[label] = actual_row
             
@@ -783,9 +724,7 @@ def generate_progression_report(summary_df, output_file, config, latest_data_df=
             cell = sheet[f'{date_col}{actual_row}']
             if not hasattr(cell, 'coordinate') or not cell.coordinate in sheet.merged_cells:
                 sheet[f'{date_col}{actual_row}'] = total_value
-                sheet[f'{date_col}{actual_row}'].font = Font(name='Calibri', size=11, bold=True)
-                sheet[f'{date_col}{actual_row}'].alignment = Alignment(horizontal='center', vertical='center')
-                sheet[f'{date_col}{actual_row}'].fill = PatternFill(start_color='E6E6E6', end_color='E6E6E6', fill_type='solid')
+                sheet[f'{date_col}{actual_row}'].style = 'Report Total'
                 # Added total value to cell
             else:
                 print(f"  Warning: Skipping merged cell at {date_col}{actual_row} for total row {label}")
@@ -798,9 +737,7 @@ def generate_progression_report(summary_df, output_file, config, latest_data_df=
                             top_left_cell = sheet[f'{date_col}{merged_range.min_row}']
                             if not hasattr(top_left_cell, 'coordinate') or not top_left_cell.coordinate in sheet.merged_cells:
                                 sheet[f'{date_col}{merged_range.min_row}'] = total_value
-                                sheet[f'{date_col}{merged_range.min_row}'].font = Font(name='Calibri', size=11, bold=True)
-                                sheet[f'{date_col}{merged_range.min_row}'].alignment = Alignment(horizontal='center', vertical='center')
-                                sheet[f'{date_col}{merged_range.min_row}'].fill = PatternFill(start_color='E6E6E6', end_color='E6E6E6', fill_type='solid')
+                                sheet[f'{date_col}{merged_range.min_row}'].style = 'Report Total'
                                 # Added total value to merged cell
                                 break
                         else:
@@ -875,7 +812,8 @@ def generate_progression_report(summary_df, output_file, config, latest_data_df=
             sheet.column_dimensions[column_letter].width = adjusted_width
         
         # Save the workbook
-        wb.save(output_file)
+        with span('workbook save'):
+            wb.save(output_file)
         return True
         
     except Exception as e:
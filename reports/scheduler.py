@@ -0,0 +1,261 @@
+"""Parallel report scheduler.
+
+Reports are independent once a project's data is in the database, so every
+project x report-type combination is run as its own job in a process pool.
+Each job opens its own read-only database connection, loads the project
+config and calls the report function. Job output is captured and printed
+when the job finishes, and a failing job is recorded without stopping the
+others. When tracing is enabled each job records its spans (see
+utils/tracing.py) and returns them with its result.
+
+A job whose report was already written from the same inputs is not run again
+(see reports/cache.py) unless the run is forced.
+"""
+
+import cProfile
+import io
+import os
+import pstats
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import redirect_stdout, nullcontext
+from pathlib import Path
+
+from config import load_project_config, REPORT_WORKERS
+from data import DocumentDatabase
+from utils import slugify
+from utils.tracing import span, capture_spans, add_spans, is_tracing_enabled
+from .cache import get_report_cache_key, is_report_current, save_report_cache_entry, clear_report_cache_entry
+
+
+# Report types in the order they are listed and reported
+REPORT_TYPES = ['summary', 'progression', 'condensed', 'certificates', 'turnaround']
+
+# Report types that are only produced when a project has the data/settings for
+# them - a False result from these counts as skipped rather than failed
+OPTIONAL_REPORT_TYPES = ['condensed', 'certificates', 'turnaround']
+
+JOB_SUCCESS = 'success'
+JOB_SKIPPED = 'skipped'
+JOB_UNCHANGED = 'unchanged'
+JOB_FAILED = 'failed'
+
+# Functions listed in a job's log when it is profiled
+PROFILE_TOP_FUNCTIONS = 15
+
+
+def build_report_jobs(project_names, report_types=None):
+    """
+    List the jobs for a set of projects and report types.
+
+    Args:
+        project_names: Project names
+        report_types: Report types from REPORT_TYPES (default: all)
+
+    Returns:
+        List of {'project', 'report'} job dictionaries, project by project
+    """
+    report_types = report_types or REPORT_TYPES
+    return [{'project': project_name, 'report': report_type}
+            for project_name in project_names
+            for report_type in report_types]
+
+
+def get_worker_count(job_count, workers=None):
+    """
+    Number of worker processes for a run.
+
+    Args:
+        job_count: Number of jobs to run
+        workers: Requested worker count (default: config.REPORT_WORKERS, then one per CPU)
+
+    Returns:
+        int: Worker count, at least 1 and at most job_count
+    """
+    workers = workers or REPORT_WORKERS or os.cpu_count() or 1
+    return max(1, min(workers, job_count))
+
+
+def run_report_job(job, report_function, db_path='data/documents.db', output_dir='output',
+                   profile_dir=None, trace=False, force=False):
+    """
+    Run one report job (in a worker process or in-process).
+
+    Args:
+        job: Job dictionary from build_report_jobs()
+        report_function: Function called as report_function(project_name, config, output_dir, db)
+        db_path: Path to the SQLite database (opened read-only)
+        output_dir: Report output directory
+        profile_dir: If set, profile the job with cProfile, save the stats there
+            as <project>_<report>.prof and list the top functions in the job output
+        trace: Record the job's tracing spans and return them as 'spans'
+        force: Run the report even if its inputs are unchanged since it was last written
+
+    Returns:
+        Job dictionary with 'status', 'seconds', 'error', the captured 'output'
+        and the recorded 'spans'
+    """
+    start = time.perf_counter()
+    log = io.StringIO()
+    error = None
+    profiler = cProfile.Profile() if profile_dir else None
+
+    with redirect_stdout(log), (capture_spans() if trace else nullcontext([])) as spans:
+        try:
+            with span('report job', project=job['project'], report=job['report']), \
+                    DocumentDatabase.open_read_only(db_path) as db:
+                if not db.has_documents(job['project']):
+                    print(f"✗ No data for {job['project']}")
+                    status = JOB_SKIPPED
+                else:
+                    config = load_project_config(job['project'])
+                    cache_key = get_report_cache_key(db, job['project'], job['report'], config)
+                    if not force and is_report_current(output_dir, job['project'], job['report'], cache_key):
+                        print("ℹ Inputs unchanged since the last run - report kept (use --force to regenerate)")
+                        status = JOB_UNCHANGED
+                    else:
+                        status = _run_report(job, report_function, config, output_dir, db, profiler, cache_key)
+        except Exception as e:
+            status = JOB_FAILED
+            error = str(e)
+            traceback.print_exc(file=log)
+
+        # Nothing to save when the job stopped before the report ran
+        if profiler and profiler.getstats():
+            _save_profile(profiler, job, profile_dir, log)
+
+    return {
+        **job,
+        'status': status,
+        'seconds': time.perf_counter() - start,
+        'error': error,
+        'output': log.getvalue(),
+        'spans': spans,
+    }
+
+
+def _run_report(job, report_function, config, output_dir, db, profiler, cache_key):
+    """Run a job's report function, recording the report in the cache when it is written."""
+    clear_report_cache_entry(output_dir, job['project'], job['report'])
+    if profiler:
+        profiler.enable()
+    try:
+        success = report_function(job['project'], config, Path(output_dir), db)
+    finally:
+        if profiler:
+            profiler.disable()
+    if success:
+        save_report_cache_entry(output_dir, job['project'], job['report'], cache_key)
+        return JOB_SUCCESS
+    if job['report'] in OPTIONAL_REPORT_TYPES:
+        return JOB_SKIPPED
+    return JOB_FAILED
+
+
+def _save_profile(profiler, job, profile_dir, log):
+    """Save a job's profile and list its most expensive functions in the job log."""
+    Path(profile_dir).mkdir(parents=True, exist_ok=True)
+    profile_file = Path(profile_dir) / f"{slugify(job['project'])}_{job['report']}.prof"
+    profiler.dump_stats(profile_file)
+    print(f"  Profile: {profile_file}", file=log)
+    stats = pstats.Stats(profiler, stream=log)
+    stats.sort_stats('cumulative').print_stats(PROFILE_TOP_FUNCTIONS)
+
+
+def run_report_jobs(jobs, report_functions, workers=None, db_path='data/documents.db', output_dir='output',
+                    profile_dir=None, force=False):
+    """
+    Run report jobs, in parallel when more than one worker is available.
+
+    Args:
+        jobs: Jobs from build_report_jobs()
+        report_functions: Dictionary of report type -> report function
+        workers: Worker process count (see get_worker_count)
+        db_path: Path to the SQLite database
+        output_dir: Report output directory
+        profile_dir: Optional directory for per-job cProfile stats (see run_report_job)
+        force: Regenerate reports whose inputs are unchanged (see run_report_job)
+
+    Jobs are traced when tracing is enabled in the calling process; their spans
+    are merged into the caller's trace as they finish.
+
+    Returns:
+        List of job results (see run_report_job), in job order
+    """
+    if not jobs:
+        return []
+
+    Path(output_dir).mkdir(exist_ok=True)
+    workers = get_worker_count(len(jobs), workers)
+    print(f"Running {len(jobs)} report jobs with {workers} worker{'s' if workers > 1 else ''}\n")
+
+    results = [None] * len(jobs)
+    trace = is_tracing_enabled()
+
+    if workers == 1:
+        for index, job in enumerate(jobs):
+            results[index] = run_report_job(job, report_functions[job['report']], db_path, output_dir,
+                                            profile_dir, trace, force)
+            add_spans(results[index]['spans'])
+            print_job_output(results[index])
+        return results
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            executor.submit(run_report_job, job, report_functions[job['report']], db_path, output_dir,
+                            profile_dir, trace, force): index
+            for index, job in enumerate(jobs)
+        }
+        for future in as_completed(futures):
+            index = futures[future]
+            try:
+                results[index] = future.result()
+            except Exception as e:
+                # The worker itself died (e.g. out of memory) - only this job is lost
+                results[index] = {**jobs[index], 'status': JOB_FAILED, 'seconds': 0.0,
+                                  'error': str(e) or type(e).__name__, 'output': '', 'spans': []}
+            add_spans(results[index]['spans'])
+            print_job_output(results[index])
+
+    return results
+
+
+def print_job_output(result):
+    """Print a finished job's captured output under a header."""
+    print(f"--- {result['project']} / {result['report']} ({result['seconds']:.1f}s) ---")
+    if result['output']:
+        print(result['output'].rstrip())
+    print()
+
+
+def print_job_summary(results, wall_seconds=None):
+    """
+    Print the end-of-run summary of report jobs.
+
+    Args:
+        results: Job results from run_report_jobs()
+        wall_seconds: Optional elapsed time of the whole run
+    """
+    symbols = {JOB_SUCCESS: '✓', JOB_UNCHANGED: 'ℹ', JOB_SKIPPED: 'ℹ', JOB_FAILED: '✗'}
+    project_width = max([len(result['project']) for result in results] + [7])
+
+    print(f"  {'Project':<{project_width}}  {'Report':<13} {'Time':>7}  Result")
+    for result in results:
+        line = (f"{symbols[result['status']]} {result['project']:<{project_width}}  "
+                f"{result['report']:<13} {result['seconds']:>6.1f}s  {result['status']}")
+        if result['error']:
+            line += f": {result['error']}"
+        print(line)
+
+    counts = {status: sum(1 for result in results if result['status'] == status) for status in symbols}
+    print(f"\n✓ Successful: {counts[JOB_SUCCESS]}")
+    if counts[JOB_UNCHANGED]:
+        print(f"ℹ Unchanged: {counts[JOB_UNCHANGED]}")
+    if counts[JOB_SKIPPED]:
+        print(f"ℹ Skipped: {counts[JOB_SKIPPED]}")
+    if counts[JOB_FAILED]:
+        print(f"✗ Failed: {counts[JOB_FAILED]}")
+    if wall_seconds is not None:
+        job_seconds = sum(result['seconds'] for result in results)
+        print(f"Elapsed: {wall_seconds:.1f}s (report time {job_seconds:.1f}s)")
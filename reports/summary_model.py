@@ -0,0 +1,157 @@
+"""In-memory model of the summary report.
+
+Everything the Overall Summary sheet shows is computed here from the summary
+and latest-data DataFrames, so the workbook can be written in a single pass
+without saving and reading sheets back.
+"""
+
+import pandas as pd
+from datetime import datetime
+
+from utils.revisions import group_revisions
+from analyzers.snapshot_profile import build_snapshot_profile
+from utils.tracing import traced
+
+
+# Revision summary sections in sheet order: (revision group, section title)
+REVISION_SECTIONS = [
+    ('P', 'P Revision Summary'),
+    ('C', 'C Revision Summary'),
+    ('other', 'Other Revision Summary'),
+]
+
+# Status pie charts: (revision family, chart title, anchor cell)
+STATUS_CHARTS = [
+    ('P', 'P Revision Status Distribution', 'G2'),
+    ('C', 'C Revision Status Distribution', 'G27'),
+]
+
+
+def _count_value(value):
+    """Summary Data count, with missing values as 0."""
+    return 0 if pd.isna(value) else value
+
+
+def _format_export_value(value, fmt):
+    return value.strftime(fmt) if isinstance(value, datetime) else value
+
+
+def order_status_counts(status_counts, config):
+    """
+    Order grouped status counts for display.
+
+    Args:
+        status_counts: Dictionary of status category counts
+        config: Project configuration (STATUS_DISPLAY_ORDER used if present)
+
+    Returns:
+        List of (status, count) tuples
+    """
+    if config and 'STATUS_DISPLAY_ORDER' in config:
+        display_order = config['STATUS_DISPLAY_ORDER']
+        ordered_statuses = [(category, status_counts[category])
+                            for category in display_order if category in status_counts]
+        # Add any remaining statuses that weren't in display order
+        ordered_statuses += [(status, count) for status, count in status_counts.items()
+                             if status not in display_order]
+        return ordered_statuses
+
+    # Fallback to alphabetical order if no display order defined
+    return sorted(status_counts.items())
+
+
+@traced('summary.build model')
+def build_summary_model(summary_df, latest_data_df, config, snapshot_profile=None):
+    """
+    Compute the contents of the Overall Summary sheet.
+
+    Args:
+        summary_df: DataFrame with summary data over time (last row is reported)
+        latest_data_df: DataFrame with latest document data
+        config: Project configuration dictionary
+        snapshot_profile: Optional SnapshotProfile of latest_data_df (built if not given)
+
+    Returns:
+        Dictionary with 'title', 'export', 'total_documents', 'revision_sections',
+        'file_type_section' (or None) and 'status_charts'
+    """
+    profile = snapshot_profile or build_snapshot_profile(latest_data_df, config)
+    latest_row = summary_df.iloc[-1]
+
+    project_title = config.get('PROJECT_TITLE', '')
+    if project_title:
+        title = f"{project_title}\nDocument Register Overall Summary"
+    else:
+        title = "Document Register Overall Summary"
+
+    export_date = _format_export_value(latest_row['Date'], "%d-%m-%Y")
+    export_time = _format_export_value(latest_row['Time'], "%H-%M-%S")
+
+    # Revision summaries - counts from the Summary Data row, statuses from the profile
+    rev_columns = [col for col in summary_df.columns if col.startswith('Rev_')]
+    revision_groups = group_revisions(rev_columns)
+
+    revision_sections = []
+    for group, section_title in REVISION_SECTIONS:
+        columns = revision_groups[group]
+        revisions = [(col.replace('Rev_', ''), _count_value(latest_row.get(col, 0))) for col in columns]
+        status_counts = profile.grouped_status_counts('revision', [name for name, _ in revisions])
+        statuses = order_status_counts(status_counts, config)
+        revision_sections.append({
+            'title': section_title,
+            # Only revisions that actually have documents get a row
+            'revisions': [(name, count) for name, count in revisions if count > 0],
+            'total': sum(count for _, count in revisions),
+            'statuses': statuses,
+            'status_total': sum(count for _, count in statuses),
+        })
+
+    file_type_section = None
+    file_type_settings = config.get('FILE_TYPE_SETTINGS', {})
+    if file_type_settings.get('include_in_summary', False):
+        if file_type_settings['column_name'] == profile.file_type_column:
+            file_type_counts = profile.file_type_counts()
+            file_type_section = {
+                'title': file_type_settings['summary_title'],
+                'counts': list(file_type_counts.items()),
+                'total': sum(file_type_counts.values()),
+            }
+
+    status_charts = []
+    for revision_type, chart_title, position in STATUS_CHARTS:
+        counts = profile.grouped_status_counts('family', [revision_type])
+        if counts:
+            status_charts.append({
+                'revision_type': revision_type,
+                'title': chart_title,
+                'position': position,
+                'counts': counts,
+            })
+
+    return {
+        'title': title,
+        'export': f'Data Export: {export_date} {export_time}',
+        'total_documents': profile.total,
+        'revision_sections': revision_sections,
+        'file_type_section': file_type_section,
+        'status_charts': status_charts,
+    }
+
+
+def get_dataframe_column_widths(df):
+    """
+    Column widths for a sheet written from a DataFrame (header row included).
+
+    Args:
+        df: DataFrame that is written with index=False
+
+    Returns:
+        List of widths, one per column
+    """
+    widths = []
+    for column in df.columns:
+        values = df[column]
+        lengths = values[values.notna()].astype(str).str.len()
+        max_length = max(len(str(column)), int(lengths.max()) if not lengths.empty else 0)
+        widths.append(max_length + 2)
+    return widths
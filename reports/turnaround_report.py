@@ -0,0 +1,56 @@
+"""Turnaround report generation module.
+
+Lists how long documents stay in each status category and how long each
+revision stays current, computed from the document history (see
+analyzers/turnaround.py), plus how long every current document has had its
+revision and status.
+"""
+
+import time
+
+from .summary_model import get_dataframe_column_widths
+from .writers import data_sheet, get_writer_backend, write_report_workbook
+
+
+def save_turnaround_report(status_df, revision_df, status_ages_df, output_file, config, max_retries=3):
+    """
+    Save the turnaround report, retrying while the file is in use.
+
+    Sheets:
+    - Status Turnaround: days spent per status category
+    - Revision Turnaround: days each revision stayed current, per revision family
+    - Current Status Age: days each current document has had its revision and status
+
+    Args:
+        status_df: DataFrame from analyzers.turnaround.calculate_status_turnaround
+        revision_df: DataFrame from analyzers.turnaround.calculate_revision_turnaround
+        status_ages_df: DataFrame from analyzers.turnaround.get_open_status_ages
+        output_file: Path to output Excel file
+        config: Project configuration dictionary
+        max_retries: Maximum number of retry attempts
+
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    sheets = [
+        data_sheet(name, df, get_dataframe_column_widths(df))
+        for name, df in [
+            ('Status Turnaround', status_df),
+            ('Revision Turnaround', revision_df),
+            ('Current Status Age', status_ages_df),
+        ]
+    ]
+
+    for attempt in range(max_retries):
+        try:
+            write_report_workbook(output_file, sheets, get_writer_backend(config))
+            return True
+
+        except PermissionError:
+            if attempt < max_retries - 1:
+                print(f"File {output_file} is in use. Waiting before retry...")
+                time.sleep(2)
+            else:
+                print(f"Could not save to {output_file} - file is in use.")
+                return False
+    return False
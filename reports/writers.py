@@ -0,0 +1,202 @@
+"""Workbook writer backends for the report modules.
+
+Reports are described as an ordered list of sheets. Each sheet is either a
+bulk data sheet (a DataFrame) or a styled sheet (a function that renders onto
+an openpyxl worksheet). The backend decides how they are written:
+
+- 'openpyxl': pandas + openpyxl in normal mode (full cell object graph)
+- 'write_only': openpyxl write_only mode - data rows are streamed to disk;
+  styled sheets are rendered on a scratch worksheet and streamed across
+  with their styles, merges, charts and page setup
+"""
+
+from copy import copy
+
+import pandas as pd
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import NamedStyle
+from openpyxl.utils import get_column_letter
+
+from utils.tracing import traced
+
+
+WRITER_BACKENDS = ['openpyxl', 'write_only']
+DEFAULT_WRITER_BACKEND = 'write_only'
+
+
+def data_sheet(name, df, column_widths=None):
+    """
+    Describe a bulk data sheet.
+
+    Args:
+        name: Sheet name
+        df: DataFrame written with a header row and no index
+        column_widths: Optional list of column widths
+
+    Returns:
+        Sheet specification for write_report_workbook
+    """
+    return {'name': name, 'data': df, 'column_widths': column_widths}
+
+
+def styled_sheet(name, render):
+    """
+    Describe a styled sheet.
+
+    Args:
+        name: Sheet name
+        render: Function taking an empty openpyxl worksheet and filling it
+
+    Returns:
+        Sheet specification for write_report_workbook
+    """
+    return {'name': name, 'render': render}
+
+
+def get_writer_backend(config=None, backend=None):
+    """
+    Resolve the writer backend for a report.
+
+    Args:
+        config: Project configuration (REPORT_SETTINGS['writer_backend'] if set)
+        backend: Explicit backend name, overrides the config
+
+    Returns:
+        str: Backend name from WRITER_BACKENDS
+    """
+    if backend is None and config:
+        backend = config.get('REPORT_SETTINGS', {}).get('writer_backend')
+    backend = backend or DEFAULT_WRITER_BACKEND
+    if backend not in WRITER_BACKENDS:
+        raise ValueError(f"Unknown writer backend '{backend}' (expected one of {', '.join(WRITER_BACKENDS)})")
+    return backend
+
+
+@traced('write workbook')
+def write_report_workbook(output_file, sheets, backend=None):
+    """
+    Write a report workbook in one pass.
+
+    Args:
+        output_file: Path to the output Excel file (replaced if it exists)
+        sheets: Sheet specifications from data_sheet()/styled_sheet(), in workbook order
+        backend: Writer backend name (default DEFAULT_WRITER_BACKEND)
+
+    Raises:
+        PermissionError: If the output file is locked (e.g. open in Excel)
+    """
+    backend = get_writer_backend(backend=backend)
+    if backend == 'write_only':
+        _write_write_only(output_file, sheets)
+    else:
+        _write_openpyxl(output_file, sheets)
+
+
+def _write_openpyxl(output_file, sheets):
+    with pd.ExcelWriter(output_file, engine='openpyxl') as writer:
+        for sheet in sheets:
+            if 'data' in sheet:
+                sheet['data'].to_excel(writer, sheet_name=sheet['name'], index=False)
+                ws = writer.sheets[sheet['name']]
+                for column_index, width in enumerate(sheet['column_widths'] or [], start=1):
+                    ws.column_dimensions[get_column_letter(column_index)].width = width
+            else:
+                sheet['render'](writer.book.create_sheet(sheet['name']))
+
+
+def _write_write_only(output_file, sheets):
+    wb = Workbook(write_only=True)
+    # Styled sheets need a normal worksheet to render on
+    scratch = Workbook()
+
+    for sheet in sheets:
+        ws = wb.create_sheet(sheet['name'])
+        if 'data' in sheet:
+            _stream_dataframe(ws, sheet['data'], sheet['column_widths'])
+        else:
+            source = scratch.create_sheet(sheet['name'])
+            sheet['render'](source)
+            _copy_named_styles(scratch, wb)
+            _stream_worksheet(source, ws)
+
+    wb.save(output_file)
+
+
+def _stream_dataframe(ws, df, column_widths=None):
+    """Append a DataFrame to a write-only worksheet (header row, no index)."""
+    for column_index, width in enumerate(column_widths or [], start=1):
+        ws.column_dimensions[get_column_letter(column_index)].width = width
+
+    # Plain header row, as DataFrame.to_excel writes it
+    ws.append(list(df.columns))
+
+    if df.empty:
+        return
+
+    # Missing values become empty cells, as with DataFrame.to_excel
+    values = df.astype(object).where(df.notna(), None)
+    for row in values.itertuples(index=False, name=None):
+        ws.append(row)
+
+
+def _copy_named_styles(source_wb, wb):
+    """Register the named styles of source_wb missing from wb (see styles.register_named_styles)."""
+    existing = set(wb.style_names)
+    for style in source_wb._named_styles:
+        if style.name not in existing:
+            wb.add_named_style(NamedStyle(
+                name=style.name,
+                font=copy(style.font),
+                fill=copy(style.fill),
+                border=copy(style.border),
+                alignment=copy(style.alignment),
+                number_format=style.number_format,
+                protection=copy(style.protection)
+            ))
+
+
+def _stream_worksheet(source, ws):
+    """Copy a rendered worksheet into a write-only worksheet."""
+    # Sheet-level settings must be in place before the first row is written
+    ws.sheet_properties = copy(source.sheet_properties)
+    for name in source.page_setup.__attrs__:
+        setattr(ws.page_setup, name, getattr(source.page_setup, name))
+    ws.page_margins = copy(source.page_margins)
+    ws.print_options = copy(source.print_options)
+    if source.freeze_panes:
+        ws.freeze_panes = source.freeze_panes
+
+    for key, dimension in source.column_dimensions.items():
+        if dimension.customWidth:
+            ws.column_dimensions[key].width = dimension.width
+    for key, dimension in source.row_dimensions.items():
+        if dimension.height is not None:
+            ws.row_dimensions[key].height = dimension.height
+
+    for merged_range in source.merged_cells.ranges:
+        ws.merged_cells.add(merged_range.coord)
+
+    for source_row in source.iter_rows(min_row=1, max_row=source.max_row, max_col=source.max_column):
+        row = []
+        for source_cell in source_row:
+            if source_cell.value is None and not source_cell.has_style:
+                row.append(None)
+                continue
+            cell = WriteOnlyCell(ws, value=source_cell.value)
+            if source_cell.has_style:
+                # Named style first (registered by _copy_named_styles), then
+                # any per-cell overrides on top of it
+                if source_cell.style != 'Normal':
+                    cell.style = source_cell.style
+                cell.font = copy(source_cell.font)
+                cell.fill = copy(source_cell.fill)
+                cell.border = copy(source_cell.border)
+                cell.alignment = copy(source_cell.alignment)
+                cell.number_format = source_cell.number_format
+                cell.protection = copy(source_cell.protection)
+            row.append(cell)
+        ws.append(row)
+
+    for chart in source._charts:
+        ws.add_chart(chart)
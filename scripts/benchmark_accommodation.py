@@ -0,0 +1,275 @@
+"""Benchmark accommodation schedule parsing and check it against the row-by-row parser.
+
+Generates a large multi-phase accommodation schedule shaped by each project's
+ACCOMMODATION_SCHEDULE_CONFIG (its column names, prefixes and extraction
+patterns, plus messy rows: missing and duplicate apartments, padded values,
+multi-line floors, unparseable bedroom codes) and parses it with:
+
+- rows: the previous parser, walking the schedule with iterrows() and the
+  per-value clean_apartment_number()/clean_floor_number() helpers
+- vectorized: build_accommodation_data() in update_accommodation_data.py
+
+The two must build the same ACCOMMODATION_DATA; the script exits with 1 if
+they differ for any project.
+
+Usage:
+    python scripts/benchmark_accommodation.py
+    python scripts/benchmark_accommodation.py --rows 50000 --projects OvalBlockB,HollowayPark
+"""
+
+import sys
+import argparse
+import importlib.util
+import random
+import re
+import time
+from pathlib import Path
+
+import pandas as pd
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config import CONFIGS_DIR
+from update_accommodation_data import (build_accommodation_data, clean_apartment_number, clean_floor_number,
+                                       get_available_projects)
+
+DEFAULT_ROWS = 20000
+DEFAULT_REPEAT = 3
+
+
+def load_schedule_config(project_name):
+    """A project's ACCOMMODATION_SCHEDULE_CONFIG."""
+    spec = importlib.util.spec_from_file_location(project_name, CONFIGS_DIR / f"{project_name}.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.ACCOMMODATION_SCHEDULE_CONFIG
+
+
+def build_schedule(schedule_config, rows, seed=0):
+    """Synthetic accommodation schedule with the columns and formats a config expects."""
+    rng = random.Random(seed)
+    column_mapping = schedule_config.get('column_mapping', {})
+    apartment_cleaning = schedule_config.get('apartment_cleaning', {})
+    floor_prefix = schedule_config.get('floor_cleaning', {}).get('remove_prefix') or ''
+    type_prefix = schedule_config.get('apartment_type_cleaning', {}).get('remove_prefix') or ''
+    coded_bedrooms = bool(schedule_config.get('bedrooms_cleaning', {}).get('extract_pattern'))
+    numbered = bool(apartment_cleaning.get('extract_pattern'))
+
+    columns = {column: [] for column in column_mapping.values()}
+    for index in range(rows):
+        phase = f"Phase {1 + index * 4 // rows}"
+        block = rng.choice('ABCDEFG')
+        floor = rng.randrange(0, 30)
+        beds = rng.randrange(0, 4)
+        if numbered:
+            apartment = rng.choice([index + 1, f"Apt {index + 1}", f" {index + 1} "])
+        else:
+            apartment = f"{block}.{index % 9 + 1}-{floor}-{index}"
+        values = {
+            'apartment': apartment,
+            'phase': phase,
+            'block': rng.choice([block, block.lower(), f" {block} "]),
+            'floor': rng.choice([f"{floor_prefix}{floor:02d}", floor, float(floor), f"{floor}\nB3+4"]),
+            'apartment_type': f"{type_prefix}{beds}B{beds + 1}P",
+            'bedrooms': f"{beds}B{beds + 1}P" if coded_bedrooms else rng.choice([beds, str(beds), 'Studio']),
+            'tenure': rng.choice(['Private', 'Affordable', 'Shared Ownership ']),
+        }
+        # Messy rows: missing values, a duplicate apartment, apartment 0
+        if index % 97 == 0:
+            values[rng.choice(list(values))] = None
+        if index % 211 == 0:
+            values['apartment'] = columns[column_mapping['apartment']][-1] if index else 0
+        for field, column in column_mapping.items():
+            columns[column].append(values.get(field))
+    return pd.DataFrame(columns)
+
+
+def parse_schedule_rows(df, schedule_config, source_file):
+    """The previous row-by-row parser, kept as the reference for build_accommodation_data()."""
+    column_mapping = schedule_config.get('column_mapping', {})
+    apartment_col = column_mapping.get('apartment')
+    phase_col = column_mapping.get('phase')
+    block_col = column_mapping.get('block')
+    floor_col = column_mapping.get('floor')
+    type_col = column_mapping.get('apartment_type')
+    bedrooms_col = column_mapping.get('bedrooms')
+    tenure_col = column_mapping.get('tenure')
+    apartment_cleaning = schedule_config.get('apartment_cleaning', {})
+    floor_cleaning = schedule_config.get('floor_cleaning', {})
+    bedrooms_cleaning = schedule_config.get('bedrooms_cleaning', {})
+    apartment_type_cleaning = schedule_config.get('apartment_type_cleaning', {})
+    custom_extractors = schedule_config.get('custom_extractors', {})
+
+    accommodation_data = {
+        'total_apartments': 0,
+        'last_updated': None,
+        'source_file': source_file,
+        'phases': {},
+        'apartment_types': {},
+        'apartment_lookup': {}
+    }
+    phase_stats = {}
+    type_stats = {}
+    tenure_stats = {}
+
+    valid_apartments = 0
+    for _, row in df.iterrows():
+        apt_num = clean_apartment_number(row.get(apartment_col), apartment_cleaning)
+        if not apt_num:
+            continue
+        valid_apartments += 1
+
+        phase = str(row.get(phase_col)).strip() if phase_col and pd.notna(row.get(phase_col)) else None
+        block = str(row.get(block_col)).strip().upper() if block_col and pd.notna(row.get(block_col)) else None
+        floor = clean_floor_number(row.get(floor_col), floor_cleaning) if floor_col else None
+        apt_type = str(row.get(type_col)).strip() if type_col and pd.notna(row.get(type_col)) else None
+        tenure = str(row.get(tenure_col)).strip() if tenure_col and pd.notna(row.get(tenure_col)) else None
+
+        if 'block' in custom_extractors and not block:
+            block_config = custom_extractors['block']
+            source_col = block_config.get('source_column')
+            pattern = block_config.get('pattern')
+            if source_col and pattern and pd.notna(row.get(source_col)):
+                match = re.search(pattern, str(row.get(source_col)).strip())
+                if match:
+                    block = block_config.get('format', '{0}').format(*match.groups())
+        if 'floor' in custom_extractors and not floor:
+            floor_config = custom_extractors['floor']
+            source_col = floor_config.get('source_column')
+            pattern = floor_config.get('pattern')
+            if source_col and pattern and pd.notna(row.get(source_col)):
+                match = re.search(pattern, str(row.get(source_col)).strip())
+                if match:
+                    floor = match.group(1)
+                    if floor_config.get('convert_to_int', False):
+                        try:
+                            floor = int(floor)
+                        except ValueError:
+                            pass
+
+        if apt_type and apartment_type_cleaning:
+            prefix_to_remove = apartment_type_cleaning.get('remove_prefix')
+            if prefix_to_remove and apt_type.startswith(prefix_to_remove):
+                apt_type = apt_type[len(prefix_to_remove):]
+
+        bedrooms = None
+        if bedrooms_col and pd.notna(row.get(bedrooms_col)):
+            bedrooms_value = str(row.get(bedrooms_col)).strip()
+            extract_pattern = bedrooms_cleaning.get('extract_pattern')
+            if extract_pattern:
+                match = re.search(extract_pattern, bedrooms_value)
+                if match:
+                    try:
+                        bedrooms = int(match.group(1))
+                    except (ValueError, TypeError, IndexError):
+                        pass
+            else:
+                try:
+                    bedrooms = int(bedrooms_value)
+                except (ValueError, TypeError):
+                    pass
+
+        accommodation_data['apartment_lookup'][apt_num] = {
+            'phase': phase, 'block': block, 'floor': floor, 'type': apt_type, 'bedrooms': bedrooms, 'tenure': tenure
+        }
+
+        phase_key = phase if phase else 'Default'
+        phase_entry = phase_stats.setdefault(phase_key, {'apartments': [], 'blocks': {}})
+        phase_entry['apartments'].append(apt_num)
+        if block:
+            block_entry = phase_entry['blocks'].setdefault(block, {'apartments': [], 'floors': set()})
+            block_entry['apartments'].append(apt_num)
+            if floor is not None:
+                block_entry['floors'].add(floor)
+        if apt_type:
+            type_stats.setdefault(apt_type, {'apartments': [], 'bedrooms': bedrooms})['apartments'].append(apt_num)
+        if tenure:
+            tenure_stats.setdefault(tenure, {'apartments': []})['apartments'].append(apt_num)
+
+    accommodation_data['total_apartments'] = valid_apartments
+
+    def sort_apartments(apt_list):
+        try:
+            return sorted(apt_list)
+        except TypeError:
+            return sorted(apt_list, key=str)
+
+    for phase, stats in phase_stats.items():
+        phase_data = {'apartment_count': len(stats['apartments']),
+                      'apartments': sort_apartments(stats['apartments']), 'blocks': {}}
+        for block, block_data in stats['blocks'].items():
+            try:
+                sorted_floors = sorted(block_data['floors'])
+            except TypeError:
+                sorted_floors = sorted(block_data['floors'], key=lambda x: int(x) if x is not None else -1)
+            phase_data['blocks'][block] = {'apartment_count': len(block_data['apartments']),
+                                           'apartments': sort_apartments(block_data['apartments']),
+                                           'floors': sorted_floors}
+        accommodation_data['phases'][phase] = phase_data
+    for apt_type, stats in type_stats.items():
+        accommodation_data['apartment_types'][apt_type] = {
+            'count': len(stats['apartments']), 'bedrooms': stats['bedrooms'],
+            'apartments': sort_apartments(stats['apartments'])
+        }
+    accommodation_data['tenures'] = {
+        tenure: {'count': len(stats['apartments']), 'apartments': sort_apartments(stats['apartments'])}
+        for tenure, stats in tenure_stats.items()
+    }
+    return accommodation_data
+
+
+def same_data(expected, actual):
+    """Compare ACCOMMODATION_DATA structures, including key order and value types."""
+    expected = dict(expected, last_updated=None)
+    actual = dict(actual, last_updated=None)
+    return repr(expected) == repr(actual)
+
+
+def best_time(parse, df, schedule_config, repeat):
+    """Best wall time of repeat parses, and the last result."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = parse(df, schedule_config, 'benchmark.xlsx')
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark accommodation schedule parsing',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+    parser.add_argument('--rows', type=int, default=DEFAULT_ROWS,
+                        help=f'Schedule rows per project (default: {DEFAULT_ROWS})')
+    parser.add_argument('--projects', type=lambda value: value.split(','),
+                        help='Comma-separated project names (default: every configured project)')
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT,
+                        help=f'Parses per parser, best time reported (default: {DEFAULT_REPEAT})')
+    args = parser.parse_args()
+
+    projects = args.projects or sorted(get_available_projects())
+    failed = []
+
+    print(f"\n{'Project':<22} {'Rows (s)':>9} {'Vectorized (s)':>15} {'Speedup':>8}  Result")
+    for project_name in projects:
+        schedule_config = load_schedule_config(project_name)
+        df = build_schedule(schedule_config, args.rows)
+        rows_time, expected = best_time(parse_schedule_rows, df, schedule_config, 1)
+        vectorized_time, actual = best_time(build_accommodation_data, df, schedule_config, args.repeat)
+        same = same_data(expected, actual)
+        if not same:
+            failed.append(project_name)
+        print(f"{project_name:<22} {rows_time:>9.3f} {vectorized_time:>15.3f} "
+              f"{rows_time / vectorized_time:>7.1f}x  {'same' if same else 'DIFFERENT'}")
+
+    if failed:
+        print(f"\n✗ Vectorized parser differs for: {', '.join(failed)}")
+        sys.exit(1)
+    print("\n✓ Vectorized parser matches the row-by-row parser")
+
+
+if __name__ == '__main__':
+    main()
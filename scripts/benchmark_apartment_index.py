@@ -0,0 +1,137 @@
+"""Benchmark the apartment index against the accommodation data lists and lookup.
+
+Builds a categorized certificate table (apartment numbers - some outside the
+schedule or missing - and categories) for each project with a numbered
+apartment lookup, then answers the same questions two ways:
+
+- lists: membership tests against the ACCOMMODATION_DATA apartment lists and
+  per-document dictionary lookups in apartment_lookup
+- index: ApartmentIndex (analyzers/apartment_index.py) positions, attribute
+  join and per-floor/type/tenure coverage
+
+The answers must match; the script exits with 1 if they differ.
+
+Usage:
+    python scripts/benchmark_apartment_index.py
+    python scripts/benchmark_apartment_index.py --documents 500000 --projects GreenwichPeninsula
+"""
+
+import sys
+import argparse
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config import get_accommodation_data, load_project_config
+from analyzers.apartment_index import ApartmentIndex
+from scripts.db_manager import PROJECT_NAMES
+
+DEFAULT_DOCUMENTS = 100000
+COVERAGE_FIELDS = ['floor', 'type', 'tenure']
+CATEGORIES = ['Fire Alarm', 'Electrical', 'Water Quality']
+
+
+def build_documents(accommodation_data, documents, seed=0):
+    """Categorized certificates spread over the scheduled apartments (and a few others)."""
+    rng = np.random.default_rng(seed)
+    apartments = np.array(list(accommodation_data['apartment_lookup']), dtype=object)
+    numbers = rng.choice(apartments, documents).astype(object)
+    # Unknown apartments and documents without an apartment number
+    numbers[rng.random(documents) < 0.05] = 9999
+    numbers[rng.random(documents) < 0.05] = None
+    categories = rng.choice(np.array(CATEGORIES + [None], dtype=object), documents)
+    return pd.DataFrame({'category': categories, 'apartment_number': numbers})
+
+
+def answer_with_lists(accommodation_data, documents):
+    """Membership, attributes and coverage with the apartment lists and lookup dictionary."""
+    lookup = accommodation_data['apartment_lookup']
+    scheduled = [apartment for phase in accommodation_data['phases'].values()
+                 for block in phase['blocks'].values() for apartment in block['apartments']]
+    block_of = {}
+    for phase in accommodation_data['phases'].values():
+        for block_name, block in phase['blocks'].items():
+            for apartment in block['apartments']:
+                block_of.setdefault(apartment, block_name)
+
+    answers = {'blocks': [], 'attributes': [], 'coverage': {}}
+    seen = {field: {} for field in COVERAGE_FIELDS}
+    for category, apartment in zip(documents['category'], documents['apartment_number']):
+        # Which block lists hold the apartment - a scan of the lists
+        answers['blocks'].append(block_of[apartment] if apartment in scheduled else None)
+        attributes = lookup.get(apartment)
+        answers['attributes'].append(attributes['floor'] if attributes else None)
+        if attributes and pd.notna(category):
+            for field in COVERAGE_FIELDS:
+                seen[field].setdefault((attributes[field], category), set()).add(apartment)
+    for field in COVERAGE_FIELDS:
+        answers['coverage'][field] = {key: len(apartments) for key, apartments in seen[field].items()
+                                      if key[0] is not None}
+    return answers
+
+
+def answer_with_index(accommodation_data, documents):
+    """The same answers from an ApartmentIndex."""
+    index = ApartmentIndex(accommodation_data)
+    attributes = index.attributes(documents['apartment_number'], ['block', 'floor'])
+    answers = {
+        'blocks': attributes['block'].tolist(),
+        'attributes': attributes['floor'].tolist(),
+        'coverage': {},
+    }
+    for field in COVERAGE_FIELDS:
+        table = index.coverage(documents, field, CATEGORIES).drop(columns='apartments')
+        answers['coverage'][field] = {key: int(count) for key, count in table.stack().items() if count}
+    return answers
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return time.perf_counter() - start, result
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark the apartment index',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+    parser.add_argument('--documents', type=int, default=DEFAULT_DOCUMENTS,
+                        help=f'Categorized documents per project (default: {DEFAULT_DOCUMENTS})')
+    parser.add_argument('--projects', type=lambda value: value.split(','),
+                        help='Comma-separated project names (default: every project)')
+    args = parser.parse_args()
+
+    failed = []
+    print(f"\n{'Project':<22} {'Apartments':>10} {'Ranges':>7} {'Lists (s)':>10} {'Index (s)':>10} "
+          f"{'Speedup':>8}  Result")
+    for project_name in args.projects or sorted(PROJECT_NAMES.values()):
+        accommodation_data = get_accommodation_data(load_project_config(project_name))
+        index = ApartmentIndex(accommodation_data)
+        if not len(index):
+            print(f"{project_name:<22} {'no numbered apartment lookup - skipped':>50}")
+            continue
+
+        documents = build_documents(accommodation_data, args.documents)
+        lists_time, expected = timed(answer_with_lists, accommodation_data, documents)
+        index_time, actual = timed(answer_with_index, accommodation_data, documents)
+        same = expected == actual
+        if not same:
+            failed.append(project_name)
+        print(f"{project_name:<22} {len(index):>10} {len(index.ranges):>7} {lists_time:>10.3f} "
+              f"{index_time:>10.3f} {lists_time / index_time:>7.1f}x  {'same' if same else 'DIFFERENT'}")
+
+    if failed:
+        print(f"\n✗ Apartment index differs for: {', '.join(failed)}")
+        sys.exit(1)
+    print("\n✓ Apartment index matches the accommodation data lists")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,217 @@
+"""Benchmark report reads running alongside an import.
+
+Synthetic registers are generated with scripts/generate_synthetic_register.py.
+The first project is imported up front so there is something to read, then the
+remaining projects are imported twice per storage mode:
+
+- alone, to time the import itself
+- while reader processes repeat the report queries in a loop (the same
+  read-only connections report workers use)
+
+Modes:
+
+- rollback: SQLite defaults - rollback journal, synchronous=FULL, no pragmas
+  (how connections were opened before storage profiles)
+- wal: the 'bulk_import' storage profile for the import and 'read_only' for
+  the readers (see data.database.STORAGE_PROFILES)
+
+For each mode the script prints the import time alone and with readers, the
+read rounds per second before and during the import, the slowest read round
+and the reads that failed with "database is locked".
+
+Usage:
+    python scripts/benchmark_concurrency.py
+    python scripts/benchmark_concurrency.py --documents 20000 --snapshots 6 --readers 4
+"""
+
+import sys
+import argparse
+import io
+import multiprocessing
+import os
+import sqlite3
+import tempfile
+import time
+from contextlib import redirect_stdout
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from data import DocumentDatabase
+from data.database import MAIN_REPORT_CLASS
+import scripts.db_manager as db_manager
+from scripts.generate_synthetic_register import generate_project_registers, parse_project_codes
+
+DEFAULT_DOCUMENTS = 5000
+DEFAULT_SNAPSHOTS = 4
+DEFAULT_PROJECTS = ['GP', 'HP']
+DEFAULT_READERS = 2
+
+# Seconds the readers run before the import starts
+IDLE_SECONDS = 2.0
+
+# Storage profiles per mode: (import connections, reader connections)
+MODES = {
+    'rollback': ({'journal_mode': 'DELETE'}, {}),
+    'wal': ('bulk_import', 'read_only'),
+}
+
+
+def read_reports(db_path, storage_profile, stop, results):
+    """
+    Repeat the report queries until stopped (runs in a reader process).
+
+    Puts a list of (finished at, seconds) per read round and the number of
+    rounds that failed because the database was locked on the results queue.
+    """
+    rounds = []
+    locked = 0
+    while not stop.is_set():
+        start = time.perf_counter()
+        try:
+            with DocumentDatabase(db_path, read_only=True, storage_profile=storage_profile) as db:
+                for project_name in db.get_all_projects():
+                    db.get_project_stats(project_name)
+                    for snapshot_date, snapshot_time in db.get_snapshots(project_name):
+                        db.get_snapshot_counts(project_name, snapshot_date, snapshot_time,
+                                               doc_class=MAIN_REPORT_CLASS)
+        except sqlite3.OperationalError as e:
+            if 'locked' not in str(e):
+                raise
+            locked += 1
+            continue
+        rounds.append((time.time(), time.perf_counter() - start))
+    results.put((rounds, locked))
+
+
+def import_projects(project_codes, db_path):
+    """Import the projects' registers, returning the seconds taken."""
+    start = time.perf_counter()
+    with redirect_stdout(io.StringIO()):
+        for project_code in project_codes:
+            db_manager.import_project_files(project_code, db_manager.PROJECT_NAMES[project_code], db_path=db_path)
+    return time.perf_counter() - start
+
+
+def prepare_database(db_path, import_profile, seed_project):
+    """Create a database in the mode's journal mode and import the seed project."""
+    with redirect_stdout(io.StringIO()):
+        db_manager.initialize_database(db_path)
+    # Switch the journal mode while nothing else is connected
+    DocumentDatabase(db_path, storage_profile=import_profile).close()
+    import_projects([seed_project], db_path)
+
+
+def run_mode(mode, project_codes, work_dir, readers):
+    """
+    Time the import alone and alongside reader processes in one storage mode.
+
+    Args:
+        mode: Key of MODES
+        project_codes: Project codes; the first is imported before timing
+        work_dir: Directory holding the generated input folder
+        readers: Number of reader processes
+
+    Returns:
+        Dictionary of results
+    """
+    import_profile, read_profile = MODES[mode]
+    seed_project, timed_projects = project_codes[0], project_codes[1:]
+    db_manager.IMPORT_STORAGE_PROFILE = import_profile
+
+    alone_db = str(Path(work_dir) / f'{mode}_alone.db')
+    prepare_database(alone_db, import_profile, seed_project)
+    import_alone = import_projects(timed_projects, alone_db)
+
+    shared_db = str(Path(work_dir) / f'{mode}_shared.db')
+    prepare_database(shared_db, import_profile, seed_project)
+
+    context = multiprocessing.get_context('spawn')
+    stop = context.Event()
+    results = context.Queue()
+    processes = [context.Process(target=read_reports, args=(shared_db, read_profile, stop, results))
+                 for _ in range(readers)]
+    for process in processes:
+        process.start()
+
+    time.sleep(IDLE_SECONDS)
+    import_start = time.time()
+    import_shared = import_projects(timed_projects, shared_db)
+    import_end = time.time()
+    stop.set()
+
+    reader_results = [results.get() for _ in processes]
+    for process in processes:
+        process.join()
+
+    rounds = [round_ for reader_rounds, _ in reader_results for round_ in reader_rounds]
+    idle = [seconds for finished, seconds in rounds if finished < import_start]
+    during = [seconds for finished, seconds in rounds if import_start <= finished <= import_end]
+    # Readers start at different times (process start-up), so the idle window
+    # runs from the first round's start
+    reads_started = min((finished - seconds for finished, seconds in rounds), default=import_start)
+    return {
+        'mode': mode,
+        'import_alone': import_alone,
+        'import_shared': import_shared,
+        'reads_idle': len(idle) / max(import_start - reads_started, 1e-9),
+        'reads_during': len(during) / (import_end - import_start),
+        'slowest_read': max(during, default=0.0),
+        'locked': sum(locked for _, locked in reader_results),
+    }
+
+
+def print_results(results):
+    """Print one line of results per mode."""
+    print(f"\n{'Mode':<10} {'Import (s)':>11} {'With reads':>11} {'Reads/s idle':>13} "
+          f"{'Reads/s import':>15} {'Slowest (s)':>12} {'Locked':>7}")
+    for result in results:
+        print(f"{result['mode']:<10} {result['import_alone']:>11.2f} {result['import_shared']:>11.2f} "
+              f"{result['reads_idle']:>13.1f} {result['reads_during']:>15.1f} "
+              f"{result['slowest_read']:>12.2f} {result['locked']:>7}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark report reads running alongside an import',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+    parser.add_argument('--documents', type=int, default=DEFAULT_DOCUMENTS,
+                        help=f'Documents per project register (default: {DEFAULT_DOCUMENTS})')
+    parser.add_argument('--snapshots', type=int, default=DEFAULT_SNAPSHOTS,
+                        help=f'Snapshots per project (default: {DEFAULT_SNAPSHOTS})')
+    parser.add_argument('--projects', type=parse_project_codes, default=DEFAULT_PROJECTS,
+                        help=f"Comma-separated project codes, the first imported before timing "
+                             f"(default: {','.join(DEFAULT_PROJECTS)})")
+    parser.add_argument('--readers', type=int, default=DEFAULT_READERS,
+                        help=f'Reader processes (default: {DEFAULT_READERS})')
+    args = parser.parse_args()
+
+    if len(args.projects) < 2:
+        parser.error('--projects needs at least two projects (one to read, one to import)')
+
+    results = []
+    with tempfile.TemporaryDirectory() as work_dir:
+        print(f"Generating {args.documents:,} documents x {args.snapshots} snapshots "
+              f"for {', '.join(args.projects)}...")
+        for project_code in args.projects:
+            generate_project_registers(project_code, Path(work_dir) / 'input',
+                                       documents=args.documents, snapshots=args.snapshots)
+
+        # db_manager reads the project folders relative to the working directory
+        previous_dir = os.getcwd()
+        os.chdir(work_dir)
+        try:
+            for mode in MODES:
+                print(f"Running {mode} with {args.readers} readers...")
+                results.append(run_mode(mode, args.projects, work_dir, args.readers))
+        finally:
+            os.chdir(previous_dir)
+
+    print_results(results)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,313 @@
+"""End-to-end pipeline benchmark on synthetic registers.
+
+For each scale (1x, 10x, 100x the base register size) synthetic registers are
+generated with scripts/generate_synthetic_register.py, then the pipeline is
+timed stage by stage:
+
+- ingest: importing every register through db_manager
+- changes: detecting document changes between each pair of consecutive
+  snapshots (also part of ingest; timed on its own to keep the diff fast)
+- queries: the database queries the reports make (project stats, latest
+  documents, snapshot list, main-report and certificate documents per snapshot)
+- history: as-of queries for every snapshot and per-document histories
+- report:<type>: each report type from main.py, summed over the projects
+
+Ingest runs once per scale; the other stages are read-only and keep the best
+of --repeat runs. Timings are compared with a saved baseline; a stage
+that got slower by more than the threshold is reported as a regression and
+the script exits with 1 (so it can gate a change). Baselines are machine
+specific - save one on the machine you compare on.
+
+Usage:
+    python scripts/benchmark_pipeline.py --save-baseline
+    python scripts/benchmark_pipeline.py
+    python scripts/benchmark_pipeline.py --scales 1,10 --projects GP,NM,HP --threshold 0.15
+"""
+
+import sys
+import argparse
+import io
+import json
+import os
+import platform
+import tempfile
+import time
+from contextlib import redirect_stdout
+from datetime import datetime
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config import DATA_DIR, load_project_config
+from data import DocumentDatabase
+from data.database import MAIN_REPORT_CLASS
+from utils.document_filters import DOC_CLASS_CERTIFICATE
+from reports.scheduler import REPORT_TYPES, JOB_FAILED, run_report_job
+from scripts.db_manager import PROJECT_NAMES, initialize_database, update_database_with_new_files
+from scripts.generate_synthetic_register import REGISTER_FORMATS, generate_project_registers, parse_project_codes
+
+# Documents per project register at 1x
+BASE_DOCUMENTS = 500
+
+DEFAULT_SCALES = [1, 10, 100]
+DEFAULT_PROJECTS = ['GP', 'HP']
+DEFAULT_SNAPSHOTS = 4
+DEFAULT_REPEAT = 3
+
+BASELINE_FILE = DATA_DIR / 'benchmark_baseline.json'
+
+# A stage is a regression when it is this much slower than the baseline...
+REGRESSION_THRESHOLD = 0.25
+# ...and at least this many seconds slower (short stages are noisy)
+REGRESSION_MIN_SECONDS = 0.1
+
+# Documents whose history is looked up per project in the history stage
+HISTORY_LOOKUPS = 100
+
+
+def time_queries(db_path, project_names):
+    """Run the database queries the reports make, for each project."""
+    start = time.perf_counter()
+    with DocumentDatabase.open_read_only(db_path) as db:
+        for project_name in project_names:
+            db.get_project_stats(project_name)
+            db.get_latest_documents(project_name)
+            for snapshot_date, snapshot_time in db.get_snapshots(project_name):
+                for doc_class in (MAIN_REPORT_CLASS, DOC_CLASS_CERTIFICATE):
+                    db.get_documents_for_snapshot(project_name, snapshot_date, snapshot_time, doc_class=doc_class)
+    return time.perf_counter() - start
+
+
+def time_change_detection(db_path, project_names):
+    """Detect the changes between each pair of consecutive snapshots, for each project."""
+    from analyzers import detect_changes
+
+    seconds = 0.0
+    with DocumentDatabase.open_read_only(db_path) as db:
+        for project_name in project_names:
+            config = load_project_config(project_name)
+            registers = [db.get_snapshot_register(project_name, *snapshot)
+                         for snapshot in db.get_snapshots(project_name)]
+            start = time.perf_counter()
+            for previous, current in zip(registers, registers[1:]):
+                detect_changes(previous, current, config)
+            seconds += time.perf_counter() - start
+    return seconds
+
+
+def time_history_queries(db_path, project_names):
+    """Query the document history: the register as of each snapshot, and per-document histories."""
+    start = time.perf_counter()
+    with DocumentDatabase.open_read_only(db_path) as db:
+        for project_name in project_names:
+            for snapshot_date, snapshot_time in db.get_snapshots(project_name):
+                db.get_documents_as_of(project_name, f'{snapshot_date} {snapshot_time}')
+            doc_refs = db.get_latest_documents(project_name)['Doc Ref']
+            for doc_ref in doc_refs.iloc[::max(1, len(doc_refs) // HISTORY_LOOKUPS)]:
+                db.get_document_history(project_name, doc_ref)
+    return time.perf_counter() - start
+
+
+def run_scale(scale, project_codes, snapshots, work_dir, repeat=DEFAULT_REPEAT):
+    """
+    Generate registers at one scale and time each pipeline stage.
+
+    Args:
+        scale: Multiple of BASE_DOCUMENTS
+        project_codes: Project codes to generate
+        snapshots: Snapshots per project
+        work_dir: Scratch directory (inputs, database and reports)
+        repeat: Runs of the query and report stages (best kept)
+
+    Returns:
+        Tuple of (stage timings dictionary, list of failed report jobs)
+    """
+    # Imported here: main.py pulls in the report modules. The report modules
+    # are loaded up front so their import time isn't charged to the first report.
+    from main import REPORT_FUNCTIONS
+    import reports.summary_report
+    import reports.progression_report
+    import reports.certificate_report
+
+    work_dir = Path(work_dir)
+    documents = BASE_DOCUMENTS * scale
+    project_names = [PROJECT_NAMES[code] for code in project_codes]
+    db_path = str(work_dir / 'documents.db')
+    output_dir = work_dir / 'output'
+    output_dir.mkdir(parents=True, exist_ok=True)
+    timings = {}
+    failures = []
+
+    start = time.perf_counter()
+    for project_code in project_codes:
+        generate_project_registers(project_code, work_dir / 'input', documents=documents, snapshots=snapshots)
+    timings['generate'] = time.perf_counter() - start
+
+    # db_manager reads the project folders relative to the working directory
+    previous_dir = os.getcwd()
+    os.chdir(work_dir)
+    try:
+        with redirect_stdout(io.StringIO()):
+            initialize_database(db_path)
+            start = time.perf_counter()
+            update_database_with_new_files(db_path)
+            timings['ingest'] = time.perf_counter() - start
+    finally:
+        os.chdir(previous_dir)
+
+    timings['changes'] = min(time_change_detection(db_path, project_names) for _ in range(repeat))
+    timings['queries'] = min(time_queries(db_path, project_names) for _ in range(repeat))
+    timings['history'] = min(time_history_queries(db_path, project_names) for _ in range(repeat))
+
+    for report_type in REPORT_TYPES:
+        runs = []
+        for _ in range(repeat):
+            seconds = 0.0
+            for project_name in project_names:
+                job = {'project': project_name, 'report': report_type}
+                result = run_report_job(job, REPORT_FUNCTIONS[report_type], db_path, output_dir)
+                seconds += result['seconds']
+                if result['status'] == JOB_FAILED:
+                    failures.append(result)
+            runs.append(seconds)
+            if failures:
+                break
+        timings[f'report:{report_type}'] = min(runs)
+
+    return timings, failures
+
+
+def load_baseline(baseline_file, settings):
+    """
+    Load saved baseline timings made with the same settings.
+
+    Returns:
+        Dictionary of scale label -> stage timings (empty if there is no usable baseline)
+    """
+    baseline_file = Path(baseline_file)
+    if not baseline_file.exists():
+        return {}
+
+    with open(baseline_file, encoding='utf-8') as f:
+        baseline = json.load(f)
+    if baseline.get('settings') != settings:
+        print(f"ℹ Baseline {baseline_file} was made with different settings - not comparing")
+        return {}
+    return baseline.get('results', {})
+
+
+def save_baseline(baseline_file, settings, results):
+    """Save timings as the baseline for later runs."""
+    baseline_file = Path(baseline_file)
+    baseline_file.parent.mkdir(parents=True, exist_ok=True)
+    with open(baseline_file, 'w', encoding='utf-8') as f:
+        json.dump({
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'machine': platform.node(),
+            'python': platform.python_version(),
+            'settings': settings,
+            'results': results,
+        }, f, indent=2)
+
+
+def find_regressions(results, baseline, threshold=REGRESSION_THRESHOLD):
+    """
+    Compare timings with the baseline.
+
+    Args:
+        results: Dictionary of scale label -> stage timings
+        baseline: Baseline in the same shape
+        threshold: Allowed slowdown as a fraction (0.25 = 25%)
+
+    Returns:
+        List of (scale label, stage, seconds, baseline seconds) regressions
+    """
+    regressions = []
+    for scale_label, timings in results.items():
+        for stage, seconds in timings.items():
+            # Generating the registers isn't part of the pipeline
+            if stage == 'generate':
+                continue
+            before = baseline.get(scale_label, {}).get(stage)
+            if before is None:
+                continue
+            if seconds > before * (1 + threshold) and seconds - before >= REGRESSION_MIN_SECONDS:
+                regressions.append((scale_label, stage, seconds, before))
+    return regressions
+
+
+def print_results(results, baseline):
+    """Print stage timings per scale, with the change against the baseline."""
+    print(f"\n{'Scale':<7} {'Stage':<22} {'Time (s)':>10} {'Baseline':>10} {'Change':>9}")
+    for scale_label, timings in results.items():
+        for stage, seconds in timings.items():
+            before = baseline.get(scale_label, {}).get(stage)
+            if before:
+                print(f"{scale_label:<7} {stage:<22} {seconds:>10.2f} {before:>10.2f} {(seconds - before) / before:>+9.1%}")
+            else:
+                print(f"{scale_label:<7} {stage:<22} {seconds:>10.2f} {'-':>10} {'':>9}")
+
+
+def _parse_scales(value):
+    return [int(scale) for scale in value.split(',') if scale.strip()]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark the pipeline on synthetic registers',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+    parser.add_argument('--scales', type=_parse_scales, default=DEFAULT_SCALES,
+                        help=f"Comma-separated multiples of {BASE_DOCUMENTS} documents (default: 1,10,100)")
+    parser.add_argument('--projects', type=parse_project_codes, default=DEFAULT_PROJECTS,
+                        help=f"Comma-separated project codes or ALL (default: {','.join(DEFAULT_PROJECTS)})")
+    parser.add_argument('--snapshots', type=int, default=DEFAULT_SNAPSHOTS,
+                        help=f'Snapshots per project (default: {DEFAULT_SNAPSHOTS})')
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT,
+                        help=f'Runs of the query and report stages, best kept (default: {DEFAULT_REPEAT})')
+    parser.add_argument('--baseline', default=str(BASELINE_FILE), help=f'Baseline file (default: {BASELINE_FILE})')
+    parser.add_argument('--save-baseline', action='store_true', help='Save this run as the baseline')
+    parser.add_argument('--threshold', type=float, default=REGRESSION_THRESHOLD,
+                        help=f'Allowed slowdown before a stage counts as a regression (default: {REGRESSION_THRESHOLD})')
+    args = parser.parse_args()
+
+    settings = {
+        'base_documents': BASE_DOCUMENTS,
+        'projects': sorted(args.projects, key=list(REGISTER_FORMATS).index),
+        'snapshots': args.snapshots,
+    }
+    baseline = {} if args.save_baseline else load_baseline(args.baseline, settings)
+
+    results = {}
+    failures = []
+    for scale in args.scales:
+        scale_label = f'{scale}x'
+        print(f"Running {scale_label}: {BASE_DOCUMENTS * scale:,} documents x {args.snapshots} snapshots "
+              f"for {', '.join(settings['projects'])}...")
+        with tempfile.TemporaryDirectory() as work_dir:
+            results[scale_label], scale_failures = run_scale(scale, settings['projects'], args.snapshots, work_dir,
+                                                             args.repeat)
+        failures.extend(scale_failures)
+
+    print_results(results, baseline)
+
+    for result in failures:
+        print(f"✗ {result['project']} / {result['report']} failed: {result['error']}")
+
+    regressions = find_regressions(results, baseline, args.threshold)
+    for scale_label, stage, seconds, before in regressions:
+        print(f"✗ Regression: {scale_label} {stage} {seconds:.2f}s (baseline {before:.2f}s)")
+    if baseline and not regressions:
+        print(f"✓ No regressions (threshold {args.threshold:.0%})")
+
+    if args.save_baseline:
+        save_baseline(args.baseline, settings, results)
+        print(f"✓ Baseline saved: {args.baseline}")
+
+    sys.exit(1 if regressions or failures else 0)
+
+
+if __name__ == '__main__':
+    main()
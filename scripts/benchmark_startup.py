@@ -0,0 +1,102 @@
+"""Check that the command-line entry points start fast.
+
+Runs each command with `python -X importtime` and fails (exit code 1) when its
+total import time exceeds the budget or when it loads pandas, numpy or
+openpyxl - those should only be imported by code paths that need them.
+
+Usage:
+    python scripts/benchmark_startup.py
+    python scripts/benchmark_startup.py --budget-ms 150 --repeat 5
+"""
+
+import sys
+import argparse
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+
+# Import-time budget per command (milliseconds)
+IMPORT_TIME_BUDGET_MS = 250
+
+# Libraries that must not be imported just to start up
+HEAVY_MODULES = ['pandas', 'numpy', 'openpyxl']
+
+
+def get_commands(db_path):
+    """Commands to check: (label, arguments after the python executable)."""
+    return [
+        ('main.py --help', [str(ROOT / 'main.py'), '--help']),
+        ('main.py run --help', [str(ROOT / 'main.py'), 'run', '--help']),
+        ('db_manager.py --help', [str(ROOT / 'scripts' / 'db_manager.py'), '--help']),
+        ('db_manager.py --stats', [str(ROOT / 'scripts' / 'db_manager.py'), '--stats', '--db-path', str(db_path)]),
+    ]
+
+
+def measure_command(args, cwd):
+    """
+    Run a command once with -X importtime.
+
+    Returns:
+        Tuple of (import ms, wall ms, heavy modules imported)
+    """
+    start = time.perf_counter()
+    result = subprocess.run([sys.executable, '-X', 'importtime'] + args, cwd=cwd,
+                            capture_output=True, text=True)
+    wall_ms = (time.perf_counter() - start) * 1000
+    if result.returncode != 0:
+        raise RuntimeError(f"{' '.join(args)} failed:\n{result.stderr[-2000:]}")
+
+    import_us = 0
+    heavy = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line.split('|')
+        module = name.strip()
+        # Top-level imports only - nested ones are included in their parent
+        if not name.startswith('  '):
+            import_us += int(cumulative)
+        if module.split('.')[0] in HEAVY_MODULES:
+            heavy.add(module.split('.')[0])
+
+    return import_us / 1000, wall_ms, sorted(heavy)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Check entry point import times')
+    parser.add_argument('--budget-ms', type=float, default=IMPORT_TIME_BUDGET_MS,
+                        help=f'Import-time budget per command (default: {IMPORT_TIME_BUDGET_MS})')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per command (best kept)')
+    args = parser.parse_args()
+
+    failures = 0
+    with tempfile.TemporaryDirectory() as work_dir:
+        db_path = Path(work_dir) / 'documents.db'
+        subprocess.run([sys.executable, str(ROOT / 'scripts' / 'db_manager.py'), '--init', '--db-path', str(db_path)],
+                       cwd=work_dir, capture_output=True, check=True)
+
+        print(f"{'Command':<24} {'Import ms':>10} {'Wall ms':>10}  Result")
+        for label, command in get_commands(db_path):
+            runs = [measure_command(command, work_dir) for _ in range(args.repeat)]
+            import_ms = min(run[0] for run in runs)
+            wall_ms = min(run[1] for run in runs)
+            heavy = runs[0][2]
+
+            problems = []
+            if import_ms > args.budget_ms:
+                problems.append(f'over {args.budget_ms:.0f} ms budget')
+            if heavy:
+                problems.append(f"imports {', '.join(heavy)}")
+            failures += bool(problems)
+
+            result = '✗ ' + '; '.join(problems) if problems else '✓'
+            print(f"{label:<24} {import_ms:>10.1f} {wall_ms:>10.1f}  {result}")
+
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,139 @@
+"""Benchmark progression report styling on a full multi-snapshot report.
+
+Builds the progression report the way main.py does (one column per snapshot,
+then the zero-fill pass) from synthetic registers, and reports the write time
+together with the size of the workbook style tables.
+
+The same report is then restyled twice from its values: once with the
+per-cell Font/PatternFill/Alignment objects the report modules built before
+the named styles, and once by name with the styles registered by
+styles.formatting.register_named_styles. Both are timed including the save.
+
+Usage:
+    python scripts/benchmark_styles.py
+    python scripts/benchmark_styles.py --snapshots 12 --rows 5000
+"""
+
+import sys
+import argparse
+import tempfile
+import time
+from copy import copy
+from datetime import date, timedelta
+from pathlib import Path
+
+import pandas as pd
+from openpyxl import Workbook, load_workbook
+from openpyxl.cell.cell import MergedCell
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config import load_project_config
+from analyzers import build_snapshot_profile, create_summary_row
+from reports import generate_progression_report, fill_empty_cells_with_zeros_in_file
+from styles import REPORT_NAMED_STYLES, register_named_styles
+from benchmark_writers import build_register
+
+
+def write_progression_report(output_file, snapshots, rows, config):
+    """Write a progression report with one column per synthetic snapshot."""
+    start_date = date(2025, 1, 6)
+    for index in range(snapshots):
+        snapshot_date = (start_date + timedelta(weeks=index)).strftime('%d-%b-%Y')
+        # Registers grow over time, as real ones do
+        register = build_register(rows + index * rows // snapshots, config, seed=index)
+        profile = build_snapshot_profile(register, config)
+        summary_df = pd.DataFrame([create_summary_row(snapshot_date, '09:00', register, config,
+                                                      profile=profile)])
+        if not generate_progression_report(summary_df, output_file, config, register,
+                                           snapshot_profile=profile):
+            raise RuntimeError(f'Failed to write snapshot {snapshot_date}')
+    fill_empty_cells_with_zeros_in_file(str(output_file))
+
+
+def style_table_sizes(output_file):
+    """Sizes of the style tables in a saved workbook."""
+    wb = load_workbook(output_file)
+    return {
+        'cell styles': len(wb._cell_styles),
+        'named styles': len(wb._named_styles),
+        'fonts': len(wb._fonts),
+        'fills': len(wb._fills),
+        'borders': len(wb._borders),
+        'alignments': len(wb._alignments),
+    }
+
+
+def restyle_report(source_file, output_file, named):
+    """Rebuild a report's values and style its cells per cell or by name.
+    
+    Returns:
+        float: Seconds taken to style and save the workbook
+    """
+    source = load_workbook(source_file)
+    wb = Workbook()
+    wb.remove(wb.active)
+    styled_cells = []
+    for source_sheet in source.worksheets:
+        sheet = wb.create_sheet(source_sheet.title)
+        for merged_range in source_sheet.merged_cells.ranges:
+            sheet.merge_cells(str(merged_range))
+        for row in source_sheet.iter_rows():
+            for cell in row:
+                if cell.value is not None and not isinstance(cell, MergedCell):
+                    sheet[cell.coordinate] = cell.value
+                if cell.style in REPORT_NAMED_STYLES:
+                    styled_cells.append((sheet[cell.coordinate], cell.style))
+    
+    start = time.perf_counter()
+    if named:
+        register_named_styles(wb, sorted({style_name for _, style_name in styled_cells}))
+        for cell, style_name in styled_cells:
+            cell.style = style_name
+    else:
+        # New style objects per cell, as the report modules built them
+        for cell, style_name in styled_cells:
+            for attribute, value in REPORT_NAMED_STYLES[style_name].items():
+                setattr(cell, attribute, copy(value))
+    wb.save(output_file)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark progression report styling')
+    parser.add_argument('--snapshots', type=int, default=24, help='Snapshots/columns to write (default: 24, max 25)')
+    parser.add_argument('--rows', type=int, default=2000, help='Documents in the first register (default: 2000)')
+    parser.add_argument('--project', default='GreenwichPeninsula', help='Project config to use')
+    parser.add_argument('--repeat', type=int, default=5, help='Restyle runs per variant, best kept (default: 5)')
+    args = parser.parse_args()
+
+    config = load_project_config(args.project)
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        output_file = Path(output_dir) / 'progression.xlsx'
+        start = time.perf_counter()
+        write_progression_report(output_file, args.snapshots, args.rows, config)
+        elapsed = time.perf_counter() - start
+
+        print(f"\nProgression report: {args.snapshots} snapshots ({args.project})")
+        print(f"{'Write time (s)':<16} {elapsed:>8.2f}")
+        print(f"{'File KB':<16} {output_file.stat().st_size / 1024:>8.1f}")
+        for name, size in style_table_sizes(output_file).items():
+            print(f"{name:<16} {size:>8}")
+        
+        results = {}
+        for label, named in (('per-cell', False), ('named', True)):
+            restyled_file = Path(output_dir) / f'progression_{label}.xlsx'
+            elapsed = min(restyle_report(output_file, restyled_file, named) for _ in range(args.repeat))
+            results[label] = (elapsed, style_table_sizes(restyled_file))
+        
+        print(f"\nSame workbook restyled (best of {args.repeat})")
+        print(f"{'':<16} {'per-cell':>10} {'named':>10}")
+        print(f"{'Style+save (s)':<16} {results['per-cell'][0]:>10.3f} {results['named'][0]:>10.3f}")
+        for name in results['named'][1]:
+            print(f"{name:<16} {results['per-cell'][1][name]:>10} {results['named'][1][name]:>10}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,100 @@
+"""Benchmark the report writer backends on a large synthetic register.
+
+Writes the summary report (Overall Summary + Summary Data + Latest Data) for a
+synthetic register with each backend in reports/writers.py and reports wall
+time, peak Python memory and file size.
+
+Usage:
+    python scripts/benchmark_writers.py
+    python scripts/benchmark_writers.py --rows 100000 --project NewMalden
+"""
+
+import sys
+import argparse
+import random
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import pandas as pd
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config import load_project_config
+from analyzers import build_snapshot_profile, create_summary_row
+from reports import save_excel_with_retry
+from reports.writers import WRITER_BACKENDS
+
+
+def build_register(rows, config, seed=0):
+    """Synthetic DB-shaped register with the project's statuses."""
+    rng = random.Random(seed)
+    statuses = [status for mapping in config['STATUS_MAPPINGS'].values() for status in mapping['statuses']]
+    revisions = ['P01', 'P02', 'P03', 'P04', 'P10', 'C01', 'C02', 'C03', 'A']
+    file_types = ['DR - Drawings (DR)', 'SC - Schedules (SC)', 'SP - Specifications (SP)']
+
+    return pd.DataFrame({
+        'Doc Ref': [f'BENCH-XX-{i:06d}' for i in range(rows)],
+        'Doc Title': [f'Synthetic document {i} level {i % 12}' for i in range(rows)],
+        'Rev': [rng.choice(revisions) for _ in range(rows)],
+        'Status': [rng.choice(statuses) for _ in range(rows)],
+        'File Type': [rng.choice(file_types) for _ in range(rows)],
+        'Date (WET)': [f'{1 + i % 28:02d}-Oct-2025' for i in range(rows)],
+        'Doc Path': [f'\\Project\\Block {i % 7}\\Level {i % 12}' for i in range(rows)],
+        'Publisher': [f'Publisher {i % 40}' for i in range(rows)],
+    })
+
+
+def write_report(backend, summary_df, register, config, output_file, profile):
+    """Write the summary report once with a backend."""
+    backend_config = dict(config)
+    backend_config['REPORT_SETTINGS'] = {**config.get('REPORT_SETTINGS', {}), 'writer_backend': backend}
+    if not save_excel_with_retry(summary_df, None, register, output_file, backend_config,
+                                 snapshot_profile=profile):
+        raise RuntimeError(f'{backend} backend failed to write {output_file}')
+
+
+def run_backend(backend, summary_df, register, config, output_dir, repeat=1):
+    """Benchmark one backend; return (best seconds, peak MB, file MB)."""
+    profile = build_snapshot_profile(register, config)
+    output_file = Path(output_dir) / f'summary_{backend}.xlsx'
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        write_report(backend, summary_df, register, config, output_file, profile)
+        timings.append(time.perf_counter() - start)
+
+    # Memory is measured on a separate run - tracing slows the write down
+    tracemalloc.start()
+    write_report(backend, summary_df, register, config, output_file, profile)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return min(timings), peak / 1024 / 1024, output_file.stat().st_size / 1024 / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark report writer backends')
+    parser.add_argument('--rows', type=int, default=50000, help='Register size (default: 50000)')
+    parser.add_argument('--project', default='GreenwichPeninsula', help='Project config to use')
+    parser.add_argument('--repeat', type=int, default=1, help='Timed runs per backend (best time kept)')
+    args = parser.parse_args()
+
+    config = load_project_config(args.project)
+    register = build_register(args.rows, config)
+    summary_df = pd.DataFrame([create_summary_row('14-Oct-2025', '09:00', register, config)])
+
+    print(f"Writing summary report for {args.rows:,} documents ({args.project})")
+    print(f"{'Backend':<12} {'Time (s)':>10} {'Peak MB':>10} {'File MB':>10}")
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        for backend in WRITER_BACKENDS:
+            elapsed, peak, size = run_backend(backend, summary_df, register, config, output_dir, args.repeat)
+            print(f"{backend:<12} {elapsed:>10.2f} {peak:>10.1f} {size:>10.2f}")
+
+
+if __name__ == '__main__':
+    main()
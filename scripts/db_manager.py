@@ -20,20 +20,38 @@ Usage:
     
     # Show database stats
     python scripts/db_manager.py --stats
+    
+    # Update and save a timing profile of the import to output/traces
+    python scripts/db_manager.py --update --trace
+    
+    # Re-import every file, checkpointing each one; resume after an interruption
+    python scripts/db_manager.py --backfill
+    python scripts/db_manager.py --backfill --resume
+    
+    # Compact old snapshots (see RETENTION_POLICY); report what would go first
+    python scripts/db_manager.py --compact --dry-run
+    python scripts/db_manager.py --compact --weekly-months 3
+    
+    # Archive every project to data/archives, and rebuild from the archives
+    python scripts/db_manager.py --export-archive
+    python scripts/db_manager.py --restore-archive
+    python scripts/db_manager.py --restore-archive data/archives/GreenwichPeninsula.zip
 """
 
 import sys
 import argparse
+from time import perf_counter
 from pathlib import Path
 from datetime import datetime
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from data import DocumentDatabase
-from config import load_project_config
-from processors import load_document_listing
+from data import DocumentDatabase, export_project_archive, restore_project_archive
+from data.archive import ARCHIVE_SUFFIX
+from config import load_project_config, ensure_directories
 from utils import get_file_timestamp, slugify
+from utils.tracing import span, traced, enable_tracing, print_trace_summary, write_trace_profile
 
 
 # Project folder mappings
@@ -53,6 +71,23 @@ PROJECT_NAMES = {
     'WCR': 'WestCromwellRoad'
 }
 
+# Where --trace saves run profiles
+TRACE_DIR = Path('output') / 'traces'
+
+# Storage profile for import and refresh connections (see data.database.STORAGE_PROFILES)
+IMPORT_STORAGE_PROFILE = 'bulk_import'
+
+# Where --export-archive writes and --restore-archive reads project archives
+ARCHIVE_DIR = Path('data') / 'archives'
+
+# Snapshot retention for --compact: every snapshot is kept for weekly_months
+# before a project's latest snapshot, then only the last snapshot of each
+# month. Older snapshots are compacted - their document rows are dropped and
+# only their report counts are kept, so progression reports still show them.
+RETENTION_POLICY = {
+    'weekly_months': 6,
+}
+
 
 def initialize_database(db_path='data/documents.db'):
     """Initialize the database schema.
@@ -87,20 +122,152 @@ def rebuild_database(db_path='data/documents.db', force=False):
     print("✓ Database rebuilt successfully")
 
 
-def import_project_files(project_code, project_name, force=False, db_path='data/documents.db'):
+@traced('refresh classification')
+def refresh_document_classification(project_name, db_path='data/documents.db'):
+    """Reclassify stored documents if the classification config has changed.
+    
+    Rows carry the fingerprint of the config sections they were classified
+    with, so only rows classified under an older config are recomputed.
+    
+    Args:
+        project_name: Full project name
+        db_path: Path to database file
+        
+    Returns:
+        int: Number of documents reclassified
+    """
+    # Classification needs pandas - imported here so --stats/--help start fast
+    from analyzers import compute_document_attributes, get_classification_fingerprint
+    
+    config = load_project_config(project_name)
+    fingerprint = get_classification_fingerprint(config)
+    reclassified = 0
+    
+    with DocumentDatabase(db_path, storage_profile=IMPORT_STORAGE_PROFILE) as db:
+        db.ensure_schema()
+        
+        if db.is_classification_current(project_name, fingerprint):
+            return 0
+        
+        for snapshot_date, snapshot_time in db.get_unclassified_snapshots(project_name, fingerprint):
+            documents = db.get_documents_to_classify(project_name, snapshot_date, snapshot_time, fingerprint)
+            attributes = compute_document_attributes(documents, config)
+            reclassified += db.update_document_attributes(attributes, fingerprint)
+        
+        db.set_classification_fingerprint(project_name, fingerprint)
+    
+    if reclassified:
+        print(f"  OK Reclassified {reclassified} documents for {project_name} (config changed)")
+    return reclassified
+
+
+def refresh_document_changes(project_name, db_path='data/documents.db'):
+    """Detect document changes for snapshots that don't have current ones.
+    
+    Each snapshot is compared with the project's previous snapshot. Changes
+    are (re)detected for new snapshots, for snapshots whose previous snapshot
+    is no longer the one they were compared with (an older file was imported
+    later), and after the CHANGE_DETECTION settings change. Snapshots that
+    are compacted, or follow a compacted one, keep the changes they have.
+    
+    Args:
+        project_name: Full project name
+        db_path: Path to database file
+        
+    Returns:
+        int: Number of snapshots whose changes were detected
+    """
+    from analyzers import detect_changes, get_change_detection_fingerprint, summarize_changes
+    
+    config = load_project_config(project_name)
+    fingerprint = get_change_detection_fingerprint(config)
+    refreshed = 0
+    
+    with DocumentDatabase(db_path, storage_profile=IMPORT_STORAGE_PROFILE) as db:
+        db.ensure_schema()
+        
+        state = db.get_change_detection_state(project_name)
+        snapshots = db.get_snapshots(project_name, include_compacted=True)
+        # Compacted snapshots have no rows to compare - their stored changes,
+        # and those of the snapshots after them, are kept as they are
+        compacted = set(db.get_compacted_snapshots(project_name))
+        previous_snapshot = None
+        previous_documents = None
+        
+        for snapshot in snapshots:
+            if (state.get(snapshot) != (previous_snapshot, fingerprint)
+                    and snapshot not in compacted and previous_snapshot not in compacted):
+                with span('detect changes', project=project_name, snapshot=' '.join(snapshot)):
+                    current_documents = db.get_snapshot_register(project_name, *snapshot)
+                    changes = None
+                    if previous_snapshot is not None:
+                        if previous_documents is None:
+                            previous_documents = db.get_snapshot_register(project_name, *previous_snapshot)
+                        changes = detect_changes(previous_documents, current_documents, config)
+                    db.replace_document_changes(project_name, *snapshot, previous_snapshot, changes, fingerprint)
+                
+                if changes is not None:
+                    counts = summarize_changes(changes)
+                    print(f"  OK Changes {snapshot[0]} {snapshot[1]}: " + ', '.join(
+                        f"{count} {change.replace('_', ' ')}" for change, count in counts.items()))
+                previous_documents = current_documents
+                refreshed += 1
+            else:
+                # Only loaded if the next snapshot needs comparing with it
+                previous_documents = None
+            previous_snapshot = snapshot
+    
+    return refreshed
+
+
+def refresh_document_history(project_name, db_path='data/documents.db'):
+    """Add new snapshots to a project's document history.
+    
+    Args:
+        project_name: Full project name
+        db_path: Path to database file
+        
+    Returns:
+        int: Number of snapshots added to the history
+    """
+    with DocumentDatabase(db_path, storage_profile=IMPORT_STORAGE_PROFILE) as db:
+        db.ensure_schema()
+        added = db.update_document_history(project_name)
+    
+    if added:
+        print(f"  OK Added {added} snapshots to the document history")
+    return added
+
+
+def import_project_files(project_code, project_name, force=False, db_path='data/documents.db', run_id=None,
+                         failed_files=None):
     """Import all files for a specific project into the database.
     
+    Each file is imported in one transaction: its documents, its processing
+    history entry and its checkpoint are stored together or not at all.
+    
     Args:
         project_code: Project code (OVB, NM, GP, HP, WCR)
         project_name: Full project name
-        force: If True, reimport even if already processed
+        force: If True, reimport even if already processed (replacing the
+            documents imported from the file before)
         db_path: Path to database file
+        run_id: Import run (see backfill_all_projects) - files it has already
+            imported are skipped, and each imported file is checkpointed
+        failed_files: Optional list the names of files that failed to import
+            are appended to
         
     Returns:
         int: Number of files imported
     """
+    from analyzers import compute_document_attributes, get_classification_fingerprint
+    from processors import load_document_listing
+    
     input_dir = Path(PROJECT_FOLDERS[project_code])
     
+    # Bring stored classifications up to date before adding new rows
+    refresh_document_classification(project_name, db_path)
+    
     if not input_dir.exists():
         print(f"✗ Project folder {input_dir} does not exist")
         return 0
@@ -141,42 +308,70 @@ def import_project_files(project_code, project_name, force=False, db_path='data/
     
     files_imported = 0
     
-    with DocumentDatabase(db_path) as db:
+    with DocumentDatabase(db_path, storage_profile=IMPORT_STORAGE_PROFILE) as db:
+        checkpointed = db.get_import_checkpoints(run_id, project_name) if run_id is not None else set()
+        
         for file_path, date, time, date_str, time_str in files_with_timestamps:
+            if file_path.name in checkpointed:
+                print(f"  ○ Skipping {file_path.name} - already imported by this backfill")
+                continue
+            
             # Check if already processed
             if not force and db.is_file_processed(project_name, file_path.name):
                 print(f"  ○ Skipping {file_path.name} - already in database")
                 continue
             
-            try:
-                # Load configuration
-                config = load_project_config(project_name, file_path)
-                
-                # Load document listing
-                print(f"  -> Processing {file_path.name} ({date_str} {time_str})...")
-                df = load_document_listing(file_path, config)
-                
-                if df is None or df.empty:
-                    print(f"  X No data in {file_path.name}")
+            with span('import file', project=project_name, file=file_path.name,
+                      snapshot=f"{date_str} {time_str}"):
+                try:
+                    # Load configuration
+                    config = load_project_config(project_name, file_path)
+                    
+                    # Load document listing
+                    print(f"  -> Processing {file_path.name} ({date_str} {time_str})...")
+                    df = load_document_listing(file_path, config)
+                    
+                    if df is None or df.empty:
+                        print(f"  X No data in {file_path.name}")
+                        continue
+                    
+                    # Convert date format for database (YYYY-MM-DD)
+                    snapshot_date = date.strftime('%Y-%m-%d')
+                    snapshot_time = time_str
+                    
+                    # Classify once at ingest so reports can select by doc_class
+                    documents = db.prepare_documents(df)
+                    attributes = compute_document_attributes(documents, config)
+                    
+                    # Insert documents and mark the file as processed in one transaction,
+                    # so an interrupted import never leaves rows without a ledger entry
+                    with db.transaction():
+                        if force:
+                            db.delete_file_documents(project_name, file_path.name)
+                        
+                        inserted = db.insert_documents(project_name, snapshot_date, snapshot_time, documents,
+                                                       attributes_df=attributes,
+                                                       fingerprint=get_classification_fingerprint(config))
+                        
+                        # Mark as processed (no more summary calculation - using dynamic counting)
+                        db.mark_file_processed(project_name, file_path, file_path.name, 
+                                               snapshot_date, snapshot_time, len(df))
+                        
+                        if run_id is not None:
+                            db.checkpoint_file(run_id, project_name, file_path.name)
+                    
+                    print(f"  OK Imported {inserted} documents from {file_path.name}")
+                    files_imported += 1
+                    
+                except Exception as e:
+                    print(f"  X Error processing {file_path.name}: {str(e)}")
+                    if failed_files is not None:
+                        failed_files.append(file_path.name)
                     continue
-                
-                # Convert date format for database (YYYY-MM-DD)
-                snapshot_date = date.strftime('%Y-%m-%d')
-                snapshot_time = time_str
-                
-                # Insert documents
-                inserted = db.insert_documents(project_name, snapshot_date, snapshot_time, df)
-                
-                # Mark as processed (no more summary calculation - using dynamic counting)
-                db.mark_file_processed(project_name, file_path, file_path.name, 
-                                       snapshot_date, snapshot_time, len(df))
-                
-                print(f"  OK Imported {inserted} documents from {file_path.name}")
-                files_imported += 1
-                
-            except Exception as e:
-                print(f"  X Error processing {file_path.name}: {str(e)}")
-                continue
+    
+    # Compare each new snapshot with the one before it
+    refresh_document_changes(project_name, db_path)
+    refresh_document_history(project_name, db_path)
     
     print(f"OK Imported {files_imported} files for {project_name}")
     return files_imported
@@ -194,7 +389,8 @@ def import_all_projects(force=False, db_path='data/documents.db'):
     
     for project_code, project_name in PROJECT_NAMES.items():
         try:
-            imported = import_project_files(project_code, project_name, force, db_path)
+            with span('import project', project=project_name):
+                imported = import_project_files(project_code, project_name, force, db_path)
             total_imported += imported
         except Exception as e:
             print(f"X Error importing {project_name}: {str(e)}")
@@ -203,6 +399,63 @@ def import_all_projects(force=False, db_path='data/documents.db'):
     print(f"\nOK Total files imported: {total_imported}")
 
 
+def backfill_all_projects(db_path='data/documents.db', resume=False):
+    """Re-import every file of every project, resumably.
+    
+    The backfill is recorded as an import run and every imported file is
+    checkpointed in the same transaction as its documents. If the backfill is
+    interrupted, or any file fails to import, the run is left unfinished:
+    resuming it skips the files already checkpointed and retries the rest.
+    
+    Args:
+        db_path: Path to database file
+        resume: Continue the last unfinished backfill instead of starting a new one
+        
+    Returns:
+        int: Number of files imported
+    """
+    with DocumentDatabase(db_path, storage_profile=IMPORT_STORAGE_PROFILE) as db:
+        db.ensure_schema()
+        
+        run = db.get_unfinished_import_run() if resume else None
+        if run:
+            print(f"Resuming backfill started {run['started_at']} ({run['files']} files already imported)...")
+            run_id = run['id']
+        else:
+            if resume:
+                print("ℹ No unfinished backfill to resume - starting a new one")
+            print("Backfilling all projects...")
+            run_id = db.start_import_run()
+    
+    total_imported = 0
+    failed_files = []
+    try:
+        for project_code, project_name in PROJECT_NAMES.items():
+            try:
+                with span('import project', project=project_name):
+                    total_imported += import_project_files(project_code, project_name, force=True,
+                                                           db_path=db_path, run_id=run_id,
+                                                           failed_files=failed_files)
+            except Exception as e:
+                print(f"X Error importing {project_name}: {str(e)}")
+                failed_files.append(project_name)
+                continue
+    except KeyboardInterrupt:
+        print("\nℹ Backfill interrupted - run with --backfill --resume to continue")
+        raise
+    
+    if failed_files:
+        print(f"\nX Backfill incomplete: {total_imported} files imported, {len(failed_files)} failed "
+              f"({', '.join(failed_files)}) - run with --backfill --resume to retry them")
+        return total_imported
+    
+    with DocumentDatabase(db_path, storage_profile=IMPORT_STORAGE_PROFILE) as db:
+        db.finish_import_run(run_id)
+    
+    print(f"\nOK Backfill complete: {total_imported} files imported")
+    return total_imported
+
+
 def update_database_with_new_files(db_path='data/documents.db', force=False):
     """Update database with any new files that haven't been processed yet.
     
@@ -225,7 +478,8 @@ def update_database_with_new_files(db_path='data/documents.db', force=False):
     
     for project_code, project_name in PROJECT_NAMES.items():
         try:
-            files_imported = import_project_files(project_code, project_name, force=force, db_path=db_path)
+            with span('import project', project=project_name):
+                files_imported = import_project_files(project_code, project_name, force=force, db_path=db_path)
             if files_imported > 0:
                 stats['projects_updated'] += 1
                 stats['files_imported'] += files_imported
@@ -243,6 +497,200 @@ def update_database_with_new_files(db_path='data/documents.db', force=False):
     return stats
 
 
+def _months_before(snapshot_date, months):
+    """Date string the given number of months before snapshot_date (day clamped to the month)."""
+    date = datetime.strptime(snapshot_date, '%Y-%m-%d')
+    month_index = date.year * 12 + date.month - 1 - months
+    year, month = divmod(month_index, 12)
+    for day in range(date.day, 0, -1):
+        try:
+            return datetime(year, month + 1, day).strftime('%Y-%m-%d')
+        except ValueError:
+            continue
+
+
+def select_snapshots_to_compact(snapshots, weekly_months):
+    """Pick the snapshots the retention policy drops.
+    
+    Snapshots within weekly_months of the latest one are all kept; before
+    that only the last snapshot of each calendar month is kept.
+    
+    Args:
+        snapshots: (snapshot_date, snapshot_time) tuples in chronological order
+        weekly_months: Months before the latest snapshot to keep every snapshot
+        
+    Returns:
+        list: (snapshot_date, snapshot_time) tuples to compact
+    """
+    if not snapshots:
+        return []
+    
+    cutoff = _months_before(snapshots[-1][0], weekly_months)
+    older = [snapshot for snapshot in snapshots if snapshot[0] < cutoff]
+    month_ends = {}
+    for snapshot in older:
+        month_ends[snapshot[0][:7]] = snapshot
+    kept = set(month_ends.values())
+    return [snapshot for snapshot in older if snapshot not in kept]
+
+
+def compact_database(db_path='data/documents.db', weekly_months=None, dry_run=False):
+    """Compact the snapshots RETENTION_POLICY no longer keeps, then VACUUM and ANALYZE.
+    
+    Compacted snapshots keep their report counts (see
+    DocumentDatabase.compact_snapshot), computed with the project's current
+    classification, and their detected changes and document history; their
+    document rows are dropped. Re-importing a compacted snapshot's file
+    with --force restores it.
+    
+    Args:
+        db_path: Path to database file
+        weekly_months: Months to keep every snapshot (default: RETENTION_POLICY)
+        dry_run: Report the snapshots and space that would go without compacting
+        
+    Returns:
+        dict: Snapshots compacted, rows dropped and bytes reclaimed (estimated for a dry run)
+    """
+    if weekly_months is None:
+        weekly_months = RETENTION_POLICY['weekly_months']
+    
+    db_file = Path(db_path)
+    stats = {'snapshots': 0, 'documents': 0, 'bytes': 0}
+    
+    print(f"{'Checking' if dry_run else 'Compacting'} snapshots older than {weekly_months} months "
+          f"(keeping the last snapshot of each month)...")
+    
+    with DocumentDatabase(db_path) as db:
+        db.ensure_schema()
+        plans = {}
+        total_documents = 0
+        for project_name in db.get_all_projects():
+            snapshot_counts = db.get_snapshot_document_counts(project_name)
+            snapshots = db.get_snapshots(project_name, include_compacted=True)
+            plans[project_name] = [(snapshot, snapshot_counts[snapshot])
+                                   for snapshot in select_snapshots_to_compact(snapshots, weekly_months)
+                                   if snapshot in snapshot_counts]
+            total_documents += sum(snapshot_counts.values())
+        storage_bytes = db.get_document_storage_bytes()
+    
+    for project_name, plan in plans.items():
+        if not plan:
+            continue
+        documents = sum(count for _, count in plan)
+        print(f"  {project_name}: {len(plan)} snapshots, {documents:,} documents "
+              f"({plan[0][0][0]} to {plan[-1][0][0]})")
+        stats['snapshots'] += len(plan)
+        stats['documents'] += documents
+    
+    if not stats['snapshots']:
+        print("✓ Nothing to compact")
+        return stats
+    
+    if dry_run:
+        # Rows and their indices take space in proportion to the row count
+        stats['bytes'] = storage_bytes * stats['documents'] // max(total_documents, 1)
+        print(f"ℹ Dry run: would drop {stats['documents']:,} documents from {stats['snapshots']} snapshots, "
+              f"reclaiming about {stats['bytes'] / 1024 / 1024:.1f} MB")
+        return stats
+    
+    from analyzers import get_classification_fingerprint
+    
+    # Counts are kept with the current classification, and the changes and
+    # history of the snapshots must be complete before their rows go
+    plans = {project_name: plan for project_name, plan in plans.items() if plan}
+    for project_name in plans:
+        refresh_document_classification(project_name, db_path)
+        refresh_document_changes(project_name, db_path)
+        refresh_document_history(project_name, db_path)
+    size_before = db_file.stat().st_size
+    
+    for project_name, plan in plans.items():
+        fingerprint = get_classification_fingerprint(load_project_config(project_name))
+        with DocumentDatabase(db_path, storage_profile=IMPORT_STORAGE_PROFILE) as db:
+            for snapshot, _ in plan:
+                with span('compact snapshot', project=project_name, snapshot=' '.join(snapshot)):
+                    db.compact_snapshot(project_name, *snapshot, fingerprint)
+        print(f"  OK Compacted {len(plan)} snapshots of {project_name}")
+    
+    with span('vacuum'):
+        with DocumentDatabase(db_path) as db:
+            db.reclaim_space()
+    
+    size_after = db_file.stat().st_size
+    stats['bytes'] = size_before - size_after
+    print(f"✓ Compacted {stats['snapshots']} snapshots ({stats['documents']:,} documents): "
+          f"{size_before / 1024 / 1024:.1f} MB -> {size_after / 1024 / 1024:.1f} MB")
+    return stats
+
+
+def export_archives(db_path='data/documents.db', archive_dir=ARCHIVE_DIR):
+    """Export every project to a compressed archive (see data/archive.py).
+    
+    Args:
+        db_path: Path to database file
+        archive_dir: Directory for the archives, one <project>.zip per project
+        
+    Returns:
+        list: Paths of the archives written
+    """
+    archive_dir = Path(archive_dir)
+    print(f"Exporting projects to {archive_dir}...")
+    written = []
+    
+    with DocumentDatabase(db_path) as db:
+        db.ensure_schema()
+        for project_name in db.get_all_projects():
+            archive_path = archive_dir / f"{project_name}{ARCHIVE_SUFFIX}"
+            with span('export archive', project=project_name):
+                stats = export_project_archive(db, project_name, archive_path)
+            print(f"  OK {project_name}: {stats['snapshots']} snapshots, {stats['documents']:,} documents "
+                  f"-> {archive_path.name} ({stats['bytes'] / 1024 / 1024:.1f} MB)")
+            written.append(archive_path)
+    
+    print(f"✓ Exported {len(written)} projects")
+    return written
+
+
+def restore_archives(archive_path=ARCHIVE_DIR, db_path='data/documents.db'):
+    """Restore projects from archives, replacing their data in the database.
+    
+    Documents are inserted as archived, with their classification, ledger,
+    changes and history, so no register is parsed.
+    
+    Args:
+        archive_path: An archive, or a directory of archives to restore all of
+        db_path: Path to database file
+        
+    Returns:
+        int: Number of projects restored
+    """
+    archive_path = Path(archive_path)
+    archives = sorted(archive_path.glob(f"*{ARCHIVE_SUFFIX}")) if archive_path.is_dir() else [archive_path]
+    if not archives or not archives[0].exists():
+        print(f"✗ No archives found at {archive_path}")
+        return 0
+    
+    print(f"Restoring {len(archives)} archives...")
+    start = perf_counter()
+    restored = 0
+    
+    with DocumentDatabase(db_path, storage_profile=IMPORT_STORAGE_PROFILE) as db:
+        db.ensure_schema()
+        for path in archives:
+            try:
+                with span('restore archive', archive=path.name):
+                    stats = restore_project_archive(db, path)
+            except Exception as e:
+                print(f"  X Error restoring {path.name}: {str(e)}")
+                continue
+            print(f"  OK {stats['project_name']}: {stats['snapshots']} snapshots, "
+                  f"{stats['documents']:,} documents")
+            restored += 1
+    
+    print(f"✓ Restored {restored} projects in {perf_counter() - start:.1f}s")
+    return restored
+
+
 def show_database_stats(db_path='data/documents.db'):
     """Display statistics about the database.
     
@@ -266,6 +714,8 @@ def show_database_stats(db_path='data/documents.db'):
             stats = db.get_project_stats(project)
             print(f"{project}:")
             print(f"  Snapshots: {stats['total_snapshots']}")
+            if stats['compacted_snapshots']:
+                print(f"  Compacted snapshots: {stats['compacted_snapshots']}")
             print(f"  Latest document count: {stats['latest_document_count']}")
             print(f"  Date range: {stats['first_snapshot']} to {stats['last_snapshot']}")
             print()
@@ -295,10 +745,28 @@ def main():
                        help='Update database with new files only')
     parser.add_argument('--stats', action='store_true',
                        help='Show database statistics')
+    parser.add_argument('--backfill', action='store_true',
+                       help='Re-import all files from all projects, checkpointing each file')
+    parser.add_argument('--resume', action='store_true',
+                       help='With --backfill: continue the last interrupted backfill')
+    parser.add_argument('--compact', action='store_true',
+                       help='Compact snapshots older than the retention policy keeps, then VACUUM and ANALYZE')
+    parser.add_argument('--weekly-months', type=int,
+                       help=f"With --compact: months to keep every snapshot "
+                            f"(default: {RETENTION_POLICY['weekly_months']})")
+    parser.add_argument('--dry-run', action='store_true',
+                       help='With --compact: report what would be compacted and the space reclaimed')
+    parser.add_argument('--export-archive', nargs='?', const=str(ARCHIVE_DIR), metavar='DIR',
+                       help=f'Export every project to a compressed archive in DIR (default: {ARCHIVE_DIR})')
+    parser.add_argument('--restore-archive', nargs='?', const=str(ARCHIVE_DIR), metavar='PATH',
+                       help=f'Restore projects from an archive or a directory of archives '
+                            f'(default: {ARCHIVE_DIR}), without re-importing registers')
     parser.add_argument('--force', action='store_true',
                        help='Force reimport even if already processed')
     parser.add_argument('--db-path', type=str, default='data/documents.db',
                        help='Path to database file (default: data/documents.db)')
+    parser.add_argument('--trace', action='store_true',
+                       help=f'Time each import stage and save a profile to {TRACE_DIR}')
     
     args = parser.parse_args()
     
@@ -307,6 +775,9 @@ def main():
         parser.print_help()
         return
     
+    if args.trace:
+        enable_tracing()
+    
     try:
         if args.init:
             initialize_database(args.db_path)
@@ -321,9 +792,15 @@ def main():
             import_all_projects(True, args.db_path)  # Force import after rebuild
             print("Rebuild and import completed successfully!")
         
+        if args.restore_archive:
+            restore_archives(args.restore_archive, args.db_path)
+        
         if args.import_all:
             import_all_projects(args.force, args.db_path)
         
+        if args.backfill:
+            backfill_all_projects(args.db_path, resume=args.resume)
+        
         if args.import_project:
             project_code = args.import_project.upper()
             if project_code not in PROJECT_NAMES:
@@ -337,6 +814,12 @@ def main():
         if args.update:
             update_database_with_new_files(args.db_path)
         
+        if args.compact:
+            compact_database(args.db_path, weekly_months=args.weekly_months, dry_run=args.dry_run)
+        
+        if args.export_archive:
+            export_archives(args.db_path, args.export_archive)
+        
         if args.stats:
             show_database_stats(args.db_path)
     
@@ -346,6 +829,11 @@ def main():
         print(f"\nX Error: {str(e)}")
         import traceback
         traceback.print_exc()
+    
+    if args.trace:
+        print_trace_summary()
+        json_path, csv_path = write_trace_profile(TRACE_DIR, 'db_manager')
+        print(f"✓ Trace profile: {json_path} ({csv_path.name})")
 
 
 def show_interactive_menu():
@@ -472,6 +960,8 @@ def show_stats():
 
 
 if __name__ == '__main__':
+    ensure_directories()
+    
     # Check if any command line arguments were provided
     if len(sys.argv) > 1:
         # Run with command line arguments (existing functionality)
@@ -0,0 +1,404 @@
+"""Generate synthetic document registers in each project's export format.
+
+Real registers can't leave the company, so benchmarks and tests run on
+synthetic ones. Registers are written the way the document control systems
+export them, so they go through the normal import path (db_manager):
+
+- GP / NM / OVB: Excel listing with the "<title>, Document Listing, <date time>"
+  timestamp in B4 and the column header on row 7 (EXCEL_SETTINGS skiprows=6),
+  using the columns in the project's EXCEL_SETTINGS usecols
+- HP: CSV with MBS/non-MBS rows, Status + Design Status and a Report Created
+  timestamp column
+- WCR: Excel with Revision Workflow, Status and Full Path (superseded
+  documents in "/ SS /" folders), timestamped by the file name
+
+Document types, statuses and apartment/block layout come from the project
+config, so the registers classify like real ones. Each snapshot grows the
+register, moves documents on to new revisions and re-rolls their statuses.
+
+Usage:
+    python scripts/generate_synthetic_register.py --projects GP --output-dir synthetic/input
+    python scripts/generate_synthetic_register.py --projects ALL --documents 20000 --snapshots 12
+    python scripts/generate_synthetic_register.py --projects NM --certificate-share 0.4 --apartments 200
+"""
+
+import sys
+import argparse
+import csv
+import random
+import re
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config import get_accommodation_data, load_project_config
+from scripts.db_manager import PROJECT_NAMES
+
+
+# Export format per project code
+REGISTER_FORMATS = {
+    'GP': 'listing',
+    'NM': 'listing',
+    'OVB': 'listing',
+    'HP': 'hp_csv',
+    'WCR': 'wcr_excel',
+}
+
+# Default generator settings (see generate_project_registers)
+DEFAULT_SETTINGS = {
+    'documents': 2000,            # Documents in the last snapshot
+    'snapshots': 6,               # Weekly snapshots
+    'construction_share': 0.35,   # Share of documents that reach C revisions
+    'certificate_share': 0.2,     # Share of documents that are certificates
+    'apartments': None,           # Apartments certificates are spread over (default: all in ACCOMMODATION_DATA)
+    'start_date': date(2025, 1, 6),
+    'interval_days': 7,
+    'seed': 0,
+}
+
+# Relative weight of each status category when statuses are rolled
+STATUS_CATEGORY_WEIGHTS = {
+    'Status A': 4,
+    'Status B': 3,
+    'Status C': 1,
+    'Under Review': 2,
+}
+
+# Share of the final register present in the first snapshot
+INITIAL_SHARE = 0.55
+
+DISCIPLINES = ['Electrical', 'Mechanical', 'Public Health', 'Sprinklers', 'Fire Alarm', 'Ventilation']
+DEFAULT_CERTIFICATE_NAMES = ['Electrical Cert', 'Part P', 'MVHR Cert', 'FA Cert', 'Water Quality Cert']
+
+HP_STATUSES = ['Construction', 'Construction', 'IFC-pending', 'Preliminary', 'Information']
+HP_DESIGN_STATUSES = ['', '', 'B', 'C']
+WCR_DOCUMENT_STATES = ['ACTIVE', 'ACTIVE', 'ACTIVE', 'REVISED']
+
+
+def _type_code(file_type):
+    """Two-letter code of a file type label, e.g. 'CE - Certificate (CE)' -> 'CE'."""
+    match = re.search(r'\((\w+)\)\s*$', file_type)
+    return match.group(1) if match else file_type[:2].upper()
+
+
+def get_document_types(config):
+    """
+    File type labels for each kind of document, from the project config.
+
+    Returns:
+        Dictionary of kind ('drawing', 'certificate', 'submittal', 'other') -> list of labels
+    """
+    drawing = config.get('DRAWING_SETTINGS', {}).get('file_type_filter', {}).get('drawing_types')
+    certificate = config.get('CERTIFICATE_SETTINGS', {}).get('file_type_filter', {}).get('certificate_types')
+    submittal = (config.get('TECHNICAL_SUBMITTAL_SETTINGS', {}).get('file_type_filter', {})
+                 .get('technical_submittal_types'))
+    return {
+        'drawing': drawing or ['DR - Drawing (DR)'],
+        'certificate': certificate or ['CE - Certificate (CE)'],
+        'submittal': submittal or ['TS - Technical submission (TS)'],
+        'other': ['RP - Report (RP)', 'SP - Specification (SP)'],
+    }
+
+
+def get_weighted_statuses(config):
+    """Raw status values from STATUS_MAPPINGS with their roll weights."""
+    statuses, weights = [], []
+    for category, mapping in config.get('STATUS_MAPPINGS', {}).items():
+        for status in mapping.get('statuses', []):
+            statuses.append(status)
+            weights.append(STATUS_CATEGORY_WEIGHTS.get(category, 1))
+    return statuses or ['Status A'], weights or [1]
+
+
+def get_apartment_layout(config, apartments=None):
+    """
+    (phase, block, apartment) for the apartments certificates are issued for.
+
+    Uses ACCOMMODATION_DATA when the project has it, so certificates line up
+    with the accommodation schedule; otherwise numbers apartments 1..N in one block.
+
+    Args:
+        config: Project configuration
+        apartments: Limit on the number of apartments (default: all)
+    """
+    layout = []
+    for phase, phase_data in get_accommodation_data(config).get('phases', {}).items():
+        for block, block_data in phase_data.get('blocks', {}).items():
+            layout.extend((phase, block, apartment) for apartment in block_data.get('apartments', []))
+
+    if not layout:
+        layout = [('Default', 'A', apartment) for apartment in range(1, (apartments or 200) + 1)]
+    return layout[:apartments] if apartments else layout
+
+
+def get_certificate_names(config):
+    """Certificate names matching the project's CERTIFICATE_TRACKING patterns."""
+    categories = config.get('CERTIFICATE_TRACKING', {}).get('apartment_certificates', {})
+    names = [category['patterns'][0] for category in categories.values() if category.get('patterns')]
+    return names or DEFAULT_CERTIFICATE_NAMES
+
+
+def build_document_pool(project_code, config, settings):
+    """
+    Build the documents of a synthetic register and their revision histories.
+
+    Args:
+        project_code: Project code (GP, NM, OVB, HP, WCR)
+        config: Project configuration
+        settings: Generator settings (see DEFAULT_SETTINGS)
+
+    Returns:
+        List of document dictionaries
+    """
+    rng = random.Random(f"{project_code}-{settings['seed']}")
+    types = get_document_types(config)
+    statuses, weights = get_weighted_statuses(config)
+    layout = get_apartment_layout(config, settings['apartments'])
+    certificate_names = get_certificate_names(config)
+    snapshots = settings['snapshots']
+    # HP's CSV export escapes with backslashes, so only the Excel listings use them in paths
+    separator = '\\' if REGISTER_FORMATS[project_code] == 'listing' else '/'
+
+    pool = []
+    for index in range(settings['documents']):
+        roll = rng.random()
+        if roll < settings['certificate_share']:
+            kind = 'certificate'
+        elif roll < settings['certificate_share'] + 0.1:
+            kind = 'submittal'
+        elif roll < settings['certificate_share'] + 0.15:
+            kind = 'other'
+        else:
+            kind = 'drawing'
+        file_type = rng.choice(types[kind])
+        discipline = rng.choice(DISCIPLINES)
+
+        if kind == 'certificate' and rng.random() < 0.8:
+            phase, block, apartment = rng.choice(layout)
+            folders = [project_code] + ([phase] if phase != 'Default' else []) + [f'Block - {block}', 'Certificates']
+            title = f"Plot {apartment} {rng.choice(certificate_names)}"
+        elif kind == 'certificate':
+            folders = [project_code, 'Landlords', 'Certificates']
+            title = f"Communal {rng.choice(certificate_names)}"
+        else:
+            phase, block, _ = rng.choice(layout)
+            folders = [project_code, 'Drawings', discipline]
+            title = f"{discipline} {'layout' if kind == 'drawing' else kind} Block {block} sheet {index % 40 + 1}"
+
+        # Revision history: P revisions, then C revisions for construction issue
+        revisions = [f'P{number:02d}' for number in range(1, rng.choice([1, 1, 2, 2, 3, 4]) + 1)]
+        if rng.random() < settings['construction_share']:
+            revisions += [f'C{number:02d}' for number in range(1, rng.choice([1, 1, 2, 3]) + 1)]
+
+        first_seen = 0 if rng.random() < INITIAL_SHARE else rng.randint(1, max(snapshots - 1, 1))
+        pool.append({
+            'index': index,
+            'kind': kind,
+            'file_type': file_type,
+            'ref': f"{project_code}-MBS-{_type_code(file_type)}-{index:05d}",
+            'title': title,
+            'path': separator + separator.join(folders) + separator,
+            'revisions': revisions,
+            'statuses': rng.choices(statuses, weights, k=len(revisions)),
+            'first_seen': min(first_seen, snapshots - 1),
+            'step': rng.choice([1, 2, 3]),
+            'superseded': rng.random() < 0.05,
+            'mbs': rng.random() < 0.9,
+        })
+    return pool
+
+
+def get_snapshot_documents(pool, snapshot_index):
+    """
+    Documents in one snapshot with their current revision and status.
+
+    Returns:
+        List of (document, revision, status) tuples
+    """
+    documents = []
+    for document in pool:
+        if document['first_seen'] > snapshot_index:
+            continue
+        revision_index = min((snapshot_index - document['first_seen']) // document['step'],
+                             len(document['revisions']) - 1)
+        documents.append((document, document['revisions'][revision_index], document['statuses'][revision_index]))
+    return documents
+
+
+def get_snapshot_timestamps(settings):
+    """(date, 'HH:MM') of each snapshot."""
+    return [(settings['start_date'] + timedelta(days=index * settings['interval_days']), f'{9 + index % 3:02d}:00')
+            for index in range(settings['snapshots'])]
+
+
+def _issue_date(document, snapshot_date):
+    return (snapshot_date - timedelta(days=document['index'] % 20)).strftime('%d-%b-%Y')
+
+
+def _listing_value(column, source_to_field, document, revision, status, snapshot_date):
+    """Value of one listing column for a document."""
+    field = source_to_field.get(column)
+    if field == 'File Type':
+        return document['file_type']
+    if field in ('Doc Ref', 'Doc Title', 'Doc Path'):
+        return document[{'Doc Ref': 'ref', 'Doc Title': 'title', 'Doc Path': 'path'}[field]]
+    if field == 'Rev':
+        return revision
+    if field == 'Status':
+        return status
+    if field == 'Date (WET)':
+        return _issue_date(document, snapshot_date)
+    if field == 'Publisher':
+        return 'MBS' if document['mbs'] else 'Other Contractor'
+    if column == 'Purpose of Issue':
+        return 'For Construction' if revision.startswith('C') else 'For Comment'
+    if '(WET)' in column:
+        return snapshot_date.strftime('%d-%b-%Y')
+    if 'Number' in column:
+        return f"{document['index']:05d}"
+    return ''
+
+
+def write_listing_register(file_path, config, documents, snapshot_date, snapshot_time):
+    """Write a GP/NM/OVB style Excel listing (timestamp in B4, header on row 7)."""
+    from openpyxl import Workbook
+
+    columns = config['EXCEL_SETTINGS']['usecols']
+    source_to_field = {source: field for field, source in config.get('COLUMN_MAPPINGS', {}).items()}
+    title = config.get('PROJECT_TITLE', '')
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet('Document Listing')
+    ws.append([None, 'Document Listing'])
+    ws.append([None, title])
+    ws.append([None, 'All documents'])
+    ws.append([None, f"{title}, Document Listing, {snapshot_date.strftime('%d-%b-%Y')} {snapshot_time}"])
+    ws.append([None, f"{len(documents)} documents"])
+    ws.append([None, ''])
+    ws.append(columns)
+    for document, revision, status in documents:
+        ws.append([_listing_value(column, source_to_field, document, revision, status, snapshot_date)
+                   for column in columns])
+    wb.save(file_path)
+
+
+def write_hp_register(file_path, documents, snapshot_date, snapshot_time):
+    """Write a Holloway Park style CSV export (MBS filter, Status + Design Status)."""
+    created = f"{snapshot_date.strftime('%d-%m-%Y')} {snapshot_time}"
+    with open(file_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['Title', 'Subject', 'Project Folder', 'Status', 'Design Status', 'Rev', 'Date',
+                         'Description', 'Report Created'])
+        for document, revision, _ in documents:
+            ref = document['ref'] if document['mbs'] else document['ref'].replace('-MBS-', '-OTH-')
+            # Statuses are re-rolled per revision from the document's index
+            rng = random.Random(f"{document['index']}-{revision}")
+            writer.writerow([ref, document['title'], document['path'], rng.choice(HP_STATUSES),
+                             rng.choice(HP_DESIGN_STATUSES), revision, _issue_date(document, snapshot_date),
+                             document['kind'].title(), created])
+
+
+def write_wcr_register(file_path, documents, snapshot_date):
+    """Write a West Cromwell Road style Excel export (Revision Workflow, Full Path)."""
+    from openpyxl import Workbook
+
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet('Export')
+    ws.append(['Name', 'Description', 'Revision', 'Status', 'Revision Workflow', 'Revision Date Modified',
+               'Full Path'])
+    for document, revision, status in documents:
+        path = document['path']
+        state = WCR_DOCUMENT_STATES[document['index'] % len(WCR_DOCUMENT_STATES)]
+        if document['superseded']:
+            path = path.replace('/Drawings/', '/ SS /')
+            state = 'Superseded'
+        ws.append([document['ref'], document['title'], revision, state, status,
+                   _issue_date(document, snapshot_date), path])
+    wb.save(file_path)
+
+
+def generate_project_registers(project_code, output_dir, **settings):
+    """
+    Write a synthetic register per snapshot for one project.
+
+    Files are written to <output_dir>/<project_code>/ with the names the real
+    exports use, so output_dir can stand in for the input/ folder.
+
+    Args:
+        project_code: Project code (GP, NM, OVB, HP, WCR)
+        output_dir: Root output directory
+        **settings: Overrides of DEFAULT_SETTINGS
+
+    Returns:
+        List of written file paths
+    """
+    settings = {**DEFAULT_SETTINGS, **{key: value for key, value in settings.items() if value is not None}}
+    config = load_project_config(PROJECT_NAMES[project_code])
+    register_format = REGISTER_FORMATS[project_code]
+
+    project_dir = Path(output_dir) / project_code
+    project_dir.mkdir(parents=True, exist_ok=True)
+
+    pool = build_document_pool(project_code, config, settings)
+    written = []
+    for snapshot_index, (snapshot_date, snapshot_time) in enumerate(get_snapshot_timestamps(settings)):
+        documents = get_snapshot_documents(pool, snapshot_index)
+        stem = f"{project_code} Document Listing {snapshot_date.strftime('%d%m%y')}"
+        if register_format == 'listing':
+            file_path = project_dir / f'{stem}.xlsx'
+            write_listing_register(file_path, config, documents, snapshot_date, snapshot_time)
+        elif register_format == 'hp_csv':
+            file_path = project_dir / f'{stem}.csv'
+            write_hp_register(file_path, documents, snapshot_date, snapshot_time)
+        else:
+            file_path = project_dir / f'{stem}.xlsx'
+            write_wcr_register(file_path, documents, snapshot_date)
+        written.append(file_path)
+    return written
+
+
+def parse_project_codes(value):
+    """Comma-separated project codes, or ALL."""
+    codes = [code.strip().upper() for code in value.split(',') if code.strip()]
+    if 'ALL' in codes:
+        return list(REGISTER_FORMATS)
+    unknown = [code for code in codes if code not in REGISTER_FORMATS]
+    if unknown:
+        raise argparse.ArgumentTypeError(f"unknown project code(s): {', '.join(unknown)}")
+    return codes
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Generate synthetic document registers',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+    parser.add_argument('--projects', type=parse_project_codes, default=list(REGISTER_FORMATS),
+                        help='Comma-separated project codes or ALL (default: ALL)')
+    parser.add_argument('--output-dir', default='synthetic/input', help='Output root (default: synthetic/input)')
+    parser.add_argument('--documents', type=int, help=f"Documents in the last snapshot (default: {DEFAULT_SETTINGS['documents']})")
+    parser.add_argument('--snapshots', type=int, help=f"Weekly snapshots (default: {DEFAULT_SETTINGS['snapshots']})")
+    parser.add_argument('--construction-share', type=float,
+                        help=f"Share of documents reaching C revisions (default: {DEFAULT_SETTINGS['construction_share']})")
+    parser.add_argument('--certificate-share', type=float,
+                        help=f"Share of documents that are certificates (default: {DEFAULT_SETTINGS['certificate_share']})")
+    parser.add_argument('--apartments', type=int, help='Apartments certificates are spread over (default: all)')
+    parser.add_argument('--start-date', type=lambda value: datetime.strptime(value, '%Y-%m-%d').date(),
+                        help='First snapshot date, YYYY-MM-DD (default: 2025-01-06)')
+    parser.add_argument('--seed', type=int, help='Random seed (default: 0)')
+    args = parser.parse_args()
+
+    for project_code in args.projects:
+        files = generate_project_registers(
+            project_code, args.output_dir, documents=args.documents, snapshots=args.snapshots,
+            construction_share=args.construction_share, certificate_share=args.certificate_share,
+            apartments=args.apartments, start_date=args.start_date, seed=args.seed
+        )
+        print(f"✓ {project_code}: {len(files)} registers in {Path(args.output_dir) / project_code}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,8 +1,10 @@
 """
-Parse accommodation schedule and update project configuration with apartment data.
+Parse accommodation schedule and update the project's apartment data.
 
 This script reads a project's accommodation schedule (Excel/CSV) and generates
-structured apartment data that gets inserted into the project's config file.
+structured apartment data (ACCOMMODATION_DATA) that gets saved to
+data/accommodation/<ProjectName>.json - see data/accommodation.py. Reports read
+it through config.get_accommodation_data() when certificate tracking needs it.
 
 Usage:
     # Interactive menu mode (recommended)
@@ -11,6 +13,9 @@ Usage:
     # Command line mode (for automation)
     python scripts/update_accommodation_data.py <ProjectName>
     
+    # Move ACCOMMODATION_DATA written into config files by older versions to data files
+    python scripts/update_accommodation_data.py --migrate
+    
 Examples:
     python scripts/update_accommodation_data.py                    # Show interactive menu
     python scripts/update_accommodation_data.py GreenwichPeninsula # Update specific project
@@ -25,6 +30,7 @@ Standardized Filename Format:
 import sys
 import os
 from pathlib import Path
+import numpy as np
 import pandas as pd
 from datetime import datetime
 import re
@@ -32,7 +38,8 @@ import re
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from config import CONFIGS_DIR, INPUT_DIR
+from config import ACCOMMODATION_DIR, CONFIGS_DIR, INPUT_DIR, get_accommodation_data, load_project_config
+from data.accommodation import ACCOMMODATION_SUFFIX, save_accommodation_data
 
 
 def clean_floor_number(floor_value, config):
@@ -111,6 +118,321 @@ def clean_apartment_number(apt_value, config):
         return apt_str
 
 
+# int() of a string: optional sign and digits, surrounding whitespace allowed
+_INTEGER_PATTERN = r'\s*[+-]?[0-9]+\s*'
+
+
+def _missing(index):
+    """Object Series of None (pd.Series(None, ...) would hold NaN)."""
+    return pd.Series([None] * len(index), index=index, dtype=object)
+
+
+def _schedule_column(df, column):
+    """
+    A schedule column as objects, None where missing (or the column is not mapped).
+    
+    Args:
+        df: Accommodation schedule
+        column: Column name from the column mapping (may be None)
+        
+    Returns:
+        Object Series aligned with df
+    """
+    if not column or column not in df.columns:
+        return _missing(df.index)
+    values = df[column]
+    return values.astype(object).where(values.notna(), None)
+
+
+def _stripped(values):
+    """str(value).strip() of each present value, None elsewhere."""
+    present = values.notna()
+    result = _missing(values.index)
+    result[present] = values[present].astype(str).str.strip().astype(object)
+    return result
+
+
+def _remove_prefix(values, prefix):
+    """Remove prefix from the values starting with it."""
+    if not prefix:
+        return values
+    values = values.copy()
+    starts = values.str.startswith(prefix).fillna(False).astype(bool)
+    values[starts] = values[starts].str[len(prefix):]
+    return values
+
+
+def _remove_suffix(values, suffix):
+    """Remove suffix from the values ending with it."""
+    if not suffix:
+        return values
+    values = values.copy()
+    ends = values.str.endswith(suffix).fillna(False).astype(bool)
+    values[ends] = values[ends].str[:-len(suffix)]
+    return values
+
+
+def _search(values, pattern):
+    """
+    re.search() of pattern in each value.
+    
+    Args:
+        values: Object Series of strings/None
+        pattern: Regular expression
+        
+    Returns:
+        Tuple of (object Series of the whole match, None where the pattern
+        did not match; DataFrame of the pattern's groups, None where they
+        did not take part)
+    """
+    groups = values.str.extract(f'({pattern})', expand=True)
+    groups = groups.astype(object).where(groups.notna(), None)
+    whole = groups.pop(0)
+    return whole, groups
+
+
+def _first_group(values, pattern):
+    """First group of pattern's match in each value (the whole match if it has no groups), None if none."""
+    whole, groups = _search(values, pattern)
+    return groups.iloc[:, 0] if groups.shape[1] else whole
+
+
+def _as_int(values, fallback):
+    """
+    int() of the values that are integer strings, fallback elsewhere.
+    
+    Args:
+        values: Object Series of strings/None
+        fallback: Object Series used where a value is not an integer string
+        
+    Returns:
+        Object Series of Python ints and fallback values
+    """
+    result = fallback.copy()
+    integers = values.str.fullmatch(_INTEGER_PATTERN).fillna(False).astype(bool)
+    if integers.any():
+        result[integers] = pd.to_numeric(values[integers].str.strip()).tolist()
+    return result
+
+
+def clean_apartment_numbers(values, config):
+    """
+    Clean and standardize a column of apartment numbers (see clean_apartment_number).
+    
+    Args:
+        values: Object Series of raw apartment values
+        config: Apartment cleaning configuration
+        
+    Returns:
+        Object Series of cleaned apartment numbers (int where numeric, None if missing)
+    """
+    apartments = _stripped(values)
+    
+    # Remove any configured prefix (e.g., "Apt " or "Flat ")
+    prefix_to_remove = config.get('remove_prefix')
+    if prefix_to_remove:
+        apartments = apartments.str.replace(prefix_to_remove, '', regex=False).astype(object)
+    
+    # Extract number using regex if configured
+    extract_pattern = config.get('extract_pattern')
+    if extract_pattern:
+        extracted = _first_group(apartments, extract_pattern)
+        apartments = apartments.where(extracted.isna(), extracted)
+    
+    # Convert to integer
+    return _as_int(apartments, apartments)
+
+
+def clean_floor_numbers(values, config):
+    """
+    Clean and standardize a column of floor numbers (see clean_floor_number).
+    
+    Args:
+        values: Object Series of raw floor values
+        config: Floor cleaning configuration
+        
+    Returns:
+        Object Series of cleaned floor numbers/identifiers (None if missing)
+    """
+    floors = _stripped(values)
+    
+    # Handle newlines in floor values (e.g., "10\nB3+4" -> "10")
+    floors = floors.str.split('\n').str[0].str.strip().astype(object).where(floors.notna(), None)
+    floors = _remove_prefix(floors, config.get('remove_prefix'))
+    floors = _remove_suffix(floors, config.get('remove_suffix'))
+    
+    # Convert to integer if configured (via float, so "1.0" -> 1)
+    if config.get('convert_to_int', False):
+        numbers = pd.to_numeric(floors.str.strip(), errors='coerce')
+        finite = numbers.notna() & np.isfinite(numbers)
+        floors = floors.copy()
+        floors[finite] = np.trunc(numbers[finite]).astype('int64').tolist()
+    
+    return floors
+
+
+def _sort_apartments(apt_list):
+    """Sort apartment list, handling mixed int/str types."""
+    try:
+        # Try sorting as-is
+        return sorted(apt_list)
+    except TypeError:
+        # If comparison fails, convert all to strings for sorting
+        return sorted(apt_list, key=str)
+
+
+def _sort_floors(floors):
+    """Sort a block's distinct floors, handling mixed int/str types."""
+    try:
+        return sorted(floors)
+    except TypeError:
+        # If comparison fails, convert all to int for sorting
+        return sorted(floors, key=lambda x: int(x) if x is not None else -1)
+
+
+def _truthy(values):
+    """Mask of values that are neither None nor empty (or zero)."""
+    return values.notna() & (values != '') & (values != 0)
+
+
+def build_accommodation_data(df, schedule_config, source_file):
+    """
+    Build the ACCOMMODATION_DATA structure from an accommodation schedule.
+    
+    Columns are cleaned and extracted a column at a time, and the phase,
+    block, type and tenure statistics grouped with pandas, rather than
+    walking the schedule row by row.
+    
+    Args:
+        df: Accommodation schedule as read from the file
+        schedule_config: The project's ACCOMMODATION_SCHEDULE_CONFIG
+        source_file: Schedule file name recorded in the data
+        
+    Returns:
+        Dictionary with structured accommodation data
+    """
+    column_mapping = schedule_config.get('column_mapping', {})
+    apartment_type_cleaning = schedule_config.get('apartment_type_cleaning', {})
+    bedrooms_cleaning = schedule_config.get('bedrooms_cleaning', {})
+    custom_extractors = schedule_config.get('custom_extractors', {})
+    
+    # Extract and clean apartment numbers; rows without one are skipped
+    apartments = clean_apartment_numbers(_schedule_column(df, column_mapping.get('apartment')),
+                                         schedule_config.get('apartment_cleaning', {}))
+    valid = _truthy(apartments)
+    df = df[valid]
+    apartments = apartments[valid]
+    
+    # Extract other attributes
+    phases = _stripped(_schedule_column(df, column_mapping.get('phase')))
+    blocks = _stripped(_schedule_column(df, column_mapping.get('block'))).str.upper().astype(object)
+    blocks = blocks.where(blocks.notna(), None)
+    floor_col = column_mapping.get('floor')
+    if floor_col:
+        floors = clean_floor_numbers(_schedule_column(df, floor_col), schedule_config.get('floor_cleaning', {}))
+    else:
+        floors = _missing(df.index)
+    apt_types = _stripped(_schedule_column(df, column_mapping.get('apartment_type')))
+    tenures = _stripped(_schedule_column(df, column_mapping.get('tenure')))
+    
+    # Apply custom extractors if defined (e.g., extract block/floor from plot number)
+    block_config = custom_extractors.get('block', {})
+    if block_config.get('source_column') and block_config.get('pattern'):
+        source = _stripped(_schedule_column(df, block_config['source_column']))
+        whole, groups = _search(source[~_truthy(blocks)], block_config['pattern'])
+        matched = whole.notna()
+        if matched.any():
+            format_str = block_config.get('format', '{0}')
+            blocks = blocks.copy()
+            blocks[whole[matched].index] = [format_str.format(*row) for row
+                                             in groups[matched].itertuples(index=False, name=None)]
+    
+    floor_config = custom_extractors.get('floor', {})
+    if floor_config.get('source_column') and floor_config.get('pattern'):
+        source = _stripped(_schedule_column(df, floor_config['source_column']))
+        whole, groups = _search(source[~_truthy(floors)], floor_config['pattern'])
+        extracted = groups.iloc[:, 0][whole.notna()]
+        if floor_config.get('convert_to_int', False):
+            extracted = _as_int(extracted, extracted)
+        floors = floors.copy()
+        floors[extracted.index] = extracted
+    
+    # Clean apartment type if needed
+    if apartment_type_cleaning:
+        apt_types = _remove_prefix(apt_types, apartment_type_cleaning.get('remove_prefix'))
+    
+    # Parse bedrooms (non-numeric values and codes without a match are None)
+    bedrooms = _stripped(_schedule_column(df, column_mapping.get('bedrooms')))
+    no_bedrooms = _missing(df.index)
+    extract_pattern = bedrooms_cleaning.get('extract_pattern')
+    if extract_pattern:
+        whole, groups = _search(bedrooms, extract_pattern)
+        # A pattern without a group gives no bedroom counts
+        bedrooms = _as_int(groups.iloc[:, 0], no_bedrooms) if groups.shape[1] else no_bedrooms
+    else:
+        bedrooms = _as_int(bedrooms, no_bedrooms)
+    
+    apartment_list = apartments.tolist()
+    schedule = pd.DataFrame({
+        'apartment': apartments,
+        'phase': phases.where(_truthy(phases), 'Default'),
+        'block': blocks.where(_truthy(blocks), None),
+        'floor': floors,
+        'type': apt_types.where(_truthy(apt_types), None),
+        'bedrooms': bedrooms,
+        'tenure': tenures.where(_truthy(tenures), None),
+    })
+    
+    # Build structured data
+    accommodation_data = {
+        'total_apartments': len(apartment_list),
+        'last_updated': datetime.now().strftime('%Y-%m-%d'),
+        'source_file': source_file,
+        'phases': {},
+        'apartment_types': {},
+        'apartment_lookup': dict(zip(apartment_list, [
+            {'phase': phase, 'block': block, 'floor': floor, 'type': apt_type,
+             'bedrooms': bedroom_count, 'tenure': tenure}
+            for phase, block, floor, apt_type, bedroom_count, tenure
+            in zip(phases, blocks, floors, apt_types, bedrooms, tenures)
+        ])),
+    }
+    
+    # Phase statistics (use 'Default' if no phase specified), with their blocks
+    for phase, phase_rows in schedule.groupby('phase', sort=False):
+        phase_data = {
+            'apartment_count': len(phase_rows),
+            'apartments': _sort_apartments(phase_rows['apartment'].tolist()),
+            'blocks': {}
+        }
+        for block, block_rows in phase_rows.groupby('block', sort=False):
+            # Include floor even if it's 0 (but not if it's None)
+            phase_data['blocks'][block] = {
+                'apartment_count': len(block_rows),
+                'apartments': _sort_apartments(block_rows['apartment'].tolist()),
+                'floors': _sort_floors(set(block_rows['floor'].dropna().tolist()))
+            }
+        accommodation_data['phases'][phase] = phase_data
+    
+    # Apartment type statistics (bedrooms of each type's first apartment)
+    for apt_type, type_rows in schedule.groupby('type', sort=False):
+        accommodation_data['apartment_types'][apt_type] = {
+            'count': len(type_rows),
+            'bedrooms': type_rows['bedrooms'].iloc[0],
+            'apartments': _sort_apartments(type_rows['apartment'].tolist())
+        }
+    
+    # Tenure statistics
+    accommodation_data['tenures'] = {}
+    for tenure, tenure_rows in schedule.groupby('tenure', sort=False):
+        accommodation_data['tenures'][tenure] = {
+            'count': len(tenure_rows),
+            'apartments': _sort_apartments(tenure_rows['apartment'].tolist())
+        }
+    
+    return accommodation_data
+
+
 def parse_accommodation_schedule(project_name):
     """
     Parse accommodation schedule for a project and generate structured data.
@@ -174,229 +496,16 @@ def parse_accommodation_schedule(project_name):
     
     print(f"   Loaded {len(df)} rows")
     
-    # Get column mappings
-    column_mapping = schedule_config.get('column_mapping', {})
-    
     # Required columns
+    column_mapping = schedule_config.get('column_mapping', {})
     apartment_col = column_mapping.get('apartment')
     if not apartment_col or apartment_col not in df.columns:
         print(f"❌ Error: Apartment column '{apartment_col}' not found in schedule")
         print(f"   Available columns: {list(df.columns)}")
         return None
     
-    # Optional columns
-    phase_col = column_mapping.get('phase')
-    block_col = column_mapping.get('block')
-    floor_col = column_mapping.get('floor')
-    type_col = column_mapping.get('apartment_type')
-    bedrooms_col = column_mapping.get('bedrooms')
-    tenure_col = column_mapping.get('tenure')
-    
-    # Get cleaning configurations
-    apartment_cleaning = schedule_config.get('apartment_cleaning', {})
-    floor_cleaning = schedule_config.get('floor_cleaning', {})
-    bedrooms_cleaning = schedule_config.get('bedrooms_cleaning', {})
-    apartment_type_cleaning = schedule_config.get('apartment_type_cleaning', {})
-    custom_extractors = schedule_config.get('custom_extractors', {})
-    
-    # Build structured data
-    accommodation_data = {
-        'total_apartments': 0,
-        'last_updated': datetime.now().strftime('%Y-%m-%d'),
-        'source_file': str(file_path.name),
-        'phases': {},
-        'apartment_types': {},
-        'apartment_lookup': {}
-    }
-    
-    # Track phase/block statistics
-    phase_stats = {}
-    block_stats = {}
-    type_stats = {}
-    tenure_stats = {}
-    
-    # Process each row
-    valid_apartments = 0
-    for idx, row in df.iterrows():
-        # Extract and clean apartment number
-        apt_num = clean_apartment_number(row.get(apartment_col), apartment_cleaning)
-        if not apt_num:
-            continue
-        
-        valid_apartments += 1
-        
-        # Extract other attributes
-        phase = str(row.get(phase_col)).strip() if phase_col and pd.notna(row.get(phase_col)) else None
-        block = str(row.get(block_col)).strip().upper() if block_col and pd.notna(row.get(block_col)) else None
-        floor = clean_floor_number(row.get(floor_col), floor_cleaning) if floor_col else None
-        apt_type = str(row.get(type_col)).strip() if type_col and pd.notna(row.get(type_col)) else None
-        tenure = str(row.get(tenure_col)).strip() if tenure_col and pd.notna(row.get(tenure_col)) else None
-        
-        # Apply custom extractors if defined (e.g., extract block/floor from plot number)
-        import re
-        if custom_extractors:
-            # Extract block from custom pattern
-            if 'block' in custom_extractors and not block:
-                block_config = custom_extractors['block']
-                source_col = block_config.get('source_column')
-                pattern = block_config.get('pattern')
-                format_str = block_config.get('format', '{0}')
-                
-                if source_col and pattern and pd.notna(row.get(source_col)):
-                    source_value = str(row.get(source_col)).strip()
-                    match = re.search(pattern, source_value)
-                    if match:
-                        block = format_str.format(*match.groups())
-            
-            # Extract floor from custom pattern
-            if 'floor' in custom_extractors and not floor:
-                floor_config = custom_extractors['floor']
-                source_col = floor_config.get('source_column')
-                pattern = floor_config.get('pattern')
-                convert_to_int = floor_config.get('convert_to_int', False)
-                
-                if source_col and pattern and pd.notna(row.get(source_col)):
-                    source_value = str(row.get(source_col)).strip()
-                    match = re.search(pattern, source_value)
-                    if match:
-                        floor_value = match.group(1)
-                        if convert_to_int:
-                            try:
-                                floor = int(floor_value)
-                            except ValueError:
-                                floor = floor_value
-                        else:
-                            floor = floor_value
-        
-        # Clean apartment type if needed
-        if apt_type and apartment_type_cleaning:
-            prefix_to_remove = apartment_type_cleaning.get('remove_prefix')
-            if prefix_to_remove and apt_type.startswith(prefix_to_remove):
-                apt_type = apt_type[len(prefix_to_remove):]
-        
-        # Parse bedrooms (handle non-numeric values and extraction patterns)
-        bedrooms = None
-        if bedrooms_col and pd.notna(row.get(bedrooms_col)):
-            bedrooms_value = str(row.get(bedrooms_col)).strip()
-            
-            # Check if extraction pattern is specified
-            extract_pattern = bedrooms_cleaning.get('extract_pattern')
-            if extract_pattern:
-                import re
-                match = re.search(extract_pattern, bedrooms_value)
-                if match:
-                    try:
-                        bedrooms = int(match.group(1))
-                    except (ValueError, TypeError, IndexError):
-                        pass
-            else:
-                # Try direct conversion
-                try:
-                    bedrooms = int(bedrooms_value)
-                except (ValueError, TypeError):
-                    pass  # Skip non-numeric bedroom values
-        
-        # Store in apartment lookup
-        accommodation_data['apartment_lookup'][apt_num] = {
-            'phase': phase,
-            'block': block,
-            'floor': floor,
-            'type': apt_type,
-            'bedrooms': bedrooms,
-            'tenure': tenure
-        }
-        
-        # Update phase statistics (use 'Default' if no phase specified)
-        phase_key = phase if phase else 'Default'
-        
-        if phase_key not in phase_stats:
-            phase_stats[phase_key] = {
-                'apartments': [],
-                'blocks': {}
-            }
-        phase_stats[phase_key]['apartments'].append(apt_num)
-        
-        # Update block statistics within phase
-        if block:
-            if block not in phase_stats[phase_key]['blocks']:
-                phase_stats[phase_key]['blocks'][block] = {
-                    'apartments': [],
-                    'floors': set()
-                }
-            phase_stats[phase_key]['blocks'][block]['apartments'].append(apt_num)
-            # Include floor even if it's 0 (but not if it's None)
-            if floor is not None:
-                phase_stats[phase_key]['blocks'][block]['floors'].add(floor)
-        
-        # Update apartment type statistics
-        if apt_type:
-            if apt_type not in type_stats:
-                type_stats[apt_type] = {
-                    'apartments': [],
-                    'bedrooms': bedrooms
-                }
-            type_stats[apt_type]['apartments'].append(apt_num)
-        
-        # Update tenure statistics
-        if tenure:
-            if tenure not in tenure_stats:
-                tenure_stats[tenure] = {
-                    'apartments': []
-                }
-            tenure_stats[tenure]['apartments'].append(apt_num)
-    
-    accommodation_data['total_apartments'] = valid_apartments
-    print(f"✓ Processed {valid_apartments} valid apartments")
-    
-    # Helper function to sort mixed types (int and str apartment numbers)
-    def sort_apartments(apt_list):
-        """Sort apartment list, handling mixed int/str types."""
-        try:
-            # Try sorting as-is
-            return sorted(apt_list)
-        except TypeError:
-            # If comparison fails, convert all to strings for sorting
-            return sorted(apt_list, key=str)
-    
-    # Build phases structure
-    for phase, stats in phase_stats.items():
-        phase_data = {
-            'apartment_count': len(stats['apartments']),
-            'apartments': sort_apartments(stats['apartments']),
-            'blocks': {}
-        }
-        
-        for block, block_data in stats['blocks'].items():
-            # Sort floors, handling potential mixed int/str types
-            try:
-                sorted_floors = sorted(list(block_data['floors']))
-            except TypeError:
-                # If comparison fails, convert all to int for sorting
-                sorted_floors = sorted(list(block_data['floors']), key=lambda x: int(x) if x is not None else -1)
-            
-            phase_data['blocks'][block] = {
-                'apartment_count': len(block_data['apartments']),
-                'apartments': sort_apartments(block_data['apartments']),
-                'floors': sorted_floors
-            }
-        
-        accommodation_data['phases'][phase] = phase_data
-    
-    # Build apartment types structure
-    for apt_type, stats in type_stats.items():
-        accommodation_data['apartment_types'][apt_type] = {
-            'count': len(stats['apartments']),
-            'bedrooms': stats['bedrooms'],
-            'apartments': sort_apartments(stats['apartments'])
-        }
-    
-    # Build tenure structure
-    accommodation_data['tenures'] = {}
-    for tenure, stats in tenure_stats.items():
-        accommodation_data['tenures'][tenure] = {
-            'count': len(stats['apartments']),
-            'apartments': sort_apartments(stats['apartments'])
-        }
+    accommodation_data = build_accommodation_data(df, schedule_config, str(file_path.name))
+    print(f"✓ Processed {accommodation_data['total_apartments']} valid apartments")
     
     # Print summary
     print(f"\n📊 Summary:")
@@ -414,123 +523,109 @@ def parse_accommodation_schedule(project_name):
     return accommodation_data
 
 
-def update_config_file(project_name, accommodation_data):
+# Header of the ACCOMMODATION_DATA section older versions wrote into the config file
+EMBEDDED_DATA_MARKER = '# Accommodation Data - Auto-generated'
+EMBEDDED_DATA_HEADER = '# Accommodation Data (Auto-generated - DO NOT EDIT MANUALLY)'
+
+
+def get_accommodation_file(project_name):
+    """Path of a project's accommodation data file."""
+    return ACCOMMODATION_DIR / f"{project_name}{ACCOMMODATION_SUFFIX}"
+
+
+def remove_embedded_data(project_name):
     """
-    Update the project config file with accommodation data.
+    Remove an ACCOMMODATION_DATA section written into the project config file.
+    
+    Configs that define ACCOMMODATION_DATA take precedence over the data
+    file, so the section goes once the file is written.
     
     Args:
         project_name: Name of the project
-        accommodation_data: Structured accommodation data dictionary
+        
+    Returns:
+        True if a section was removed
     """
     config_file = CONFIGS_DIR / f"{project_name}.py"
-    
-    print(f"\n📝 Updating config file: {config_file}")
-    
-    # Read existing config
     with open(config_file, 'r', encoding='utf-8') as f:
         config_content = f.read()
     
-    # Generate ACCOMMODATION_DATA section
-    data_section = f"\n# Accommodation Data - Auto-generated by update_accommodation_data.py\n"
-    data_section += f"# Last updated: {accommodation_data['last_updated']}\n"
-    data_section += f"# Source: {accommodation_data['source_file']}\n"
-    data_section += f"ACCOMMODATION_DATA = {{\n"
-    data_section += f"    'total_apartments': {accommodation_data['total_apartments']},\n"
-    data_section += f"    'last_updated': '{accommodation_data['last_updated']}',\n"
-    data_section += f"    'source_file': '{accommodation_data['source_file']}',\n"
-    data_section += f"    \n"
-    data_section += f"    'phases': {{\n"
-    
-    for phase, phase_data in accommodation_data['phases'].items():
-        data_section += f"        '{phase}': {{\n"
-        data_section += f"            'apartment_count': {phase_data['apartment_count']},\n"
-        data_section += f"            'apartments': {phase_data['apartments']},\n"
-        data_section += f"            'blocks': {{\n"
-        
-        for block, block_data in phase_data['blocks'].items():
-            data_section += f"                '{block}': {{\n"
-            data_section += f"                    'apartment_count': {block_data['apartment_count']},\n"
-            data_section += f"                    'apartments': {block_data['apartments']},\n"
-            data_section += f"                    'floors': {block_data['floors']}\n"
-            data_section += f"                }},\n"
-        
-        data_section += f"            }}\n"
-        data_section += f"        }},\n"
+    if 'ACCOMMODATION_DATA = {' not in config_content:
+        return False
+    
+    start_idx = config_content.find(EMBEDDED_DATA_MARKER)
+    if start_idx == -1:
+        start_idx = config_content.find('ACCOMMODATION_DATA = {')
+    header_idx = config_content.rfind(EMBEDDED_DATA_HEADER, 0, start_idx)
+    if header_idx != -1 and all(not line.strip() or line.startswith('#')
+                                for line in config_content[header_idx:start_idx].splitlines()):
+        start_idx = header_idx
+    
+    # Find the end of the dictionary
+    end_marker = '\n}\n'
+    end_idx = config_content.find(end_marker, start_idx)
+    if end_idx == -1:
+        print("⚠️  Warning: Could not find end of ACCOMMODATION_DATA section")
+        print("   Please remove it from the config file manually")
+        return False
+    
+    before = config_content[:start_idx].rstrip()
+    after = config_content[end_idx + len(end_marker):].lstrip('\n')
+    pointer = (f"# Accommodation data is stored in data/accommodation/{project_name}{ACCOMMODATION_SUFFIX}\n"
+               f"# Run scripts/update_accommodation_data.py to regenerate it\n")
+    config_content = before + '\n\n' + pointer + ('\n\n' + after if after.strip() else '')
+    
+    with open(config_file, 'w', encoding='utf-8') as f:
+        f.write(config_content)
+    return True
+
+
+def update_accommodation_file(project_name, accommodation_data):
+    """
+    Save accommodation data to the project's data file.
     
-    data_section += f"    }},\n"
-    data_section += f"    \n"
+    Args:
+        project_name: Name of the project
+        accommodation_data: Structured accommodation data dictionary
+    """
+    data_file = get_accommodation_file(project_name)
     
-    # Add apartment types if present
-    if accommodation_data['apartment_types']:
-        data_section += f"    'apartment_types': {{\n"
-        for apt_type, type_data in accommodation_data['apartment_types'].items():
-            data_section += f"        '{apt_type}': {{\n"
-            data_section += f"            'count': {type_data['count']},\n"
-            data_section += f"            'bedrooms': {type_data.get('bedrooms')},\n"
-            data_section += f"            'apartments': {type_data['apartments']}\n"
-            data_section += f"        }},\n"
-        data_section += f"    }},\n"
-        data_section += f"    \n"
-    
-    # Add tenures if present
-    if accommodation_data.get('tenures'):
-        data_section += f"    'tenures': {{\n"
-        for tenure, tenure_data in accommodation_data['tenures'].items():
-            data_section += f"        '{tenure}': {{\n"
-            data_section += f"            'count': {tenure_data['count']},\n"
-            data_section += f"            'apartments': {tenure_data['apartments']}\n"
-            data_section += f"        }},\n"
-        data_section += f"    }},\n"
-        data_section += f"    \n"
-    
-    # Add apartment lookup (but abbreviated for readability)
-    data_section += f"    'apartment_lookup': {{\n"
-    data_section += f"        # Full apartment lookup dictionary with {len(accommodation_data['apartment_lookup'])} apartments\n"
-    for apt_num, apt_data in accommodation_data['apartment_lookup'].items():
-        # Quote apartment numbers if they are strings, otherwise use as-is for numeric IDs
-        apt_key = f"'{apt_num}'" if isinstance(apt_num, str) else apt_num
-        data_section += f"        {apt_key}: {apt_data},\n"
-    data_section += f"    }}\n"
-    data_section += f"}}\n"
-    
-    # Check if ACCOMMODATION_DATA already exists in the file
-    if 'ACCOMMODATION_DATA = {' in config_content:
-        # Replace existing ACCOMMODATION_DATA section
-        # Find the start of ACCOMMODATION_DATA
-        start_marker = '# Accommodation Data - Auto-generated'
-        end_marker = '\n}\n'
+    print(f"\n📝 Writing accommodation data: {data_file}")
+    save_accommodation_data(accommodation_data, data_file)
+    print(f"✓ Saved {accommodation_data['total_apartments']} apartments "
+          f"({data_file.stat().st_size / 1024:.1f} KB)")
+    
+    if remove_embedded_data(project_name):
+        print(f"✓ Removed the old ACCOMMODATION_DATA section from configs/{project_name}.py")
+
+
+def migrate_config_files():
+    """
+    Move ACCOMMODATION_DATA out of the project config files into data files.
+    
+    Returns:
+        Number of projects migrated
+    """
+    migrated = 0
+    for config_file in sorted(CONFIGS_DIR.glob("*.py")):
+        if config_file.name.startswith('__'):
+            continue
         
-        start_idx = config_content.find(start_marker)
-        if start_idx == -1:
-            start_idx = config_content.find('ACCOMMODATION_DATA = {')
+        project_name = config_file.stem
+        import importlib.util
+        spec = importlib.util.spec_from_file_location(project_name, config_file)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        accommodation_data = getattr(module, 'ACCOMMODATION_DATA', None)
+        if not accommodation_data:
+            continue
         
-        if start_idx != -1:
-            # Find the end of the dictionary
-            end_idx = config_content.find(end_marker, start_idx)
-            if end_idx != -1:
-                end_idx += len(end_marker)
-                # Replace the section
-                config_content = config_content[:start_idx] + data_section + config_content[end_idx:]
-            else:
-                print("⚠️  Warning: Could not find end of ACCOMMODATION_DATA section")
-                print("   Please manually review and update the config file")
-        else:
-            print("⚠️  Warning: Could not find ACCOMMODATION_DATA section to replace")
-            print("   Appending to end of file instead")
-            config_content += '\n' + data_section
-    else:
-        # Append to end of file
-        config_content += '\n' + data_section
+        print(f"\n🏢 {project_name}: {config_file.stat().st_size / 1024:.1f} KB config")
+        update_accommodation_file(project_name, accommodation_data)
+        print(f"   Config is now {config_file.stat().st_size / 1024:.1f} KB")
+        migrated += 1
     
-    # Write updated config
-    with open(config_file, 'w', encoding='utf-8') as f:
-        f.write(config_content)
-    
-    print(f"✓ Config file updated successfully")
-    print(f"\n💡 Next steps:")
-    print(f"   1. Review the changes in your Git diff")
-    print(f"   2. Verify the accommodation data looks correct")
-    print(f"   3. Commit the changes when satisfied")
+    return migrated
 
 
 def get_available_projects():
@@ -587,14 +682,10 @@ def show_current_status():
     
     for project_name in sorted(available_projects.keys()):
         try:
-            import importlib.util
-            config_file = CONFIGS_DIR / f"{project_name}.py"
-            spec = importlib.util.spec_from_file_location(project_name, config_file)
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
+            # The data file, or ACCOMMODATION_DATA in configs not yet migrated
+            data = get_accommodation_data(load_project_config(project_name))
             
-            if hasattr(module, 'ACCOMMODATION_DATA'):
-                data = module.ACCOMMODATION_DATA
+            if data:
                 apartments = data.get('total_apartments', 0)
                 total_apartments += apartments
                 
@@ -636,7 +727,7 @@ def show_menu():
     print("\n" + "=" * 80)
     print("🏢  ACCOMMODATION SCHEDULE UPDATER")
     print("=" * 80)
-    print("\nThis tool parses accommodation schedules and updates project configurations")
+    print("\nThis tool parses accommodation schedules and updates project accommodation data")
     print("with apartment data (phases, blocks, types, tenures, etc.)")
     
     # Get available projects
@@ -694,6 +785,11 @@ def show_menu():
 
 def main():
     """Main entry point for the script."""
+    if len(sys.argv) >= 2 and sys.argv[1] == '--migrate':
+        migrated = migrate_config_files()
+        print(f"\n✓ Migrated {migrated} project(s)" if migrated else "\nℹ️  No config files with ACCOMMODATION_DATA")
+        sys.exit(0)
+    
     # Check if project name provided as command line argument
     if len(sys.argv) >= 2:
         # Command line mode
@@ -724,8 +820,8 @@ def main():
                 fail_count += 1
                 continue
             
-            # Update the config file
-            update_config_file(project_name, accommodation_data)
+            # Save the data file
+            update_accommodation_file(project_name, accommodation_data)
             
             print(f"\n✅ {project_name} accommodation data updated successfully!")
             success_count += 1
@@ -4,13 +4,25 @@ from .formatting import (
     OVERALL_SUMMARY_STYLES,
     PROGRESSION_STATUS_ORDER,
     STATUS_STYLES,
-    apply_status_style
+    REPORT_NAMED_STYLES,
+    PROGRESSION_NAMED_STYLES,
+    CERTIFICATE_TABLE_NAMED_STYLES,
+    apply_status_style,
+    register_named_styles,
+    get_status_style_name,
+    get_progress_style_name
 )
 
 __all__ = [
     'OVERALL_SUMMARY_STYLES',
     'PROGRESSION_STATUS_ORDER',
     'STATUS_STYLES',
-    'apply_status_style'
+    'REPORT_NAMED_STYLES',
+    'PROGRESSION_NAMED_STYLES',
+    'CERTIFICATE_TABLE_NAMED_STYLES',
+    'apply_status_style',
+    'register_named_styles',
+    'get_status_style_name',
+    'get_progress_style_name'
 ]
 
@@ -1,6 +1,7 @@
 """Formatting and styling configurations for Excel reports."""
 
-from openpyxl.styles import PatternFill, Font, Alignment, Border, Side
+from openpyxl.styles import PatternFill, Font, Alignment, Border, Side, NamedStyle
+from openpyxl.styles.borders import DEFAULT_BORDER
 
 
 # Overall Summary Sheet Style Configuration
@@ -181,6 +182,153 @@ STATUS_STYLES = {
     }
 }
 
+_THIN_BORDER = Border(
+    left=Side(style='thin'),
+    right=Side(style='thin'),
+    top=Side(style='thin'),
+    bottom=Side(style='thin')
+)
+
+# Named styles shared by the report modules. Registered once per workbook with
+# register_named_styles() and applied by name (cell.style = 'Report Data').
+REPORT_NAMED_STYLES = {
+    'Report Title': {
+        'font': Font(name='Calibri', size=14, bold=True),
+        'alignment': Alignment(horizontal='center', vertical='center')
+    },
+    'Report Section': {
+        'font': Font(name='Calibri', size=12, bold=True),
+        'fill': PatternFill(start_color='F0F0F0', end_color='F0F0F0', fill_type='solid')
+    },
+    'Report Column Header': {
+        'font': Font(name='Calibri', size=11, bold=True),
+        'alignment': Alignment(horizontal='center', vertical='center', wrap_text=True)
+    },
+    'Report Monthly Header': {
+        'font': Font(name='Calibri', size=11, bold=True, color='FFFFFF'),
+        'fill': PatternFill(start_color='4472C4', end_color='4472C4', fill_type='solid'),
+        'alignment': Alignment(horizontal='center', vertical='center', wrap_text=True)
+    },
+    'Report Label': {
+        'font': Font(name='Calibri', size=11),
+        'alignment': Alignment(horizontal='left', vertical='center')
+    },
+    'Report Data': {
+        'font': Font(name='Calibri', size=11),
+        'alignment': Alignment(horizontal='center', vertical='center')
+    },
+    'Report Zero': {
+        'font': Font(name='Calibri', size=11),
+        'alignment': Alignment(horizontal='center', vertical='center')
+    },
+    'Report Total Label': {
+        'font': Font(name='Calibri', size=11, bold=True),
+        'alignment': Alignment(horizontal='left', vertical='center'),
+        'fill': PatternFill(start_color='E6E6E6', end_color='E6E6E6', fill_type='solid')
+    },
+    'Report Total': {
+        'font': Font(name='Calibri', size=11, bold=True),
+        'alignment': Alignment(horizontal='center', vertical='center'),
+        'fill': PatternFill(start_color='E6E6E6', end_color='E6E6E6', fill_type='solid')
+    },
+    'Report Table Header': {
+        'font': Font(name='Calibri', size=11, bold=True),
+        'fill': PatternFill(start_color='D9E1F2', end_color='D9E1F2', fill_type='solid'),
+        'alignment': Alignment(horizontal='center', vertical='center'),
+        'border': _THIN_BORDER
+    },
+    'Report Table Label': {
+        'font': Font(name='Calibri', size=10),
+        'alignment': Alignment(horizontal='left', vertical='center'),
+        'border': _THIN_BORDER
+    },
+    'Report Table Value': {
+        'font': Font(name='Calibri', size=10),
+        'alignment': Alignment(horizontal='center', vertical='center'),
+        'border': _THIN_BORDER
+    },
+    'Report Table Bar': {
+        'font': Font(name='Courier New', size=10),
+        'alignment': Alignment(horizontal='left', vertical='center'),
+        'border': _THIN_BORDER
+    },
+}
+
+# Styles used by the progression report sheets
+PROGRESSION_NAMED_STYLES = [
+    'Report Title', 'Report Section', 'Report Column Header', 'Report Label',
+    'Report Data', 'Report Zero', 'Report Total Label', 'Report Total'
+]
+
+# Progress percentage fills: (minimum percentage, style name, color)
+PROGRESS_FILL_STYLES = [
+    (80, 'Progress High', '25E82C'),      # Green
+    (50, 'Progress Medium', 'EDDDA1'),    # Yellow
+    (25, 'Progress Low', 'FFA500'),       # Orange
+    (0, 'Progress Critical', 'ED1111'),   # Red
+]
+
+for _, _style_name, _color in PROGRESS_FILL_STYLES:
+    REPORT_NAMED_STYLES[_style_name] = {
+        'font': Font(name='Calibri', size=10, bold=True),
+        'alignment': Alignment(horizontal='center', vertical='center'),
+        'fill': PatternFill(start_color=_color, end_color=_color, fill_type='solid'),
+        'border': _THIN_BORDER
+    }
+
+# Styles used by the certificate tracking table
+CERTIFICATE_TABLE_NAMED_STYLES = [
+    'Report Table Header', 'Report Table Label', 'Report Table Value', 'Report Table Bar'
+] + [style_name for _, style_name, _ in PROGRESS_FILL_STYLES]
+
+
+def get_status_style_name(category):
+    """Name of the registered named style for a STATUS_MAPPINGS category."""
+    return f'Status: {category}'
+
+
+def get_progress_style_name(progress_pct):
+    """Name of the progress fill style for a completion percentage."""
+    for minimum, style_name, _ in PROGRESS_FILL_STYLES:
+        if progress_pct >= minimum:
+            return style_name
+    return PROGRESS_FILL_STYLES[-1][1]
+
+
+def register_named_styles(wb, names=None, config=None):
+    """Register the report named styles on a workbook (once per workbook).
+    
+    Styles already present (e.g. in a workbook loaded from disk) are reused.
+    
+    Args:
+        wb: openpyxl Workbook
+        names: Names from REPORT_NAMED_STYLES to register (default: all)
+        config: Project configuration - adds one style per STATUS_MAPPINGS color
+        
+    Returns:
+        list: Names of the registered styles
+    """
+    if names is None:
+        names = REPORT_NAMED_STYLES
+    styles = {name: REPORT_NAMED_STYLES[name] for name in names}
+    if config and config.get('STATUS_MAPPINGS'):
+        for category, mapping in config['STATUS_MAPPINGS'].items():
+            color = mapping.get('color')
+            if color:
+                styles[get_status_style_name(category)] = {
+                    'font': OVERALL_SUMMARY_STYLES['data_cell']['font'],
+                    'fill': PatternFill(start_color=color, end_color=color, fill_type='solid')
+                }
+    
+    existing = set(wb.style_names)
+    for name, attributes in styles.items():
+        if name not in existing:
+            # Same empty border as unstyled cells (a bare Border() makes merged
+            # ranges restyle every edge cell)
+            attributes = {'border': DEFAULT_BORDER, **attributes}
+            wb.add_named_style(NamedStyle(name=name, **attributes))
+    return list(styles)
+
 
 def apply_status_style(cell, status_name, config=None):
     """Apply conditional formatting based on status name.
@@ -199,8 +347,13 @@ def apply_status_style(cell, status_name, config=None):
         if status_name in status_mappings:
             color = status_mappings[status_name].get('color')
             if color:
-                cell.font = OVERALL_SUMMARY_STYLES['data_cell']['font']
-                cell.fill = PatternFill(start_color=color, end_color=color, fill_type='solid')
+                style_name = get_status_style_name(status_name)
+                if style_name in cell.parent.parent.style_names:
+                    # Registered by register_named_styles()
+                    cell.style = style_name
+                else:
+                    cell.font = OVERALL_SUMMARY_STYLES['data_cell']['font']
+                    cell.fill = PatternFill(start_color=color, end_color=color, fill_type='solid')
                 return OVERALL_SUMMARY_STYLES['data_cell']
     
     # Fallback to old hardcoded styling
@@ -0,0 +1,103 @@
+"""Document history kept across snapshot compaction (DocumentDatabase.update_document_history)."""
+
+import pandas as pd
+
+from data.database import DocumentDatabase
+
+PROJECT = 'TestProject'
+
+# (snapshot_date, snapshot_time) -> {doc_ref: (revision, status)}
+SNAPSHOTS = {
+    ('2025-01-06', '09:00'): {'D-001': ('P01', 'S2'), 'D-002': ('P01', 'S2')},
+    ('2025-01-13', '09:00'): {'D-001': ('P02', 'S2'), 'D-002': ('P01', 'S2')},
+    ('2025-01-20', '09:00'): {'D-001': ('P02', 'A'), 'D-002': ('P01', 'S2'), 'D-003': ('P01', 'S1')},
+    ('2025-01-27', '09:00'): {'D-001': ('P02', 'A'), 'D-002': ('C01', 'A'), 'D-003': ('P01', 'S1')},
+}
+
+
+def insert_snapshot(db, snapshot, documents):
+    documents_df = pd.DataFrame(
+        [{'Doc Ref': doc_ref, 'Rev': revision, 'Status': status}
+         for doc_ref, (revision, status) in documents.items()]
+    )
+    db.insert_documents(PROJECT, *snapshot, documents_df)
+
+
+def history_spans(db):
+    index = db.get_snapshot_index(PROJECT)
+    snapshots = {row.id: (row.snapshot_date, row.snapshot_time) for row in index.itertuples()}
+    return sorted(
+        (span.doc_ref, span.revision, span.status,
+         snapshots[span.first_snapshot_id], snapshots[span.last_snapshot_id])
+        for span in db.get_history_spans(PROJECT).itertuples()
+    )
+
+
+def compacted_database(tmp_path):
+    db = DocumentDatabase(tmp_path / 'documents.db')
+    db.ensure_schema()
+    for snapshot, documents in SNAPSHOTS.items():
+        insert_snapshot(db, snapshot, documents)
+    db.update_document_history(PROJECT)
+    for snapshot in list(SNAPSHOTS)[:2]:
+        db.compact_snapshot(PROJECT, *snapshot, None)
+    return db
+
+
+def test_compacted_snapshots_stay_in_history_after_import(tmp_path):
+    db = compacted_database(tmp_path)
+    index_before = db.get_snapshot_index(PROJECT)
+    spans_before = history_spans(db)
+    
+    insert_snapshot(db, ('2025-02-03', '09:00'), SNAPSHOTS[('2025-01-27', '09:00')])
+    assert db.update_document_history(PROJECT) == 1
+    
+    index_after = db.get_snapshot_index(PROJECT)
+    assert index_after['id'].tolist()[:len(index_before)] == index_before['id'].tolist()
+    assert len(index_after) == len(SNAPSHOTS) + 1
+    assert ('D-001', 'P01', 'S2', ('2025-01-06', '09:00'), ('2025-01-06', '09:00')) in history_spans(db)
+    # Open spans of the last indexed snapshot are continued
+    assert len(history_spans(db)) == len(spans_before)
+    db.close()
+
+
+def test_rebuild_keeps_compacted_snapshot_documents(tmp_path):
+    db = compacted_database(tmp_path)
+    spans_before = history_spans(db)
+    
+    # An older register imported later rebuilds the history from its snapshot on
+    documents = dict(SNAPSHOTS[('2025-01-13', '09:00')], **{'D-004': ('P01', 'S1')})
+    insert_snapshot(db, ('2025-01-15', '09:00'), documents)
+    db.update_document_history(PROJECT)
+    
+    index = db.get_snapshot_index(PROJECT)
+    assert list(zip(index['snapshot_date'], index['snapshot_time'])) == sorted(
+        list(SNAPSHOTS) + [('2025-01-15', '09:00')]
+    )
+    spans = history_spans(db)
+    assert ('D-004', 'P01', 'S1', ('2025-01-15', '09:00'), ('2025-01-15', '09:00')) in spans
+    assert ('D-001', 'P01', 'S2', ('2025-01-06', '09:00'), ('2025-01-06', '09:00')) in spans
+    assert ('D-002', 'P01', 'S2', ('2025-01-06', '09:00'), ('2025-01-20', '09:00')) in spans
+    assert len(spans) == len(spans_before) + 1
+    db.close()
+
+
+def test_changes_against_compacted_snapshot_are_kept(tmp_path):
+    db = DocumentDatabase(tmp_path / 'documents.db')
+    db.ensure_schema()
+    snapshots = list(SNAPSHOTS)
+    for snapshot in snapshots[:3]:
+        insert_snapshot(db, snapshot, SNAPSHOTS[snapshot])
+    changes = pd.DataFrame([{
+        'Doc Ref': 'D-001', 'Doc Title': '', 'Change': 'status_changed', 'Previous Rev': 'P02',
+        'Rev': 'P02', 'Previous Status': 'S2', 'Status': 'A', 'Changed Columns': 'Status',
+    }])
+    db.replace_document_changes(PROJECT, *snapshots[2], snapshots[1], changes, 'fingerprint')
+    
+    db.compact_snapshot(PROJECT, *snapshots[1], None)
+    
+    assert db.get_previous_snapshot(PROJECT, *snapshots[2]) == snapshots[1]
+    stored = db.get_document_changes(PROJECT, *snapshots[2], fingerprint='fingerprint')
+    assert stored is not None
+    assert stored[['Doc Ref', 'Previous Status', 'Status']].values.tolist() == [['D-001', 'S2', 'A']]
+    db.close()
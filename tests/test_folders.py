@@ -0,0 +1,24 @@
+"""Folder attributes joined from the folders table (utils/folders.py)."""
+
+import pandas as pd
+
+from data.database import DocumentDatabase
+from utils.folders import document_folder_attributes
+
+PATHS = [r'\18.01\Block - A\FA Certs', r'\18.01\Landlords\FA Certs', '/Drawings/ SS /', '']
+
+
+def test_stored_folder_attributes_match_parsed_paths(tmp_path):
+    db = DocumentDatabase(tmp_path / 'documents.db')
+    db.ensure_schema()
+    documents_df = pd.DataFrame({'Doc Ref': [f'D-{index}' for index in range(len(PATHS))], 'Doc Path': PATHS})
+    db.insert_documents('TestProject', '2025-01-06', '09:00', documents_df)
+    
+    stored = db.get_documents_for_snapshot('TestProject', '2025-01-06', '09:00', include_attributes=True)
+    joined = document_folder_attributes(stored)
+    parsed = document_folder_attributes(stored[['Doc Path']])
+    
+    assert joined['landlords'].tolist() == parsed['landlords'].tolist() == [False, True, False, False]
+    assert joined['block'].fillna('').tolist() == parsed['block'].fillna('').tolist() == ['A', '', '', '']
+    assert joined['superseded'].tolist() == parsed['superseded'].tolist() == [False, False, True, False]
+    db.close()
@@ -0,0 +1,35 @@
+"""Named styles kept in the streamed (write_only) report workbooks."""
+
+import io
+from contextlib import redirect_stdout
+
+from openpyxl import load_workbook
+
+from main import REPORT_FUNCTIONS
+from reports.scheduler import JOB_SUCCESS, run_report_job
+from scripts.db_manager import initialize_database, update_database_with_new_files
+from scripts.generate_synthetic_register import generate_project_registers
+
+PROJECT = 'GreenwichPeninsula'
+
+
+def test_certificate_report_keeps_named_styles(tmp_path, monkeypatch):
+    generate_project_registers('GP', tmp_path / 'input', documents=300, snapshots=2)
+    db_path = str(tmp_path / 'documents.db')
+    # db_manager reads the project folders relative to the working directory
+    monkeypatch.chdir(tmp_path)
+    with redirect_stdout(io.StringIO()):
+        initialize_database(db_path)
+        update_database_with_new_files(db_path)
+    
+    output_dir = tmp_path / 'output'
+    output_dir.mkdir()
+    job = {'project': PROJECT, 'report': 'certificates'}
+    result = run_report_job(job, REPORT_FUNCTIONS['certificates'], db_path, output_dir)
+    assert result['status'] == JOB_SUCCESS, result['output']
+    
+    [report_file] = output_dir.rglob('*certificates*.xlsx')
+    wb = load_workbook(report_file)
+    assert 'Report Table Header' in wb.style_names
+    styles = {cell.style for row in wb['Overall Summary'].iter_rows() for cell in row}
+    assert {'Report Table Header', 'Report Table Label', 'Report Table Value'} <= styles
@@ -1,28 +1,60 @@
 """Utilities module for document reporter."""
 
-from .file_operations import (
-    load_processed_files_per_project,
-    save_processed_files_per_project,
-    get_project_files_with_timestamps,
-    detect_project_files,
-    slugify
-)
-from .timestamps import get_file_timestamp
-from .data_cleaning import clean_revision
-from .status_mapping import (
-    get_status_category,
-    get_status_color,
-    get_status_display_name,
-    get_grouped_status_counts,
-    get_status_display_order
-)
-from .document_filters import (
-    filter_certificates,
-    filter_technical_submittals,
-    filter_drawings_and_schematics,
-    get_main_report_data,
-    get_document_type_summary
-)
+from .lazy_imports import lazy_exports
+
+# Submodules are imported on first use of one of their names
+_SUBMODULE_EXPORTS = {
+    'file_operations': [
+        'load_processed_files_per_project',
+        'save_processed_files_per_project',
+        'get_project_files_with_timestamps',
+        'detect_project_files',
+        'slugify'
+    ],
+    'timestamps': [
+        'get_file_timestamp'
+    ],
+    'data_cleaning': [
+        'clean_revision'
+    ],
+    'revisions': [
+        'parse_revision',
+        'revision_sort_key',
+        'sort_revisions',
+        'group_revisions'
+    ],
+    'folders': [
+        'parse_folder',
+        'folder_attributes',
+        'document_folder_attributes'
+    ],
+    'status_mapping': [
+        'get_status_category',
+        'get_status_color',
+        'get_status_display_name',
+        'get_grouped_status_counts',
+        'get_status_display_order'
+    ],
+    'document_filters': [
+        'filter_certificates',
+        'filter_technical_submittals',
+        'filter_drawings_and_schematics',
+        'classify_documents',
+        'get_main_report_data',
+        'get_document_type_summary'
+    ],
+    'tracing': [
+        'span',
+        'traced',
+        'enable_tracing',
+        'disable_tracing',
+        'is_tracing_enabled',
+        'print_trace_summary',
+        'write_trace_profile'
+    ]
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _SUBMODULE_EXPORTS)
 
 __all__ = [
     'load_processed_files_per_project',
@@ -32,6 +64,13 @@ __all__ = [
     'slugify',
     'get_file_timestamp',
     'clean_revision',
+    'parse_revision',
+    'revision_sort_key',
+    'sort_revisions',
+    'group_revisions',
+    'parse_folder',
+    'folder_attributes',
+    'document_folder_attributes',
     'get_status_category',
     'get_status_color',
     'get_status_display_name',
@@ -40,7 +79,15 @@ __all__ = [
     'filter_certificates',
     'filter_technical_submittals',
     'filter_drawings_and_schematics',
+    'classify_documents',
     'get_main_report_data',
-    'get_document_type_summary'
+    'get_document_type_summary',
+    'span',
+    'traced',
+    'enable_tracing',
+    'disable_tracing',
+    'is_tracing_enabled',
+    'print_trace_summary',
+    'write_trace_profile'
 ]
 
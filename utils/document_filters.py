@@ -4,234 +4,296 @@ import pandas as pd
 import re
 
 
-def filter_certificates(df, config):
+# Document classes stored in the database (documents.doc_class)
+DOC_CLASS_CERTIFICATE = 'certificate'
+DOC_CLASS_TECHNICAL_SUBMITTAL = 'technical_submittal'
+DOC_CLASS_DRAWING = 'drawing'
+DOC_CLASS_OTHER = 'other'
+
+# Config sections that drive classification - a change to any of these
+# invalidates previously stored classifications
+CLASSIFICATION_CONFIG_SECTIONS = [
+    'CERTIFICATE_SETTINGS',
+    'TECHNICAL_SUBMITTAL_SETTINGS',
+    'DRAWING_SETTINGS',
+    'CERTIFICATE_TRACKING',
+]
+
+
+def _pattern_mask(df, settings, types_key, patterns_key, exact_types=False):
     """
-    Filter documents to return only certificates based on project config.
-    
-    Supports two filtering methods:
-    1. File type column matching (e.g., 'CT - Certificate (CT)')
-    2. Doc Ref pattern matching (e.g., 2-letter codes like 'CT', 'CE')
-    
+    Build a boolean mask from a file type filter and a Doc Ref pattern filter.
+
     Args:
         df: DataFrame containing document data
-        config: Project configuration dictionary
-        
+        settings: Settings section (e.g. CERTIFICATE_SETTINGS)
+        types_key: Key of the type list inside 'file_type_filter'
+        patterns_key: Key of the pattern list inside 'doc_ref_filter'
+        exact_types: Match file types exactly instead of by substring
+
     Returns:
-        DataFrame containing only certificate documents
+        Boolean Series aligned with df.index
     """
-    if df.empty:
-        return df
-    
-    cert_settings = config.get('CERTIFICATE_SETTINGS', {})
-    if not cert_settings.get('enabled', False):
-        return pd.DataFrame()  # Return empty DataFrame if certificates not enabled
-    
     mask = pd.Series([False] * len(df), index=df.index)
-    
+
     # Method 1: File type column filtering
-    file_type_filter = cert_settings.get('file_type_filter', {})
+    file_type_filter = settings.get('file_type_filter', {})
     if file_type_filter.get('enabled', False):
         file_type_col = file_type_filter.get('column_name')
-        cert_types = file_type_filter.get('certificate_types', [])
-        
-        if file_type_col and file_type_col in df.columns and cert_types:
-            for cert_type in cert_types:
-                type_mask = df[file_type_col].fillna('').astype(str).str.contains(
-                    re.escape(cert_type), 
-                    case=False, 
-                    na=False
-                )
-                mask = mask | type_mask
-    
+        doc_types = file_type_filter.get(types_key, [])
+
+        if file_type_col and file_type_col in df.columns and doc_types:
+            file_types = df[file_type_col].fillna('').astype(str)
+            if exact_types:
+                # Use .isin() for exact matching instead of .contains()
+                mask = mask | file_types.isin(doc_types)
+            else:
+                for doc_type in doc_types:
+                    type_mask = file_types.str.contains(
+                        re.escape(doc_type),
+                        case=False,
+                        na=False
+                    )
+                    mask = mask | type_mask
+
     # Method 2: Doc Ref pattern filtering
-    doc_ref_filter = cert_settings.get('doc_ref_filter', {})
+    doc_ref_filter = settings.get('doc_ref_filter', {})
     if doc_ref_filter.get('enabled', False):
         doc_ref_col = doc_ref_filter.get('column_name', 'Doc Ref')
-        cert_patterns = doc_ref_filter.get('certificate_patterns', [])
-        
-        if doc_ref_col in df.columns and cert_patterns:
-            for pattern in cert_patterns:
+        patterns = doc_ref_filter.get(patterns_key, [])
+
+        if doc_ref_col in df.columns and patterns:
+            doc_refs = df[doc_ref_col].fillna('').astype(str)
+            for pattern in patterns:
                 # Create regex pattern: match the 2-letter code anywhere in Doc Ref
                 # Pattern should match things like: "MBS-XXX-CT-001" or "PROJECT-CE-001"
                 regex_pattern = rf'\b{re.escape(pattern)}\b'
-                ref_mask = df[doc_ref_col].fillna('').astype(str).str.contains(
+                ref_mask = doc_refs.str.contains(
                     regex_pattern,
                     case=False,
                     na=False,
                     regex=True
                 )
                 mask = mask | ref_mask
-    
+
+    return mask
+
+
+def get_certificate_mask(df, config):
+    """
+    Get a boolean mask of certificate rows (all False if not enabled).
+
+    Args:
+        df: DataFrame containing document data
+        config: Project configuration dictionary
+
+    Returns:
+        Boolean Series aligned with df.index
+    """
+    cert_settings = config.get('CERTIFICATE_SETTINGS', {})
+    if not cert_settings.get('enabled', False):
+        return pd.Series([False] * len(df), index=df.index)
+    return _pattern_mask(df, cert_settings, 'certificate_types', 'certificate_patterns')
+
+
+def get_technical_submittal_mask(df, config):
+    """
+    Get a boolean mask of technical submittal rows (all False if not enabled).
+
+    Args:
+        df: DataFrame containing document data
+        config: Project configuration dictionary
+
+    Returns:
+        Boolean Series aligned with df.index
+    """
+    ts_settings = config.get('TECHNICAL_SUBMITTAL_SETTINGS', {})
+    if not ts_settings.get('enabled', False):
+        return pd.Series([False] * len(df), index=df.index)
+    return _pattern_mask(df, ts_settings, 'technical_submittal_types', 'technical_submittal_patterns')
+
+
+def get_drawing_mask(df, config):
+    """
+    Get a boolean mask of rows matching the drawing filters (all False if not enabled).
+
+    Args:
+        df: DataFrame containing document data
+        config: Project configuration dictionary
+
+    Returns:
+        Boolean Series aligned with df.index
+    """
+    drawing_settings = config.get('DRAWING_SETTINGS', {})
+    if not drawing_settings.get('enabled', False):
+        return pd.Series([False] * len(df), index=df.index)
+    return _pattern_mask(df, drawing_settings, 'drawing_types', 'drawing_patterns', exact_types=True)
+
+
+def filter_certificates(df, config):
+    """
+    Filter documents to return only certificates based on project config.
+
+    Supports two filtering methods:
+    1. File type column matching (e.g., 'CT - Certificate (CT)')
+    2. Doc Ref pattern matching (e.g., 2-letter codes like 'CT', 'CE')
+
+    Args:
+        df: DataFrame containing document data
+        config: Project configuration dictionary
+
+    Returns:
+        DataFrame containing only certificate documents
+    """
+    if df.empty:
+        return df
+
+    cert_settings = config.get('CERTIFICATE_SETTINGS', {})
+    if not cert_settings.get('enabled', False):
+        return pd.DataFrame()  # Return empty DataFrame if certificates not enabled
+
+    mask = get_certificate_mask(df, config)
+
     return df[mask].copy()
 
 
 def filter_technical_submittals(df, config):
     """
     Filter documents to return only technical submittals based on project config.
-    
+
     Supports two filtering methods:
     1. File type column matching (e.g., 'TX - Technical Submittals (TX)')
     2. Doc Ref pattern matching (e.g., 2-letter codes like 'TX', 'TS')
-    
+
     Args:
         df: DataFrame containing document data
         config: Project configuration dictionary
-        
+
     Returns:
         DataFrame containing only technical submittal documents
     """
     if df.empty:
         return df
-    
+
     ts_settings = config.get('TECHNICAL_SUBMITTAL_SETTINGS', {})
     if not ts_settings.get('enabled', False):
         return pd.DataFrame()  # Return empty DataFrame if technical submittals not enabled
-    
-    mask = pd.Series([False] * len(df), index=df.index)
-    
-    # Method 1: File type column filtering
-    file_type_filter = ts_settings.get('file_type_filter', {})
-    if file_type_filter.get('enabled', False):
-        file_type_col = file_type_filter.get('column_name')
-        ts_types = file_type_filter.get('technical_submittal_types', [])
-        
-        if file_type_col and file_type_col in df.columns and ts_types:
-            for ts_type in ts_types:
-                type_mask = df[file_type_col].fillna('').astype(str).str.contains(
-                    re.escape(ts_type),
-                    case=False,
-                    na=False
-                )
-                mask = mask | type_mask
-    
-    # Method 2: Doc Ref pattern filtering
-    doc_ref_filter = ts_settings.get('doc_ref_filter', {})
-    if doc_ref_filter.get('enabled', False):
-        doc_ref_col = doc_ref_filter.get('column_name', 'Doc Ref')
-        ts_patterns = doc_ref_filter.get('technical_submittal_patterns', [])
-        
-        if doc_ref_col in df.columns and ts_patterns:
-            for pattern in ts_patterns:
-                regex_pattern = rf'\b{re.escape(pattern)}\b'
-                ref_mask = df[doc_ref_col].fillna('').astype(str).str.contains(
-                    regex_pattern,
-                    case=False,
-                    na=False,
-                    regex=True
-                )
-                mask = mask | ref_mask
-    
+
+    mask = get_technical_submittal_mask(df, config)
+
     return df[mask].copy()
 
 
 def filter_drawings_and_schematics(df, config):
     """
     Filter documents to return only drawings and schematics based on project config.
-    
+
     This is the main document type that the summary report focuses on.
     Supports two filtering methods:
     1. File type column exact matching (e.g., 'DR - Drawings (DR)')
     2. Doc Ref pattern matching (e.g., 2-letter codes like 'DR', 'DRG')
-    
+
     Args:
         df: DataFrame containing document data
         config: Project configuration dictionary
-        
+
     Returns:
         DataFrame containing only drawing and schematic documents
     """
     if df.empty:
         return df
-    
+
     drawing_settings = config.get('DRAWING_SETTINGS', {})
     if not drawing_settings.get('enabled', False):
         return df  # If not configured, return all documents (backwards compatible)
-    
-    mask = pd.Series([False] * len(df), index=df.index)
-    
-    # Method 1: File type column filtering (EXACT matches)
-    file_type_filter = drawing_settings.get('file_type_filter', {})
-    if file_type_filter.get('enabled', False):
-        file_type_col = file_type_filter.get('column_name')
-        drawing_types = file_type_filter.get('drawing_types', [])
-        
-        if file_type_col and file_type_col in df.columns and drawing_types:
-            # Use .isin() for exact matching instead of .contains()
-            type_mask = df[file_type_col].fillna('').astype(str).isin(drawing_types)
-            mask = mask | type_mask
-    
-    # Method 2: Doc Ref pattern filtering
-    doc_ref_filter = drawing_settings.get('doc_ref_filter', {})
-    if doc_ref_filter.get('enabled', False):
-        doc_ref_col = doc_ref_filter.get('column_name', 'Doc Ref')
-        drawing_patterns = doc_ref_filter.get('drawing_patterns', [])
-        
-        if doc_ref_col in df.columns and drawing_patterns:
-            for pattern in drawing_patterns:
-                # Create regex pattern: match the 2-letter code anywhere in Doc Ref
-                regex_pattern = rf'\b{re.escape(pattern)}\b'
-                ref_mask = df[doc_ref_col].fillna('').astype(str).str.contains(
-                    regex_pattern,
-                    case=False,
-                    na=False,
-                    regex=True
-                )
-                mask = mask | ref_mask
-    
+
+    mask = get_drawing_mask(df, config)
+
     # If no filters were configured or no matches, return all documents (backwards compatible)
     if not mask.any():
         return df
-    
+
     return df[mask].copy()
 
 
+def classify_documents(df, config):
+    """
+    Assign a document class to every row.
+
+    Precedence matches get_main_report_data: certificates first, then
+    technical submittals, then drawings; everything else is 'other'.
+    The main summary report uses 'drawing' rows, falling back to 'other'
+    rows for snapshots where no drawings matched.
+
+    Args:
+        df: DataFrame containing document data
+        config: Project configuration dictionary
+
+    Returns:
+        Series of document class names aligned with df.index
+    """
+    doc_class = pd.Series(DOC_CLASS_OTHER, index=df.index, dtype=object)
+    if df.empty:
+        return doc_class
+
+    cert_mask = get_certificate_mask(df, config)
+    ts_mask = get_technical_submittal_mask(df, config) & ~cert_mask
+    drawing_mask = get_drawing_mask(df, config) & ~cert_mask & ~ts_mask
+
+    doc_class[drawing_mask] = DOC_CLASS_DRAWING
+    doc_class[ts_mask] = DOC_CLASS_TECHNICAL_SUBMITTAL
+    doc_class[cert_mask] = DOC_CLASS_CERTIFICATE
+
+    return doc_class
+
+
 def get_main_report_data(df, config):
     """
     Get filtered data for main summary report.
-    
+
     This excludes certificates and technical submittals, focusing on
     drawings and schematics (the main document types for the summary report).
-    
+
     Args:
         df: DataFrame containing document data
         config: Project configuration dictionary
-        
+
     Returns:
         DataFrame containing documents for main summary report
         (excludes certificates and technical submittals)
     """
     if df.empty:
         return df
-    
+
     # Start with all documents
     filtered_df = df.copy()
-    
+
     # Remove certificates
     cert_df = filter_certificates(df, config)
     if not cert_df.empty:
         filtered_df = filtered_df[~filtered_df.index.isin(cert_df.index)]
-    
+
     # Remove technical submittals
     ts_df = filter_technical_submittals(df, config)
     if not ts_df.empty:
         filtered_df = filtered_df[~filtered_df.index.isin(ts_df.index)]
-    
+
     # Optionally filter to only drawings/schematics if configured
     drawing_settings = config.get('DRAWING_SETTINGS', {})
     if drawing_settings.get('enabled', False):
         filtered_df = filter_drawings_and_schematics(filtered_df, config)
-    
+
     return filtered_df
 
 
 def get_document_type_summary(df, config):
     """
     Get a summary of document types for debugging/logging.
-    
+
     Args:
         df: DataFrame containing document data
         config: Project configuration dictionary
-        
+
     Returns:
         Dictionary with counts for each document type category
     """
@@ -241,6 +303,5 @@ def get_document_type_summary(df, config):
         'technical_submittals': len(filter_technical_submittals(df, config)),
         'main_report_docs': len(get_main_report_data(df, config))
     }
-    
-    return summary
 
+    return summary
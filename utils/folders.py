@@ -0,0 +1,92 @@
+"""Folder attributes read from document paths.
+
+Doc Path values are folder paths repeated on every row of every snapshot,
+so the attributes read from them - landlord/communal folders, block folders
+and superseded (SS) folders - are parsed once per distinct folder. The
+database stores them per folder too (see the folders table), and returns
+them as FOLDER_COLUMNS when documents are read with their attributes.
+"""
+
+import re
+from functools import lru_cache
+from typing import Optional, Tuple
+
+
+# Folder attribute columns, in parse_folder() order
+FOLDER_ATTRIBUTES = ['landlords', 'block', 'superseded']
+
+# Document columns holding the stored folder attributes (joined from the
+# folders table by DocumentDatabase.get_documents_for_snapshot)
+FOLDER_COLUMNS = ['folder_' + attribute for attribute in FOLDER_ATTRIBUTES]
+
+# Landlord/communal certificates: \18.XX\Landlords\
+_LANDLORDS_PATTERN = re.compile(r'[\\/]Landlords[\\/]', re.IGNORECASE)
+
+# Apartment certificates of a block: \18.XX\Block - X\
+_BLOCK_FOLDER_PATTERN = re.compile(r'\\Block\s*-\s*([A-G])\\', re.IGNORECASE)
+
+# Superseded documents: /SS/ or "/ SS /"
+_SUPERSEDED_PATTERN = re.compile(r'/\s*SS\s*/', re.IGNORECASE)
+
+
+@lru_cache(maxsize=None)
+def _parse_folder(path: str) -> Tuple[bool, Optional[str], bool]:
+    block_match = _BLOCK_FOLDER_PATTERN.search(path)
+    return (
+        _LANDLORDS_PATTERN.search(path) is not None,
+        block_match.group(1).upper() if block_match else None,
+        _SUPERSEDED_PATTERN.search(path) is not None,
+    )
+
+
+def parse_folder(path) -> Tuple[bool, Optional[str], bool]:
+    """
+    Read the folder attributes from a document path.
+
+    Args:
+        path: Doc Path value (None/NaN is treated as an empty path)
+
+    Returns:
+        Tuple of (landlords, block, superseded): whether the path is in a
+        Landlords folder, the letter of its 'Block - X' folder (None if
+        none) and whether it is in an SS folder
+    """
+    return _parse_folder(path.strip() if isinstance(path, str) else '')
+
+
+def folder_attributes(paths):
+    """
+    Folder attributes for a Series of paths, parsed once per distinct path.
+
+    Args:
+        paths: Series of Doc Path values
+
+    Returns:
+        DataFrame with FOLDER_ATTRIBUTES columns aligned with paths
+    """
+    import pandas as pd
+
+    distinct = paths.drop_duplicates()
+    attributes = pd.DataFrame([parse_folder(path) for path in distinct], index=distinct.to_numpy(),
+                              columns=FOLDER_ATTRIBUTES)
+    if attributes.empty:
+        attributes = attributes.astype({'landlords': bool, 'superseded': bool})
+    return attributes.reindex(paths.to_numpy()).set_axis(paths.index)
+
+
+def document_folder_attributes(documents):
+    """
+    Folder attributes of a documents DataFrame.
+
+    Uses the stored attributes (FOLDER_COLUMNS) when the documents were read
+    with them, otherwise parses the 'Doc Path' column.
+
+    Args:
+        documents: DataFrame of documents
+
+    Returns:
+        DataFrame with FOLDER_ATTRIBUTES columns aligned with documents
+    """
+    if all(column in documents.columns for column in FOLDER_COLUMNS):
+        return documents[FOLDER_COLUMNS].set_axis(FOLDER_ATTRIBUTES, axis=1)
+    return folder_attributes(documents['Doc Path'])
@@ -0,0 +1,40 @@
+"""Lazy package exports (PEP 562).
+
+Package __init__ modules list which submodule defines each public name. The
+submodule is only imported when one of its names is first used, so importing
+a package does not pull in pandas/openpyxl for code paths that never need them.
+"""
+
+import importlib
+from typing import Dict, List
+
+
+def lazy_exports(package_name: str, submodule_exports: Dict[str, List[str]]):
+    """
+    Build module-level __getattr__ and __dir__ functions for a package.
+
+    Args:
+        package_name: The package's __name__
+        submodule_exports: Dictionary of submodule name -> public names it defines
+
+    Returns:
+        Tuple of (__getattr__, __dir__) to assign in the package __init__
+    """
+    package = importlib.import_module(package_name)
+    owners = {name: submodule
+              for submodule, names in submodule_exports.items()
+              for name in names}
+
+    def __getattr__(name):
+        submodule = owners.get(name)
+        if submodule is None:
+            raise AttributeError(f"module {package_name!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(f'.{submodule}', package_name), name)
+        # Cache on the package so later lookups skip __getattr__
+        setattr(package, name, value)
+        return value
+
+    def __dir__():
+        return sorted(set(vars(package)) | set(owners))
+
+    return __getattr__, __dir__
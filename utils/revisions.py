@@ -0,0 +1,83 @@
+"""Revision parsing and ordering shared by every report.
+
+Revisions such as P01, C03, P1A or A are parsed once into a family letter,
+a numeric part and a suffix. Sorting and P/C grouping then compare those
+parts instead of re-slicing strings in each report.
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+# Revision families that get their own report sections, in report order
+REVISION_FAMILIES = ['P', 'C']
+
+# Family letter, numeric part, anything after the number
+_REVISION_PATTERN = re.compile(r'^([A-Z]?)(\d*)(.*)$', re.DOTALL)
+
+
+@lru_cache(maxsize=None)
+def parse_revision(revision) -> Tuple[str, Optional[int], str]:
+    """
+    Split a (cleaned) revision into its key parts.
+
+    Args:
+        revision: Revision string, e.g. 'P01', 'C03', 'P1A', 'A'
+
+    Returns:
+        Tuple of (family, number, suffix), e.g. ('P', 1, ''), ('P', 1, 'A'),
+        ('A', None, ''). Family is '' when the revision does not start with a letter.
+    """
+    family, digits, suffix = _REVISION_PATTERN.match(str(revision).strip().upper()).groups()
+    return family, int(digits) if digits else None, suffix
+
+
+def revision_sort_key(revision) -> Tuple:
+    """
+    Sort key giving the same revision order in every report.
+
+    Numbered revisions sort numerically within their family (P2 before P10),
+    suffixed revisions follow their number (P01, P1A, P02) and revisions
+    without a number come last in their family.
+
+    Args:
+        revision: Revision string, with or without a 'Rev_' prefix
+
+    Returns:
+        Tuple suitable for sorted(key=...)
+    """
+    family, number, suffix = parse_revision(_strip_prefix(revision))
+    return (family, number is None, number or 0, suffix)
+
+
+def sort_revisions(revisions: Iterable[str]) -> List[str]:
+    """Sort revisions (or 'Rev_' column names) with revision_sort_key."""
+    return sorted(revisions, key=revision_sort_key)
+
+
+def revision_family(revision) -> str:
+    """Report family of a revision: 'P', 'C' or 'other'."""
+    family = parse_revision(_strip_prefix(revision))[0]
+    return family if family in REVISION_FAMILIES else 'other'
+
+
+def group_revisions(revisions: Iterable[str]) -> Dict[str, List[str]]:
+    """
+    Group revisions by report family, each group sorted.
+
+    Args:
+        revisions: Revisions or 'Rev_' column names
+
+    Returns:
+        Dictionary with 'P', 'C' and 'other' lists
+    """
+    groups = {family: [] for family in REVISION_FAMILIES + ['other']}
+    for revision in sort_revisions(revisions):
+        groups[revision_family(revision)].append(revision)
+    return groups
+
+
+def _strip_prefix(revision) -> str:
+    revision = str(revision)
+    return revision[4:] if revision.startswith('Rev_') else revision
@@ -1,5 +1,121 @@
 """Status mapping utilities for project-specific status categorization."""
 
+import pandas as pd
+
+
+# Row label for statuses not listed in any category (when not folded into 'Other')
+UNMAPPED_CATEGORY = 'Unmapped'
+
+
+class StatusMapper:
+    """Compiled STATUS_MAPPINGS for constant-time status -> category lookup.
+    
+    Build once per config with get_status_mapper() rather than scanning every
+    category's status list for each value.
+    """
+    
+    def __init__(self, status_mappings, statuses_key='statuses'):
+        """Compile a status mapping.
+        
+        Args:
+            status_mappings: Dict of category -> {'statuses': [...], ...}
+            statuses_key: Key holding the status list ('status_terms' for PROGRESSION_STATUS_ORDER)
+        """
+        self.categories = list(status_mappings.keys())
+        
+        # Unmapped statuses are counted under 'Other' when the project defines it
+        self.unmapped_category = 'Other' if 'Other' in status_mappings else UNMAPPED_CATEGORY
+        
+        # Reverse lookup - first category listing a status wins (as get_status_category)
+        self.lookup = {}
+        for category, mapping_info in status_mappings.items():
+            for status_value in mapping_info.get(statuses_key, []):
+                self.lookup.setdefault(status_value, category)
+    
+    def category_of(self, status_value):
+        """Get the category for a status value, or None if it isn't mapped."""
+        return self.lookup.get(status_value)
+    
+    def map_series(self, statuses, fold_unmapped=True):
+        """Map a Series of status values to categories.
+        
+        Args:
+            statuses: Series of raw status values
+            fold_unmapped: Put unmapped statuses under 'Other'/'Unmapped'; if False
+                they are labelled UNMAPPED_CATEGORY even when 'Other' exists
+                
+        Returns:
+            Series: Category per row (missing statuses stay NaN)
+        """
+        categories = statuses.map(self.lookup)
+        unmapped_label = self.unmapped_category if fold_unmapped else UNMAPPED_CATEGORY
+        return categories.where(categories.notna() | statuses.isna(), unmapped_label)
+    
+    def category_order(self, fold_unmapped=True):
+        """Categories in configured order, followed by the unmapped label if separate."""
+        unmapped_label = self.unmapped_category if fold_unmapped else UNMAPPED_CATEGORY
+        if unmapped_label in self.categories:
+            return list(self.categories)
+        return self.categories + [unmapped_label]
+    
+    def grouped_counts(self, statuses):
+        """Count status values per category (same result as get_grouped_status_counts).
+        
+        Args:
+            statuses: Series of raw status values
+            
+        Returns:
+            dict: Category -> count, in configured order, zero counts removed
+        """
+        grouped_counts = dict.fromkeys(self.category_order(), 0)
+        for status_value, count in statuses.value_counts().items():
+            category = self.lookup.get(status_value, self.unmapped_category)
+            grouped_counts[category] += count
+        return {k: int(v) for k, v in grouped_counts.items() if v > 0}
+    
+    def crosstab(self, statuses, groups, fold_unmapped=True):
+        """Count documents per status category and group (e.g. revision family).
+        
+        Args:
+            statuses: Series of raw status values
+            groups: Series of group labels aligned with statuses (e.g. 'P'/'C')
+            fold_unmapped: See map_series
+            
+        Returns:
+            DataFrame: One row per category (configured order), one column per
+            group, zero-filled integer counts
+        """
+        categories = self.map_series(statuses, fold_unmapped)
+        counts = pd.DataFrame({'category': categories, 'group': groups}).groupby(
+            ['category', 'group']
+        ).size()
+        table = counts.unstack(fill_value=0) if not counts.empty else pd.DataFrame()
+        return table.reindex(self.category_order(fold_unmapped), fill_value=0).fillna(0).astype(int)
+
+
+# Compiled mappers keyed by the identity of the STATUS_MAPPINGS dict they were built from
+_status_mapper_cache = {}
+
+
+def get_status_mapper(config):
+    """Get the compiled StatusMapper for a project config.
+    
+    Args:
+        config: Project configuration dictionary containing STATUS_MAPPINGS
+        
+    Returns:
+        StatusMapper or None if the config defines no STATUS_MAPPINGS
+    """
+    if not config or config.get('STATUS_MAPPINGS') is None:
+        return None
+    
+    status_mappings = config['STATUS_MAPPINGS']
+    cached = _status_mapper_cache.get(id(status_mappings))
+    if cached is None or cached[0] is not status_mappings:
+        cached = (status_mappings, StatusMapper(status_mappings))
+        _status_mapper_cache[id(status_mappings)] = cached
+    return cached[1]
+
 
 def get_status_category(status_value, config):
     """Get the status category for a given status value based on project config.
@@ -11,17 +127,11 @@ def get_status_category(status_value, config):
     Returns:
         str: The category name (e.g., 'Status A', 'Status B') or None if not found
     """
-    if not config or 'STATUS_MAPPINGS' not in config:
+    mapper = get_status_mapper(config)
+    if mapper is None:
         return None
     
-    status_mappings = config['STATUS_MAPPINGS']
-    
-    # Search through all categories to find which one contains this status
-    for category, mapping_info in status_mappings.items():
-        if status_value in mapping_info.get('statuses', []):
-            return category
-    
-    return None
+    return mapper.category_of(status_value)
 
 
 def get_status_color(category, config):
@@ -76,49 +186,15 @@ def get_grouped_status_counts(df, config):
     Returns:
         dict: Dictionary mapping category names to counts
     """
-    if not config or 'STATUS_MAPPINGS' not in config:
-        # Fallback to raw status counts if no mappings defined
-        if hasattr(df, 'value_counts'):
-            # It's a Series
-            return df.value_counts().to_dict()
-        else:
-            # It's a DataFrame
-            return df['Status'].value_counts().to_dict()
-    
-    # Get actual status counts from data
-    if hasattr(df, 'value_counts'):
-        # It's a Series (already filtered Status column)
-        status_counts = df.value_counts()
-    else:
-        # It's a DataFrame, get Status column
-        status_counts = df['Status'].value_counts()
-    
-    # Initialize category counts
-    grouped_counts = {}
-    status_mappings = config['STATUS_MAPPINGS']
+    # Accept a Series (already selected Status column) or a DataFrame
+    statuses = df if isinstance(df, pd.Series) else df['Status']
     
-    for category in status_mappings.keys():
-        grouped_counts[category] = 0
+    mapper = get_status_mapper(config)
+    if mapper is None:
+        # Fallback to raw status counts if no mappings defined
+        return statuses.value_counts().to_dict()
     
-    # Map each status to its category and sum counts
-    for status_value, count in status_counts.items():
-        category = get_status_category(status_value, config)
-        if category:
-            grouped_counts[category] += count
-        else:
-            # If status not mapped, add to "Other" if it exists, otherwise track separately
-            if 'Other' in grouped_counts:
-                grouped_counts['Other'] += count
-            else:
-                # Create unmapped category if Other doesn't exist
-                if 'Unmapped' not in grouped_counts:
-                    grouped_counts['Unmapped'] = 0
-                grouped_counts['Unmapped'] += count
-    
-    # Remove categories with zero counts for cleaner output
-    grouped_counts = {k: v for k, v in grouped_counts.items() if v > 0}
-    
-    return grouped_counts
+    return mapper.grouped_counts(statuses)
 
 
 def get_status_display_order(config):
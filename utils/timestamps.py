@@ -1,11 +1,13 @@
 """Timestamp extraction utilities."""
 
-import pandas as pd
 import re
 from datetime import datetime
 from pathlib import Path
 
+from .tracing import traced
 
+
+@traced('read file timestamp')
 def get_file_timestamp(file_path):
     """Get the timestamp from cell B4 of the Excel file or from CSV file.
     
@@ -15,6 +17,8 @@ def get_file_timestamp(file_path):
     Returns:
         tuple: (date_str, time_str) or (None, None) if parsing fails
     """
+    import pandas as pd
+    
     try:
         file_path_str = str(file_path).lower()
         
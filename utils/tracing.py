@@ -0,0 +1,320 @@
+"""Lightweight pipeline tracing.
+
+Code marks the stages of a run with spans:
+
+    with span('import file', project=project_name, file=file_path.name):
+        ...
+
+    @traced('db.insert_documents')
+    def insert_documents(...):
+        ...
+
+Tracing is off by default. A disabled span() returns a shared no-op context
+manager and a @traced function checks one flag before calling through, so the
+instrumentation costs next to nothing in normal runs. When enabled (--trace on
+the command line) every finished span is recorded with its duration, its time
+excluding child spans (self time) and its attributes - child spans inherit the
+project/snapshot/report attributes of their parents. At the end of a run the
+spans are written as a JSON profile plus a CSV summary, and a flame-style
+summary of the hot spots is printed.
+"""
+
+import csv
+import json
+import time
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from functools import wraps
+from pathlib import Path
+
+# Spans below this share of the run are left out of the console summary
+SUMMARY_MIN_SHARE = 0.01
+
+# Hot spots listed in the console summary
+SUMMARY_TOP_SPOTS = 10
+
+_NULL_SPAN = nullcontext()
+
+_state = {
+    'enabled': False,
+    'spans': [],
+    'stack': [],
+}
+
+
+def enable_tracing():
+    """Start recording spans (previously recorded spans are kept)."""
+    _state['enabled'] = True
+
+
+def disable_tracing():
+    """Stop recording spans."""
+    _state['enabled'] = False
+
+
+def is_tracing_enabled():
+    """Whether spans are currently being recorded."""
+    return _state['enabled']
+
+
+def reset_tracing():
+    """Discard all recorded spans."""
+    _state['spans'] = []
+    _state['stack'] = []
+
+
+def get_spans():
+    """
+    Spans recorded so far, in the order they finished.
+
+    Returns:
+        List of span dictionaries with 'name', 'path', 'depth', 'start',
+        'seconds', 'self_seconds' and 'attributes'
+    """
+    return list(_state['spans'])
+
+
+def span(name, **attributes):
+    """
+    Context manager timing one stage of a run.
+
+    Args:
+        name: Stage name (e.g. 'parse file', 'db.insert_documents')
+        **attributes: Context such as project, snapshot, report or file
+
+    Returns:
+        Context manager (a shared no-op when tracing is disabled)
+    """
+    if not _state['enabled']:
+        return _NULL_SPAN
+    return _record_span(name, attributes)
+
+
+@contextmanager
+def _record_span(name, attributes):
+    stack = _state['stack']
+    parent = stack[-1] if stack else None
+    frame = {
+        'name': name,
+        'path': f"{parent['path']}/{name}" if parent else name,
+        'attributes': {**parent['attributes'], **attributes} if parent else dict(attributes),
+        'child_seconds': 0.0,
+    }
+    stack.append(frame)
+    wall_start = time.time()
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        seconds = time.perf_counter() - start
+        stack.pop()
+        if parent:
+            parent['child_seconds'] += seconds
+        _state['spans'].append({
+            'name': name,
+            'path': frame['path'],
+            'depth': len(stack),
+            'start': wall_start,
+            'seconds': seconds,
+            'self_seconds': max(seconds - frame['child_seconds'], 0.0),
+            'attributes': frame['attributes'],
+        })
+
+
+def traced(name=None):
+    """
+    Decorator recording each call of a function as a span.
+
+    Args:
+        name: Span name (default: the function's qualified name)
+    """
+    def decorator(func):
+        span_name = name or func.__qualname__
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _state['enabled']:
+                return func(*args, **kwargs)
+            with _record_span(span_name, {}):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+@contextmanager
+def capture_spans():
+    """
+    Record the spans of a block separately from the rest of the run.
+
+    Used for report jobs, which may run in worker processes: the job records
+    its spans into a fresh list, returns them with its result, and the parent
+    process merges them back with add_spans().
+
+    Yields:
+        List that holds the block's spans once the block has finished
+    """
+    captured = []
+    saved = dict(_state)
+    _state.update({'enabled': True, 'spans': captured, 'stack': []})
+    try:
+        yield captured
+    finally:
+        _state.update(saved)
+
+
+def add_spans(spans):
+    """
+    Merge spans recorded elsewhere (see capture_spans) into the current run.
+
+    The spans are nested under the currently open span, if any.
+
+    Args:
+        spans: Span dictionaries from get_spans()/capture_spans()
+    """
+    if not _state['enabled'] or not spans:
+        return
+
+    stack = _state['stack']
+    parent = stack[-1] if stack else None
+    for record in spans:
+        record = dict(record)
+        if parent:
+            record['path'] = f"{parent['path']}/{record['path']}"
+            record['depth'] += len(stack)
+            record['attributes'] = {**parent['attributes'], **record['attributes']}
+            if record['depth'] == len(stack):
+                parent['child_seconds'] += record['seconds']
+        _state['spans'].append(record)
+
+
+def summarize_spans(spans):
+    """
+    Aggregate spans by call path.
+
+    Args:
+        spans: Span dictionaries
+
+    Returns:
+        List of {'path', 'name', 'depth', 'calls', 'seconds', 'self_seconds'}
+        dictionaries, in tree order (children after their parent, slowest first)
+    """
+    totals = {}
+    for record in spans:
+        entry = totals.setdefault(record['path'], {
+            'path': record['path'],
+            'name': record['name'],
+            'depth': record['path'].count('/'),
+            'calls': 0,
+            'seconds': 0.0,
+            'self_seconds': 0.0,
+        })
+        entry['calls'] += 1
+        entry['seconds'] += record['seconds']
+        entry['self_seconds'] += record['self_seconds']
+
+    children = {}
+    for path, entry in totals.items():
+        parent_path = path.rsplit('/', 1)[0] if '/' in path else None
+        # Spans merged from elsewhere may miss their parent - treat them as roots
+        if parent_path not in totals:
+            parent_path = None
+            entry['depth'] = 0
+        children.setdefault(parent_path, []).append(entry)
+
+    ordered = []
+
+    def walk(parent_path):
+        for entry in sorted(children.get(parent_path, []), key=lambda e: -e['seconds']):
+            ordered.append(entry)
+            walk(entry['path'])
+
+    walk(None)
+    return ordered
+
+
+def print_trace_summary(spans=None, top=SUMMARY_TOP_SPOTS):
+    """
+    Print a flame-style tree of where the run's time went, then the hot spots.
+
+    Shares are of the run's wall time, so spans from parallel report jobs can
+    add up to more than 100%.
+
+    Args:
+        spans: Span dictionaries (default: the spans recorded in this run)
+        top: Number of hot spots (by self time) to list
+    """
+    spans = get_spans() if spans is None else spans
+    summary = summarize_spans(spans)
+    if not summary:
+        print("ℹ No trace spans recorded")
+        return
+
+    total = sum(entry['seconds'] for entry in summary if entry['depth'] == 0) or 1e-9
+    print(f"\n{'='*60}")
+    print("TRACE SUMMARY")
+    print(f"{'='*60}")
+    print(f"{'Span':<44} {'Calls':>6} {'Total':>8} {'Self':>8}  Share")
+    shown = set()
+    for entry in summary:
+        share = entry['seconds'] / total
+        parent_path = entry['path'].rsplit('/', 1)[0] if entry['depth'] else None
+        # Skip small spans, and the children of spans that were skipped
+        if share < SUMMARY_MIN_SHARE or (parent_path and parent_path not in shown):
+            continue
+        shown.add(entry['path'])
+        label = ('  ' * entry['depth'] + entry['name'])[:44]
+        bar = '█' * min(max(1, round(share * 20)), 20)
+        print(f"{label:<44} {entry['calls']:>6} {entry['seconds']:>7.2f}s {entry['self_seconds']:>7.2f}s  "
+              f"{bar:<20} {share:>6.1%}")
+
+    hot_spots = {}
+    for entry in summary:
+        spot = hot_spots.setdefault(entry['name'], {'calls': 0, 'self_seconds': 0.0})
+        spot['calls'] += entry['calls']
+        spot['self_seconds'] += entry['self_seconds']
+
+    print(f"\nHot spots (self time):")
+    for name, spot in sorted(hot_spots.items(), key=lambda item: -item[1]['self_seconds'])[:top]:
+        print(f"  {spot['self_seconds']:>7.2f}s {spot['self_seconds'] / total:>6.1%}  {name} ({spot['calls']} calls)")
+    print(f"{'='*60}")
+
+
+def write_trace_profile(output_dir, run_name='run', spans=None):
+    """
+    Write a run's spans as <run>_<timestamp>.json and its per-path summary as
+    <run>_<timestamp>.csv.
+
+    Args:
+        output_dir: Directory for the profile files
+        run_name: Prefix for the file names
+        spans: Span dictionaries (default: the spans recorded in this run)
+
+    Returns:
+        Tuple of (json_path, csv_path)
+    """
+    spans = get_spans() if spans is None else spans
+    summary = summarize_spans(spans)
+
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    stem = f"{run_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    json_path = output_dir / f"{stem}.json"
+    csv_path = output_dir / f"{stem}.csv"
+
+    with open(json_path, 'w', encoding='utf-8') as f:
+        json.dump({
+            'run': run_name,
+            'created': datetime.now().isoformat(timespec='seconds'),
+            'seconds': sum(entry['seconds'] for entry in summary if entry['depth'] == 0),
+            'summary': summary,
+            'spans': spans,
+        }, f, indent=2, default=str)
+
+    with open(csv_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=['path', 'name', 'depth', 'calls', 'seconds', 'self_seconds'])
+        writer.writeheader()
+        writer.writerows(summary)
+
+    return json_path, csv_path